@@ -0,0 +1,95 @@
+"""Benchmark the session listing queries before and after the v2.5.0 workload indexes.
+
+Seeds a sessions table with SESSIONS_COUNT rows (5M by default), drops the v2.5.0 indexes to reproduce a table created
+by an earlier version, times the get_sessions query shapes, applies the v2.5.0 migration and times them again.
+
+1. Run: `./cookbook/scripts/run_pgvector.sh` to start a postgres container
+2. Run: `uv pip install sqlalchemy psycopg` to install dependencies
+3. Run: `python cookbook/06_storage/postgres/session_index_benchmark.py`
+"""
+
+import asyncio
+import os
+import time
+from statistics import median
+
+from agno.db.base import SessionType
+from agno.db.migrations.manager import MigrationManager
+from agno.db.migrations.versions.v2_5_0 import ADDED_INDEXES
+from agno.db.postgres import PostgresDb
+from sqlalchemy import text
+
+db_url = "postgresql+psycopg://ai:ai@localhost:5532/ai"
+sessions_count = int(os.getenv("SESSIONS_COUNT", "5000000"))
+table_name = "agno_sessions_index_benchmark"
+
+db = PostgresDb(db_url=db_url, session_table=table_name)
+
+# The get_sessions calls behind the AgentOS sessions endpoints
+queries = {
+    "user's agent sessions": dict(user_id="user_42", session_type=SessionType.AGENT),
+    "agent's sessions": dict(component_id="agent_7", session_type=SessionType.AGENT),
+    "team's sessions": dict(component_id="team_3", session_type=SessionType.TEAM),
+}
+
+
+def seed() -> None:
+    """Create the table and fill it server side: 10k users, 100 agents, 20 teams and 20 workflows."""
+    with db.db_engine.begin() as conn:
+        conn.execute(text(f'DROP TABLE IF EXISTS "{db.db_schema}"."{table_name}"'))
+    db._get_table("sessions", create_table_if_not_found=True)
+    with db.db_engine.begin() as conn:
+        conn.execute(
+            text(f"""
+            INSERT INTO "{db.db_schema}"."{table_name}"
+                (session_id, session_type, agent_id, team_id, workflow_id, user_id, created_at, updated_at)
+            SELECT
+                'session_' || i,
+                (ARRAY['agent', 'team', 'workflow'])[1 + i % 3],
+                CASE WHEN i % 3 = 0 THEN 'agent_' || (i / 3) % 100 END,
+                CASE WHEN i % 3 = 1 THEN 'team_' || (i / 3) % 20 END,
+                CASE WHEN i % 3 = 2 THEN 'workflow_' || (i / 3) % 20 END,
+                'user_' || i % 10000,
+                1700000000 + i,
+                1700000000 + i
+            FROM generate_series(1, :count) AS i
+            """),
+            {"count": sessions_count},
+        )
+        # Reproduce a table created before v2.5.0
+        for name in ADDED_INDEXES["sessions"]:
+            conn.execute(
+                text(f'DROP INDEX IF EXISTS "{db.db_schema}"."idx_{table_name}_{name}"')
+            )
+        conn.execute(text(f'ANALYZE "{db.db_schema}"."{table_name}"'))
+
+
+def time_queries(label: str, repeats: int = 5) -> None:
+    print(f"\n{label}")
+    for name, kwargs in queries.items():
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            db.get_sessions(
+                limit=20,
+                page=1,
+                sort_by="created_at",
+                sort_order="desc",
+                deserialize=False,
+                **kwargs,
+            )
+            timings.append(time.perf_counter() - start)
+        print(f"  {name:<24} median {median(timings) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    print(f"Seeding {sessions_count:,} sessions...")
+    seed()
+    time_queries("Before v2.5.0 indexes")
+
+    db.upsert_schema_version(table_name, "2.3.0")
+    start = time.perf_counter()
+    asyncio.run(MigrationManager(db).up(target_version="2.5.0", table_type="session"))
+    print(f"\nBuilt indexes concurrently in {time.perf_counter() - start:.1f} s")
+
+    time_queries("After v2.5.0 indexes")
@@ -0,0 +1,33 @@
+import asyncio
+
+from agno.agent import Agent
+from agno.knowledge.knowledge import Knowledge
+from agno.vectordb.local import LocalVectorDb, SearchType
+
+# Stored in tmp/local_vectordb/recipes, with numpy as the only dependency
+vector_db = LocalVectorDb(
+    collection="recipes",
+    path="tmp/local_vectordb",
+    search_type=SearchType.hybrid,
+)
+
+knowledge = Knowledge(
+    name="Local Knowledge Base",
+    description="Agno 2.0 Knowledge Implementation with LocalVectorDb",
+    vector_db=vector_db,
+)
+
+asyncio.run(
+    knowledge.ainsert(
+        name="Recipes",
+        url="https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf",
+        metadata={"doc_type": "recipe_book"},
+    )
+)
+
+agent = Agent(knowledge=knowledge)
+agent.print_response("List down the ingredients to make Massaman Gai", markdown=True)
+
+vector_db.delete_by_name("Recipes")
+# or
+vector_db.delete_by_metadata({"doc_type": "recipe_book"})
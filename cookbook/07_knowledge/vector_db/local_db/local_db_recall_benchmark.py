@@ -0,0 +1,64 @@
+"""Recall and latency of LocalVectorDb's IVF index against an exact (brute force) search.
+
+Inserts random vectors directly, so no embedding API is called. Higher nprobe values scan more
+IVF lists per query, trading latency for recall.
+"""
+
+import shutil
+from time import perf_counter
+
+import numpy as np
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.vectordb.local import LocalVectorDb
+
+NUM_VECTORS = 50_000
+DIMENSIONS = 256
+NUM_QUERIES = 200
+LIMIT = 10
+PATH = "tmp/local_vectordb_benchmark"
+
+rng = np.random.default_rng(42)
+# Clustered data, closer to real embeddings than uniform noise
+centers = rng.standard_normal((100, DIMENSIONS)).astype(np.float32)
+vectors = centers[rng.integers(0, len(centers), NUM_VECTORS)]
+vectors += 0.5 * rng.standard_normal((NUM_VECTORS, DIMENSIONS)).astype(np.float32)
+queries = vectors[rng.choice(NUM_VECTORS, NUM_QUERIES, replace=False)]
+queries += 0.1 * rng.standard_normal((NUM_QUERIES, DIMENSIONS)).astype(np.float32)
+
+shutil.rmtree(PATH, ignore_errors=True)
+vector_db = LocalVectorDb(
+    collection="benchmark",
+    path=PATH,
+    embedder=Embedder(dimensions=DIMENSIONS),
+    background_compaction=False,
+)
+start = perf_counter()
+for offset in range(0, NUM_VECTORS, 10_000):
+    documents = [
+        Document(content=f"document {offset + i}", embedding=vector)
+        for i, vector in enumerate(vectors[offset : offset + 10_000])
+    ]
+    vector_db.insert(content_hash=f"batch-{offset}", documents=documents)
+vector_db.optimize()
+print(f"Inserted and indexed {NUM_VECTORS} vectors in {perf_counter() - start:.2f}s")
+
+
+def run(exact: bool) -> tuple:
+    results = []
+    start = perf_counter()
+    for query in queries:
+        results.append([doc.id for doc in vector_db.search_by_embedding(query, limit=LIMIT, exact=exact)])
+    return results, (perf_counter() - start) / NUM_QUERIES * 1000
+
+
+ground_truth, exact_ms = run(exact=True)
+print(f"brute force   recall@{LIMIT}=1.000  {exact_ms:.2f} ms/query")
+
+for nprobe in (1, 4, 8, 16, 32):
+    vector_db.nprobe = nprobe
+    results, ivf_ms = run(exact=False)
+    recall = np.mean([len(set(r) & set(t)) / LIMIT for r, t in zip(results, ground_truth)])
+    print(f"ivf nprobe={nprobe:<3} recall@{LIMIT}={recall:.3f}  {ivf_ms:.2f} ms/query")
+
+vector_db.drop()
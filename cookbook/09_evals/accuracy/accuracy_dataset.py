@@ -0,0 +1,43 @@
+"""This example shows how to run an Accuracy evaluation over a dataset of cases, concurrently.
+
+Results are checkpointed to the db as the run progresses: if it is interrupted, running it again with the same
+run_id only runs the remaining cases.
+"""
+
+import asyncio
+from typing import Optional
+
+from agno.agent import Agent
+from agno.db.sqlite import SqliteDb
+from agno.eval.accuracy import AccuracyEval
+from agno.eval.dataset import DatasetEval, DatasetEvalResult, EvalCase
+from agno.models.openai import OpenAIChat
+from agno.tools.calculator import CalculatorTools
+
+cases = [
+    EvalCase(input=f"What is {a} * {b}?", expected_output=str(a * b))
+    for a in range(2, 12)
+    for b in range(2, 12)
+]
+
+dataset_eval = DatasetEval(
+    name="Multiplication table",
+    run_id="multiplication-table-nightly",
+    cases=cases,
+    # The AccuracyEval configures the judge. Its input and expected_output are taken from the cases.
+    evaluation=AccuracyEval(
+        model=OpenAIChat(id="o4-mini"), input="", expected_output=""
+    ),
+    agent=Agent(model=OpenAIChat(id="gpt-4o-mini"), tools=[CalculatorTools()]),
+    num_iterations=2,
+    max_concurrency=16,
+    # Judge 10 outputs per judge call
+    judge_batch_size=10,
+    db=SqliteDb(db_file="tmp/evals.db"),
+)
+
+if __name__ == "__main__":
+    result: Optional[DatasetEvalResult] = asyncio.run(
+        dataset_eval.arun(print_summary=True)
+    )
+    assert result is not None and result.avg_score is not None and result.avg_score >= 8
@@ -0,0 +1,52 @@
+"""This example shows how to load test an Agent: latency percentiles, time to first token, throughput and errors
+under 200 concurrent requests.
+
+The MockModel returns scripted responses after a configurable latency, so the load test runs offline and measures the
+overhead of the framework. Swap it for a real model to load test the full stack.
+"""
+
+import asyncio
+
+from agno.agent import Agent
+from agno.eval.performance import PerformanceEval
+from agno.models.mock import MockModel
+
+agent = Agent(
+    model=MockModel(
+        responses=["The capital of France is Paris."], latency=0.2, chunk_latency=0.01
+    ),
+    system_message="Be concise, reply with one sentence.",
+    # Run fully offline
+    telemetry=False,
+)
+
+
+def stream_agent():
+    # Yielding the run output reports the output tokens of streamed runs
+    return agent.arun(
+        "What is the capital of France?", stream=True, yield_run_output=True
+    )
+
+
+# Closed model: 200 users, each sending a new request as soon as the previous one completes
+concurrent_load_test = PerformanceEval(
+    name="Agent under 200 concurrent users",
+    func=stream_agent,
+    num_requests=2000,
+    concurrency=200,
+    telemetry=False,
+)
+
+# Open model: 500 requests started per second, whether or not earlier ones completed
+arrival_rate_load_test = PerformanceEval(
+    name="Agent at 500 requests/s",
+    func=stream_agent,
+    num_requests=2000,
+    arrival_rate=500,
+    concurrency=1000,
+    telemetry=False,
+)
+
+if __name__ == "__main__":
+    asyncio.run(concurrent_load_test.arun_load_test(print_summary=True))
+    asyncio.run(arrival_rate_load_test.arun_load_test(print_summary=True))
@@ -0,0 +1,36 @@
+"""Run `uv pip install agno orjson memory_profiler` to install dependencies.
+
+Measures how fast streamed RunContentEvent chunks are encoded as SSE frames,
+which is the hot path of every streaming AgentOS response.
+"""
+
+from agno.eval.performance import PerformanceEval
+from agno.os.utils import format_sse_event
+from agno.run.agent import RunContentEvent
+
+events = [
+    RunContentEvent(
+        run_id="run-1",
+        session_id="session-1",
+        agent_id="agent-1",
+        agent_name="Streaming Agent",
+        content=f"token {i} ",
+    )
+    for i in range(1000)
+]
+
+
+def encode_stream():
+    for event in events:
+        format_sse_event(event)
+
+
+serialization_perf = PerformanceEval(
+    name="RunContentEvent SSE Encoding (1000 events)",
+    func=encode_stream,
+    num_iterations=100,
+    warmup_runs=5,
+)
+
+if __name__ == "__main__":
+    serialization_perf.run(print_results=True, print_summary=True)
@@ -0,0 +1,41 @@
+"""Run `uv pip install agno openai memory_profiler` to install dependencies.
+
+Measures provider message formatting over a 30-iteration tool loop. Every iteration formats the whole
+history, as Model.response does before each model call; messages formatted in earlier iterations reuse
+their cached payload, so only the new assistant and tool messages are formatted each turn.
+"""
+
+import json
+import os
+
+from agno.eval.performance import PerformanceEval
+from agno.media import Image
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+
+model = OpenAIChat(id="gpt-4o")
+image_bytes = os.urandom(512 * 1024)
+
+
+def run_tool_loop():
+    messages = [
+        Message(role="system", content="You are a research assistant."),
+        Message(role="user", content="Compare these charts", images=[Image(content=image_bytes)]),
+    ]
+    for i in range(30):
+        model._format_messages(messages)
+        tool_call = {"id": f"call-{i}", "type": "function", "function": {"name": "search", "arguments": "{}"}}
+        messages.append(Message(role="assistant", tool_calls=[tool_call]))
+        messages.append(Message(role="tool", tool_call_id=f"call-{i}", content=json.dumps({"result": "x" * 2000})))
+    model._format_messages(messages)
+
+
+formatting_perf = PerformanceEval(
+    name="Tool Loop Message Formatting (30 iterations)",
+    func=run_tool_loop,
+    num_iterations=20,
+    warmup_runs=2,
+)
+
+if __name__ == "__main__":
+    formatting_perf.run(print_results=True, print_summary=True)
@@ -0,0 +1,14 @@
+"""Record the exchanges with OpenAI once, then replay them offline.
+
+The first run sends the requests to OpenAI and writes them to the cassette. The next runs replay the cassette without
+network access: any OPENAI_API_KEY works, and keys are never written to the cassette.
+"""
+
+from agno.agent import Agent
+from agno.models.mock import use_cassette
+from agno.models.openai import OpenAIChat
+
+with use_cassette("tmp/cassettes/capital_of_france.json") as cassette:
+    agent = Agent(model=OpenAIChat(id="gpt-4o-mini"), telemetry=False)
+    agent.print_response("What is the capital of France?", stream=True)
+    print(f"Mode: {cassette.mode}, {len(cassette.exchanges)} exchanges in the cassette")
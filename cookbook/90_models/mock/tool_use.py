@@ -0,0 +1,26 @@
+"""Run an Agent with tools offline: the MockModel calls the tool, then answers."""
+
+from agno.agent import Agent
+from agno.models.mock import MockModel, MockToolCall
+
+
+def get_weather(city: str) -> str:
+    """Get the weather of a city."""
+    return f"It is sunny in {city}."
+
+
+agent = Agent(
+    model=MockModel(
+        responses=[
+            MockToolCall(name="get_weather", arguments={"city": "Paris"}),
+            "It is sunny in Paris today.",
+        ],
+        # Log-normal latency with a median of ~200ms. Samples are seeded, so they are the same on every run.
+        latency=lambda rng: rng.lognormvariate(-1.6, 0.5),
+        chunk_latency=0.02,
+    ),
+    tools=[get_weather],
+    telemetry=False,
+)
+
+agent.print_response("What is the weather in Paris?", stream=True)
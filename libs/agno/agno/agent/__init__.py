@@ -1,32 +1,36 @@
-from agno.agent.agent import (
-    Agent,
-    AgentSession,
-    Function,
-    Message,
-    Toolkit,
-    get_agent_by_id,
-    get_agents,
-)
-from agno.agent.remote import RemoteAgent
-from agno.run.agent import (
-    MemoryUpdateCompletedEvent,
-    MemoryUpdateStartedEvent,
-    ReasoningCompletedEvent,
-    ReasoningStartedEvent,
-    ReasoningStepEvent,
-    RunCancelledEvent,
-    RunCompletedEvent,
-    RunContentEvent,
-    RunContinuedEvent,
-    RunErrorEvent,
-    RunEvent,
-    RunOutput,
-    RunOutputEvent,
-    RunPausedEvent,
-    RunStartedEvent,
-    ToolCallCompletedEvent,
-    ToolCallStartedEvent,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agno.agent.agent import (
+        Agent,
+        AgentSession,
+        Function,
+        Message,
+        Toolkit,
+        get_agent_by_id,
+        get_agents,
+    )
+    from agno.agent.remote import RemoteAgent
+    from agno.run.agent import (
+        MemoryUpdateCompletedEvent,
+        MemoryUpdateStartedEvent,
+        ReasoningCompletedEvent,
+        ReasoningStartedEvent,
+        ReasoningStepEvent,
+        RunCancelledEvent,
+        RunCompletedEvent,
+        RunContentEvent,
+        RunContinuedEvent,
+        RunErrorEvent,
+        RunEvent,
+        RunOutput,
+        RunOutputEvent,
+        RunPausedEvent,
+        RunStartedEvent,
+        ToolCallCompletedEvent,
+        ToolCallStartedEvent,
+    )
 
 __all__ = [
     "Agent",
@@ -55,3 +59,43 @@ __all__ = [
     "get_agent_by_id",
     "get_agents",
 ]
+
+# Module each name is imported from on first access
+_LAZY_IMPORTS = {
+    "Agent": "agno.agent.agent",
+    "AgentSession": "agno.agent.agent",
+    "Function": "agno.agent.agent",
+    "Message": "agno.agent.agent",
+    "Toolkit": "agno.agent.agent",
+    "get_agent_by_id": "agno.agent.agent",
+    "get_agents": "agno.agent.agent",
+    "RemoteAgent": "agno.agent.remote",
+    "RunEvent": "agno.run.agent",
+    "RunOutput": "agno.run.agent",
+    "RunOutputEvent": "agno.run.agent",
+    "RunContentEvent": "agno.run.agent",
+    "RunCancelledEvent": "agno.run.agent",
+    "RunErrorEvent": "agno.run.agent",
+    "RunPausedEvent": "agno.run.agent",
+    "RunContinuedEvent": "agno.run.agent",
+    "RunStartedEvent": "agno.run.agent",
+    "RunCompletedEvent": "agno.run.agent",
+    "MemoryUpdateStartedEvent": "agno.run.agent",
+    "MemoryUpdateCompletedEvent": "agno.run.agent",
+    "ReasoningStartedEvent": "agno.run.agent",
+    "ReasoningStepEvent": "agno.run.agent",
+    "ReasoningCompletedEvent": "agno.run.agent",
+    "ToolCallStartedEvent": "agno.run.agent",
+    "ToolCallCompletedEvent": "agno.run.agent",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import, so importing agno.agent (e.g. for its run events) does not load the Agent and its dependencies."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(import_module(module_path), name)
+    # Cached, so later accesses do not go through __getattr__
+    globals()[name] = value
+    return value
@@ -7,9 +7,11 @@ from asyncio import CancelledError, Task, create_task
 from collections import ChainMap, deque
 from concurrent.futures import Future
 from dataclasses import dataclass
+from importlib import import_module
 from inspect import iscoroutinefunction
 from os import getenv
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -31,31 +33,22 @@ from uuid import uuid4
 
 from pydantic import BaseModel
 
-from agno.compression.manager import CompressionManager
-from agno.culture.manager import CultureManager
 from agno.db.base import AsyncBaseDb, BaseDb, ComponentType, SessionType, UserMemory
-from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.utils import db_from_dict
-from agno.eval.base import BaseEval
 from agno.exceptions import (
     InputCheckError,
     OutputCheckError,
     RunCancelledException,
 )
 from agno.filters import FilterExpr
-from agno.guardrails import BaseGuardrail
-from agno.knowledge.protocol import KnowledgeProtocol
 from agno.knowledge.types import KnowledgeFilter
-from agno.learn.machine import LearningMachine
 from agno.media import Audio, File, Image, Video
-from agno.memory import MemoryManager
 from agno.models.base import Model
 from agno.models.message import Message, MessageReferences
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.models.utils import get_model
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
-from agno.registry.registry import Registry
 from agno.run import RunContext, RunStatus
 from agno.run.agent import (
     RunEvent,
@@ -82,7 +75,6 @@ from agno.run.requirement import RunRequirement
 from agno.run.team import TeamRunOutputEvent
 from agno.session import AgentSession, SessionSummaryManager, TeamSession, WorkflowSession
 from agno.session.summary import SessionSummary
-from agno.skills import Skills
 from agno.tools import Toolkit
 from agno.tools.function import Function
 from agno.utils.agent import (
@@ -108,6 +100,9 @@ from agno.utils.agent import (
     get_session_metrics_util,
     get_session_name_util,
     get_session_state_util,
+    load_media_into_messages,
+    load_media_into_run_output,
+    offload_media_from_run_output,
     scrub_history_messages_from_run_output,
     scrub_media_from_run_output,
     scrub_tool_results_from_run_output,
@@ -119,7 +114,8 @@ from agno.utils.agent import (
     wait_for_open_threads,
     wait_for_thread_tasks_stream,
 )
-from agno.utils.common import is_typed_dict
+from agno.utils.common import LazyAnnotations, is_typed_dict
+from agno.utils.context_assembly import ContextAssembly
 from agno.utils.events import (
     add_error_event,
     create_compression_completed_event,
@@ -170,12 +166,6 @@ from agno.utils.log import (
 )
 from agno.utils.merge_dict import merge_dictionaries
 from agno.utils.message import filter_tool_calls, get_text_from_message
-from agno.utils.print_response.agent import (
-    aprint_response,
-    aprint_response_stream,
-    print_response,
-    print_response_stream,
-)
 from agno.utils.prompts import get_json_output_prompt, get_response_model_format_prompt
 from agno.utils.reasoning import (
     add_reasoning_metrics_to_metadata,
@@ -190,6 +180,57 @@ from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import generate_id_from_name, parse_response_dict_str, parse_response_model_str
 from agno.utils.timer import Timer
 
+# Optional subsystems are imported on first use, so that importing the Agent stays fast
+if TYPE_CHECKING:
+    from agno.compression.manager import CompressionManager
+    from agno.culture.manager import CultureManager
+    from agno.db.schemas.culture import CulturalKnowledge
+    from agno.db.session_writer import SessionWriter
+    from agno.eval.base import BaseEval
+    from agno.guardrails import BaseGuardrail
+    from agno.knowledge.protocol import KnowledgeProtocol
+    from agno.learn.machine import LearningMachine
+    from agno.media_store import MediaStore
+    from agno.memory import MemoryManager
+    from agno.registry.registry import Registry
+    from agno.skills import Skills
+
+# Module each of the names above is imported from on first access
+_LAZY_IMPORTS = {
+    "CompressionManager": "agno.compression.manager",
+    "CultureManager": "agno.culture.manager",
+    "CulturalKnowledge": "agno.db.schemas.culture",
+    "SessionWriter": "agno.db.session_writer",
+    "BaseEval": "agno.eval.base",
+    "BaseGuardrail": "agno.guardrails",
+    "KnowledgeProtocol": "agno.knowledge.protocol",
+    "LearningMachine": "agno.learn.machine",
+    "MediaStore": "agno.media_store",
+    "MemoryManager": "agno.memory",
+    "Registry": "agno.registry.registry",
+    "Skills": "agno.skills",
+}
+
+
+def __getattr__(name: str):
+    """
+    Lazy import of the optional subsystems used in annotations, e.g. agno.agent.agent.MemoryManager.
+    """
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(import_module(module_path), name)
+    # Cached, so later accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def _import_lazy_names() -> None:
+    """Import every lazy name, so typing.get_type_hints() can resolve the annotations of the Agent."""
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
 
 @dataclass(init=False)
 class Agent:
@@ -218,6 +259,8 @@ class Agent:
     overwrite_db_session_state: bool = False
     # If True, cache the current Agent session in memory for faster access
     cache_session: bool = False
+    # Write the session to the database in the background, off the critical path of runs
+    session_writer: Optional["SessionWriter"] = None
 
     search_session_history: Optional[bool] = False
     num_history_sessions: Optional[int] = None
@@ -330,6 +373,8 @@ class Agent:
     send_media_to_model: bool = True
     # If True, store media in run output
     store_media: bool = True
+    # Store media content here and persist references in the session instead of inline base64
+    media_store: Optional[MediaStore] = None
     # If True, store tool results in run output
     store_tool_messages: bool = True
     # If True, store history messages in run output
@@ -483,6 +528,7 @@ class Agent:
         overwrite_db_session_state: bool = False,
         enable_agentic_state: bool = False,
         cache_session: bool = False,
+        session_writer: Optional["SessionWriter"] = None,
         search_session_history: Optional[bool] = False,
         num_history_sessions: Optional[int] = None,
         dependencies: Optional[Dict[str, Any]] = None,
@@ -503,6 +549,7 @@ class Agent:
         num_history_messages: Optional[int] = None,
         max_tool_calls_from_history: Optional[int] = None,
         store_media: bool = True,
+        media_store: Optional[MediaStore] = None,
         store_tool_messages: bool = True,
         store_history_messages: bool = True,
         knowledge: Optional[KnowledgeProtocol] = None,
@@ -587,6 +634,7 @@ class Agent:
         self.overwrite_db_session_state = overwrite_db_session_state
         self.enable_agentic_state = enable_agentic_state
         self.cache_session = cache_session
+        self.session_writer = session_writer
 
         self.search_session_history = search_session_history
         self.num_history_sessions = num_history_sessions
@@ -634,6 +682,7 @@ class Agent:
         self.max_tool_calls_from_history = max_tool_calls_from_history
 
         self.store_media = store_media
+        self.media_store = media_store
         self.store_tool_messages = store_tool_messages
         self.store_history_messages = store_history_messages
 
@@ -807,6 +856,8 @@ class Agent:
             log_warning("Database not provided. Cultural knowledge will not be stored.")
 
         if self.culture_manager is None:
+            from agno.culture.manager import CultureManager
+
             self.culture_manager = CultureManager(model=self.model, db=self.db)
         else:
             if self.culture_manager.model is None:
@@ -824,6 +875,8 @@ class Agent:
             log_warning("Database not provided. Memories will not be stored.")
 
         if self.memory_manager is None:
+            from agno.memory import MemoryManager
+
             self.memory_manager = MemoryManager(model=self.model, db=self.db)
         else:
             if self.memory_manager.model is None:
@@ -857,6 +910,8 @@ class Agent:
             self._learning = None
             return
 
+        from agno.learn.machine import LearningMachine
+
         # Handle learning=True: create default LearningMachine
         # Enables user_profile (structured fields) and user_memory (unstructured observations)
         if self.learning is True:
@@ -895,6 +950,8 @@ class Agent:
 
     def _set_compression_manager(self) -> None:
         if self.compress_tool_results and self.compression_manager is None:
+            from agno.compression.manager import CompressionManager
+
             self.compression_manager = CompressionManager(
                 model=self.model,
             )
@@ -1065,6 +1122,7 @@ class Agent:
         memory_future = None
         learning_future = None
         cultural_knowledge_future = None
+        context_assembly: Optional[ContextAssembly] = None
 
         try:
             # Register run for cancellation tracking
@@ -1076,6 +1134,13 @@ class Agent:
                 if num_attempts > 1:
                     log_debug(f"Retrying Agent run {run_response.run_id}. Attempt {attempt + 1} of {num_attempts}...")
                 try:
+                    # Start reading the context for the system message, concurrently with the run setup
+                    if context_assembly is not None:
+                        context_assembly.cancel()
+                    context_assembly = self._start_context_assembly(
+                        run_context=run_context, session_id=session.session_id
+                    )
+
                     # 1. Execute pre-hooks
                     run_input = cast(RunInput, run_response.input)
                     self.model = cast(Model, self.model)
@@ -1125,8 +1190,10 @@ class Agent:
                         add_dependencies_to_context=add_dependencies_to_context,
                         add_session_state_to_context=add_session_state_to_context,
                         tools=_tools,
+                        context_assembly=context_assembly,
                         **kwargs,
                     )
+                    self._record_context_assembly(run_response, context_assembly)
                     if len(run_messages.messages) == 0:
                         log_error("No messages to be sent to the model.")
 
@@ -1314,6 +1381,8 @@ class Agent:
 
                     return run_response
         finally:
+            if context_assembly is not None:
+                context_assembly.cancel()
             # Cancel background futures on error (wait_for_open_threads handles waiting on success)
             if memory_future is not None and not memory_future.done():
                 memory_future.cancel()
@@ -1362,6 +1431,7 @@ class Agent:
         memory_future = None
         learning_future = None
         cultural_knowledge_future = None
+        context_assembly: Optional[ContextAssembly] = None
 
         try:
             # Register run for cancellation tracking
@@ -1373,6 +1443,13 @@ class Agent:
                 if num_attempts > 1:
                     log_debug(f"Retrying Agent run {run_response.run_id}. Attempt {attempt + 1} of {num_attempts}...")
                 try:
+                    # Start reading the context for the system message, concurrently with the run setup
+                    if context_assembly is not None:
+                        context_assembly.cancel()
+                    context_assembly = self._start_context_assembly(
+                        run_context=run_context, session_id=session.session_id
+                    )
+
                     # 1. Execute pre-hooks
                     run_input = cast(RunInput, run_response.input)
                     self.model = cast(Model, self.model)
@@ -1423,8 +1500,10 @@ class Agent:
                         add_dependencies_to_context=add_dependencies_to_context,
                         add_session_state_to_context=add_session_state_to_context,
                         tools=_tools,
+                        context_assembly=context_assembly,
                         **kwargs,
                     )
+                    self._record_context_assembly(run_response, context_assembly)
                     if len(run_messages.messages) == 0:
                         log_error("No messages to be sent to the model.")
 
@@ -1724,6 +1803,8 @@ class Agent:
 
                     yield run_error
         finally:
+            if context_assembly is not None:
+                context_assembly.cancel()
             # Cancel background futures on error (wait_for_thread_tasks_stream handles waiting on success)
             if memory_future is not None and not memory_future.done():
                 memory_future.cancel()
@@ -2026,6 +2107,7 @@ class Agent:
         memory_task = None
         learning_task = None
         cultural_knowledge_task = None
+        context_assembly: Optional[ContextAssembly] = None
 
         # Set up retry logic
         num_attempts = self.retries + 1
@@ -2036,6 +2118,11 @@ class Agent:
                     log_debug(f"Retrying Agent run {run_response.run_id}. Attempt {attempt + 1} of {num_attempts}...")
 
                 try:
+                    # Start reading the context for the system message, concurrently with the run setup
+                    if context_assembly is not None:
+                        context_assembly.cancel()
+                    context_assembly = self._astart_context_assembly(run_context=run_context, session_id=session_id)
+
                     # 1. Read or create session. Reads from the database if provided.
                     agent_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
 
@@ -2105,8 +2192,10 @@ class Agent:
                         add_dependencies_to_context=add_dependencies_to_context,
                         add_session_state_to_context=add_session_state_to_context,
                         tools=_tools,
+                        context_assembly=context_assembly,
                         **kwargs,
                     )
+                    self._record_context_assembly(run_response, context_assembly)
                     if len(run_messages.messages) == 0:
                         log_error("No messages to be sent to the model.")
 
@@ -2312,6 +2401,8 @@ class Agent:
 
                     return run_response
         finally:
+            if context_assembly is not None:
+                context_assembly.cancel()
             # Always disconnect connectable tools
             self._disconnect_connectable_tools()
             # Always disconnect MCP tools
@@ -2381,6 +2472,7 @@ class Agent:
         memory_task = None
         cultural_knowledge_task = None
         learning_task = None
+        context_assembly: Optional[ContextAssembly] = None
 
         # 1. Read or create session. Reads from the database if provided.
         agent_session = await self._aread_or_create_session(session_id=session_id, user_id=user_id)
@@ -2393,6 +2485,11 @@ class Agent:
                     log_debug(f"Retrying Agent run {run_response.run_id}. Attempt {attempt + 1} of {num_attempts}...")
 
                 try:
+                    # Start reading the context for the system message, concurrently with the run setup
+                    if context_assembly is not None:
+                        context_assembly.cancel()
+                    context_assembly = self._astart_context_assembly(run_context=run_context, session_id=session_id)
+
                     # Start the Run by yielding a RunStarted event
                     if stream_events:
                         yield handle_event(  # type: ignore
@@ -2468,8 +2565,10 @@ class Agent:
                         add_dependencies_to_context=add_dependencies_to_context,
                         add_session_state_to_context=add_session_state_to_context,
                         tools=_tools,
+                        context_assembly=context_assembly,
                         **kwargs,
                     )
+                    self._record_context_assembly(run_response, context_assembly)
                     if len(run_messages.messages) == 0:
                         log_error("No messages to be sent to the model.")
 
@@ -2792,6 +2891,8 @@ class Agent:
                     # Yield the error event
                     yield run_error
         finally:
+            if context_assembly is not None:
+                context_assembly.cancel()
             # Always disconnect connectable tools
             self._disconnect_connectable_tools()
             # Always disconnect MCP tools
@@ -3215,6 +3316,8 @@ class Agent:
             run_response = next((r for r in runs if r.run_id == run_id), None)  # type: ignore
             if run_response is None:
                 raise RuntimeError(f"No runs found for run ID {run_id}")
+            if self.media_store is not None:
+                load_media_into_run_output(run_response, self.media_store)
 
             input = run_response.messages or []
 
@@ -3986,6 +4089,8 @@ class Agent:
                         run_response = next((r for r in runs if r.run_id == run_id), None)  # type: ignore
                         if run_response is None:
                             raise RuntimeError(f"No runs found for run ID {run_id}")
+                        if self.media_store is not None:
+                            load_media_into_run_output(run_response, self.media_store)
 
                         input = run_response.messages or []
 
@@ -4293,6 +4398,8 @@ class Agent:
                         run_response = next((r for r in runs if r.run_id == run_id), None)  # type: ignore
                         if run_response is None:
                             raise RuntimeError(f"No runs found for run ID {run_id}")
+                        if self.media_store is not None:
+                            load_media_into_run_output(run_response, self.media_store)
 
                         input = run_response.messages or []
 
@@ -6862,11 +6969,10 @@ class Agent:
                     if name in _function_names:
                         continue
                     _function_names.append(name)
-                    _func = _func.model_copy(deep=True)
-                    _func._agent = self
                     # Respect the function's explicit strict setting if set
                     effective_strict = strict if _func.strict is None else _func.strict
-                    _func.process_entrypoint(strict=effective_strict)
+                    _func = _func.get_processed_copy(strict=effective_strict)
+                    _func._agent = self
                     if strict and _func.strict is None:
                         _func.strict = True
                     if self.tool_hooks is not None:
@@ -6885,8 +6991,7 @@ class Agent:
 
                 # Respect the function's explicit strict setting if set
                 effective_strict = strict if tool.strict is None else tool.strict
-                tool.process_entrypoint(strict=effective_strict)
-                tool = tool.model_copy(deep=True)
+                tool = tool.get_processed_copy(strict=effective_strict)
 
                 tool._agent = self
                 if strict and tool.strict is None:
@@ -6908,8 +7013,7 @@ class Agent:
                         continue
                     _function_names.append(function_name)
 
-                    _func = Function.from_callable(tool, strict=strict)
-                    _func = _func.model_copy(deep=True)
+                    _func = Function.from_callable_cached(tool, strict=strict)
                     _func._agent = self
                     if strict:
                         _func.strict = True
@@ -7130,7 +7234,10 @@ class Agent:
         try:
             if not self.db:
                 raise ValueError("Db not initialized")
-            return self.db.get_session(session_id=session_id, session_type=session_type)  # type: ignore
+            if self.session_writer is not None:
+                self.session_writer.wait_for_writes(self.db, session_id)
+            session = self.db.get_session(session_id=session_id, session_type=session_type)
+            return session  # type: ignore
         except Exception as e:
             import traceback
 
@@ -7145,7 +7252,10 @@ class Agent:
         try:
             if not self.db:
                 raise ValueError("Db not initialized")
-            return await self.db.get_session(session_id=session_id, session_type=session_type)  # type: ignore
+            if self.session_writer is not None:
+                await self.session_writer.await_for_writes(self.db, session_id)
+            session = await self.db.get_session(session_id=session_id, session_type=session_type)  # type: ignore
+            return session  # type: ignore
         except Exception as e:
             import traceback
 
@@ -8191,6 +8301,9 @@ class Agent:
                 session.session_data["session_state"].pop("current_user_id", None)
                 session.session_data["session_state"].pop("current_run_id", None)
 
+            if self.session_writer is not None:
+                self.session_writer.save(self.db, session)  # type: ignore
+                return
             self._upsert_session(session=session)
             log_debug(f"Created or updated AgentSession record: {session.session_id}")
 
@@ -8209,6 +8322,9 @@ class Agent:
                 session.session_data["session_state"].pop("current_session_id", None)
                 session.session_data["session_state"].pop("current_user_id", None)
                 session.session_data["session_state"].pop("current_run_id", None)
+            if self.session_writer is not None:
+                await self.session_writer.asave(self.db, session)
+                return
             if self._has_async_db():
                 await self._aupsert_session(session=session)
             else:
@@ -8482,6 +8598,7 @@ class Agent:
         """Delete the current session and save to storage"""
         if self.db is None:
             return
+
         await self.db.delete_session(session_id=session_id)  # type: ignore
 
     def get_session_messages(
@@ -8705,6 +8822,142 @@ class Agent:
 
         return await self.culture_manager.aget_all_knowledge()
 
+    # -*- Context Assembly Functions
+    def _get_context_managers(self) -> Tuple[Optional["MemoryManager"], Optional["CultureManager"]]:
+        """Return the managers to read memories and cultural knowledge for the system message with.
+
+        The system message reads them with default managers when none are set, without keeping those on the Agent.
+        """
+        memory_manager = None
+        if self.add_memories_to_context:
+            memory_manager = self.memory_manager
+            if memory_manager is None:
+                from agno.memory import MemoryManager
+
+                memory_manager = MemoryManager(model=self.model, db=self.db)
+
+        culture_manager = None
+        if self.add_culture_to_context:
+            culture_manager = self.culture_manager
+            if not culture_manager:
+                from agno.culture.manager import CultureManager
+
+                culture_manager = CultureManager(model=self.model, db=self.db)
+
+        return memory_manager, culture_manager
+
+    def _start_context_assembly(self, run_context: RunContext, session_id: str) -> ContextAssembly:
+        """Start reading the memories, cultural knowledge and learnings for the system message.
+
+        They don't depend on the pre-hooks or tools, so they are read concurrently with those.
+        """
+        context_assembly = ContextAssembly()
+        if self.system_message is not None or not self.build_context:
+            return context_assembly
+
+        memory_manager, culture_manager = self._get_context_managers()
+        user_id = run_context.user_id
+        if memory_manager is not None:
+            # Memories are read for the default user if no user_id is set, and so are learnings
+            user_id = user_id or "default"
+            context_assembly.add("memories", lambda: memory_manager.get_user_memories(user_id=user_id))
+        if culture_manager is not None:
+            context_assembly.add("culture", culture_manager.get_all_knowledge)
+        learning = self._learning
+        if learning is not None and self.add_learnings_to_context:
+            store_latencies = context_assembly.stage_timings.setdefault("learnings", {})
+            context_assembly.add(
+                "learnings",
+                lambda: learning.build_context(
+                    user_id=user_id, session_id=session_id, agent_id=self.id, store_latencies=store_latencies
+                ),
+            )
+        return context_assembly
+
+    def _astart_context_assembly(self, run_context: RunContext, session_id: str) -> ContextAssembly:
+        """Start reading the memories, cultural knowledge and learnings for the system message.
+
+        They don't depend on the session, pre-hooks or tools, so they are read concurrently with those.
+        """
+        context_assembly = ContextAssembly()
+        if self.system_message is not None or not self.build_context:
+            return context_assembly
+
+        memory_manager, culture_manager = self._get_context_managers()
+        user_id = run_context.user_id
+        if memory_manager is not None:
+            user_id = user_id or "default"
+            if self._has_async_db():
+                context_assembly.aadd("memories", lambda: memory_manager.aget_user_memories(user_id=user_id))
+            else:
+                context_assembly.add("memories", lambda: memory_manager.get_user_memories(user_id=user_id))
+        if culture_manager is not None:
+            context_assembly.aadd("culture", culture_manager.aget_all_knowledge)
+        learning = self._learning
+        if learning is not None and self.add_learnings_to_context:
+            store_latencies = context_assembly.stage_timings.setdefault("learnings", {})
+            context_assembly.aadd(
+                "learnings",
+                lambda: learning.abuild_context(
+                    user_id=user_id, session_id=session_id, agent_id=self.id, store_latencies=store_latencies
+                ),
+            )
+        return context_assembly
+
+    def _start_knowledge_search(
+        self,
+        context_assembly: ContextAssembly,
+        input: Any,
+        run_context: Optional[RunContext] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Start searching the knowledge for references to add to the user message, while the system message is built."""
+        if not (self.add_knowledge_to_context and self.build_user_context and isinstance(input, str)):
+            return
+        knowledge_filters = run_context.knowledge_filters if run_context else None
+        context_assembly.add(
+            "knowledge",
+            lambda: self.get_relevant_docs_from_knowledge(
+                query=input, filters=knowledge_filters, run_context=run_context, **kwargs
+            ),
+        )
+
+    def _astart_knowledge_search(
+        self,
+        context_assembly: ContextAssembly,
+        input: Any,
+        run_context: Optional[RunContext] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Start searching the knowledge for references to add to the user message, while the system message is built."""
+        if not (self.add_knowledge_to_context and self.build_user_context and isinstance(input, str)):
+            return
+        knowledge_filters = run_context.knowledge_filters if run_context else None
+        context_assembly.aadd(
+            "knowledge",
+            lambda: self.aget_relevant_docs_from_knowledge(
+                query=input, filters=knowledge_filters, run_context=run_context, **kwargs
+            ),
+        )
+
+    def _record_context_assembly(self, run_response: RunOutput, context_assembly: ContextAssembly) -> None:
+        """Add the time spent in each stage of the context assembly, and in each learning store, to the run metrics."""
+        if not context_assembly.timings:
+            return
+        if run_response.metrics is None:
+            run_response.metrics = Metrics()
+        if run_response.metrics.additional_metrics is None:
+            run_response.metrics.additional_metrics = {}
+        run_response.metrics.additional_metrics["context_assembly"] = {
+            name: round(elapsed, 4) for name, elapsed in context_assembly.timings.items()
+        }
+        # Latency of each learning store read for the context of this run
+        learning_latencies = context_assembly.stage_timings.get("learnings")
+        if learning_latencies:
+            run_response.metrics.additional_metrics["learning_stores"] = {
+                name: round(elapsed, 4) for name, elapsed in learning_latencies.items()
+            }
+
     # -*- System & User Message Functions
     def _format_message_with_state_variables(
         self,
@@ -8755,6 +9008,7 @@ class Agent:
         run_context: Optional[RunContext] = None,
         tools: Optional[List[Union[Function, dict]]] = None,
         add_session_state_to_context: Optional[bool] = None,
+        context_assembly: Optional[ContextAssembly] = None,
     ) -> Optional[Message]:
         """Return the system message for the Agent.
 
@@ -8925,11 +9179,14 @@ class Agent:
             _memory_manager_not_set = False
             if not user_id:
                 user_id = "default"
-            if self.memory_manager is None:
-                self._set_memory_manager()
-                _memory_manager_not_set = True
+            if context_assembly is not None and context_assembly.has("memories"):
+                user_memories = context_assembly.result("memories")
+            else:
+                if self.memory_manager is None:
+                    self._set_memory_manager()
+                    _memory_manager_not_set = True
 
-            user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
+                user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
 
             if user_memories and len(user_memories) > 0:
                 system_message_content += "You have access to user info and preferences from previous interactions that you can use to personalize your response:\n\n"
@@ -8964,11 +9221,14 @@ class Agent:
         # 3.3.10 Then add cultural knowledge to the system prompt
         if self.add_culture_to_context:
             _culture_manager_not_set = None
-            if not self.culture_manager:
-                self._set_culture_manager()
-                _culture_manager_not_set = True
+            if context_assembly is not None and context_assembly.has("culture"):
+                cultural_knowledge = context_assembly.result("culture")
+            else:
+                if not self.culture_manager:
+                    self._set_culture_manager()
+                    _culture_manager_not_set = True
 
-            cultural_knowledge = self.culture_manager.get_all_knowledge()  # type: ignore
+                cultural_knowledge = self.culture_manager.get_all_knowledge()  # type: ignore
 
             if cultural_knowledge and len(cultural_knowledge) > 0:
                 system_message_content += (
@@ -9035,11 +9295,14 @@ class Agent:
 
         # 3.3.12 then add learnings to the system prompt
         if self._learning is not None and self.add_learnings_to_context:
-            learning_context = self._learning.build_context(
-                user_id=user_id,
-                session_id=session.session_id if session else None,
-                agent_id=self.id,
-            )
+            if context_assembly is not None and context_assembly.has("learnings"):
+                learning_context = context_assembly.result("learnings")
+            else:
+                learning_context = self._learning.build_context(
+                    user_id=user_id,
+                    session_id=session.session_id if session else None,
+                    agent_id=self.id,
+                )
             if learning_context:
                 system_message_content += learning_context + "\n"
 
@@ -9091,6 +9354,7 @@ class Agent:
         run_context: Optional[RunContext] = None,
         tools: Optional[List[Union[Function, dict]]] = None,
         add_session_state_to_context: Optional[bool] = None,
+        context_assembly: Optional[ContextAssembly] = None,
     ) -> Optional[Message]:
         """Return the system message for the Agent.
 
@@ -9262,14 +9526,17 @@ class Agent:
             _memory_manager_not_set = False
             if not user_id:
                 user_id = "default"
-            if self.memory_manager is None:
-                self._set_memory_manager()
-                _memory_manager_not_set = True
-
-            if self._has_async_db():
-                user_memories = await self.memory_manager.aget_user_memories(user_id=user_id)  # type: ignore
+            if context_assembly is not None and context_assembly.has("memories"):
+                user_memories = await context_assembly.aresult("memories")
             else:
-                user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
+                if self.memory_manager is None:
+                    self._set_memory_manager()
+                    _memory_manager_not_set = True
+
+                if self._has_async_db():
+                    user_memories = await self.memory_manager.aget_user_memories(user_id=user_id)  # type: ignore
+                else:
+                    user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
 
             if user_memories and len(user_memories) > 0:
                 system_message_content += "You have access to user info and preferences from previous interactions that you can use to personalize your response:\n\n"
@@ -9304,11 +9571,14 @@ class Agent:
         # 3.3.10 Then add cultural knowledge to the system prompt
         if self.add_culture_to_context:
             _culture_manager_not_set = None
-            if not self.culture_manager:
-                self._set_culture_manager()
-                _culture_manager_not_set = True
+            if context_assembly is not None and context_assembly.has("culture"):
+                cultural_knowledge = await context_assembly.aresult("culture")
+            else:
+                if not self.culture_manager:
+                    self._set_culture_manager()
+                    _culture_manager_not_set = True
 
-            cultural_knowledge = await self.culture_manager.aget_all_knowledge()  # type: ignore
+                cultural_knowledge = await self.culture_manager.aget_all_knowledge()  # type: ignore
 
             if cultural_knowledge and len(cultural_knowledge) > 0:
                 system_message_content += (
@@ -9375,11 +9645,14 @@ class Agent:
 
         # 3.3.12 then add learnings to the system prompt
         if self._learning is not None and self.add_learnings_to_context:
-            learning_context = await self._learning.abuild_context(
-                user_id=user_id,
-                session_id=session.session_id if session else None,
-                agent_id=self.id,
-            )
+            if context_assembly is not None and context_assembly.has("learnings"):
+                learning_context = await context_assembly.aresult("learnings")
+            else:
+                learning_context = await self._learning.abuild_context(
+                    user_id=user_id,
+                    session_id=session.session_id if session else None,
+                    agent_id=self.id,
+                )
             if learning_context:
                 system_message_content += learning_context + "\n"
 
@@ -9447,6 +9720,7 @@ class Agent:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         add_dependencies_to_context: Optional[bool] = None,
+        context_assembly: Optional[ContextAssembly] = None,
         **kwargs: Any,
     ) -> Optional[Message]:
         """Return the user message for the Agent.
@@ -9539,23 +9813,29 @@ class Agent:
                         raise Exception("message must be a string or a callable when add_references is True")
 
                     try:
-                        retrieval_timer = Timer()
-                        retrieval_timer.start()
-                        docs_from_knowledge = self.get_relevant_docs_from_knowledge(
-                            query=user_msg_content, filters=knowledge_filters, run_context=run_context, **kwargs
-                        )
+                        if context_assembly is not None and context_assembly.has("knowledge"):
+                            # The search started with the run messages
+                            docs_from_knowledge = context_assembly.result("knowledge")
+                            retrieval_time = context_assembly.timings["knowledge"]
+                        else:
+                            retrieval_timer = Timer()
+                            retrieval_timer.start()
+                            docs_from_knowledge = self.get_relevant_docs_from_knowledge(
+                                query=user_msg_content, filters=knowledge_filters, run_context=run_context, **kwargs
+                            )
+                            retrieval_timer.stop()
+                            retrieval_time = retrieval_timer.elapsed
                         if docs_from_knowledge is not None:
                             references = MessageReferences(
                                 query=user_msg_content,
                                 references=docs_from_knowledge,
-                                time=round(retrieval_timer.elapsed, 4),
+                                time=round(retrieval_time, 4),
                             )
                             # Add the references to the run_response
                             if run_response.references is None:
                                 run_response.references = []
                             run_response.references.append(references)
-                        retrieval_timer.stop()
-                        log_debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+                        log_debug(f"Time to get references: {retrieval_time:.4f}s")
                     except Exception as e:
                         log_warning(f"Failed to get references: {e}")
 
@@ -9610,6 +9890,7 @@ class Agent:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         add_dependencies_to_context: Optional[bool] = None,
+        context_assembly: Optional[ContextAssembly] = None,
         **kwargs: Any,
     ) -> Optional[Message]:
         """Return the user message for the Agent (async version).
@@ -9702,23 +9983,29 @@ class Agent:
                         raise Exception("message must be a string or a callable when add_references is True")
 
                     try:
-                        retrieval_timer = Timer()
-                        retrieval_timer.start()
-                        docs_from_knowledge = await self.aget_relevant_docs_from_knowledge(
-                            query=user_msg_content, filters=knowledge_filters, run_context=run_context, **kwargs
-                        )
+                        if context_assembly is not None and context_assembly.has("knowledge"):
+                            # The search started with the run messages
+                            docs_from_knowledge = await context_assembly.aresult("knowledge")
+                            retrieval_time = context_assembly.timings["knowledge"]
+                        else:
+                            retrieval_timer = Timer()
+                            retrieval_timer.start()
+                            docs_from_knowledge = await self.aget_relevant_docs_from_knowledge(
+                                query=user_msg_content, filters=knowledge_filters, run_context=run_context, **kwargs
+                            )
+                            retrieval_timer.stop()
+                            retrieval_time = retrieval_timer.elapsed
                         if docs_from_knowledge is not None:
                             references = MessageReferences(
                                 query=user_msg_content,
                                 references=docs_from_knowledge,
-                                time=round(retrieval_timer.elapsed, 4),
+                                time=round(retrieval_time, 4),
                             )
                             # Add the references to the run_response
                             if run_response.references is None:
                                 run_response.references = []
                             run_response.references.append(references)
-                        retrieval_timer.stop()
-                        log_debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+                        log_debug(f"Time to get references: {retrieval_time:.4f}s")
                     except Exception as e:
                         log_warning(f"Failed to get references: {e}")
 
@@ -9778,6 +10065,7 @@ class Agent:
         add_dependencies_to_context: Optional[bool] = None,
         add_session_state_to_context: Optional[bool] = None,
         tools: Optional[List[Union[Function, dict]]] = None,
+        context_assembly: Optional[ContextAssembly] = None,
         **kwargs: Any,
     ) -> RunMessages:
         """This function returns a RunMessages object with the following attributes:
@@ -9807,12 +10095,17 @@ class Agent:
         # Initialize the RunMessages object (no media here - that's in RunInput now)
         run_messages = RunMessages()
 
+        # Search the knowledge for the user message while the system message is built
+        if context_assembly is not None:
+            self._start_knowledge_search(context_assembly, input=input, run_context=run_context, **kwargs)
+
         # 1. Add system message to run_messages
         system_message = self.get_system_message(
             session=session,
             run_context=run_context,
             tools=tools,
             add_session_state_to_context=add_session_state_to_context,
+            context_assembly=context_assembly,
         )
         if system_message is not None:
             run_messages.system_message = system_message
@@ -9847,8 +10140,6 @@ class Agent:
 
         # 3. Add history to run_messages
         if add_history_to_context:
-            from copy import deepcopy
-
             # Only skip messages from history when system_message_role is NOT a standard conversation role.
             # Standard conversation roles ("user", "assistant", "tool") should never be filtered
             # to preserve conversation continuity.
@@ -9864,17 +10155,19 @@ class Agent:
             )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Tag shallow copies of the history messages as coming from history. Copies share their content, and
+                # nested objects such as media, with the messages of the stored runs, so they must only be changed by
+                # assigning fields. Shared objects are replaced by changed copies, never mutated in place
+                history_copy = [msg.model_copy(update={"from_history": True}) for msg in history]
 
                 # Filter tool calls from history if limit is set (before adding to run_messages)
                 if self.max_tool_calls_from_history is not None:
                     filter_tool_calls(history_copy, self.max_tool_calls_from_history)
 
+                # Only the media of the history window are read from the media store, into copies of the media
+                if self.media_store is not None:
+                    load_media_into_messages(history_copy, self.media_store)
+
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
                 run_messages.messages += history_copy
@@ -9903,6 +10196,7 @@ class Agent:
                 videos=videos,
                 files=files,
                 add_dependencies_to_context=add_dependencies_to_context,
+                context_assembly=context_assembly,
                 **kwargs,
             )
 
@@ -9981,6 +10275,7 @@ class Agent:
         add_session_state_to_context: Optional[bool] = None,
         metadata: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Union[Function, dict]]] = None,
+        context_assembly: Optional[ContextAssembly] = None,
         **kwargs: Any,
     ) -> RunMessages:
         """This function returns a RunMessages object with the following attributes:
@@ -10010,12 +10305,17 @@ class Agent:
         # Initialize the RunMessages object (no media here - that's in RunInput now)
         run_messages = RunMessages()
 
+        # Search the knowledge for the user message while the system message is built
+        if context_assembly is not None:
+            self._astart_knowledge_search(context_assembly, input=input, run_context=run_context, **kwargs)
+
         # 1. Add system message to run_messages
         system_message = await self.aget_system_message(
             session=session,
             run_context=run_context,
             tools=tools,
             add_session_state_to_context=add_session_state_to_context,
+            context_assembly=context_assembly,
         )
         if system_message is not None:
             run_messages.system_message = system_message
@@ -10050,8 +10350,6 @@ class Agent:
 
         # 3. Add history to run_messages
         if add_history_to_context:
-            from copy import deepcopy
-
             # Only skip messages from history when system_message_role is NOT a standard conversation role.
             # Standard conversation roles ("user", "assistant", "tool") should never be filtered
             # to preserve conversation continuity.
@@ -10067,17 +10365,19 @@ class Agent:
             )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Tag shallow copies of the history messages as coming from history. Copies share their content, and
+                # nested objects such as media, with the messages of the stored runs, so they must only be changed by
+                # assigning fields. Shared objects are replaced by changed copies, never mutated in place
+                history_copy = [msg.model_copy(update={"from_history": True}) for msg in history]
 
                 # Filter tool calls from history if limit is set (before adding to run_messages)
                 if self.max_tool_calls_from_history is not None:
                     filter_tool_calls(history_copy, self.max_tool_calls_from_history)
 
+                # Only the media of the history window are read from the media store, into copies of the media
+                if self.media_store is not None:
+                    load_media_into_messages(history_copy, self.media_store)
+
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
                 run_messages.messages += history_copy
@@ -10106,6 +10406,7 @@ class Agent:
                 videos=videos,
                 files=files,
                 add_dependencies_to_context=add_dependencies_to_context,
+                context_assembly=context_assembly,
                 **kwargs,
             )
 
@@ -10589,6 +10890,7 @@ class Agent:
             "compression_manager",
             "learning",
             "skills",
+            "session_writer",
         ):
             return field_value
 
@@ -11270,7 +11572,7 @@ class Agent:
             Returns:
                 str: A string indicating the status of the task.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = self.memory_manager.update_memory_task(task=task, user_id=user_id)
 
             return response
@@ -11286,7 +11588,7 @@ class Agent:
             Returns:
                 str: A string indicating the status of the task.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = await self.memory_manager.aupdate_memory_task(task=task, user_id=user_id)
             return response
 
@@ -11300,14 +11602,14 @@ class Agent:
     def _get_update_cultural_knowledge_function(self, async_mode: bool = False) -> Function:
         def update_cultural_knowledge(task: str) -> str:
             """Use this function to update a cultural knowledge."""
-            self.culture_manager = cast(CultureManager, self.culture_manager)
+            self.culture_manager = cast("CultureManager", self.culture_manager)
             response = self.culture_manager.update_culture_task(task=task)
 
             return response
 
         async def aupdate_cultural_knowledge(task: str) -> str:
             """Use this function to update a cultural knowledge asynchronously."""
-            self.culture_manager = cast(CultureManager, self.culture_manager)
+            self.culture_manager = cast("CultureManager", self.culture_manager)
             response = await self.culture_manager.aupdate_culture_task(task=task)
             return response
 
@@ -11904,6 +12206,8 @@ class Agent:
         if "stream_events" in kwargs:
             kwargs.pop("stream_events")
 
+        from agno.utils.print_response.agent import print_response, print_response_stream
+
         if stream:
             print_response_stream(
                 agent=self,
@@ -12005,6 +12309,8 @@ class Agent:
         if "stream_events" in kwargs:
             kwargs.pop("stream_events")
 
+        from agno.utils.print_response.agent import aprint_response, aprint_response_stream
+
         if stream:
             await aprint_response_stream(
                 agent=self,
@@ -12215,8 +12521,11 @@ class Agent:
             user_id=user_id,
         )
 
-        # Add RunOutput to Agent Session
-        session.upsert_run(run=run_response)
+        # Add RunOutput to Agent Session, storing its media in the media store if set
+        if self.media_store is not None:
+            session.upsert_run(run=offload_media_from_run_output(run_response, self.media_store))  # type: ignore
+        else:
+            session.upsert_run(run=run_response)
 
         # Calculate session metrics
         self._update_session_metrics(session=session, run_response=run_response)
@@ -12251,8 +12560,11 @@ class Agent:
             user_id=user_id,
         )
 
-        # Add RunOutput to Agent Session
-        session.upsert_run(run=run_response)
+        # Add RunOutput to Agent Session, storing its media in the media store if set
+        if self.media_store is not None:
+            session.upsert_run(run=offload_media_from_run_output(run_response, self.media_store))  # type: ignore
+        else:
+            session.upsert_run(run=run_response)
 
         # Calculate session metrics
         self._update_session_metrics(session=session, run_response=run_response)
@@ -12448,6 +12760,9 @@ class Agent:
             log_debug(f"Could not create Agent run telemetry event: {e}")
 
 
+Agent.__annotations__ = LazyAnnotations(Agent.__annotations__, _import_lazy_names)
+
+
 def get_agent_by_id(
     db: "BaseDb",
     id: str,
@@ -377,6 +377,10 @@ class AgentOSClient:
             Parsed event objects
         """
         from agno.utils.log import logger
+        from agno.utils.sse import DeltaStreamDecoder
+
+        # Expands delta-format content events, full-format events pass through unchanged
+        decoder = DeltaStreamDecoder()
 
         async for line in raw_stream:
             # Skip empty lines and comments (SSE protocol)
@@ -388,7 +392,7 @@ class AgentOSClient:
                 try:
                     # Extract and parse JSON payload
                     json_str = line[6:]  # Remove "data: " prefix
-                    event_dict = json.loads(json_str)
+                    event_dict = decoder.decode(json.loads(json_str))
 
                     # Parse into typed event using provided factory
                     event = event_parser(event_dict)
@@ -620,7 +624,8 @@ class AgentOSClient:
             videos: Optional list of Video objects
             files: Optional list of MediaFile objects
             headers: HTTP headers to include in the request (optional)
-            **kwargs: Additional parameters (session_state, dependencies, metadata, etc.)
+            **kwargs: Additional parameters (session_state, dependencies, metadata, etc.).
+                Pass stream_format="delta" to receive content events as compact deltas (decoded transparently).
 
         Yields:
             RunOutputEvent: Typed event objects (RunStartedEvent, RunContentEvent, etc.)
@@ -892,7 +897,8 @@ class AgentOSClient:
             videos: Optional list of videos
             files: Optional list of files
             headers: HTTP headers to include in the request (optional)
-            **kwargs: Additional parameters passed to the team run
+            **kwargs: Additional parameters passed to the team run.
+                Pass stream_format="delta" to receive content events as compact deltas (decoded transparently).
 
         Yields:
             TeamRunOutputEvent: Typed event objects (team and agent events)
@@ -1078,6 +1084,7 @@ class AgentOSClient:
             files: Optional list of files
             headers: HTTP headers to include in the request (optional)
             **kwargs: Additional parameters passed to the workflow run.
+                Pass stream_format="delta" to receive content events as compact deltas (decoded transparently).
 
         Yields:
             WorkflowRunOutputEvent: Typed event objects (workflow, team, and agent events)
@@ -1203,6 +1210,8 @@ class AgentOSClient:
         page: int = 1,
         sort_by: str = "updated_at",
         sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        count_total: bool = True,
         db_id: Optional[str] = None,
         table: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -1219,6 +1228,8 @@ class AgentOSClient:
             page: Page number
             sort_by: Field to sort by
             sort_order: Sort order (asc or desc)
+            cursor: Cursor from the previous page's meta.next_cursor. Takes precedence over page.
+            count_total: Whether to count all matching items. Skipping the count is faster on large tables.
             db_id: Optional database ID to use
             table: Optional table name to use
             headers: HTTP headers to include in the request (optional)
@@ -1234,6 +1245,8 @@ class AgentOSClient:
             "page": page,
             "sort_by": sort_by,
             "sort_order": sort_order,
+            "cursor": cursor,
+            "count_total": None if count_total else "false",
             "db_id": db_id,
             "table": table,
             "user_id": user_id,
@@ -1494,6 +1507,8 @@ class AgentOSClient:
         page: int = 1,
         sort_by: str = "created_at",
         sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        count_total: bool = True,
         db_id: Optional[str] = None,
         table: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -1509,6 +1524,8 @@ class AgentOSClient:
             page: Page number
             sort_by: Field to sort by
             sort_order: Sort order (asc or desc)
+            cursor: Cursor from the previous page's meta.next_cursor. Takes precedence over page.
+            count_total: Whether to count all matching items. Skipping the count is faster on large tables.
             db_id: Optional database ID to use
             table: Optional table name to use
             headers: HTTP headers to include in the request (optional)
@@ -1522,6 +1539,8 @@ class AgentOSClient:
             "page": str(page),
             "sort_by": sort_by,
             "sort_order": sort_order,
+            "cursor": cursor,
+            "count_total": None if count_total else "false",
             "db_id": db_id,
             "table": table,
             "user_id": user_id,
@@ -1852,6 +1871,8 @@ class AgentOSClient:
         page: int = 1,
         sort_by: str = "created_at",
         sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        count_total: bool = True,
         db_id: Optional[str] = None,
         table: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -1869,6 +1890,8 @@ class AgentOSClient:
             page: Page number
             sort_by: Field to sort by
             sort_order: Sort order (asc or desc)
+            cursor: Cursor from the previous page's meta.next_cursor. Takes precedence over page.
+            count_total: Whether to count all matching items. Skipping the count is faster on large tables.
             db_id: Optional database ID to use
             table: Optional table name to use
             headers: HTTP headers to include in the request (optional)
@@ -1884,6 +1907,8 @@ class AgentOSClient:
             "page": page,
             "sort_by": sort_by,
             "sort_order": sort_order,
+            "cursor": cursor,
+            "count_total": None if count_total else "false",
             "agent_id": agent_id,
             "team_id": team_id,
             "workflow_id": workflow_id,
@@ -2459,6 +2484,8 @@ class AgentOSClient:
         end_time: Optional[str] = None,
         page: int = 1,
         limit: int = 20,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
         db_id: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> PaginatedResponse[TraceSummary]:
@@ -2479,6 +2506,8 @@ class AgentOSClient:
             end_time: Filter traces ending before this time (ISO 8601 format)
             page: Page number (1-indexed)
             limit: Number of traces per page
+            cursor: Cursor from the previous page's meta.next_cursor. Takes precedence over page.
+            count_total: Whether to count all matching items. Skipping the count is faster on large tables.
             db_id: Optional database ID to use
             headers: HTTP headers to include in the request (optional)
 
@@ -2491,6 +2520,8 @@ class AgentOSClient:
         params: Dict[str, Any] = {
             "page": page,
             "limit": limit,
+            "cursor": cursor,
+            "count_total": None if count_total else "false",
             "run_id": run_id,
             "session_id": session_id,
             "user_id": user_id,
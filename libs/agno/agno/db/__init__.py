@@ -8,7 +8,11 @@ __all__ = [
 
 def __getattr__(name: str):
     """Lazy import for database implementations to avoid forcing all dependencies."""
-    if name == "DynamoDb":
+    if name == "AsyncDbAdapter":
+        from agno.db.async_adapter import AsyncDbAdapter
+
+        return AsyncDbAdapter
+    elif name == "DynamoDb":
         from agno.db.dynamo import DynamoDb
 
         return DynamoDb
@@ -20,5 +24,9 @@ def __getattr__(name: str):
         from agno.db.postgres import PostgresDb
 
         return PostgresDb
+    elif name == "SessionWriter":
+        from agno.db.session_writer import SessionWriter
+
+        return SessionWriter
     # Add other db implementations as needed
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
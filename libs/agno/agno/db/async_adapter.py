@@ -0,0 +1,520 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import partial
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from agno.db.base import AsyncBaseDb, BaseDb, SessionType
+from agno.db.schemas import UserMemory
+from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
+from agno.db.schemas.knowledge import KnowledgeRow
+from agno.session import Session
+from agno.utils.log import log_debug
+
+
+class AsyncDbAdapter(AsyncBaseDb):
+    def __init__(self, db: BaseDb, max_workers: int = 4, id: Optional[str] = None):
+        """
+        Async interface over a sync database, for backends without a native async driver (e.g. RedisDb, DynamoDb).
+
+        Every call runs on a dedicated pool of single-threaded workers, so the event loop never blocks on storage I/O.
+        Calls for the same session (or user) are always routed to the same worker. This keeps them ordered and pins
+        them to one thread, so backends holding thread-bound connections keep using the same connection.
+
+        Args:
+            db (BaseDb): The sync database to wrap.
+            max_workers (int): Number of worker threads. Use 1 for clients that are not thread-safe.
+            id (Optional[str]): ID of the database. Defaults to the ID of the wrapped database.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        super().__init__(
+            id=id or db.id,
+            session_table=db.session_table_name,
+            memory_table=db.memory_table_name,
+            metrics_table=db.metrics_table_name,
+            eval_table=db.eval_table_name,
+            knowledge_table=db.knowledge_table_name,
+            traces_table=db.trace_table_name,
+            spans_table=db.span_table_name,
+            culture_table=db.culture_table_name,
+            versions_table=db.versions_table_name,
+            learnings_table=db.learnings_table_name,
+        )
+
+        self.db: BaseDb = db
+        self.max_workers: int = max_workers
+        self._workers: List[ThreadPoolExecutor] = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"agno-db-{self.id[:8]}-{i}")
+            for i in range(max_workers)
+        ]
+        self._round_robin = count()
+
+    def _get_worker(self, affinity_key: Optional[str]) -> ThreadPoolExecutor:
+        if affinity_key is None:
+            return self._workers[next(self._round_robin) % self.max_workers]
+        return self._workers[hash(affinity_key) % self.max_workers]
+
+    async def _run(self, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        """Run a blocking database call on a worker thread, keyed by the session or user it touches."""
+        session = kwargs.get("session")
+        affinity_key = kwargs.get("session_id") or getattr(session, "session_id", None) or kwargs.get("user_id")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_worker(affinity_key), partial(fn, **kwargs))
+
+    async def _create_all_tables(self) -> None:
+        create_all_tables = getattr(self.db, "_create_all_tables", None)
+        if callable(create_all_tables):
+            await self._run(create_all_tables)
+
+    async def close(self) -> None:
+        """Close the wrapped database and shut down the worker threads."""
+        try:
+            await self._run(self.db.close)
+        finally:
+            for worker in self._workers:
+                worker.shutdown(wait=False)
+            log_debug(f"Closed async adapter for {self.db.__class__.__name__}")
+
+    async def table_exists(self, table_name: str) -> bool:
+        return await self._run(self.db.table_exists, table_name=table_name)
+
+    async def get_latest_schema_version(self, table_name: str) -> str:
+        return await self._run(self.db.get_latest_schema_version, table_name=table_name)
+
+    async def upsert_schema_version(self, table_name: str, version: str):
+        return await self._run(self.db.upsert_schema_version, table_name=table_name, version=version)
+
+    async def delete_session(self, session_id: str) -> bool:
+        return await self._run(self.db.delete_session, session_id=session_id)
+
+    async def delete_sessions(self, session_ids: List[str]) -> None:
+        return await self._run(self.db.delete_sessions, session_ids=session_ids)
+
+    async def get_session(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        return await self._run(
+            self.db.get_session,
+            session_id=session_id,
+            session_type=session_type,
+            user_id=user_id,
+            deserialize=deserialize,
+        )
+
+    async def get_sessions(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
+    ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
+        return await self._run(
+            self.db.get_sessions,
+            session_type=session_type,
+            user_id=user_id,
+            component_id=component_id,
+            session_name=session_name,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            deserialize=deserialize,
+            columns=columns,
+            cursor=cursor,
+            count_total=count_total,
+        )
+
+    async def rename_session(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        session_name: str,
+        deserialize: Optional[bool] = True,
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        return await self._run(
+            self.db.rename_session,
+            session_id=session_id,
+            session_type=session_type,
+            session_name=session_name,
+            deserialize=deserialize,
+        )
+
+    async def upsert_session(
+        self, session: Session, deserialize: Optional[bool] = True
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        return await self._run(self.db.upsert_session, session=session, deserialize=deserialize)
+
+    async def clear_memories(self) -> None:
+        return await self._run(self.db.clear_memories)
+
+    async def delete_user_memory(self, memory_id: str, user_id: Optional[str] = None) -> None:
+        return await self._run(self.db.delete_user_memory, memory_id=memory_id, user_id=user_id)
+
+    async def delete_user_memories(self, memory_ids: List[str], user_id: Optional[str] = None) -> None:
+        return await self._run(self.db.delete_user_memories, memory_ids=memory_ids, user_id=user_id)
+
+    async def get_all_memory_topics(self, user_id: Optional[str] = None) -> List[str]:
+        return await self._run(self.db.get_all_memory_topics, user_id=user_id)
+
+    async def get_user_memory(
+        self,
+        memory_id: str,
+        deserialize: Optional[bool] = True,
+        user_id: Optional[str] = None,
+    ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
+        return await self._run(self.db.get_user_memory, memory_id=memory_id, deserialize=deserialize, user_id=user_id)
+
+    async def get_user_memories(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        topics: Optional[List[str]] = None,
+        search_content: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
+    ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
+        return await self._run(
+            self.db.get_user_memories,
+            user_id=user_id,
+            agent_id=agent_id,
+            team_id=team_id,
+            topics=topics,
+            search_content=search_content,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            deserialize=deserialize,
+            cursor=cursor,
+            count_total=count_total,
+        )
+
+    async def get_user_memory_stats(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        user_id: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        return await self._run(self.db.get_user_memory_stats, limit=limit, page=page, user_id=user_id)
+
+    async def upsert_user_memory(
+        self, memory: UserMemory, deserialize: Optional[bool] = True
+    ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
+        return await self._run(self.db.upsert_user_memory, memory=memory, deserialize=deserialize)
+
+    async def get_metrics(
+        self, starting_date: Optional[date] = None, ending_date: Optional[date] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        return await self._run(self.db.get_metrics, starting_date=starting_date, ending_date=ending_date)
+
+    async def calculate_metrics(self) -> Optional[Any]:
+        return await self._run(self.db.calculate_metrics)
+
+    async def delete_knowledge_content(self, id: str):
+        return await self._run(self.db.delete_knowledge_content, id=id)
+
+    async def get_knowledge_content(self, id: str) -> Optional[KnowledgeRow]:
+        return await self._run(self.db.get_knowledge_content, id=id)
+
+    async def get_knowledge_contents(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[KnowledgeRow], int]:
+        return await self._run(
+            self.db.get_knowledge_contents, limit=limit, page=page, sort_by=sort_by, sort_order=sort_order
+        )
+
+    async def upsert_knowledge_content(self, knowledge_row: KnowledgeRow):
+        return await self._run(self.db.upsert_knowledge_content, knowledge_row=knowledge_row)
+
+    async def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
+        return await self._run(self.db.create_eval_run, eval_run=eval_run)
+
+    async def delete_eval_runs(self, eval_run_ids: List[str]) -> None:
+        return await self._run(self.db.delete_eval_runs, eval_run_ids=eval_run_ids)
+
+    async def get_eval_run(
+        self, eval_run_id: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
+        return await self._run(self.db.get_eval_run, eval_run_id=eval_run_id, deserialize=deserialize)
+
+    async def get_eval_runs(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+        filter_type: Optional[EvalFilterType] = None,
+        eval_type: Optional[List[EvalType]] = None,
+        deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
+    ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
+        return await self._run(
+            self.db.get_eval_runs,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            agent_id=agent_id,
+            team_id=team_id,
+            workflow_id=workflow_id,
+            model_id=model_id,
+            filter_type=filter_type,
+            eval_type=eval_type,
+            deserialize=deserialize,
+            cursor=cursor,
+            count_total=count_total,
+        )
+
+    async def rename_eval_run(
+        self, eval_run_id: str, name: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
+        return await self._run(self.db.rename_eval_run, eval_run_id=eval_run_id, name=name, deserialize=deserialize)
+
+    async def upsert_trace(self, trace) -> None:
+        return await self._run(self.db.upsert_trace, trace=trace)
+
+    async def get_trace(
+        self,
+        trace_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ):
+        return await self._run(
+            self.db.get_trace,
+            trace_id=trace_id,
+            run_id=run_id,
+            session_id=session_id,
+            user_id=user_id,
+            agent_id=agent_id,
+        )
+
+    async def get_traces(
+        self,
+        run_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        status: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = 20,
+        page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
+    ) -> tuple[List, int]:
+        return await self._run(
+            self.db.get_traces,
+            run_id=run_id,
+            session_id=session_id,
+            user_id=user_id,
+            agent_id=agent_id,
+            team_id=team_id,
+            workflow_id=workflow_id,
+            status=status,
+            start_time=start_time,
+            end_time=end_time,
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            count_total=count_total,
+        )
+
+    async def get_trace_stats(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = 20,
+        page: Optional[int] = 1,
+    ) -> tuple[List[Dict[str, Any]], int]:
+        return await self._run(
+            self.db.get_trace_stats,
+            user_id=user_id,
+            agent_id=agent_id,
+            team_id=team_id,
+            workflow_id=workflow_id,
+            start_time=start_time,
+            end_time=end_time,
+            limit=limit,
+            page=page,
+        )
+
+    async def create_span(self, span) -> None:
+        return await self._run(self.db.create_span, span=span)
+
+    async def create_spans(self, spans: List) -> None:
+        return await self._run(self.db.create_spans, spans=spans)
+
+    async def get_span(self, span_id: str):
+        return await self._run(self.db.get_span, span_id=span_id)
+
+    async def get_spans(
+        self,
+        trace_id: Optional[str] = None,
+        parent_span_id: Optional[str] = None,
+        limit: Optional[int] = 1000,
+    ) -> List:
+        return await self._run(self.db.get_spans, trace_id=trace_id, parent_span_id=parent_span_id, limit=limit)
+
+    async def clear_cultural_knowledge(self) -> None:
+        return await self._run(self.db.clear_cultural_knowledge)
+
+    async def delete_cultural_knowledge(self, id: str) -> None:
+        return await self._run(self.db.delete_cultural_knowledge, id=id)
+
+    async def get_cultural_knowledge(
+        self, id: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[CulturalKnowledge, Dict[str, Any]]]:
+        return await self._run(self.db.get_cultural_knowledge, id=id, deserialize=deserialize)
+
+    async def get_all_cultural_knowledge(
+        self,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        name: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[CulturalKnowledge], Tuple[List[Dict[str, Any]], int]]:
+        return await self._run(
+            self.db.get_all_cultural_knowledge,
+            agent_id=agent_id,
+            team_id=team_id,
+            name=name,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            deserialize=deserialize,
+        )
+
+    async def upsert_cultural_knowledge(
+        self, cultural_knowledge: CulturalKnowledge, deserialize: Optional[bool] = True
+    ) -> Optional[Union[CulturalKnowledge, Dict[str, Any]]]:
+        return await self._run(
+            self.db.upsert_cultural_knowledge, cultural_knowledge=cultural_knowledge, deserialize=deserialize
+        )
+
+    async def get_learning(
+        self,
+        learning_type: str,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        namespace: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        entity_type: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        return await self._run(
+            self.db.get_learning,
+            learning_type=learning_type,
+            user_id=user_id,
+            agent_id=agent_id,
+            team_id=team_id,
+            session_id=session_id,
+            namespace=namespace,
+            entity_id=entity_id,
+            entity_type=entity_type,
+        )
+
+    async def upsert_learning(
+        self,
+        id: str,
+        learning_type: str,
+        content: Dict[str, Any],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        namespace: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        return await self._run(
+            self.db.upsert_learning,
+            id=id,
+            learning_type=learning_type,
+            content=content,
+            user_id=user_id,
+            agent_id=agent_id,
+            team_id=team_id,
+            session_id=session_id,
+            namespace=namespace,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            metadata=metadata,
+        )
+
+    async def delete_learning(self, id: str) -> bool:
+        return await self._run(self.db.delete_learning, id=id)
+
+    async def get_learnings(
+        self,
+        learning_type: Optional[str] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        namespace: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        return await self._run(
+            self.db.get_learnings,
+            learning_type=learning_type,
+            user_id=user_id,
+            agent_id=agent_id,
+            team_id=team_id,
+            session_id=session_id,
+            namespace=namespace,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            limit=limit,
+        )
@@ -164,6 +164,9 @@ class BaseDb(ABC):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         raise NotImplementedError
 
@@ -232,6 +235,8 @@ class BaseDb(ABC):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         raise NotImplementedError
 
@@ -360,6 +365,8 @@ class BaseDb(ABC):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         raise NotImplementedError
 
@@ -420,6 +427,8 @@ class BaseDb(ABC):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters with pagination.
 
@@ -435,6 +444,8 @@ class BaseDb(ABC):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces with datetime fields, total count).
@@ -1042,6 +1053,9 @@ class AsyncBaseDb(ABC):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         raise NotImplementedError
 
@@ -1100,6 +1114,8 @@ class AsyncBaseDb(ABC):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         raise NotImplementedError
 
@@ -1216,6 +1232,8 @@ class AsyncBaseDb(ABC):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         raise NotImplementedError
 
@@ -1276,6 +1294,8 @@ class AsyncBaseDb(ABC):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters with pagination.
 
@@ -1291,6 +1311,8 @@ class AsyncBaseDb(ABC):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces with datetime fields, total count).
@@ -36,6 +36,12 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import (
+    apply_cursor_to_records,
+    get_session_ids_needing_runs,
+    get_stored_session_fields,
+    project_session,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -330,6 +336,9 @@ class DynamoDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         try:
             table_name = self._get_table("sessions")
@@ -374,6 +383,14 @@ class DynamoDb(BaseDb):
                 else:
                     filter_expression = name_filter
 
+            # Project at the database level so `runs` is not read for every item
+            projection_expression = None
+            if columns is not None and not deserialize:
+                fields = get_stored_session_fields(columns + ["created_at"] + ([sort_by] if sort_by else []))
+                for i, field in enumerate(fields):
+                    expression_attribute_names[f"#p{i}"] = field
+                projection_expression = ", ".join(f"#p{i}" for i in range(len(fields)))
+
             # Use GSI query for session_type
             query_kwargs = {
                 "TableName": table_name,
@@ -383,6 +400,8 @@ class DynamoDb(BaseDb):
             }
             if filter_expression:
                 query_kwargs["FilterExpression"] = filter_expression
+            if projection_expression:
+                query_kwargs["ProjectionExpression"] = projection_expression
             if expression_attribute_names:
                 query_kwargs["ExpressionAttributeNames"] = expression_attribute_names
 
@@ -412,17 +431,23 @@ class DynamoDb(BaseDb):
                     sessions_data.append(session_data)
 
             # Apply in-memory sorting for fields not supported by DynamoDB
-            if sort_by and sort_by != "created_at":
+            if cursor is not None:
+                sessions_data = apply_cursor_to_records(
+                    sessions_data, "session_id", sort_by or "created_at", sort_order or "asc", cursor
+                )
+            elif sort_by and sort_by != "created_at":
                 sessions_data = apply_sorting(sessions_data, sort_by, sort_order)
 
             # Get total count before pagination
             total_count = len(sessions_data)
 
             # Apply pagination
-            if page:
-                sessions_data = apply_pagination(sessions_data, limit, page)
+            if page or cursor is not None:
+                sessions_data = apply_pagination(sessions_data, limit, page if cursor is None else None)
 
             if not deserialize:
+                if columns is not None:
+                    sessions_data = self._project_sessions(table_name, sessions_data, columns)
                 return sessions_data, total_count
 
             sessions = []
@@ -437,6 +462,33 @@ class DynamoDb(BaseDb):
             log_error(f"Failed to get sessions: {e}")
             raise e
 
+    def _project_sessions(
+        self, table_name: str, sessions: List[Dict[str, Any]], columns: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Read `runs` only for the sessions whose projection needs it, then apply the projection."""
+        session_ids = get_session_ids_needing_runs(sessions, columns)
+        runs_by_session_id: Dict[str, Any] = {}
+        # BatchGetItem accepts at most 100 keys
+        for i in range(0, len(session_ids), 100):
+            request_items: Dict[str, Any] = {
+                table_name: {
+                    "Keys": [{"session_id": {"S": session_id}} for session_id in session_ids[i : i + 100]],
+                    "ProjectionExpression": "#session_id, #runs",
+                    "ExpressionAttributeNames": {"#session_id": "session_id", "#runs": "runs"},
+                }
+            }
+            while request_items:
+                response = self.client.batch_get_item(RequestItems=request_items)
+                for item in response.get("Responses", {}).get(table_name, []):
+                    record = deserialize_from_dynamodb_item(item)
+                    runs_by_session_id[record["session_id"]] = record.get("runs")
+                request_items = response.get("UnprocessedKeys") or {}
+
+        return [
+            project_session({**session, "runs": runs_by_session_id.get(session["session_id"])}, columns)
+            for session in sessions
+        ]
+
     def rename_session(
         self,
         session_id: str,
@@ -757,6 +809,8 @@ class DynamoDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """
         Get user memories from the database as a list of UserMemory objects.
@@ -773,6 +827,8 @@ class DynamoDb(BaseDb):
             sort_by: The field to sort the memories by.
             sort_order: The order to sort the memories by.
             deserialize: Whether to deserialize the memories.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[UserMemory], List[Dict[str, Any]], Tuple[List[Dict[str, Any]], int]]: The user memories data.
@@ -850,11 +906,16 @@ class DynamoDb(BaseDb):
 
             items = [deserialize_from_dynamodb_item(item) for item in items]
 
-            if sort_by and sort_by != "updated_at":
+            if cursor is not None:
+                items = apply_cursor_to_records(
+                    items, "memory_id", sort_by or "updated_at", sort_order or "asc", cursor
+                )
+            elif sort_by and sort_by != "updated_at":
                 items = apply_sorting(items, sort_by, sort_order)
 
-            if page:
-                paginated_items = apply_pagination(items, limit, page)
+            paginated_items = items
+            if page or cursor is not None:
+                paginated_items = apply_pagination(items, limit, page if cursor is None else None)
 
             if not deserialize:
                 return paginated_items, len(items)
@@ -1801,6 +1862,8 @@ class DynamoDb(BaseDb):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         try:
             table_name = self._get_table("evals")
@@ -1868,13 +1931,18 @@ class DynamoDb(BaseDb):
                     eval_data.append(eval_item)
 
             # Apply sorting
-            eval_data = apply_sorting(eval_data, sort_by, sort_order)
+            if cursor is not None:
+                eval_data = apply_cursor_to_records(
+                    eval_data, "run_id", sort_by or "created_at", sort_order or "asc", cursor
+                )
+            else:
+                eval_data = apply_sorting(eval_data, sort_by, sort_order)
 
             # Get total count before pagination
             total_count = len(eval_data)
 
             # Apply pagination
-            eval_data = apply_pagination(eval_data, limit, page)
+            eval_data = apply_pagination(eval_data, limit, page if cursor is None else None)
 
             if not deserialize:
                 return eval_data, total_count
@@ -2264,6 +2332,8 @@ class DynamoDb(BaseDb):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters.
 
@@ -2279,6 +2349,8 @@ class DynamoDb(BaseDb):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces, total count).
@@ -2395,13 +2467,13 @@ class DynamoDb(BaseDb):
             traces_data = [deserialize_from_dynamodb_item(item) for item in items]
 
             # Sort by start_time descending
-            traces_data.sort(key=lambda x: x.get("start_time", ""), reverse=True)
+            traces_data = apply_cursor_to_records(traces_data, "trace_id", "start_time", "desc", cursor)
 
             # Get total count
             total_count = len(traces_data)
 
             # Apply pagination
-            offset = (page - 1) * limit if page and limit else 0
+            offset = (page - 1) * limit if page and limit and cursor is None else 0
             paginated_data = traces_data[offset : offset + limit] if limit else traces_data
 
             # Use stored total_spans and error_count (default to 0 if not present)
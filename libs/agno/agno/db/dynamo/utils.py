@@ -222,6 +222,10 @@ def prepare_session_data(session: "Session") -> Dict[str, Any]:
             if isinstance(serialized_session[field], (dict, list)):
                 serialized_session[field] = json.dumps(serialized_session[field])
 
+    # Store the run count so session listings don't need to read the runs
+    runs = serialized_session.get("runs")
+    serialized_session["run_count"] = len(runs) if isinstance(runs, list) else 0
+
     # Set the session type
     if isinstance(session, AgentSession):
         serialized_session["session_type"] = SessionType.AGENT.value
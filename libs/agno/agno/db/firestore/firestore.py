@@ -25,7 +25,13 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
-from agno.db.utils import deserialize_session_json_fields
+from agno.db.utils import (
+    apply_cursor_to_records,
+    deserialize_session_json_fields,
+    get_session_ids_needing_runs,
+    get_stored_session_fields,
+    project_session,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -367,6 +373,9 @@ class FirestoreDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """Get all sessions.
 
@@ -382,6 +391,9 @@ class FirestoreDb(BaseDb):
             sort_by (Optional[str]): The field to sort the sessions by.
             sort_order (Optional[str]): The order to sort the sessions by.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            columns (Optional[List[str]]): Columns to return when deserialize=False, e.g. SESSION_SUMMARY_COLUMNS.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[AgentSession], List[TeamSession], List[WorkflowSession], Tuple[List[Dict[str, Any]], int]]:
@@ -419,6 +431,10 @@ class FirestoreDb(BaseDb):
             # Apply sorting
             query = apply_sorting(query, sort_by, sort_order)
 
+            # Project at the database level so `runs` is not read for every document
+            if columns is not None and not deserialize:
+                query = query.select(get_stored_session_fields(columns))
+
             # Get all documents for counting before pagination
             all_docs = query.stream()
             all_records = [doc.to_dict() for doc in all_docs]
@@ -431,8 +447,11 @@ class FirestoreDb(BaseDb):
             # Get total count before pagination
             total_count = len(all_sessions_raw)
 
+            if cursor is not None:
+                all_sessions_raw = apply_cursor_to_records(all_sessions_raw, "session_id", sort_by, sort_order, cursor)
+
             # Apply pagination to the results
-            if limit is not None and page is not None:
+            if limit is not None and page is not None and cursor is None:
                 start_index = (page - 1) * limit
                 end_index = start_index + limit
                 sessions_raw = all_sessions_raw[start_index:end_index]
@@ -442,6 +461,8 @@ class FirestoreDb(BaseDb):
                 sessions_raw = all_sessions_raw
 
             if not deserialize:
+                if columns is not None:
+                    sessions_raw = self._project_sessions(collection_ref, sessions_raw, columns)
                 return sessions_raw, total_count
 
             sessions: List[Union[AgentSession, TeamSession, WorkflowSession]] = []
@@ -468,6 +489,28 @@ class FirestoreDb(BaseDb):
             log_error(f"Exception reading sessions: {e}")
             raise e
 
+    def _project_sessions(
+        self, collection_ref: Any, sessions: List[Dict[str, Any]], columns: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Read `runs` only for the sessions whose projection needs it, then apply the projection."""
+        session_ids = get_session_ids_needing_runs(sessions, columns)
+        runs_by_session_id: Dict[str, Any] = {}
+        # Firestore "in" filters accept at most 30 values
+        for i in range(0, len(session_ids), 30):
+            docs = (
+                collection_ref.where(filter=FieldFilter("session_id", "in", session_ids[i : i + 30]))
+                .select(["session_id", "runs"])
+                .stream()
+            )
+            for doc in docs:
+                record = deserialize_session_json_fields(doc.to_dict())
+                runs_by_session_id[record["session_id"]] = record.get("runs")
+
+        return [
+            project_session({**session, "runs": runs_by_session_id.get(session["session_id"])}, columns)
+            for session in sessions
+        ]
+
     def rename_session(
         self, session_id: str, session_type: SessionType, session_name: str, deserialize: Optional[bool] = True
     ) -> Optional[Union[Session, Dict[str, Any]]]:
@@ -571,6 +614,7 @@ class FirestoreDb(BaseDb):
                     "agent_id": session_dict.get("agent_id"),
                     "user_id": session_dict.get("user_id"),
                     "runs": session_dict.get("runs"),
+                    "run_count": len(session_dict.get("runs") or []),
                     "agent_data": session_dict.get("agent_data"),
                     "session_data": session_dict.get("session_data"),
                     "summary": session_dict.get("summary"),
@@ -586,6 +630,7 @@ class FirestoreDb(BaseDb):
                     "team_id": session_dict.get("team_id"),
                     "user_id": session_dict.get("user_id"),
                     "runs": session_dict.get("runs"),
+                    "run_count": len(session_dict.get("runs") or []),
                     "team_data": session_dict.get("team_data"),
                     "session_data": session_dict.get("session_data"),
                     "summary": session_dict.get("summary"),
@@ -601,6 +646,7 @@ class FirestoreDb(BaseDb):
                     "workflow_id": session_dict.get("workflow_id"),
                     "user_id": session_dict.get("user_id"),
                     "runs": session_dict.get("runs"),
+                    "run_count": len(session_dict.get("runs") or []),
                     "workflow_data": session_dict.get("workflow_data"),
                     "session_data": session_dict.get("session_data"),
                     "summary": session_dict.get("summary"),
@@ -852,6 +898,8 @@ class FirestoreDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from the database as UserMemory objects.
 
@@ -867,6 +915,8 @@ class FirestoreDb(BaseDb):
             sort_order (Optional[str]): The order to sort the memories by.
             deserialize (Optional[bool]): Whether to serialize the memories. Defaults to True.
             create_table_if_not_found: Whether to create the index if it doesn't exist.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Tuple[List[Dict[str, Any]], int]: A tuple containing the memories and the total count.
@@ -901,8 +951,11 @@ class FirestoreDb(BaseDb):
 
             total_count = len(all_records)
 
+            if cursor is not None:
+                all_records = apply_cursor_to_records(all_records, "memory_id", sort_by, sort_order, cursor)
+
             # Apply pagination to the filtered results
-            if limit is not None and page is not None:
+            if limit is not None and page is not None and cursor is None:
                 start_index = (page - 1) * limit
                 end_index = start_index + limit
                 records = all_records[start_index:end_index]
@@ -1720,6 +1773,8 @@ class FirestoreDb(BaseDb):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         """Get all eval runs from the database.
 
@@ -1736,6 +1791,8 @@ class FirestoreDb(BaseDb):
             filter_type (Optional[EvalFilterType]): The type of filter to apply.
             deserialize (Optional[bool]): Whether to serialize the eval runs. Defaults to True.
             create_table_if_not_found (Optional[bool]): Whether to create the table if it doesn't exist.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
@@ -1789,8 +1846,13 @@ class FirestoreDb(BaseDb):
             # Get total count before pagination
             total_count = len(all_records)
 
+            if cursor is not None:
+                all_records = apply_cursor_to_records(
+                    all_records, "run_id", sort_by or "created_at", sort_order if sort_by else "desc", cursor
+                )
+
             # Apply pagination to the results
-            if limit is not None and page is not None:
+            if limit is not None and page is not None and cursor is None:
                 start_index = (page - 1) * limit
                 end_index = start_index + limit
                 records = all_records[start_index:end_index]
@@ -2010,6 +2072,8 @@ class FirestoreDb(BaseDb):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters.
 
@@ -2025,6 +2089,8 @@ class FirestoreDb(BaseDb):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces, total count).
@@ -2063,13 +2129,13 @@ class FirestoreDb(BaseDb):
             all_records = [doc.to_dict() for doc in docs]
 
             # Sort by start_time descending
-            all_records.sort(key=lambda x: x.get("start_time", ""), reverse=True)
+            all_records = apply_cursor_to_records(all_records, "trace_id", "start_time", "desc", cursor)
 
             # Get total count
             total_count = len(all_records)
 
             # Apply pagination
-            if limit and page:
+            if limit and page and cursor is None:
                 offset = (page - 1) * limit
                 paginated_records = all_records[offset : offset + limit]
             elif limit:
@@ -20,6 +20,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_cursor_to_records, project_session
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -272,6 +273,9 @@ class GcsJsonDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """Get all sessions from the GCS JSON file with filtering and pagination.
 
@@ -287,7 +291,10 @@ class GcsJsonDb(BaseDb):
             sort_by (Optional[str]): The field to sort the sessions by.
             sort_order (Optional[str]): The order to sort the sessions by.
             deserialize (Optional[bool]): Whether to deserialize the sessions.
+            columns (Optional[List[str]]): Columns to return when deserialize=False, e.g. SESSION_SUMMARY_COLUMNS.
             create_table_if_not_found (Optional[bool]): Whether to create a file to track sessions if it doesn't exist.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[AgentSession], List[TeamSession], List[WorkflowSession], Tuple[List[Dict[str, Any]], int]]:
@@ -329,17 +336,20 @@ class GcsJsonDb(BaseDb):
             total_count = len(filtered_sessions)
 
             # Apply sorting
-            filtered_sessions = apply_sorting(filtered_sessions, sort_by, sort_order)
+            if sort_by is not None or cursor is not None:
+                filtered_sessions = apply_cursor_to_records(
+                    filtered_sessions, "session_id", sort_by, sort_order, cursor
+                )
 
             # Apply pagination
             if limit is not None:
                 start_idx = 0
-                if page is not None:
+                if page is not None and cursor is None:
                     start_idx = (page - 1) * limit
                 filtered_sessions = filtered_sessions[start_idx : start_idx + limit]
 
             if not deserialize:
-                return filtered_sessions, total_count
+                return [project_session(session, columns) for session in filtered_sessions], total_count
 
             if session_type == SessionType.AGENT:
                 return [AgentSession.from_dict(session) for session in filtered_sessions]  # type: ignore
@@ -597,6 +607,8 @@ class GcsJsonDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from the GCS JSON file with filtering and pagination."""
         try:
@@ -625,12 +637,13 @@ class GcsJsonDb(BaseDb):
             total_count = len(filtered_memories)
 
             # Apply sorting
-            filtered_memories = apply_sorting(filtered_memories, sort_by, sort_order)
+            if sort_by is not None or cursor is not None:
+                filtered_memories = apply_cursor_to_records(filtered_memories, "memory_id", sort_by, sort_order, cursor)
 
             # Apply pagination
             if limit is not None:
                 start_idx = 0
-                if page is not None:
+                if page is not None and cursor is None:
                     start_idx = (page - 1) * limit
                 filtered_memories = filtered_memories[start_idx : start_idx + limit]
 
@@ -1094,6 +1107,8 @@ class GcsJsonDb(BaseDb):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         """Get all eval runs from the GCS JSON file with filtering and pagination."""
         try:
@@ -1130,11 +1145,15 @@ class GcsJsonDb(BaseDb):
                 filtered_runs.sort(key=lambda x: x.get("created_at", 0), reverse=True)
             else:
                 filtered_runs = apply_sorting(filtered_runs, sort_by, sort_order)
+            if cursor is not None:
+                filtered_runs = apply_cursor_to_records(
+                    filtered_runs, "run_id", sort_by or "created_at", sort_order if sort_by else "desc", cursor
+                )
 
             # Apply pagination
             if limit is not None:
                 start_idx = 0
-                if page is not None:
+                if page is not None and cursor is None:
                     start_idx = (page - 1) * limit
                 filtered_runs = filtered_runs[start_idx : start_idx + limit]
 
@@ -1508,6 +1527,8 @@ class GcsJsonDb(BaseDb):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters with pagination.
 
@@ -1523,6 +1544,8 @@ class GcsJsonDb(BaseDb):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces, total count).
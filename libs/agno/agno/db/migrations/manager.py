@@ -14,6 +14,7 @@ class MigrationManager:
     available_versions: list[tuple[str, Version]] = [
         ("v2_0_0", packaging_version.parse("2.0.0")),
         ("v2_3_0", packaging_version.parse("2.3.0")),
+        ("v2_5_0", packaging_version.parse("2.5.0")),
     ]
 
     def __init__(self, db: Union[AsyncBaseDb, BaseDb]):
@@ -42,9 +43,9 @@ class MigrationManager:
 
         # Select tables to migrate
         if table_type:
-            if table_type not in ["memory", "session", "metrics", "eval", "knowledge", "culture"]:
+            if table_type not in ["memory", "session", "metrics", "eval", "knowledge", "culture", "trace"]:
                 log_warning(
-                    f"Invalid table type: {table_type}. Use one of: memory, session, metrics, eval, knowledge, culture"
+                    f"Invalid table type: {table_type}. Use one of: memory, session, metrics, eval, knowledge, culture, trace"
                 )
                 return
             tables = [(table_type, getattr(self.db, f"{table_type}_table_name"))]
@@ -56,6 +57,7 @@ class MigrationManager:
                 ("evals", self.db.eval_table_name),
                 ("knowledge", self.db.knowledge_table_name),
                 ("culture", self.db.culture_table_name),
+                ("traces", self.db.trace_table_name),
             ]
 
         # Handle migrations for each table separately (extend in future if needed):
@@ -134,9 +136,9 @@ class MigrationManager:
 
         # Select tables to migrate
         if table_type:
-            if table_type not in ["memory", "session", "metrics", "eval", "knowledge", "culture"]:
+            if table_type not in ["memory", "session", "metrics", "eval", "knowledge", "culture", "trace"]:
                 log_warning(
-                    f"Invalid table type: {table_type}. Use one of: memory, session, metrics, eval, knowledge, culture"
+                    f"Invalid table type: {table_type}. Use one of: memory, session, metrics, eval, knowledge, culture, trace"
                 )
                 return
             tables = [(table_type, getattr(self.db, f"{table_type}_table_name"))]
@@ -148,6 +150,7 @@ class MigrationManager:
                 ("evals", self.db.eval_table_name),
                 ("knowledge", self.db.knowledge_table_name),
                 ("culture", self.db.culture_table_name),
+                ("traces", self.db.trace_table_name),
             ]
 
         for table_type, table_name in tables:
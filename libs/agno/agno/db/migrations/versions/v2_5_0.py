@@ -0,0 +1,301 @@
+"""Migration v2.5.0: Workload indexes for sessions, memories and traces
+
+Changes:
+- Add composite indexes matching the filters and sort keys of get_sessions, get_user_memories and get_traces
+- Index the updated_at sort key of PostgreSQL and SQLite as COALESCE(updated_at, created_at), as it is sorted on
+- Create every composite index of the table schema that is missing, as tables created by earlier versions lack them
+- PostgreSQL builds the indexes CONCURRENTLY and MySQL with LOCK=NONE, so writes are not blocked while they build
+"""
+
+import importlib
+from typing import Any, Dict, List, Optional
+
+from agno.db.base import AsyncBaseDb, BaseDb
+from agno.db.migrations.utils import quote_db_identifier
+from agno.utils.log import log_error, log_info
+
+try:
+    from sqlalchemy import text
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+# Indexes introduced by this version, dropped again by down()
+ADDED_INDEXES: Dict[str, List[str]] = {
+    "sessions": [
+        "user_id_session_type_created_at",
+        "agent_id_created_at",
+        "team_id_created_at",
+        "workflow_id_created_at",
+    ],
+    "memories": ["agent_id_updated_at", "team_id_updated_at"],
+    "traces": ["session_id_start_time", "user_id_start_time", "agent_id_start_time"],
+}
+
+_TABLE_TYPES = {"session": "sessions", "memory": "memories", "eval": "evals", "trace": "traces"}
+
+_SYNC_DB_TYPES = ("PostgresDb", "MySQLDb", "SqliteDb", "SingleStoreDb")
+_ASYNC_DB_TYPES = ("AsyncPostgresDb", "AsyncMySQLDb", "AsyncSqliteDb")
+
+
+def up(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Apply the following changes to the database:
+    - Create the composite indexes of the table schema missing from the table
+
+    Notice only the changes related to the given table_type are applied.
+
+    Returns:
+        bool: True if the table was migrated, False otherwise.
+    """
+    db_type = type(db).__name__
+    if db_type not in _SYNC_DB_TYPES:
+        log_info(f"{db_type} does not require schema migrations (NoSQL/document store)")
+        return False
+
+    try:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        with db.db_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:  # type: ignore
+            existing = _fetch_existing_indexes(conn, db_type, db, table_name)
+            if existing is None:
+                return False
+            for statement in _create_statements(db_type, db, table_type, table_name, existing):
+                log_info(f"-- {statement}")
+                conn.execute(text(statement))
+        return True
+    except Exception as e:
+        log_error(f"Error running migration v2.5.0 for {db_type} on table {table_name}: {e}")
+        raise
+
+
+async def async_up(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Apply the following changes to the database:
+    - Create the composite indexes of the table schema missing from the table
+
+    Notice only the changes related to the given table_type are applied.
+
+    Returns:
+        bool: True if the table was migrated, False otherwise.
+    """
+    db_type = type(db).__name__
+    if db_type not in _ASYNC_DB_TYPES:
+        log_info(f"{db_type} does not require schema migrations (NoSQL/document store)")
+        return False
+
+    try:
+        async with db.db_engine.connect() as conn:  # type: ignore
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            existing = await conn.run_sync(_fetch_existing_indexes, db_type, db, table_name)
+            if existing is None:
+                return False
+            for statement in _create_statements(db_type, db, table_type, table_name, existing):
+                log_info(f"-- {statement}")
+                await conn.execute(text(statement))
+        return True
+    except Exception as e:
+        log_error(f"Error running migration v2.5.0 for {db_type} on table {table_name}: {e}")
+        raise
+
+
+def down(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Revert the following changes to the database:
+    - Drop the composite indexes introduced by this version
+
+    Notice only the changes related to the given table_type are reverted.
+
+    Returns:
+        bool: True if the table was reverted, False otherwise.
+    """
+    db_type = type(db).__name__
+    if db_type not in _SYNC_DB_TYPES:
+        log_info(f"Revert not implemented for {db_type}")
+        return False
+
+    try:
+        with db.db_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:  # type: ignore
+            existing = _fetch_existing_indexes(conn, db_type, db, table_name)
+            if existing is None:
+                return False
+            for statement in _drop_statements(db_type, db, table_type, table_name, existing):
+                log_info(f"-- {statement}")
+                conn.execute(text(statement))
+        return True
+    except Exception as e:
+        log_error(f"Error reverting migration v2.5.0 for {db_type} on table {table_name}: {e}")
+        raise
+
+
+async def async_down(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Revert the following changes to the database:
+    - Drop the composite indexes introduced by this version
+
+    Notice only the changes related to the given table_type are reverted.
+
+    Returns:
+        bool: True if the table was reverted, False otherwise.
+    """
+    db_type = type(db).__name__
+    if db_type not in _ASYNC_DB_TYPES:
+        log_info(f"Revert not implemented for {db_type}")
+        return False
+
+    try:
+        async with db.db_engine.connect() as conn:  # type: ignore
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            existing = await conn.run_sync(_fetch_existing_indexes, db_type, db, table_name)
+            if existing is None:
+                return False
+            for statement in _drop_statements(db_type, db, table_type, table_name, existing):
+                log_info(f"-- {statement}")
+                await conn.execute(text(statement))
+        return True
+    except Exception as e:
+        log_error(f"Error reverting migration v2.5.0 for {db_type} on table {table_name}: {e}")
+        raise
+
+
+def _dialect(db_type: str) -> str:
+    return db_type.replace("Async", "").replace("Db", "").lower()
+
+
+def _schema_composite_indexes(db_type: str, table_type: str) -> List[Dict[str, Any]]:
+    """Composite indexes of the table schema for the given table type"""
+    schemas = importlib.import_module(f"agno.db.{_dialect(db_type)}.schemas")
+
+    try:
+        schema = schemas.get_table_schema_definition(_TABLE_TYPES.get(table_type, table_type))
+    except ValueError:
+        return []
+    return schema.get("_composite_indexes", [])
+
+
+def _qualified_table_name(db_type: str, db: Any, table_name: str) -> str:
+    quoted_table = quote_db_identifier(db_type, table_name)
+    db_schema = getattr(db, "db_schema", None)
+    if _dialect(db_type) == "postgres":
+        db_schema = db_schema or "public"
+    if db_schema and _dialect(db_type) != "sqlite":
+        return f"{quote_db_identifier(db_type, db_schema)}.{quoted_table}"
+    return quoted_table
+
+
+def _fetch_existing_indexes(conn: Any, db_type: str, db: Any, table_name: str) -> Optional[Dict[str, bool]]:
+    """Names of the indexes on the table, mapped to whether they are valid. None if the table does not exist."""
+    dialect = _dialect(db_type)
+    if dialect == "postgres":
+        params = {"schema": getattr(db, "db_schema", None) or "public", "table_name": table_name}
+        table_exists = conn.execute(
+            text("SELECT 1 FROM information_schema.tables WHERE table_schema = :schema AND table_name = :table_name"),
+            params,
+        ).scalar()
+        if not table_exists:
+            return None
+        # An interrupted CREATE INDEX CONCURRENTLY leaves an invalid index behind
+        rows = conn.execute(
+            text(
+                "SELECT c.relname, i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "JOIN pg_class t ON t.oid = i.indrelid "
+                "JOIN pg_namespace n ON n.oid = t.relnamespace "
+                "WHERE n.nspname = :schema AND t.relname = :table_name"
+            ),
+            params,
+        ).fetchall()
+        return {row[0]: bool(row[1]) for row in rows}
+
+    if dialect == "sqlite":
+        table_exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :table_name"),
+            {"table_name": table_name},
+        ).scalar()
+        if not table_exists:
+            return None
+        rows = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table_name"),
+            {"table_name": table_name},
+        ).fetchall()
+        return {row[0]: True for row in rows}
+
+    # MySQL and SingleStore
+    db_schema = getattr(db, "db_schema", None)
+    schema_clause = "TABLE_SCHEMA = :schema" if db_schema else "TABLE_SCHEMA = DATABASE()"
+    params = {"schema": db_schema, "table_name": table_name}
+    table_exists = conn.execute(
+        text(f"SELECT 1 FROM information_schema.tables WHERE {schema_clause} AND TABLE_NAME = :table_name"),
+        params,
+    ).scalar()
+    if not table_exists:
+        return None
+    rows = conn.execute(
+        text(
+            f"SELECT DISTINCT INDEX_NAME FROM information_schema.statistics "
+            f"WHERE {schema_clause} AND TABLE_NAME = :table_name"
+        ),
+        params,
+    ).fetchall()
+    return {row[0]: True for row in rows}
+
+
+def _create_statements(db_type: str, db: Any, table_type: str, table_name: str, existing: Dict[str, bool]) -> List[str]:
+    """Statements creating the composite indexes of the table schema missing from the table"""
+    dialect = _dialect(db_type)
+    qualified_table = _qualified_table_name(db_type, db, table_name)
+
+    statements: List[str] = []
+    for composite_index in _schema_composite_indexes(db_type, table_type):
+        index_name = f"idx_{table_name}_{composite_index['name']}"
+        if existing.get(index_name):
+            continue
+        quoted_index = quote_db_identifier(db_type, index_name)
+        columns = ", ".join(_index_column(db_type, column) for column in composite_index["columns"])
+
+        if dialect == "postgres":
+            if index_name in existing:
+                statements.append(f"DROP INDEX CONCURRENTLY IF EXISTS {_postgres_index_name(db, quoted_index)}")
+            statements.append(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {quoted_index} ON {qualified_table} ({columns})"
+            )
+        elif dialect == "mysql":
+            statements.append(
+                f"ALTER TABLE {qualified_table} ADD INDEX {quoted_index} ({columns}), ALGORITHM=INPLACE, LOCK=NONE"
+            )
+        elif dialect == "sqlite":
+            statements.append(f"CREATE INDEX IF NOT EXISTS {quoted_index} ON {qualified_table} ({columns})")
+        else:
+            statements.append(f"CREATE INDEX {quoted_index} ON {qualified_table} ({columns})")
+    return statements
+
+
+def _index_column(db_type: str, column: Any) -> str:
+    # A list of columns is indexed as their COALESCE, the sort key of updated_at
+    if isinstance(column, list):
+        return f"(COALESCE({', '.join(quote_db_identifier(db_type, name) for name in column)}))"
+    return quote_db_identifier(db_type, column)
+
+
+def _drop_statements(db_type: str, db: Any, table_type: str, table_name: str, existing: Dict[str, bool]) -> List[str]:
+    """Statements dropping the indexes introduced by this version"""
+    dialect = _dialect(db_type)
+    qualified_table = _qualified_table_name(db_type, db, table_name)
+
+    statements: List[str] = []
+    for name in ADDED_INDEXES.get(_TABLE_TYPES.get(table_type, table_type), []):
+        index_name = f"idx_{table_name}_{name}"
+        if index_name not in existing:
+            continue
+        quoted_index = quote_db_identifier(db_type, index_name)
+
+        if dialect == "postgres":
+            statements.append(f"DROP INDEX CONCURRENTLY IF EXISTS {_postgres_index_name(db, quoted_index)}")
+        elif dialect == "sqlite":
+            statements.append(f"DROP INDEX IF EXISTS {quoted_index}")
+        else:
+            statements.append(f"DROP INDEX {quoted_index} ON {qualified_table}")
+    return statements
+
+
+def _postgres_index_name(db: Any, quoted_index: str) -> str:
+    # Indexes live in the schema of their table
+    return f"{quote_db_identifier('PostgresDb', getattr(db, 'db_schema', None) or 'public')}.{quoted_index}"
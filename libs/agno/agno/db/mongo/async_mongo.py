@@ -17,6 +17,8 @@ from agno.db.mongo.utils import (
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_cursor_pipeline,
+    get_session_projection,
     serialize_cultural_knowledge_for_db,
 )
 from agno.db.schemas.culture import CulturalKnowledge
@@ -625,6 +627,9 @@ class AsyncMongoDb(AsyncBaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """Get all sessions.
 
@@ -640,6 +645,9 @@ class AsyncMongoDb(AsyncBaseDb):
             sort_by (Optional[str]): The field to sort the sessions by.
             sort_order (Optional[str]): The order to sort the sessions by.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            columns (Optional[List[str]]): Columns to return when deserialize=False, e.g. SESSION_SUMMARY_COLUMNS.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[AgentSession], List[TeamSession], List[WorkflowSession], Tuple[List[Dict[str, Any]], int]]:
@@ -678,23 +686,21 @@ class AsyncMongoDb(AsyncBaseDb):
                 query["session_data.session_name"] = {"$regex": session_name, "$options": "i"}
 
             # Get total count
-            total_count = await collection.count_documents(query)
-
-            cursor = collection.find(query)
+            total_count = 0
+            if count_total:
+                total_count = await collection.count_documents(query)
 
-            # Sorting
-            sort_criteria = apply_sorting({}, sort_by, sort_order)
-            if sort_criteria:
-                cursor = cursor.sort(sort_criteria)
+            # Sorting and keyset pagination on (sort field, id)
+            pipeline = get_cursor_pipeline(query, "session_id", sort_by, sort_order, cursor, limit, page)
 
-            # Pagination
-            query_args = apply_pagination({}, limit, page)
-            if query_args.get("skip"):
-                cursor = cursor.skip(query_args["skip"])
-            if query_args.get("limit"):
-                cursor = cursor.limit(query_args["limit"])
+            # Projections only apply to raw rows, Session objects need the full record
+            projection = get_session_projection(None if deserialize else columns)
+            if projection is not None:
+                pipeline.append({"$project": projection})
 
-            records = await cursor.to_list(length=None)
+            records = await collection.aggregate(pipeline).to_list(length=None)
+            if not count_total:
+                total_count = len(records)
             if records is None:
                 return [] if deserialize else ([], 0)
             sessions_raw = [deserialize_session_json_fields(record) for record in records]
@@ -1186,6 +1192,8 @@ class AsyncMongoDb(AsyncBaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from the database as UserMemory objects.
 
@@ -1200,6 +1208,8 @@ class AsyncMongoDb(AsyncBaseDb):
             sort_by (Optional[str]): The field to sort the memories by.
             sort_order (Optional[str]): The order to sort the memories by.
             deserialize (Optional[bool]): Whether to serialize the memories. Defaults to True.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
@@ -1227,23 +1237,16 @@ class AsyncMongoDb(AsyncBaseDb):
                 query["memory"] = {"$regex": search_content, "$options": "i"}
 
             # Get total count
-            total_count = await collection.count_documents(query)
-
-            # Apply sorting
-            sort_criteria = apply_sorting({}, sort_by, sort_order)
+            total_count = 0
+            if count_total:
+                total_count = await collection.count_documents(query)
 
-            # Apply pagination
-            query_args = apply_pagination({}, limit, page)
+            # Sorting and keyset pagination on (sort field, id)
+            pipeline = get_cursor_pipeline(query, "memory_id", sort_by, sort_order, cursor, limit, page)
 
-            cursor = collection.find(query)
-            if sort_criteria:
-                cursor = cursor.sort(sort_criteria)
-            if query_args.get("skip"):
-                cursor = cursor.skip(query_args["skip"])
-            if query_args.get("limit"):
-                cursor = cursor.limit(query_args["limit"])
-
-            records = await cursor.to_list(length=None)
+            records = await collection.aggregate(pipeline).to_list(length=None)
+            if not count_total:
+                total_count = len(records)
             if not deserialize:
                 return records, total_count
 
@@ -2096,6 +2099,8 @@ class AsyncMongoDb(AsyncBaseDb):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         """Get all eval runs from the database.
 
@@ -2111,6 +2116,8 @@ class AsyncMongoDb(AsyncBaseDb):
             eval_type (Optional[List[EvalType]]): The type of eval to filter by.
             filter_type (Optional[EvalFilterType]): The type of filter to apply.
             deserialize (Optional[bool]): Whether to serialize the eval runs. Defaults to True.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
@@ -2145,26 +2152,18 @@ class AsyncMongoDb(AsyncBaseDb):
                     query["workflow_id"] = {"$ne": None}
 
             # Get total count
-            total_count = await collection.count_documents(query)
-
-            # Apply default sorting by created_at desc if no sort parameters provided
-            if sort_by is None:
-                sort_criteria = [("created_at", -1)]
-            else:
-                sort_criteria = apply_sorting({}, sort_by, sort_order)
+            total_count = 0
+            if count_total:
+                total_count = await collection.count_documents(query)
 
-            # Apply pagination
-            query_args = apply_pagination({}, limit, page)
-
-            cursor = collection.find(query)
-            if sort_criteria:
-                cursor = cursor.sort(sort_criteria)
-            if query_args.get("skip"):
-                cursor = cursor.skip(query_args["skip"])
-            if query_args.get("limit"):
-                cursor = cursor.limit(query_args["limit"])
+            # Keyset pagination on (sort field, id), sorting by created_at desc if no sort parameters provided
+            pipeline = get_cursor_pipeline(
+                query, "run_id", sort_by or "created_at", sort_order if sort_by else "desc", cursor, limit, page
+            )
 
-            records = await cursor.to_list(length=None)
+            records = await collection.aggregate(pipeline).to_list(length=None)
+            if not count_total:
+                total_count = len(records)
             if not records:
                 return [] if deserialize else ([], 0)
 
@@ -2477,6 +2476,8 @@ class AsyncMongoDb(AsyncBaseDb):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters with pagination.
 
@@ -2492,6 +2493,8 @@ class AsyncMongoDb(AsyncBaseDb):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces, total count).
@@ -2532,13 +2535,16 @@ class AsyncMongoDb(AsyncBaseDb):
                     query["end_time"] = {"$lte": end_time.isoformat()}
 
             # Get total count
-            total_count = await collection.count_documents(query)
+            total_count = 0
+            if count_total:
+                total_count = await collection.count_documents(query)
 
-            # Apply pagination
-            skip = ((page or 1) - 1) * (limit or 20)
-            cursor = collection.find(query).sort("start_time", -1).skip(skip).limit(limit or 20)
+            # Keyset pagination on (sort field, id)
+            pipeline = get_cursor_pipeline(query, "trace_id", "start_time", "desc", cursor, limit or 20, page or 1)
 
-            results = await cursor.to_list(length=None)
+            results = await collection.aggregate(pipeline).to_list(length=None)
+            if not count_total:
+                total_count = len(results)
 
             traces = []
             for row in results:
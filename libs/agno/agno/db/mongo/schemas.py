@@ -11,6 +11,7 @@ SESSION_COLLECTION_SCHEMA = [
     {"key": "workflow_id"},
     {"key": "created_at"},
     {"key": "updated_at"},
+    {"key": [("created_at", -1), ("session_id", -1)]},
 ]
 
 MEMORY_COLLECTION_SCHEMA = [
@@ -35,6 +36,7 @@ EVAL_COLLECTION_SCHEMA = [
     {"key": "model_id"},
     {"key": "created_at"},
     {"key": "updated_at"},
+    {"key": [("created_at", -1), ("run_id", -1)]},
 ]
 
 KNOWLEDGE_COLLECTION_SCHEMA = [
@@ -84,6 +86,7 @@ TRACE_COLLECTION_SCHEMA = [
     {"key": "start_time"},
     {"key": "end_time"},
     {"key": "created_at"},
+    {"key": [("start_time", -1), ("trace_id", -1)]},
 ]
 
 SPAN_COLLECTION_SCHEMA = [
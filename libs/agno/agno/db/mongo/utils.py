@@ -8,6 +8,7 @@ from uuid import uuid4
 
 from agno.db.mongo.schemas import get_collection_indexes
 from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.utils import decode_cursor, get_sort_fields
 from agno.utils.log import log_error, log_warning
 
 try:
@@ -16,6 +17,10 @@ except ImportError:
     raise ImportError("`pymongo` not installed. Please install it using `pip install pymongo`")
 
 
+# Computed sort value of the documents, for sort fields falling back to other fields
+_SORT_VALUE_FIELD = "_sort_value"
+
+
 # -- DB util methods --
 def create_collection_indexes(collection: Collection, collection_type: str) -> None:
     """Create all required indexes for a collection"""
@@ -73,6 +78,97 @@ def apply_pagination(
     return query_args
 
 
+def get_cursor_pipeline(
+    query: Dict[str, Any],
+    id_field: str,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    page: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Build an aggregation pipeline reading a page of the documents matching a query, with keyset pagination on
+    (sort value, id_field).
+
+    Documents are sorted on the sort value of get_sort_value, so the cursors of get_next_cursor line up with the
+    order of the pipeline. A sort value falling back to another field is computed as their $ifNull.
+
+    Args:
+        query: The filter query
+        id_field: The unique field used to break ties between equal sort values
+        sort_by: The field to sort by
+        sort_order: The sort order ('asc' or 'desc')
+        cursor: The cursor returned for the previous page, if any. Takes precedence over page.
+        limit: The page size
+        page: The page number, skipping the pages before it when no cursor is given
+
+    Returns:
+        The aggregation pipeline
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    pipeline: List[Dict[str, Any]] = [{"$match": query}] if query else []
+    sort_direction = 1 if sort_order == "asc" else -1
+
+    sort_field = sort_by
+    if sort_by is not None:
+        sort_fields = get_sort_fields(sort_by)
+        if len(sort_fields) > 1:
+            sort_field = _SORT_VALUE_FIELD
+            pipeline.append({"$addFields": {sort_field: {"$ifNull": [f"${field}" for field in sort_fields]}}})
+
+    if cursor is not None:
+        sort_value, last_id = decode_cursor(cursor)
+        operator = "$gt" if sort_direction == 1 else "$lt"
+        if sort_field is None:
+            condition: Dict[str, Any] = {id_field: {operator: last_id}}
+        else:
+            condition = {
+                "$or": [{sort_field: {operator: sort_value}}, {sort_field: sort_value, id_field: {operator: last_id}}]
+            }
+        pipeline.append({"$match": condition})
+
+    sort: Dict[str, int] = {sort_field: sort_direction} if sort_field is not None else {}
+    sort[id_field] = sort_direction
+    pipeline.append({"$sort": sort})
+
+    if limit is not None:
+        if cursor is None and page is not None:
+            pipeline.append({"$skip": (page - 1) * limit})
+        pipeline.append({"$limit": limit})
+
+    if sort_field == _SORT_VALUE_FIELD:
+        pipeline.append({"$project": {_SORT_VALUE_FIELD: 0}})
+    return pipeline
+
+
+def get_session_projection(columns: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """Build a MongoDB projection for the given session columns, computing run_count and unnamed_runs server-side."""
+    if columns is None:
+        return None
+
+    projection: Dict[str, Any] = {"_id": 0}
+    for column in columns:
+        if column == "run_count":
+            projection["run_count"] = {"$cond": [{"$isArray": "$runs"}, {"$size": "$runs"}, 0]}
+        elif column == "unnamed_runs":
+            # Only the input of the first run is read, skipping the member runs stored in team sessions
+            runs = {"$cond": [{"$isArray": "$runs"}, "$runs", []]}
+            team_runs = {"$filter": {"input": runs, "as": "run", "cond": {"$not": ["$$run.agent_id"]}}}
+            first_run = {"$arrayElemAt": [{"$cond": [{"$eq": ["$session_type", "team"]}, team_runs, runs]}, 0]}
+            projection["runs"] = {
+                "$cond": [
+                    {"$eq": [{"$ifNull": ["$session_data.session_name", None]}, None]},
+                    {"$let": {"vars": {"first_run": first_run}, "in": [{"input": "$$first_run.input"}]}},
+                    "$$REMOVE",
+                ]
+            }
+        else:
+            projection[column] = 1
+    return projection
+
+
 # -- Metrics util methods --
 def calculate_date_metrics(date_to_process: date, sessions_data: dict) -> dict:
     """Calculate metrics for the given single date."""
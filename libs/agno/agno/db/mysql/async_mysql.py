@@ -14,11 +14,13 @@ from agno.db.mysql.utils import (
     acreate_schema,
     ais_table_available,
     ais_valid_table,
+    apply_cursor,
     apply_sorting,
     calculate_date_metrics,
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_session_columns,
     serialize_cultural_knowledge_for_db,
 )
 from agno.db.schemas.culture import CulturalKnowledge
@@ -169,6 +171,7 @@ class AsyncMySQLDb(AsyncBaseDb):
             indexes: List[str] = []
             unique_constraints: List[str] = []
             schema_unique_constraints = table_schema.pop("_unique_constraints", [])
+            schema_composite_indexes = table_schema.pop("_composite_indexes", [])
 
             # Get the columns, indexes, and unique constraints from the table schema
             for col_name, col_config in table_schema.items():
@@ -204,6 +207,11 @@ class AsyncMySQLDb(AsyncBaseDb):
                 idx_name = f"idx_{table_name}_{idx_col}"
                 table.append_constraint(Index(idx_name, idx_col))
 
+            # Multi-column indexes
+            for composite_index in schema_composite_indexes:
+                idx_name = f"idx_{table_name}_{composite_index['name']}"
+                table.append_constraint(Index(idx_name, *composite_index["columns"]))
+
             # Create schema if not exists
             if self.create_schema:
                 async with self.async_session_factory() as sess, sess.begin():
@@ -556,6 +564,9 @@ class AsyncMySQLDb(AsyncBaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """
         Get all sessions in the given table. Can filter by user_id and entity_id.
@@ -571,6 +582,9 @@ class AsyncMySQLDb(AsyncBaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            columns (Optional[List[str]]): Columns to return when deserialize=False, e.g. SESSION_SUMMARY_COLUMNS.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[Session], Tuple[List[Dict], int]]:
@@ -584,7 +598,8 @@ class AsyncMySQLDb(AsyncBaseDb):
             table = await self._get_table(table_type="sessions")
 
             async with self.async_session_factory() as sess, sess.begin():
-                stmt = select(table)
+                # Projections only apply to raw rows, Session objects need the full record
+                stmt = select(*get_session_columns(table, None if deserialize else columns))
 
                 # Filtering
                 if user_id is not None:
@@ -611,20 +626,25 @@ class AsyncMySQLDb(AsyncBaseDb):
                     session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
                     stmt = stmt.where(table.c.session_type == session_type_value)
 
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = await sess.scalar(count_stmt) or 0
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = await sess.scalar(count_stmt) or 0
 
                 # Sorting
                 stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(stmt, table, "session_id", sort_by, sort_order, cursor)
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 result = await sess.execute(stmt)
                 records = result.fetchall()
+                if not count_total:
+                    total_count = len(records)
                 if records is None:
                     return [], 0
 
@@ -1216,6 +1236,8 @@ class AsyncMySQLDb(AsyncBaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from the database as UserMemory objects.
 
@@ -1230,6 +1252,8 @@ class AsyncMySQLDb(AsyncBaseDb):
             sort_by (Optional[str]): The column to sort by.
             sort_order (Optional[str]): The order to sort by.
             deserialize (Optional[bool]): Whether to serialize the memories. Defaults to True.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
@@ -1261,20 +1285,25 @@ class AsyncMySQLDb(AsyncBaseDb):
                     stmt = stmt.where(cast(table.c.memory, TEXT).ilike(f"%{search_content}%"))
 
                 # Get total count after applying filtering
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = await sess.scalar(count_stmt) or 0
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = await sess.scalar(count_stmt) or 0
 
                 # Sorting
                 stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(stmt, table, "memory_id", sort_by, sort_order, cursor)
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 result = await sess.execute(stmt)
                 records = result.fetchall()
+                if not count_total:
+                    total_count = len(records)
                 if not records:
                     return [] if deserialize else ([], 0)
 
@@ -2230,6 +2259,8 @@ class AsyncMySQLDb(AsyncBaseDb):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         """Get all eval runs from the database.
 
@@ -2245,6 +2276,8 @@ class AsyncMySQLDb(AsyncBaseDb):
             eval_type (Optional[List[EvalType]]): The type(s) of eval to filter by.
             filter_type (Optional[EvalFilterType]): Filter by component type (agent, team, workflow).
             deserialize (Optional[bool]): Whether to serialize the eval runs. Defaults to True.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
@@ -2280,23 +2313,30 @@ class AsyncMySQLDb(AsyncBaseDb):
                         stmt = stmt.where(table.c.workflow_id.is_not(None))
 
                 # Get total count after applying filtering
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = await sess.scalar(count_stmt) or 0
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = await sess.scalar(count_stmt) or 0
 
                 # Sorting
                 if sort_by is None:
                     stmt = stmt.order_by(table.c.created_at.desc())
                 else:
                     stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(
+                    stmt, table, "run_id", sort_by or "created_at", sort_order if sort_by else "desc", cursor
+                )
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 result = await sess.execute(stmt)
                 records = result.fetchall()
+                if not count_total:
+                    total_count = len(records)
                 if not records:
                     return [] if deserialize else ([], 0)
 
@@ -2608,6 +2648,8 @@ class AsyncMySQLDb(AsyncBaseDb):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters with pagination.
 
@@ -2623,6 +2665,8 @@ class AsyncMySQLDb(AsyncBaseDb):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces, total count).
@@ -2669,16 +2713,23 @@ class AsyncMySQLDb(AsyncBaseDb):
                     base_stmt = base_stmt.where(table.c.end_time <= end_time.isoformat())
 
                 # Get total count
-                count_stmt = select(func.count()).select_from(base_stmt.alias())
-                count_result = await sess.execute(count_stmt)
-                total_count = count_result.scalar() or 0
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(base_stmt.alias())
+                    count_result = await sess.execute(count_stmt)
+                    total_count = count_result.scalar() or 0
 
                 # Apply pagination
-                offset = (page - 1) * limit if page and limit else 0
-                paginated_stmt = base_stmt.order_by(table.c.start_time.desc()).limit(limit).offset(offset)
+                offset = (page - 1) * limit if page and limit and cursor is None else 0
+                base_stmt = apply_cursor(
+                    base_stmt.order_by(table.c.start_time.desc()), table, "trace_id", "start_time", "desc", cursor
+                )
+                paginated_stmt = base_stmt.limit(limit).offset(offset)
 
                 result = await sess.execute(paginated_stmt)
                 results = result.fetchall()
+                if not count_total:
+                    total_count = len(results)
 
                 traces = [Trace.from_dict(dict(row._mapping)) for row in results]
                 return traces, total_count
@@ -7,10 +7,11 @@ from uuid import uuid4
 
 from agno.db.mysql.schemas import get_table_schema_definition
 from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.utils import decode_cursor
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
-    from sqlalchemy import Engine, Table, func
+    from sqlalchemy import Engine, Table, and_, case, func, literal_column, or_, select
     from sqlalchemy.dialects import mysql
     from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
     from sqlalchemy.inspection import inspect
@@ -58,6 +59,117 @@ def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order:
         return stmt.order_by(sort_column.desc())
 
 
+def apply_cursor(
+    stmt,
+    table: Table,
+    id_column: str,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+    cursor: Optional[str] = None,
+):
+    """Apply keyset pagination on (sort_by, id_column) to the given SQLAlchemy statement.
+
+    Adds the ID column as a tiebreaker to the ordering set by apply_sorting and, when a cursor is given,
+    only selects the rows following it. Unlike OFFSET, this stays fast on deep pages as long as
+    (sort_by, id_column) is indexed.
+
+    Args:
+        stmt: The SQLAlchemy statement to modify, already sorted with apply_sorting
+        table: The table being queried
+        id_column: The unique column used to break ties between equal sort values
+        sort_by: The field the statement is sorted by
+        sort_order: The sort order ('asc' or 'desc')
+        cursor: The cursor returned for the previous page, if any
+
+    Returns:
+        The modified statement with the tiebreaker and cursor filter applied
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    id_col = table.c[id_column]
+    is_descending = sort_order != "asc"
+
+    sort_column = None
+    if sort_by is not None and hasattr(table.c, sort_by):
+        if sort_by == "updated_at" and hasattr(table.c, "created_at"):
+            sort_column = func.coalesce(table.c.updated_at, table.c.created_at)
+        else:
+            sort_column = getattr(table.c, sort_by)
+
+    if cursor is not None:
+        sort_value, last_id = decode_cursor(cursor)
+        if sort_column is None:
+            stmt = stmt.where(id_col < last_id if is_descending else id_col > last_id)
+        elif is_descending:
+            stmt = stmt.where(or_(sort_column < sort_value, and_(sort_column == sort_value, id_col < last_id)))
+        else:
+            stmt = stmt.where(or_(sort_column > sort_value, and_(sort_column == sort_value, id_col > last_id)))
+
+    return stmt.order_by(id_col.desc() if is_descending else id_col.asc())
+
+
+def get_session_columns(table: Table, columns: Optional[List[str]] = None) -> List[Any]:
+    """Map a session projection to selectable columns, computing run_count and unnamed_runs in the database.
+
+    Args:
+        table: The sessions table
+        columns: The columns to select. None selects every column.
+
+    Returns:
+        The list of columns and labelled expressions to select
+    """
+    if columns is None:
+        return list(table.c)
+
+    selected: List[Any] = []
+    for column in columns:
+        if column == "run_count":
+            selected.append(
+                case(
+                    (func.json_type(table.c.runs) == "ARRAY", func.json_length(table.c.runs)),
+                    else_=0,
+                ).label("run_count")
+            )
+        elif column == "unnamed_runs":
+            # JSON_TYPE is 'NULL' for a JSON null and NULL for a missing key
+            session_name_type = func.json_type(func.json_extract(table.c.session_data, "$.session_name"))
+            # Only the input of the first run is read, skipping the member runs stored in team sessions
+            run_items = func.json_table(
+                table.c.runs, literal_column("'$[*]' COLUMNS (idx FOR ORDINALITY, agent_id JSON PATH '$.agent_id')")
+            ).table_valued("idx", "agent_id")
+            team_run_index = (
+                select(run_items.c.idx - 1)
+                .where(or_(run_items.c.agent_id.is_(None), func.json_type(run_items.c.agent_id) == "NULL"))
+                .order_by(run_items.c.idx)
+                .limit(1)
+                .scalar_subquery()
+            )
+            first_run_input_path = case(
+                (table.c.session_type == "team", func.concat("$[", team_run_index, "].input")),
+                else_="$[0].input",
+            )
+            first_run_input = func.json_array(
+                func.json_object("input", func.json_extract(table.c.runs, first_run_input_path)),
+                type_=table.c.runs.type,
+            )
+            selected.append(
+                case(
+                    (
+                        and_(
+                            func.coalesce(session_name_type, "NULL") == "NULL",
+                            func.json_type(table.c.runs) == "ARRAY",
+                        ),
+                        first_run_input,
+                    ),
+                    else_=None,
+                ).label("runs")
+            )
+        elif column in table.c:
+            selected.append(table.c[column])
+    return selected
+
+
 def create_schema(session: Session, db_schema: str) -> None:
     """Create the database schema if it doesn't exist.
 
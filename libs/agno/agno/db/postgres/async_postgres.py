@@ -14,11 +14,14 @@ from agno.db.postgres.utils import (
     acreate_schema,
     ais_table_available,
     ais_valid_table,
+    apply_cursor,
     apply_sorting,
     calculate_date_metrics,
     deserialize_cultural_knowledge,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_index_columns,
+    get_session_columns,
     serialize_cultural_knowledge,
 )
 from agno.db.schemas.culture import CulturalKnowledge
@@ -196,6 +199,7 @@ class AsyncPostgresDb(AsyncBaseDb):
             indexes: List[str] = []
             unique_constraints: List[str] = []
             schema_unique_constraints = table_schema.pop("_unique_constraints", [])
+            schema_composite_indexes = table_schema.pop("_composite_indexes", [])
 
             # Get the columns, indexes, and unique constraints from the table schema
             for col_name, col_config in table_schema.items():
@@ -231,6 +235,11 @@ class AsyncPostgresDb(AsyncBaseDb):
                 idx_name = f"idx_{table_name}_{idx_col}"
                 table.append_constraint(Index(idx_name, idx_col))
 
+            # Multi-column indexes
+            for composite_index in schema_composite_indexes:
+                idx_name = f"idx_{table_name}_{composite_index['name']}"
+                table.append_constraint(Index(idx_name, *get_index_columns(table, composite_index["columns"])))
+
             if self.create_schema:
                 async with self.async_session_factory() as sess, sess.begin():
                     await acreate_schema(session=sess, db_schema=self.db_schema)
@@ -580,6 +589,9 @@ class AsyncPostgresDb(AsyncBaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """
         Get all sessions in the given table. Can filter by user_id and entity_id.
@@ -595,6 +607,9 @@ class AsyncPostgresDb(AsyncBaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            columns (Optional[List[str]]): Columns to return when deserialize=False, e.g. SESSION_SUMMARY_COLUMNS.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[Session], Tuple[List[Dict], int]]:
@@ -608,7 +623,8 @@ class AsyncPostgresDb(AsyncBaseDb):
             table = await self._get_table(table_type="sessions")
 
             async with self.async_session_factory() as sess, sess.begin():
-                stmt = select(table)
+                # Projections only apply to raw rows, Session objects need the full record
+                stmt = select(*get_session_columns(table, None if deserialize else columns))
 
                 # Filtering
                 if user_id is not None:
@@ -632,20 +648,25 @@ class AsyncPostgresDb(AsyncBaseDb):
                     session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
                     stmt = stmt.where(table.c.session_type == session_type_value)
 
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = await sess.scalar(count_stmt) or 0
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = await sess.scalar(count_stmt) or 0
 
                 # Sorting
                 stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(stmt, table, "session_id", sort_by, sort_order, cursor)
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 result = await sess.execute(stmt)
                 records = result.fetchall()
+                if not count_total:
+                    total_count = len(records)
                 if records is None:
                     return [], 0
 
@@ -1061,6 +1082,8 @@ class AsyncPostgresDb(AsyncBaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from the database as UserMemory objects.
 
@@ -1075,6 +1098,8 @@ class AsyncPostgresDb(AsyncBaseDb):
             sort_by (Optional[str]): The column to sort by.
             sort_order (Optional[str]): The order to sort by.
             deserialize (Optional[bool]): Whether to serialize the memories. Defaults to True.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
@@ -1103,20 +1128,25 @@ class AsyncPostgresDb(AsyncBaseDb):
                     stmt = stmt.where(func.cast(table.c.memory, postgresql.TEXT).ilike(f"%{search_content}%"))
 
                 # Get total count after applying filtering
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = await sess.scalar(count_stmt) or 0
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = await sess.scalar(count_stmt) or 0
 
                 # Sorting
                 stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(stmt, table, "memory_id", sort_by, sort_order, cursor)
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 result = await sess.execute(stmt)
                 records = result.fetchall()
+                if not count_total:
+                    total_count = len(records)
                 if not records:
                     return [] if deserialize else ([], 0)
 
@@ -2027,6 +2057,8 @@ class AsyncPostgresDb(AsyncBaseDb):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         """Get all eval runs from the database.
 
@@ -2042,6 +2074,8 @@ class AsyncPostgresDb(AsyncBaseDb):
             eval_type (Optional[List[EvalType]]): The type(s) of eval to filter by.
             filter_type (Optional[EvalFilterType]): Filter by component type (agent, team, workflow).
             deserialize (Optional[bool]): Whether to serialize the eval runs. Defaults to True.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
@@ -2077,23 +2111,30 @@ class AsyncPostgresDb(AsyncBaseDb):
                         stmt = stmt.where(table.c.workflow_id.is_not(None))
 
                 # Get total count after applying filtering
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = await sess.scalar(count_stmt) or 0
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = await sess.scalar(count_stmt) or 0
 
                 # Sorting
                 if sort_by is None:
                     stmt = stmt.order_by(table.c.created_at.desc())
                 else:
                     stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(
+                    stmt, table, "run_id", sort_by or "created_at", sort_order if sort_by else "desc", cursor
+                )
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 result = await sess.execute(stmt)
                 records = result.fetchall()
+                if not count_total:
+                    total_count = len(records)
                 if not records:
                     return [] if deserialize else ([], 0)
 
@@ -2412,6 +2453,8 @@ class AsyncPostgresDb(AsyncBaseDb):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters with pagination.
 
@@ -2427,6 +2470,8 @@ class AsyncPostgresDb(AsyncBaseDb):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces, total count).
@@ -2466,16 +2511,23 @@ class AsyncPostgresDb(AsyncBaseDb):
                     base_stmt = base_stmt.where(table.c.end_time <= end_time.isoformat())
 
                 # Get total count
-                count_stmt = select(func.count()).select_from(base_stmt.alias())
-                total_count = await sess.scalar(count_stmt) or 0
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(base_stmt.alias())
+                    total_count = await sess.scalar(count_stmt) or 0
                 log_debug(f"Total matching traces: {total_count}")
 
                 # Apply pagination
-                offset = (page - 1) * limit if page and limit else 0
-                paginated_stmt = base_stmt.order_by(table.c.start_time.desc()).limit(limit).offset(offset)
+                offset = (page - 1) * limit if page and limit and cursor is None else 0
+                base_stmt = apply_cursor(
+                    base_stmt.order_by(table.c.start_time.desc()), table, "trace_id", "start_time", "desc", cursor
+                )
+                paginated_stmt = base_stmt.limit(limit).offset(offset)
 
                 result = await sess.execute(paginated_stmt)
                 results = result.fetchall()
+                if not count_total:
+                    total_count = len(results)
                 log_debug(f"Returning page {page} with {len(results)} traces")
 
                 traces = [Trace.from_dict(dict(row._mapping)) for row in results]
@@ -10,6 +10,7 @@ from agno.db.base import BaseDb, ComponentType, SessionType
 from agno.db.migrations.manager import MigrationManager
 from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.postgres.utils import (
+    apply_cursor,
     apply_sorting,
     bulk_upsert_metrics,
     calculate_date_metrics,
@@ -17,6 +18,8 @@ from agno.db.postgres.utils import (
     deserialize_cultural_knowledge,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_index_columns,
+    get_session_columns,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge,
@@ -231,6 +234,7 @@ class PostgresDb(BaseDb):
 
         Supports:
         - _unique_constraints: [{"name": "...", "columns": [...]}]
+        - _composite_indexes: [{"name": "...", "columns": [...]}]
         - __primary_key__: ["col1", "col2", ...]
         - __foreign_keys__: [{"columns":[...], "ref_table":"...", "ref_columns":[...]}]
         - column-level foreign_key: "logical_table.column" (resolved via _resolve_* helpers)
@@ -246,6 +250,7 @@ class PostgresDb(BaseDb):
 
             # Extract special schema keys before iterating columns
             schema_unique_constraints = table_schema.pop("_unique_constraints", [])
+            schema_composite_indexes = table_schema.pop("_composite_indexes", [])
             schema_primary_key = table_schema.pop("__primary_key__", None)
             schema_foreign_keys = table_schema.pop("__foreign_keys__", [])
 
@@ -336,6 +341,11 @@ class PostgresDb(BaseDb):
                 idx_name = f"idx_{table_name}_{idx_col}"
                 Index(idx_name, table.c[idx_col])  # Correct way; do NOT append as constraint
 
+            # Multi-column indexes
+            for composite_index in schema_composite_indexes:
+                idx_name = f"idx_{table_name}_{composite_index['name']}"
+                Index(idx_name, *get_index_columns(table, composite_index["columns"]))
+
             # Create schema if requested
             if self.create_schema:
                 with self.Session() as sess, sess.begin():
@@ -736,6 +746,9 @@ class PostgresDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """
         Get all sessions in the given table. Can filter by user_id and component_id.
@@ -752,6 +765,9 @@ class PostgresDb(BaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            columns (Optional[List[str]]): Columns to return when deserialize=False, e.g. SESSION_SUMMARY_COLUMNS.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[Session], Tuple[List[Dict], int]]:
@@ -767,7 +783,8 @@ class PostgresDb(BaseDb):
                 return [] if deserialize else ([], 0)
 
             with self.Session() as sess, sess.begin():
-                stmt = select(table)
+                # Projections only apply to raw rows, Session objects need the full record
+                stmt = select(*get_session_columns(table, None if deserialize else columns))
 
                 # Filtering
                 if user_id is not None:
@@ -791,19 +808,24 @@ class PostgresDb(BaseDb):
                     session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
                     stmt = stmt.where(table.c.session_type == session_type_value)
 
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = sess.execute(count_stmt).scalar()
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = sess.execute(count_stmt).scalar()
 
                 # Sorting
                 stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(stmt, table, "session_id", sort_by, sort_order, cursor)
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 records = sess.execute(stmt).fetchall()
+                if not count_total:
+                    total_count = len(records)
                 if records is None:
                     return [], 0
 
@@ -1427,6 +1449,8 @@ class PostgresDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from the database as UserMemory objects.
 
@@ -1441,6 +1465,8 @@ class PostgresDb(BaseDb):
             sort_by (Optional[str]): The column to sort by.
             sort_order (Optional[str]): The order to sort by.
             deserialize (Optional[bool]): Whether to serialize the memories. Defaults to True.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
 
         Returns:
@@ -1472,19 +1498,24 @@ class PostgresDb(BaseDb):
                     stmt = stmt.where(func.cast(table.c.memory, postgresql.TEXT).ilike(f"%{search_content}%"))
 
                 # Get total count after applying filtering
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = sess.execute(count_stmt).scalar()
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = sess.execute(count_stmt).scalar()
 
                 # Sorting
                 stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(stmt, table, "memory_id", sort_by, sort_order, cursor)
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 result = sess.execute(stmt).fetchall()
+                if not count_total:
+                    total_count = len(result)
                 if not result:
                     return [] if deserialize else ([], 0)
 
@@ -2268,6 +2299,8 @@ class PostgresDb(BaseDb):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         """Get all eval runs from the database.
 
@@ -2284,6 +2317,8 @@ class PostgresDb(BaseDb):
             filter_type (Optional[EvalFilterType]): Filter by component type (agent, team, workflow).
             deserialize (Optional[bool]): Whether to serialize the eval runs. Defaults to True.
             create_table_if_not_found (Optional[bool]): Whether to create the table if it doesn't exist.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
@@ -2321,22 +2356,29 @@ class PostgresDb(BaseDb):
                         stmt = stmt.where(table.c.workflow_id.is_not(None))
 
                 # Get total count after applying filtering
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = sess.execute(count_stmt).scalar()
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = sess.execute(count_stmt).scalar()
 
                 # Sorting
                 if sort_by is None:
                     stmt = stmt.order_by(table.c.created_at.desc())
                 else:
                     stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(
+                    stmt, table, "run_id", sort_by or "created_at", sort_order if sort_by else "desc", cursor
+                )
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 result = sess.execute(stmt).fetchall()
+                if not count_total:
+                    total_count = len(result)
                 if not result:
                     return [] if deserialize else ([], 0)
 
@@ -2900,6 +2942,8 @@ class PostgresDb(BaseDb):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters with pagination.
 
@@ -2915,6 +2959,8 @@ class PostgresDb(BaseDb):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces, total count).
@@ -2957,14 +3003,21 @@ class PostgresDb(BaseDb):
                     base_stmt = base_stmt.where(table.c.end_time <= end_time.isoformat())
 
                 # Get total count
-                count_stmt = select(func.count()).select_from(base_stmt.alias())
-                total_count = sess.execute(count_stmt).scalar() or 0
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(base_stmt.alias())
+                    total_count = sess.execute(count_stmt).scalar() or 0
 
                 # Apply pagination
-                offset = (page - 1) * limit if page and limit else 0
-                paginated_stmt = base_stmt.order_by(table.c.start_time.desc()).limit(limit).offset(offset)
+                offset = (page - 1) * limit if page and limit and cursor is None else 0
+                base_stmt = apply_cursor(
+                    base_stmt.order_by(table.c.start_time.desc()), table, "trace_id", "start_time", "desc", cursor
+                )
+                paginated_stmt = base_stmt.limit(limit).offset(offset)
 
                 results = sess.execute(paginated_stmt).fetchall()
+                if not count_total:
+                    total_count = len(results)
 
                 traces = [Trace.from_dict(dict(row._mapping)) for row in results]
                 return traces, total_count
@@ -30,6 +30,18 @@ SESSION_TABLE_SCHEMA = {
             "columns": ["session_id"],
         },
     ],
+    # (sort key, id) indexes backing keyset pagination
+    "_composite_indexes": [
+        {"name": "created_at_session_id", "columns": ["created_at", "session_id"]},
+        # updated_at sorts on COALESCE(updated_at, created_at), so that is what is indexed
+        {"name": "updated_at_created_at_session_id", "columns": [["updated_at", "created_at"], "session_id"]},
+        # (filter, sort key) indexes backing get_sessions, which filters on the user and the component and
+        # sorts on created_at by default
+        {"name": "user_id_session_type_created_at", "columns": ["user_id", "session_type", "created_at"]},
+        {"name": "agent_id_created_at", "columns": ["agent_id", "created_at"]},
+        {"name": "team_id_created_at", "columns": ["team_id", "created_at"]},
+        {"name": "workflow_id_created_at", "columns": ["workflow_id", "created_at"]},
+    ],
 }
 
 MEMORY_TABLE_SCHEMA = {
@@ -43,6 +55,14 @@ MEMORY_TABLE_SCHEMA = {
     "topics": {"type": JSONB, "nullable": True},
     "created_at": {"type": BigInteger, "nullable": False, "index": True},
     "updated_at": {"type": BigInteger, "nullable": True, "index": True},
+    # (sort key, id) indexes backing keyset pagination
+    "_composite_indexes": [
+        # updated_at sorts on COALESCE(updated_at, created_at), so that is what is indexed
+        {"name": "updated_at_created_at_memory_id", "columns": [["updated_at", "created_at"], "memory_id"]},
+        # (filter, sort key) indexes backing get_user_memories filtered by agent or team
+        {"name": "agent_id_updated_at", "columns": ["agent_id", "updated_at"]},
+        {"name": "team_id_updated_at", "columns": ["team_id", "updated_at"]},
+    ],
 }
 
 EVAL_TABLE_SCHEMA = {
@@ -59,6 +79,10 @@ EVAL_TABLE_SCHEMA = {
     "evaluated_component_name": {"type": String, "nullable": True},
     "created_at": {"type": BigInteger, "nullable": False, "index": True},
     "updated_at": {"type": BigInteger, "nullable": True},
+    # (sort key, id) indexes backing keyset pagination
+    "_composite_indexes": [
+        {"name": "created_at_run_id", "columns": ["created_at", "run_id"]},
+    ],
 }
 
 KNOWLEDGE_TABLE_SCHEMA = {
@@ -135,6 +159,14 @@ TRACE_TABLE_SCHEMA = {
     "team_id": {"type": String, "nullable": True, "index": True},
     "workflow_id": {"type": String, "nullable": True, "index": True},
     "created_at": {"type": String, "nullable": False, "index": True},  # ISO 8601 datetime string
+    # (sort key, id) indexes backing keyset pagination
+    "_composite_indexes": [
+        {"name": "start_time_trace_id", "columns": ["start_time", "trace_id"]},
+        # (filter, sort key) indexes backing get_traces, which lists the latest traces of a session, user or agent
+        {"name": "session_id_start_time", "columns": ["session_id", "start_time"]},
+        {"name": "user_id_start_time", "columns": ["user_id", "start_time"]},
+        {"name": "agent_id_start_time", "columns": ["agent_id", "start_time"]},
+    ],
 }
 
 
@@ -10,10 +10,11 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.utils import decode_cursor
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
-    from sqlalchemy import Table, func
+    from sqlalchemy import Table, and_, case, func, literal_column, or_
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.exc import NoSuchTableError
     from sqlalchemy.inspection import inspect
@@ -24,6 +25,30 @@ except ImportError:
 
 
 # -- DB util methods --
+
+
+def get_index_columns(table: Table, columns: List[Any]) -> List[Any]:
+    """Get the indexed expressions of a composite index of the given table.
+
+    A column given as a list of columns is indexed as their COALESCE, matching the sort key apply_sorting uses
+    for updated_at, so the index can serve the ordering.
+
+    Raises:
+        ValueError: If the index references columns missing from the table.
+    """
+    index_columns: List[Any] = []
+    for column in columns:
+        names = column if isinstance(column, list) else [column]
+        missing = [name for name in names if name not in table.c]
+        if missing:
+            raise ValueError(f"Index references missing columns in {table.name}: {missing}")
+        if isinstance(column, list):
+            index_columns.append(func.coalesce(*[table.c[name] for name in names]))
+        else:
+            index_columns.append(table.c[column])
+    return index_columns
+
+
 def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order: Optional[str] = None):
     """Apply sorting to the given SQLAlchemy statement.
 
@@ -61,6 +86,105 @@ def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order:
         return stmt.order_by(sort_column.desc())
 
 
+def apply_cursor(
+    stmt,
+    table: Table,
+    id_column: str,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+    cursor: Optional[str] = None,
+):
+    """Apply keyset pagination on (sort_by, id_column) to the given SQLAlchemy statement.
+
+    Adds the ID column as a tiebreaker to the ordering set by apply_sorting and, when a cursor is given,
+    only selects the rows following it. Unlike OFFSET, this stays fast on deep pages as long as
+    (sort_by, id_column) is indexed.
+
+    Args:
+        stmt: The SQLAlchemy statement to modify, already sorted with apply_sorting
+        table: The table being queried
+        id_column: The unique column used to break ties between equal sort values
+        sort_by: The field the statement is sorted by
+        sort_order: The sort order ('asc' or 'desc')
+        cursor: The cursor returned for the previous page, if any
+
+    Returns:
+        The modified statement with the tiebreaker and cursor filter applied
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    id_col = table.c[id_column]
+    is_descending = sort_order != "asc"
+
+    sort_column = None
+    if sort_by is not None and hasattr(table.c, sort_by):
+        if sort_by == "updated_at" and hasattr(table.c, "created_at"):
+            sort_column = func.coalesce(table.c.updated_at, table.c.created_at)
+        else:
+            sort_column = getattr(table.c, sort_by)
+
+    if cursor is not None:
+        sort_value, last_id = decode_cursor(cursor)
+        if sort_column is None:
+            stmt = stmt.where(id_col < last_id if is_descending else id_col > last_id)
+        elif is_descending:
+            stmt = stmt.where(or_(sort_column < sort_value, and_(sort_column == sort_value, id_col < last_id)))
+        else:
+            stmt = stmt.where(or_(sort_column > sort_value, and_(sort_column == sort_value, id_col > last_id)))
+
+    return stmt.order_by(id_col.desc() if is_descending else id_col.asc())
+
+
+# Runs of a team session without an agent_id, i.e. not stored for a member
+_TEAM_RUN_PATH = "'$[*] ? (!(exists(@.agent_id)) || @.agent_id == null)'::jsonpath"
+
+
+def get_session_columns(table: Table, columns: Optional[List[str]] = None) -> List[Any]:
+    """Map a session projection to selectable columns, computing run_count and unnamed_runs in the database.
+
+    Args:
+        table: The sessions table
+        columns: The columns to select. None selects every column.
+
+    Returns:
+        The list of columns and labelled expressions to select
+    """
+    if columns is None:
+        return list(table.c)
+
+    selected: List[Any] = []
+    for column in columns:
+        if column == "run_count":
+            runs = func.cast(table.c.runs, postgresql.JSONB)
+            selected.append(
+                case((func.jsonb_typeof(runs) == "array", func.jsonb_array_length(runs)), else_=0).label("run_count")
+            )
+        elif column == "unnamed_runs":
+            # Only the input of the first run is read, skipping the member runs stored in team sessions
+            session_name = func.cast(table.c.session_data, postgresql.JSONB)["session_name"].astext
+            runs = func.cast(table.c.runs, postgresql.JSONB)
+            first_run = case(
+                (
+                    table.c.session_type == "team",
+                    func.jsonb_path_query_first(runs, literal_column(_TEAM_RUN_PATH), type_=postgresql.JSONB),
+                ),
+                else_=runs.op("->", return_type=postgresql.JSONB)(0),
+            )
+            first_run_input = func.jsonb_build_array(
+                func.jsonb_build_object("input", first_run.op("->", return_type=postgresql.JSONB)("input")),
+                type_=postgresql.JSONB,
+            )
+            selected.append(
+                case(
+                    (and_(session_name.is_(None), func.jsonb_typeof(runs) == "array"), first_run_input), else_=None
+                ).label("runs")
+            )
+        elif column in table.c:
+            selected.append(table.c[column])
+    return selected
+
+
 def create_schema(session: Session, db_schema: str) -> None:
     """Create the database schema if it doesn't exist.
 
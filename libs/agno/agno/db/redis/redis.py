@@ -27,6 +27,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import apply_cursor_to_records, project_session
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -388,6 +389,9 @@ class RedisDb(BaseDb):
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
         create_index_if_not_found: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """Get all sessions matching the given filters.
 
@@ -400,6 +404,9 @@ class RedisDb(BaseDb):
             page (Optional[int]): The page number to return.
             sort_by (Optional[str]): The field to sort by.
             sort_order (Optional[str]): The order to sort by.
+            columns (Optional[List[str]]): Columns to return when deserialize=False, e.g. SESSION_SUMMARY_COLUMNS.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             List[Union[AgentSession, TeamSession, WorkflowSession]]: The list of sessions.
@@ -434,12 +441,17 @@ class RedisDb(BaseDb):
                     if session_name.lower() in s.get("session_data", {}).get("session_name", "").lower()
                 ]
 
-            sorted_sessions = apply_sorting(records=filtered_sessions, sort_by=sort_by, sort_order=sort_order)
-            sessions = apply_pagination(records=sorted_sessions, limit=limit, page=page)
+            # The ID breaks ties between equal sort values, keeping pages stable for cursors
+            sorted_sessions = filtered_sessions
+            if sort_by is not None or cursor is not None:
+                sorted_sessions = apply_cursor_to_records(
+                    filtered_sessions, "session_id", sort_by, sort_order or "asc", cursor
+                )
+            sessions = apply_pagination(records=sorted_sessions, limit=limit, page=page if cursor is None else None)
             sessions = [record for record in sessions]
 
             if not deserialize:
-                return sessions, len(filtered_sessions)
+                return [project_session(session, columns) for session in sessions], len(filtered_sessions)
 
             if session_type == SessionType.AGENT:
                 return [AgentSession.from_dict(record) for record in sessions]  # type: ignore
@@ -791,6 +803,8 @@ class RedisDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from Redis as UserMemory objects.
 
@@ -805,6 +819,8 @@ class RedisDb(BaseDb):
             sort_by (Optional[str]): The field to sort by.
             sort_order (Optional[str]): The order to sort by.
             deserialize (Optional[bool]): Whether to deserialize the memories.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
@@ -840,8 +856,15 @@ class RedisDb(BaseDb):
                     m for m in filtered_memories if search_content.lower() in str(m.get("memory", "")).lower()
                 ]
 
-            sorted_memories = apply_sorting(records=filtered_memories, sort_by=sort_by, sort_order=sort_order)
-            paginated_memories = apply_pagination(records=sorted_memories, limit=limit, page=page)
+            # The ID breaks ties between equal sort values, keeping pages stable for cursors
+            sorted_memories = filtered_memories
+            if sort_by is not None or cursor is not None:
+                sorted_memories = apply_cursor_to_records(
+                    filtered_memories, "memory_id", sort_by, sort_order or "asc", cursor
+                )
+            paginated_memories = apply_pagination(
+                records=sorted_memories, limit=limit, page=page if cursor is None else None
+            )
 
             if not deserialize:
                 return paginated_memories, len(filtered_memories)
@@ -1419,6 +1442,8 @@ class RedisDb(BaseDb):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         """Get all eval runs from Redis.
 
@@ -1427,6 +1452,8 @@ class RedisDb(BaseDb):
             page (Optional[int]): The page number to return.
             sort_by (Optional[str]): The field to sort by.
             sort_order (Optional[str]): The order to sort by.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             List[EvalRunRecord]: The list of eval runs.
@@ -1470,8 +1497,11 @@ class RedisDb(BaseDb):
                 sort_by = "created_at"
                 sort_order = "desc"
 
-            sorted_runs = apply_sorting(records=filtered_runs, sort_by=sort_by, sort_order=sort_order)
-            paginated_runs = apply_pagination(records=sorted_runs, limit=limit, page=page)
+            # The ID breaks ties between equal sort values, keeping pages stable for cursors
+            sorted_runs = filtered_runs
+            if sort_by is not None or cursor is not None:
+                sorted_runs = apply_cursor_to_records(filtered_runs, "run_id", sort_by, sort_order or "asc", cursor)
+            paginated_runs = apply_pagination(records=sorted_runs, limit=limit, page=page if cursor is None else None)
 
             if not deserialize:
                 return paginated_runs, len(filtered_runs)
@@ -1860,6 +1890,8 @@ class RedisDb(BaseDb):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters.
 
@@ -1875,6 +1907,8 @@ class RedisDb(BaseDb):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces, total count).
@@ -1921,10 +1955,12 @@ class RedisDb(BaseDb):
             total_count = len(filtered_traces)
 
             # Sort by start_time descending
-            filtered_traces.sort(key=lambda x: x.get("start_time", ""), reverse=True)
+            filtered_traces = apply_cursor_to_records(filtered_traces, "trace_id", "start_time", "desc", cursor)
 
             # Apply pagination
-            paginated_traces = apply_pagination(records=filtered_traces, limit=limit, page=page)
+            paginated_traces = apply_pagination(
+                records=filtered_traces, limit=limit, page=page if cursor is None else None
+            )
 
             traces = []
             for row in paginated_traces:
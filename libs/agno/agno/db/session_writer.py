@@ -0,0 +1,268 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from copy import copy, deepcopy
+from dataclasses import dataclass, replace
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+
+from agno.db.base import AsyncBaseDb, BaseDb
+from agno.session import Session
+from agno.utils.log import log_debug, log_error
+
+Durability = Literal["sync", "async"]
+
+# Writes are keyed by database id and session_id, so copies of a database share the writes of its sessions
+_WriteKey = Tuple[str, str]
+
+
+@dataclass
+class _PendingWrite:
+    db: Union[BaseDb, AsyncBaseDb]
+    session: Session
+    # When the write starts, unless another save of the session is coalesced into it before
+    deadline: float
+    future: "Future[None]"
+
+
+class SessionWriter:
+    def __init__(self, durability: Durability = "async", coalesce_ms: float = 50.0, max_workers: int = 4):
+        """
+        Write-behind persistence of sessions, taking database writes off the critical path of runs.
+
+        Saves of the same session within coalesce_ms are coalesced into one write of its latest state, and the
+        writes of a session are always applied in the order of its saves. Sessions are copied when saved (their list
+        of runs, latest run, session data and metadata), so the caller can go on changing them while they are written.
+        Earlier runs are shared with the copy and must not be changed in place.
+
+        Durability modes:
+            sync: save() returns once the session is written.
+            async: save() returns a future, resolved once the session is written. Agents and teams wait for the
+                pending writes of a session before reading it again, so a run always sees the previous ones.
+
+        Writes to async databases run on the event loop of the save, which can end with the run (e.g. asyncio.run),
+        so asave() waits for them unless the writer is attached to a long-lived loop with attach(). AgentOS attaches
+        the writers of its agents and teams to its event loop, and flushes them, in its lifespan.
+
+        Failed writes are logged. Call flush() or aflush() on shutdown to write the pending sessions.
+
+        Args:
+            durability (Durability): When saves return. Defaults to "async".
+            coalesce_ms (float): How long a save waits for further saves of the same session before it is written.
+            max_workers (int): Number of threads writing to sync databases. Writes of a session use the same thread.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.durability: Durability = durability
+        self.coalesce_ms: float = coalesce_ms
+        self.max_workers: int = max_workers
+
+        self._lock = Lock()
+        # Saves not written yet, which later saves of the same session are coalesced into
+        self._pending: Dict[_WriteKey, _PendingWrite] = {}
+        # The future of the latest write of each session, until it is done
+        self._latest: Dict[_WriteKey, "Future[None]"] = {}
+        # The task of the latest write of each session to an async database, which the next write waits for
+        self._tasks: Dict[_WriteKey, "asyncio.Task[None]"] = {}
+        self._workers: Optional[List[ThreadPoolExecutor]] = None
+        # The long-lived event loop writes to async databases are left to run in the background on
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+
+    def save(self, db: BaseDb, session: Session) -> "Future[None]":
+        """Queue a write of the session, waiting for it in sync mode."""
+        future = self._submit(db, session)
+        if self.durability == "sync":
+            wait_for_futures([future])
+        return future
+
+    async def asave(self, db: Union[BaseDb, AsyncBaseDb], session: Session) -> "Future[None]":
+        """
+        Queue a write of the session, waiting for it in sync mode, or if it is written on an event loop the writer
+        is not attached to.
+        """
+        # The task writing to an async database would be cancelled if the loop ends before it is done
+        inline = isinstance(db, AsyncBaseDb) and self._loop is not asyncio.get_running_loop()
+        future = self._submit(db, session, coalesce=not inline)
+        if self.durability == "sync" or inline:
+            await _wait([future])
+        return future
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Leave writes to async databases saved on a long-lived event loop to run in the background."""
+        self._loop = loop
+
+    def detach(self) -> None:
+        """Write to async databases before asave() returns again."""
+        self._loop = None
+
+    def wait_for_writes(self, db: Union[BaseDb, AsyncBaseDb], session_id: str) -> None:
+        """Wait for the pending writes of a session before reading it."""
+        future = self._latest.get((db.id, session_id))
+        if future is not None:
+            wait_for_futures([future])
+
+    async def await_for_writes(self, db: Union[BaseDb, AsyncBaseDb], session_id: str) -> None:
+        """Wait for the pending writes of a session before reading it, without blocking the event loop."""
+        future = self._latest.get((db.id, session_id))
+        if future is not None:
+            await _wait([future])
+
+    def flush(self) -> None:
+        """Wait until every saved session is written."""
+        wait_for_futures(list(self._latest.values()))
+
+    async def aflush(self) -> None:
+        """Wait until every saved session is written, without blocking the event loop."""
+        await _wait(list(self._latest.values()))
+
+    def close(self) -> None:
+        """Write the pending sessions and stop the writer threads."""
+        self._closed = True
+        self.flush()
+        for worker in self._workers or []:
+            worker.shutdown(wait=True)
+        self._workers = None
+
+    async def aclose(self) -> None:
+        """Write the pending sessions and stop the writer threads, without blocking the event loop."""
+        self._closed = True
+        await self.aflush()
+        for worker in self._workers or []:
+            worker.shutdown(wait=False)
+        self._workers = None
+
+    def _submit(self, db: Union[BaseDb, AsyncBaseDb], session: Session, coalesce: bool = True) -> "Future[None]":
+        if self._closed:
+            raise RuntimeError("SessionWriter is closed")
+
+        key = (db.id, session.session_id)
+        snapshot = _snapshot(session)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                # The previous save is not written yet: write the latest state instead
+                pending.session = snapshot
+                return pending.future
+
+            # Saves that are waited for are written at once, only coalescing saves queued behind another write
+            delay = self.coalesce_ms / 1000 if coalesce and self.durability != "sync" else 0
+            pending = _PendingWrite(db=db, session=snapshot, deadline=monotonic() + delay, future=Future())
+            self._pending[key] = pending
+            self._latest[key] = pending.future
+        pending.future.add_done_callback(lambda future: self._forget(key, future))
+
+        if isinstance(db, AsyncBaseDb):
+            # Async databases are bound to the event loop of the caller, so chain the writes of a session as tasks
+            previous = self._tasks.get(key)
+            task = asyncio.get_running_loop().create_task(self._awrite(key, pending, previous))
+            self._tasks[key] = task
+            task.add_done_callback(lambda task: self._forget_task(key, task))
+        else:
+            self._get_worker(key).submit(self._write, key, pending)
+        return pending.future
+
+    def _get_worker(self, key: _WriteKey) -> ThreadPoolExecutor:
+        # Single-threaded workers run the writes of a session in order
+        with self._lock:
+            if self._workers is None:
+                self._workers = [
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"agno-session-writer-{i}")
+                    for i in range(self.max_workers)
+                ]
+            return self._workers[hash(key) % self.max_workers]
+
+    def _start(self, key: _WriteKey, pending: _PendingWrite) -> None:
+        # Saves from now on go to a new write, queued after this one
+        with self._lock:
+            if self._pending.get(key) is pending:
+                del self._pending[key]
+
+    def _write(self, key: _WriteKey, pending: _PendingWrite) -> None:
+        delay = pending.deadline - monotonic()
+        if delay > 0 and not self._closed:
+            sleep(delay)
+        self._start(key, pending)
+        try:
+            pending.db.upsert_session(session=pending.session)  # type: ignore
+            log_debug(f"Wrote session {pending.session.session_id}")
+            pending.future.set_result(None)
+        except Exception as e:
+            log_error(f"Error writing session {pending.session.session_id}: {e}")
+            pending.future.set_exception(e)
+
+    async def _awrite(
+        self, key: _WriteKey, pending: _PendingWrite, previous: Optional["asyncio.Task[None]"] = None
+    ) -> None:
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])
+            delay = pending.deadline - monotonic()
+            if delay > 0 and not self._closed:
+                await asyncio.sleep(delay)
+            self._start(key, pending)
+            await pending.db.upsert_session(session=pending.session)  # type: ignore
+            log_debug(f"Wrote session {pending.session.session_id}")
+            pending.future.set_result(None)
+        except asyncio.CancelledError:
+            # The event loop ended before the session was written: fail the write, so nothing waits for it forever
+            self._start(key, pending)
+            log_error(f"Write of session {pending.session.session_id} was cancelled before it was done")
+            pending.future.set_exception(RuntimeError(f"Write of session {pending.session.session_id} was cancelled"))
+            raise
+        except Exception as e:
+            log_error(f"Error writing session {pending.session.session_id}: {e}")
+            pending.future.set_exception(e)
+
+    def _forget(self, key: _WriteKey, future: "Future[None]") -> None:
+        with self._lock:
+            if self._latest.get(key) is future:
+                del self._latest[key]
+
+    def _forget_task(self, key: _WriteKey, task: "asyncio.Task[None]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+
+async def _wait(futures: List["Future[None]"]) -> None:
+    if not futures:
+        return
+    wrapped = [asyncio.wrap_future(future) for future in futures]
+    await asyncio.wait(wrapped)
+    # Failed writes are already logged
+    for future in wrapped:
+        future.exception()
+
+
+def _copy(value: Optional[Dict]) -> Optional[Dict]:
+    try:
+        return deepcopy(value)
+    except Exception:
+        # Session state can hold objects that can't be copied
+        return copy(value)
+
+
+def _copy_run(run: Any) -> Any:
+    try:
+        return deepcopy(run)
+    except Exception:
+        # Runs can hold objects that can't be copied, e.g. in their content
+        return type(run).from_dict(run.to_dict())
+
+
+def _snapshot(session: Session) -> Session:
+    """Copy the parts of a session that runs change, so it can be written while the next run goes on.
+
+    The latest run is deep-copied, as the caller still holds it and can change it while it is serialized.
+    """
+    runs = list(session.runs) if session.runs is not None else None
+    if runs:
+        runs[-1] = _copy_run(runs[-1])
+    return replace(
+        session,
+        runs=runs,  # type: ignore[arg-type]
+        session_data=_copy(session.session_data),
+        metadata=_copy(session.metadata),
+    )
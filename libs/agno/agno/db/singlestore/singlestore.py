@@ -15,6 +15,7 @@ from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
 from agno.db.singlestore.schemas import get_table_schema_definition
 from agno.db.singlestore.utils import (
+    apply_cursor,
     apply_sorting,
     bulk_upsert_metrics,
     calculate_date_metrics,
@@ -22,6 +23,7 @@ from agno.db.singlestore.utils import (
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_session_columns,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
@@ -218,6 +220,7 @@ class SingleStoreDb(BaseDb):
             indexes: List[str] = []
             unique_constraints: List[str] = []
             schema_unique_constraints = table_schema.pop("_unique_constraints", [])
+            schema_composite_indexes = table_schema.pop("_composite_indexes", [])
 
             # Get the columns, indexes, and unique constraints from the table schema
             for col_name, col_config in table_schema.items():
@@ -252,6 +255,11 @@ class SingleStoreDb(BaseDb):
                 idx_name = f"idx_{table_name}_{idx_col}"
                 table.append_constraint(Index(idx_name, idx_col))
 
+            # Multi-column indexes
+            for composite_index in schema_composite_indexes:
+                idx_name = f"idx_{table_name}_{composite_index['name']}"
+                table.append_constraint(Index(idx_name, *composite_index["columns"]))
+
             # Create schema if one is specified
             if self.create_schema and self.db_schema is not None:
                 with self.Session() as sess, sess.begin():
@@ -616,6 +624,9 @@ class SingleStoreDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         """
         Get all sessions in the given table. Can filter by user_id and entity_id.
@@ -632,7 +643,10 @@ class SingleStoreDb(BaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            columns (Optional[List[str]]): Columns to return when deserialize=False, e.g. SESSION_SUMMARY_COLUMNS.
             create_table_if_not_found (Optional[bool]): Whether to create the table if it doesn't exist.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[Session], Tuple[List[Dict], int]]:
@@ -648,7 +662,8 @@ class SingleStoreDb(BaseDb):
                 return [] if deserialize else ([], 0)
 
             with self.Session() as sess, sess.begin():
-                stmt = select(table)
+                # Projections only apply to raw rows, Session objects need the full record
+                stmt = select(*get_session_columns(table, None if deserialize else columns))
 
                 # Filtering
                 if user_id is not None:
@@ -675,19 +690,24 @@ class SingleStoreDb(BaseDb):
                     session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
                     stmt = stmt.where(table.c.session_type == session_type_value)
 
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = sess.execute(count_stmt).scalar()
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = sess.execute(count_stmt).scalar()
 
                 # Sorting
                 stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(stmt, table, "session_id", sort_by, sort_order, cursor)
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 records = sess.execute(stmt).fetchall()
+                if not count_total:
+                    total_count = len(records)
                 if records is None:
                     return [] if deserialize else ([], 0)
 
@@ -1262,6 +1282,8 @@ class SingleStoreDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from the database as UserMemory objects.
 
@@ -1276,6 +1298,8 @@ class SingleStoreDb(BaseDb):
             sort_by (Optional[str]): The column to sort by.
             sort_order (Optional[str]): The order to sort by.
             deserialize (Optional[bool]): Whether to serialize the memories. Defaults to True.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
 
         Returns:
@@ -1308,19 +1332,24 @@ class SingleStoreDb(BaseDb):
                     stmt = stmt.where(table.c.memory.like(f"%{search_content}%"))
 
                 # Get total count after applying filtering
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = sess.execute(count_stmt).scalar()
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = sess.execute(count_stmt).scalar()
 
                 # Sorting
                 stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(stmt, table, "memory_id", sort_by, sort_order, cursor)
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 result = sess.execute(stmt).fetchall()
+                if not count_total:
+                    total_count = len(result)
                 if not result:
                     return [] if deserialize else ([], 0)
 
@@ -2038,6 +2067,8 @@ class SingleStoreDb(BaseDb):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         """Get all eval runs from the database.
 
@@ -2054,6 +2085,8 @@ class SingleStoreDb(BaseDb):
             filter_type (Optional[EvalFilterType]): Filter by component type (agent, team, workflow).
             deserialize (Optional[bool]): Whether to serialize the eval runs. Defaults to True.
             create_table_if_not_found (Optional[bool]): Whether to create the table if it doesn't exist.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
@@ -2091,22 +2124,29 @@ class SingleStoreDb(BaseDb):
                         stmt = stmt.where(table.c.workflow_id.is_not(None))
 
                 # Get total count after applying filtering
-                count_stmt = select(func.count()).select_from(stmt.alias())
-                total_count = sess.execute(count_stmt).scalar()
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(stmt.alias())
+                    total_count = sess.execute(count_stmt).scalar()
 
                 # Sorting
                 if sort_by is None:
                     stmt = stmt.order_by(table.c.created_at.desc())
                 else:
                     stmt = apply_sorting(stmt, table, sort_by, sort_order)
+                stmt = apply_cursor(
+                    stmt, table, "run_id", sort_by or "created_at", sort_order if sort_by else "desc", cursor
+                )
 
                 # Paginating
                 if limit is not None:
                     stmt = stmt.limit(limit)
-                    if page is not None:
+                    if page is not None and cursor is None:
                         stmt = stmt.offset((page - 1) * limit)
 
                 result = sess.execute(stmt).fetchall()
+                if not count_total:
+                    total_count = len(result)
                 if not result:
                     return [] if deserialize else ([], 0)
 
@@ -2578,6 +2618,8 @@ class SingleStoreDb(BaseDb):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters.
 
@@ -2593,6 +2635,8 @@ class SingleStoreDb(BaseDb):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces, total count).
@@ -2639,14 +2683,21 @@ class SingleStoreDb(BaseDb):
                     base_stmt = base_stmt.where(table.c.end_time <= end_time.isoformat())
 
                 # Get total count
-                count_stmt = select(func.count()).select_from(base_stmt.alias())
-                total_count = sess.execute(count_stmt).scalar() or 0
+                total_count = 0
+                if count_total:
+                    count_stmt = select(func.count()).select_from(base_stmt.alias())
+                    total_count = sess.execute(count_stmt).scalar() or 0
 
                 # Apply pagination
-                offset = (page - 1) * limit if page and limit else 0
-                paginated_stmt = base_stmt.order_by(table.c.start_time.desc()).limit(limit).offset(offset)
+                offset = (page - 1) * limit if page and limit and cursor is None else 0
+                base_stmt = apply_cursor(
+                    base_stmt.order_by(table.c.start_time.desc()), table, "trace_id", "start_time", "desc", cursor
+                )
+                paginated_stmt = base_stmt.limit(limit).offset(offset)
 
                 results = sess.execute(paginated_stmt).fetchall()
+                if not count_total:
+                    total_count = len(results)
 
                 traces = [Trace.from_dict(dict(row._mapping)) for row in results]
                 return traces, total_count
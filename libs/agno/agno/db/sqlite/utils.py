@@ -8,10 +8,11 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.sqlite.schemas import get_table_schema_definition
+from agno.db.utils import decode_cursor
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
-    from sqlalchemy import Table, func
+    from sqlalchemy import String, Table, and_, case, cast, func, or_, select
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine
     from sqlalchemy.inspection import inspect
@@ -24,6 +25,28 @@ except ImportError:
 # -- DB util methods --
 
 
+def get_index_columns(table: Table, columns: List[Any]) -> List[Any]:
+    """Get the indexed expressions of a composite index of the given table.
+
+    A column given as a list of columns is indexed as their COALESCE, matching the sort key apply_sorting uses
+    for updated_at, so the index can serve the ordering.
+
+    Raises:
+        ValueError: If the index references columns missing from the table.
+    """
+    index_columns: List[Any] = []
+    for column in columns:
+        names = column if isinstance(column, list) else [column]
+        missing = [name for name in names if name not in table.c]
+        if missing:
+            raise ValueError(f"Index references missing columns in {table.name}: {missing}")
+        if isinstance(column, list):
+            index_columns.append(func.coalesce(*[table.c[name] for name in names]))
+        else:
+            index_columns.append(table.c[column])
+    return index_columns
+
+
 def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order: Optional[str] = None):
     """Apply sorting to the given SQLAlchemy statement.
 
@@ -60,6 +83,102 @@ def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order:
         return stmt.order_by(sort_column.desc())
 
 
+def apply_cursor(
+    stmt,
+    table: Table,
+    id_column: str,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+    cursor: Optional[str] = None,
+):
+    """Apply keyset pagination on (sort_by, id_column) to the given SQLAlchemy statement.
+
+    Adds the ID column as a tiebreaker to the ordering set by apply_sorting and, when a cursor is given,
+    only selects the rows following it. Unlike OFFSET, this stays fast on deep pages as long as
+    (sort_by, id_column) is indexed.
+
+    Args:
+        stmt: The SQLAlchemy statement to modify, already sorted with apply_sorting
+        table: The table being queried
+        id_column: The unique column used to break ties between equal sort values
+        sort_by: The field the statement is sorted by
+        sort_order: The sort order ('asc' or 'desc')
+        cursor: The cursor returned for the previous page, if any
+
+    Returns:
+        The modified statement with the tiebreaker and cursor filter applied
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    id_col = table.c[id_column]
+    is_descending = sort_order != "asc"
+
+    sort_column = None
+    if sort_by is not None and hasattr(table.c, sort_by):
+        if sort_by == "updated_at" and hasattr(table.c, "created_at"):
+            sort_column = func.coalesce(table.c.updated_at, table.c.created_at)
+        else:
+            sort_column = getattr(table.c, sort_by)
+
+    if cursor is not None:
+        sort_value, last_id = decode_cursor(cursor)
+        if sort_column is None:
+            stmt = stmt.where(id_col < last_id if is_descending else id_col > last_id)
+        elif is_descending:
+            stmt = stmt.where(or_(sort_column < sort_value, and_(sort_column == sort_value, id_col < last_id)))
+        else:
+            stmt = stmt.where(or_(sort_column > sort_value, and_(sort_column == sort_value, id_col > last_id)))
+
+    return stmt.order_by(id_col.desc() if is_descending else id_col.asc())
+
+
+def get_session_columns(table: Table, columns: Optional[List[str]] = None) -> List[Any]:
+    """Map a session projection to selectable columns, computing run_count and unnamed_runs in the database.
+
+    Args:
+        table: The sessions table
+        columns: The columns to select. None selects every column.
+
+    Returns:
+        The list of columns and labelled expressions to select
+    """
+    if columns is None:
+        return list(table.c)
+
+    selected: List[Any] = []
+    for column in columns:
+        # JSON fields are stored as JSON-encoded strings, json_extract(..., "$") unwraps them
+        if column == "run_count":
+            runs = func.json_extract(table.c.runs, "$")
+            selected.append(func.coalesce(func.json_array_length(runs), 0).label("run_count"))
+        elif column == "unnamed_runs":
+            # Only the input of the first run is read, skipping the member runs stored in team sessions
+            session_name = func.json_extract(func.json_extract(table.c.session_data, "$"), "$.session_name")
+            runs = func.json_extract(table.c.runs, "$")
+            run_items = func.json_each(runs).table_valued("key", "value")
+            team_run_index = (
+                select(run_items.c.key)
+                .where(func.json_extract(run_items.c.value, "$.agent_id").is_(None))
+                .order_by(run_items.c.key)
+                .limit(1)
+                .scalar_subquery()
+            )
+            first_run_input_path = case(
+                (table.c.session_type == "team", "$[" + cast(team_run_index, String) + "].input"),
+                else_="$[0].input",
+            )
+            first_run_input = func.json_array(func.json_object("input", func.json_extract(runs, first_run_input_path)))
+            selected.append(
+                case(
+                    (and_(session_name.is_(None), func.json_type(runs) == "array"), first_run_input), else_=None
+                ).label("runs")
+            )
+        elif column in table.c:
+            selected.append(table.c[column])
+    return selected
+
+
 def is_table_available(session: Session, table_name: str, db_schema: Optional[str] = None) -> bool:
     """
     Check if a table with the given name exists.
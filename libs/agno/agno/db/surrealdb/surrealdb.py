@@ -43,6 +43,7 @@ from agno.db.surrealdb.models import (
 )
 from agno.db.surrealdb.queries import COUNT_QUERY, WhereClause, order_limit_start
 from agno.db.surrealdb.utils import build_client
+from agno.db.utils import apply_cursor_to_records, project_session
 from agno.session import Session
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -233,6 +234,24 @@ class SurrealDb(BaseDb):
         total_count = int(total_count)
         return total_count
 
+    def _get_cursor_page(
+        self,
+        keys: List[Dict[str, Any]],
+        id_key: str,
+        sort_by: Optional[str],
+        sort_order: Optional[str],
+        cursor: str,
+        limit: Optional[int],
+    ) -> List[int]:
+        """Get the positions of the rows following the cursor, in page order.
+
+        Record IDs and datetimes don't compare with the plain values stored in cursors, so cursor pages
+        are fetched without LIMIT/START and cut on the deserialized keys of each row.
+        """
+        positions = {id(key): i for i, key in enumerate(keys)}
+        page = apply_cursor_to_records(list(keys), id_key, sort_by, sort_order, cursor)[:limit]
+        return [positions[id(key)] for key in page]
+
     # --- Sessions ---
     def clear_sessions(self) -> None:
         """Delete all session rows from the database.
@@ -325,6 +344,9 @@ class SurrealDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        columns: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         r"""
         Get all sessions in the given table. Can filter by user_id and entity_id.
@@ -341,6 +363,9 @@ class SurrealDb(BaseDb):
             sort_by (Optional[str]): The field to sort by. Defaults to None.
             sort_order (Optional[str]): The sort order. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the sessions. Defaults to True.
+            columns (Optional[List[str]]): Columns to return when deserialize=False, e.g. SESSION_SUMMARY_COLUMNS.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[Session], Tuple[List[Dict], int]]:
@@ -387,10 +412,12 @@ class SurrealDb(BaseDb):
         where_clause, where_vars = where.build()
 
         # Total count
-        total_count = self._count(table, where_clause, where_vars)
+        total_count = self._count(table, where_clause, where_vars) if count_total else 0
 
         # Query
-        order_limit_start_clause = order_limit_start(sort_by, sort_order, limit, page)
+        order_limit_start_clause = order_limit_start(
+            sort_by, sort_order, limit if cursor is None else None, page if cursor is None else None
+        )
         query = dedent(f"""
             SELECT *
             FROM {table}
@@ -399,9 +426,15 @@ class SurrealDb(BaseDb):
         """)
         sessions_raw = self._query(query, where_vars, dict)
         converted_sessions_raw = [desurrealize_session(session, session_type) for session in sessions_raw]
+        if cursor is not None:
+            positions = self._get_cursor_page(converted_sessions_raw, "session_id", sort_by, sort_order, cursor, limit)
+            sessions_raw = [sessions_raw[i] for i in positions]
+            converted_sessions_raw = [converted_sessions_raw[i] for i in positions]
+        if not count_total:
+            total_count = len(sessions_raw)
 
         if not deserialize:
-            return list(converted_sessions_raw), total_count
+            return [project_session(session, columns) for session in converted_sessions_raw], total_count
 
         if session_type is None:
             raise ValueError("session_type is required when deserialize=True")
@@ -798,6 +831,8 @@ class SurrealDb(BaseDb):
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from the database as UserMemory objects.
 
@@ -812,6 +847,8 @@ class SurrealDb(BaseDb):
             sort_by (Optional[str]): The column to sort by.
             sort_order (Optional[str]): The order to sort by.
             deserialize (Optional[bool]): Whether to serialize the memories. Defaults to True.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
 
         Returns:
@@ -840,10 +877,12 @@ class SurrealDb(BaseDb):
         where_clause, where_vars = where.build()
 
         # Total count
-        total_count = self._count(table, where_clause, where_vars)
+        total_count = self._count(table, where_clause, where_vars) if count_total else 0
 
         # Query
-        order_limit_start_clause = order_limit_start(sort_by, sort_order, limit, page)
+        order_limit_start_clause = order_limit_start(
+            sort_by, sort_order, limit if cursor is None else None, page if cursor is None else None
+        )
         query = dedent(f"""
             SELECT *
             FROM {table}
@@ -851,6 +890,11 @@ class SurrealDb(BaseDb):
             {order_limit_start_clause}
         """)
         result = self._query(query, where_vars, dict)
+        if cursor is not None:
+            keys = [desurrealize_user_memory(x) for x in result]
+            result = [result[i] for i in self._get_cursor_page(keys, "memory_id", sort_by, sort_order, cursor, limit)]
+        if not count_total:
+            total_count = len(result)
         if deserialize:
             return deserialize_user_memories(result)
         return [desurrealize_user_memory(x) for x in result], total_count
@@ -1310,6 +1354,8 @@ class SurrealDb(BaseDb):
         filter_type: Optional[EvalFilterType] = None,
         eval_type: Optional[List[EvalType]] = None,
         deserialize: Optional[bool] = True,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         """Get all eval runs from the database.
 
@@ -1325,6 +1371,8 @@ class SurrealDb(BaseDb):
             eval_type (Optional[List[EvalType]]): The type of eval to filter by.
             filter_type (Optional[EvalFilterType]): The type of filter to apply.
             deserialize (Optional[bool]): Whether to serialize the eval runs. Defaults to True.
+            cursor (Optional[str]): Cursor returned for the previous page. Takes precedence over page.
+            count_total (bool): Whether to count all matching rows. When False, the count is a lower bound.
 
         Returns:
             Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
@@ -1351,10 +1399,12 @@ class SurrealDb(BaseDb):
         where_clause, where_vars = where.build()
 
         # Order
-        order_limit_start_clause = order_limit_start(sort_by, sort_order, limit, page)
+        order_limit_start_clause = order_limit_start(
+            sort_by, sort_order, limit if cursor is None else None, page if cursor is None else None
+        )
 
         # Total count
-        total_count = self._count(table, where_clause, where_vars)
+        total_count = self._count(table, where_clause, where_vars) if count_total else 0
 
         # Query
         query = dedent(f"""
@@ -1364,6 +1414,11 @@ class SurrealDb(BaseDb):
             {order_limit_start_clause}
         """)
         result = self._query(query, where_vars, dict)
+        if cursor is not None:
+            keys = [desurrealize_eval_run_record(x) for x in result]
+            result = [result[i] for i in self._get_cursor_page(keys, "run_id", sort_by, sort_order, cursor, limit)]
+        if not count_total:
+            total_count = len(result)
 
         if not deserialize:
             return list(result), total_count
@@ -1580,6 +1635,8 @@ class SurrealDb(BaseDb):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = 20,
         page: Optional[int] = 1,
+        cursor: Optional[str] = None,
+        count_total: bool = True,
     ) -> tuple[List, int]:
         """Get traces matching the provided filters with pagination.
 
@@ -1595,6 +1652,8 @@ class SurrealDb(BaseDb):
             end_time: Filter traces ending before this datetime.
             limit: Maximum number of traces to return per page.
             page: Page number (1-indexed).
+            cursor: Cursor returned for the previous page. Takes precedence over page.
+            count_total: Whether to count all matching traces. When False, the count is a lower bound.
 
         Returns:
             tuple[List[Trace], int]: Tuple of (list of matching traces, total count).
@@ -1627,16 +1686,32 @@ class SurrealDb(BaseDb):
             where_clause, where_vars = where.build()
 
             # Total count
-            total_count = self._count(table, where_clause, where_vars)
+            total_count = self._count(table, where_clause, where_vars) if count_total else 0
 
             # Query with pagination
-            order_limit_start_clause = order_limit_start("start_time", "DESC", limit, page)
+            order_limit_start_clause = order_limit_start(
+                "start_time", "DESC", limit if cursor is None else None, page if cursor is None else None
+            )
             query = dedent(f"""
                 SELECT * FROM {table}
                 {where_clause}
                 {order_limit_start_clause}
             """)
             traces_raw = self._query(query, where_vars, dict)
+            if cursor is not None:
+                keys = [
+                    {
+                        "trace_id": trace.get("trace_id") or trace["id"].id,
+                        "start_time": trace["start_time"].isoformat()
+                        if isinstance(trace.get("start_time"), datetime)
+                        else trace.get("start_time"),
+                    }
+                    for trace in traces_raw
+                ]
+                positions = self._get_cursor_page(keys, "trace_id", "start_time", "desc", cursor, limit)
+                traces_raw = [traces_raw[i] for i in positions]
+            if not count_total:
+                total_count = len(traces_raw)
 
             # Add total_spans and error_count to each trace
             result_traces = []
@@ -1,8 +1,9 @@
 """Logic shared across different database implementations"""
 
 import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from agno.models.message import Message
@@ -13,13 +14,118 @@ if TYPE_CHECKING:
     from agno.db.base import BaseDb
 
 
+# Projection used by session listings. Everything but the `runs` payload, plus two computed columns:
+# - run_count: number of runs in the session
+# - unnamed_runs: only when no session_name is stored, the input of the first run (the first team run in team
+#   sessions), returned as `runs: [{"input": ...}]` so a display name can still be derived from it
+SESSION_SUMMARY_COLUMNS: List[str] = [
+    "session_id",
+    "session_type",
+    "agent_id",
+    "team_id",
+    "workflow_id",
+    "user_id",
+    "session_data",
+    "created_at",
+    "updated_at",
+    "run_count",
+    "unnamed_runs",
+]
+
+SESSION_COMPUTED_COLUMNS = {"run_count", "unnamed_runs"}
+
+
+def project_session(session: Dict[str, Any], columns: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Apply a column projection to a session dictionary.
+
+    Used by the backends that read whole session records, and on documents where
+    the projection could only be partially applied by the database.
+
+    Args:
+        session: The session dictionary to project
+        columns: The columns to keep. None keeps the full record.
+
+    Returns:
+        The projected session dictionary
+    """
+    if columns is None:
+        return session
+
+    projected = {column: session.get(column) for column in columns if column not in SESSION_COMPUTED_COLUMNS}
+    if "run_count" in columns:
+        run_count = session.get("run_count")
+        if run_count is None:
+            runs = session.get("runs")
+            run_count = len(runs) if isinstance(runs, list) else 0
+        projected["run_count"] = run_count
+    if "unnamed_runs" in columns and session.get("runs") is not None:
+        session_data = session.get("session_data")
+        if not isinstance(session_data, dict) or session_data.get("session_name") is None:
+            projected["runs"] = [{"input": get_first_run_input(session)}]
+    return projected
+
+
+def get_first_run_input(session: Dict[str, Any]) -> Any:
+    """Get the input of the first run of a session dictionary, skipping the member runs of team sessions."""
+    for run in session.get("runs") or []:
+        if not isinstance(run, dict):
+            run = run.to_dict()
+        # Member runs stored in team sessions have an agent_id
+        if session.get("session_type") == "team" and run.get("agent_id") is not None:
+            continue
+        return run.get("input")
+    return None
+
+
+def get_stored_session_fields(columns: List[str]) -> List[str]:
+    """Get the stored fields to read for a session projection, leaving `runs` out.
+
+    Used by document stores that persist `run_count` on write. `session_data` is always
+    read so sessions without a stored name can be detected.
+    """
+    fields = ["session_id", "session_data"]
+    for column in columns:
+        if column != "unnamed_runs" and column not in fields:
+            fields.append(column)
+    return fields
+
+
+def get_session_ids_needing_runs(sessions: List[Dict[str, Any]], columns: List[str]) -> List[str]:
+    """Get the ids of the sessions whose projection can't be built without reading `runs`.
+
+    That is unnamed sessions when `unnamed_runs` is requested, and sessions written before
+    `run_count` was stored when `run_count` is requested.
+    """
+    session_ids = []
+    for session in sessions:
+        session_data = session.get("session_data")
+        is_unnamed = not isinstance(session_data, dict) or session_data.get("session_name") is None
+        if ("unnamed_runs" in columns and is_unnamed) or ("run_count" in columns and session.get("run_count") is None):
+            session_ids.append(session["session_id"])
+    return session_ids
+
+
+def get_sort_fields(sort_by: str) -> List[str]:
+    """Get the fields a record is sorted on when sorting by sort_by, in order of precedence.
+
+    The sort value of a record is the first of these fields that is not None. 'updated_at' falls
+    back to 'created_at', so pre-2.0 records (which may have NULL updated_at values) are sorted by
+    their creation time. Backends sorting in the database must use the same sort value.
+
+    Args:
+        sort_by: The field to sort by
+
+    Returns:
+        The fields making up the sort value
+    """
+    if sort_by == "updated_at":
+        return ["updated_at", "created_at"]
+    return [sort_by]
+
+
 def get_sort_value(record: Dict[str, Any], sort_by: str) -> Any:
     """Get the sort value for a record, with fallback to created_at for updated_at.
 
-    When sorting by 'updated_at', this function falls back to 'created_at' if
-    'updated_at' is None. This ensures pre-2.0 records (which may have NULL
-    updated_at values) are sorted correctly by their creation time.
-
     Args:
         record: The record dictionary to get the sort value from
         sort_by: The field to sort by
@@ -27,11 +133,110 @@ def get_sort_value(record: Dict[str, Any], sort_by: str) -> Any:
     Returns:
         The value to use for sorting
     """
-    value = record.get(sort_by)
-    # For updated_at, fall back to created_at if updated_at is None
-    if value is None and sort_by == "updated_at":
-        value = record.get("created_at")
-    return value
+    for field in get_sort_fields(sort_by):
+        value = record.get(field)
+        if value is not None:
+            return value
+    return None
+
+
+def encode_cursor(sort_value: Any, record_id: str) -> str:
+    """Encode the (sort value, id) pair of the last record in a page into an opaque cursor.
+
+    Args:
+        sort_value: The value of the sort field for the last record. None when no sort field is used.
+        record_id: The ID of the last record
+
+    Returns:
+        A url-safe cursor string
+    """
+    payload = json.dumps([sort_value, record_id], separators=(",", ":"))
+    return urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor created by encode_cursor.
+
+    Args:
+        cursor: The cursor string
+
+    Returns:
+        The (sort value, id) pair of the record the next page starts after
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, record_id = json.loads(urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+    if not isinstance(record_id, str):
+        raise ValueError(f"Invalid pagination cursor: {cursor}")
+    return sort_value, record_id
+
+
+def get_next_cursor(
+    records: List[Dict[str, Any]], id_key: str, sort_by: Optional[str] = None, limit: Optional[int] = None
+) -> Optional[str]:
+    """Get the cursor for the page following the given records.
+
+    Args:
+        records: The records of the current page, in the order they were returned
+        id_key: The name of the ID field, used to break ties between equal sort values
+        sort_by: The field the records are sorted by
+        limit: The page size. No cursor is returned when the page is not full.
+
+    Returns:
+        The cursor for the next page, or None if this is the last page
+    """
+    if not records or (limit is not None and len(records) < limit):
+        return None
+    last = records[-1]
+    return encode_cursor(get_sort_value(last, sort_by) if sort_by else None, last[id_key])
+
+
+def apply_cursor_to_records(
+    records: List[Dict[str, Any]],
+    id_key: str,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Sort records on (sort_by, id_key) and drop everything up to and including the cursor.
+
+    Used by the backends that sort in Python. The ID tiebreaker keeps the order stable across pages.
+
+    Args:
+        records: The records to paginate
+        id_key: The name of the ID field
+        sort_by: The field to sort by. When None, records are ordered by ID only.
+        sort_order: The sort order ('asc' or 'desc'). Defaults to 'desc'.
+        cursor: The cursor returned for the previous page, if any
+
+    Returns:
+        The sorted records following the cursor
+    """
+    is_descending = sort_order != "asc"
+
+    def sort_key(record: Dict[str, Any]) -> Tuple[Any, ...]:
+        value = get_sort_value(record, sort_by) if sort_by else None
+        return (value is not None, value, record.get(id_key) or "")
+
+    try:
+        records = sorted(records, key=sort_key, reverse=is_descending)
+    except TypeError as e:
+        log_warning(f"Error sorting records by '{sort_by}': {e}")
+        return records
+
+    if cursor is None:
+        return records
+
+    sort_value, last_id = decode_cursor(cursor)
+    last_key = (sort_value is not None, sort_value if sort_by else None, last_id)
+    if is_descending:
+        return [record for record in records if sort_key(record) < last_key]
+    return [record for record in records if sort_key(record) > last_key]
 
 
 class CustomJSONEncoder(json.JSONEncoder):
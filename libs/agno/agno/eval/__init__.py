@@ -9,6 +9,11 @@ __all__ = [
     "AgentAsJudgeEvaluation",
     "AgentAsJudgeResult",
     "BaseEval",
+    "DatasetEval",
+    "DatasetEvalCaseResult",
+    "DatasetEvalResult",
+    "EvalCase",
+    "LoadTestResult",
     "PerformanceEval",
     "PerformanceResult",
     "ReliabilityEval",
@@ -26,7 +31,11 @@ def __getattr__(name: str):
         from agno.eval import agent_as_judge
 
         return getattr(agent_as_judge, name)
-    elif name in ("PerformanceEval", "PerformanceResult"):
+    elif name in ("DatasetEval", "DatasetEvalCaseResult", "DatasetEvalResult", "EvalCase"):
+        from agno.eval import dataset
+
+        return getattr(dataset, name)
+    elif name in ("LoadTestResult", "PerformanceEval", "PerformanceResult"):
         from agno.eval import performance
 
         return getattr(performance, name)
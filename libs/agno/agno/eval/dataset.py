@@ -0,0 +1,706 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from hashlib import md5
+from os import getenv
+from textwrap import dedent
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple, Type, Union
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from agno.agent import Agent
+from agno.db.base import AsyncBaseDb, BaseDb
+from agno.db.schemas.evals import EvalRunRecord, EvalType
+from agno.eval.accuracy import AccuracyAgentResponse, AccuracyEval
+from agno.eval.agent_as_judge import AgentAsJudgeEval, AgentAsJudgeEvaluation, BinaryJudgeResponse, NumericJudgeResponse
+from agno.eval.utils import async_log_eval, log_eval_run
+from agno.team.team import Team
+from agno.utils.log import log_info, log_warning, logger, set_log_level_to_debug, set_log_level_to_info
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class _IndexedAccuracyResponse(AccuracyAgentResponse):
+    case_index: int = Field(..., description="Index of the evaluated case.")
+
+
+class _IndexedNumericJudgeResponse(NumericJudgeResponse):
+    case_index: int = Field(..., description="Index of the evaluated case.")
+
+
+class _IndexedBinaryJudgeResponse(BinaryJudgeResponse):
+    case_index: int = Field(..., description="Index of the evaluated case.")
+
+
+class _AccuracyBatchResponse(BaseModel):
+    evaluations: List[_IndexedAccuracyResponse] = Field(..., description="One evaluation per case.")
+
+
+class _NumericJudgeBatchResponse(BaseModel):
+    evaluations: List[_IndexedNumericJudgeResponse] = Field(..., description="One evaluation per case.")
+
+
+class _BinaryJudgeBatchResponse(BaseModel):
+    evaluations: List[_IndexedBinaryJudgeResponse] = Field(..., description="One evaluation per case.")
+
+
+@dataclass
+class EvalCase:
+    """A case of a dataset evaluation"""
+
+    input: str
+    # Expected answer, required when judging with an AccuracyEval
+    expected_output: Optional[str] = None
+    # Stable ID used to resume interrupted runs. Defaults to a hash of the input and expected output.
+    id: Optional[str] = None
+
+
+@dataclass
+class DatasetEvalCaseResult:
+    """Result of one iteration of one case"""
+
+    case_id: str
+    iteration: int
+    input: str
+    expected_output: Optional[str] = None
+    output: Optional[str] = None
+    score: Optional[int] = None
+    passed: Optional[bool] = None
+    reason: Optional[str] = None
+    error: Optional[str] = None
+    # Time taken to generate the output, in seconds
+    duration: float = 0.0
+
+
+@dataclass
+class DatasetEvalResult:
+    run_id: str
+    num_cases: int = 0
+    num_iterations: int = 1
+    results: List[DatasetEvalCaseResult] = field(default_factory=list)
+    # Number of results loaded from the checkpoints of an interrupted run
+    resumed: int = 0
+    # Wall time of this run and the evaluations it completed per second
+    duration: float = 0.0
+    throughput: float = 0.0
+    judge_calls: int = 0
+    failed: int = field(init=False)
+    avg_score: Optional[float] = field(init=False)
+    pass_rate: Optional[float] = field(init=False)
+
+    def __post_init__(self):
+        self.compute_stats()
+
+    def compute_stats(self):
+        import statistics
+
+        self.failed = sum(1 for r in self.results if r.error is not None)
+        scores = [r.score for r in self.results if r.score is not None]
+        self.avg_score = statistics.mean(scores) if scores else None
+        passed = [r.passed for r in self.results if r.passed is not None]
+        self.pass_rate = sum(passed) / len(passed) * 100 if passed else None
+
+    def print_summary(self, console: Optional["Console"] = None):
+        from rich.box import ROUNDED
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        summary_table = Table(
+            box=ROUNDED,
+            border_style="blue",
+            show_header=False,
+            title="[ Dataset Evaluation Summary ]",
+            title_style="bold sky_blue1",
+            title_justify="center",
+        )
+        summary_table.add_row("Cases", f"{self.num_cases}")
+        summary_table.add_row("Iterations", f"{self.num_iterations}")
+        summary_table.add_row("Evaluations", f"{len(self.results)} ({self.resumed} resumed)")
+        summary_table.add_row("Failed", f"{self.failed}")
+        if self.avg_score is not None:
+            summary_table.add_row("Average Score", f"{self.avg_score:.2f}/10")
+        if self.pass_rate is not None:
+            summary_table.add_row("Pass Rate", f"{self.pass_rate:.1f}%")
+        summary_table.add_row("Duration", f"{self.duration:.1f}s")
+        summary_table.add_row("Throughput", f"{self.throughput:.2f} evaluations/s")
+        summary_table.add_row("Judge Calls", f"{self.judge_calls}")
+        console.print(summary_table)
+
+
+@dataclass
+class DatasetEval:
+    """Run an Agent or Team over a dataset of cases and judge every output with an AccuracyEval or AgentAsJudgeEval.
+
+    Cases x iterations run with bounded concurrency, in windows of checkpoint_interval evaluations. After each window,
+    the window's results are checkpointed to the db, so an interrupted run resumes where it stopped when run again
+    with the same run_id.
+    """
+
+    # Cases to evaluate, as EvalCase or dicts with the same keys
+    cases: Sequence[Union[EvalCase, Dict[str, Any]]]
+    # Evaluation judging the outputs. Its evaluator agent is used as the judge.
+    evaluation: Union[AccuracyEval, AgentAsJudgeEval]
+    # Agent to evaluate. Defaults to the agent of the AccuracyEval.
+    agent: Optional[Agent] = None
+    # Team to evaluate. Defaults to the team of the AccuracyEval.
+    team: Optional[Team] = None
+
+    # Evaluation name
+    name: Optional[str] = None
+    # Run ID. Pass the ID of an interrupted run to resume it.
+    run_id: str = field(default_factory=lambda: str(uuid4()))
+    # Number of times each case is run
+    num_iterations: int = 1
+    # Maximum number of agent runs and judge calls in flight
+    max_concurrency: int = 8
+    # Number of outputs judged in a single judge call. Only used when the judge model supports structured outputs.
+    judge_batch_size: int = 1
+    # Number of evaluations between checkpoints
+    checkpoint_interval: int = 50
+    # Result of the evaluation
+    result: Optional[DatasetEvalResult] = None
+
+    # Print summary of results
+    print_summary: bool = False
+    # Enable debug logs
+    debug_mode: bool = getenv("AGNO_DEBUG", "false").lower() == "true"
+    # The database to store checkpoints and the Evaluation results
+    db: Optional[Union[BaseDb, AsyncBaseDb]] = None
+
+    # IDs of the checkpoints stored for this run
+    _checkpoint_ids: List[str] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {self.max_concurrency}")
+        if self.judge_batch_size < 1:
+            raise ValueError(f"judge_batch_size must be at least 1, got {self.judge_batch_size}")
+        if isinstance(self.evaluation, AccuracyEval):
+            self.agent = self.agent or self.evaluation.agent
+            self.team = self.team or self.evaluation.team
+
+    @property
+    def eval_type(self) -> EvalType:
+        return EvalType.ACCURACY if isinstance(self.evaluation, AccuracyEval) else EvalType.AGENT_AS_JUDGE
+
+    def get_cases(self) -> List[EvalCase]:
+        """Return the cases with their IDs set, making IDs of identical cases unique"""
+        cases: List[EvalCase] = []
+        seen: Set[str] = set()
+        for case in self.cases:
+            if isinstance(case, dict):
+                case = EvalCase(**case)
+            if isinstance(self.evaluation, AccuracyEval) and case.expected_output is None:
+                raise ValueError(f"Case {case.id or case.input!r} has no expected_output, required by AccuracyEval")
+            case_id = case.id
+            if case_id is None:
+                case_id = md5(f"{case.input}\n{case.expected_output}".encode()).hexdigest()[:16]
+                duplicate = 1
+                while case_id in seen:
+                    case_id = f"{case_id.split(':')[0]}:{duplicate}"
+                    duplicate += 1
+            seen.add(case_id)
+            cases.append(EvalCase(input=case.input, expected_output=case.expected_output, id=case_id))
+        return cases
+
+    def run(self, *, print_summary: bool = False) -> Optional[DatasetEvalResult]:
+        if isinstance(self.db, AsyncBaseDb):
+            raise ValueError("run() is not supported with an async DB. Please use arun() instead.")
+        if not self._validate():
+            return None
+
+        set_log_level_to_debug() if self.debug_mode else set_log_level_to_info()
+
+        finished, completed = self._load_previous_run()
+        if finished is not None:
+            self.result = finished
+            return finished
+
+        pending, result = self._prepare(completed)
+        evaluator_agent = self.evaluation.get_evaluator_agent()
+        judge_batch_size = self._get_judge_batch_size(evaluator_agent)
+        checkpoint = len(self._checkpoint_ids)
+        # Results not in a stored checkpoint yet
+        unsaved: List[DatasetEvalCaseResult] = []
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for window_start in range(0, len(pending), self.checkpoint_interval):
+                window = pending[window_start : window_start + self.checkpoint_interval]
+                generated = list(executor.map(self._generate, window))
+                batches = self._judge_batches(generated, judge_batch_size)
+                for _, calls in executor.map(lambda batch: self._judge(batch, evaluator_agent), batches):
+                    result.judge_calls += calls
+                window_results = [item for item, _ in generated]
+                result.results.extend(window_results)
+
+                unsaved.extend(window_results)
+                if self._log_checkpoint(checkpoint, unsaved):
+                    checkpoint += 1
+                    unsaved = []
+                self._log_progress(result, start)
+
+        return self._finish(result, start, print_summary=print_summary)
+
+    async def arun(self, *, print_summary: bool = False) -> Optional[DatasetEvalResult]:
+        if not self._validate():
+            return None
+
+        set_log_level_to_debug() if self.debug_mode else set_log_level_to_info()
+
+        finished, completed = await self._aload_previous_run()
+        if finished is not None:
+            self.result = finished
+            return finished
+
+        pending, result = self._prepare(completed)
+        evaluator_agent = self.evaluation.get_evaluator_agent()
+        judge_batch_size = self._get_judge_batch_size(evaluator_agent)
+        checkpoint = len(self._checkpoint_ids)
+        # Results not in a stored checkpoint yet
+        unsaved: List[DatasetEvalCaseResult] = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        start = time.perf_counter()
+
+        async def generate(item: DatasetEvalCaseResult) -> Tuple[DatasetEvalCaseResult, Optional[str]]:
+            async with semaphore:
+                return await self._agenerate(item)
+
+        async def judge(batch: List[DatasetEvalCaseResult]) -> Tuple[List[DatasetEvalCaseResult], int]:
+            async with semaphore:
+                return await self._ajudge(batch, evaluator_agent)
+
+        for window_start in range(0, len(pending), self.checkpoint_interval):
+            window = pending[window_start : window_start + self.checkpoint_interval]
+            generated = await asyncio.gather(*[generate(item) for item in window])
+            batches = self._judge_batches(generated, judge_batch_size)
+            for _, calls in await asyncio.gather(*[judge(batch) for batch in batches]):
+                result.judge_calls += calls
+            window_results = [item for item, _ in generated]
+            result.results.extend(window_results)
+
+            unsaved.extend(window_results)
+            if await self._alog_checkpoint(checkpoint, unsaved):
+                checkpoint += 1
+                unsaved = []
+            self._log_progress(result, start)
+
+        return await self._afinish(result, start, print_summary=print_summary)
+
+    def _validate(self) -> bool:
+        if self.agent is None and self.team is None:
+            logger.error("You need to provide one of 'agent' or 'team' to run the evaluation.")
+            return False
+        if self.agent is not None and self.team is not None:
+            logger.error("Provide only one of 'agent' or 'team' to run the evaluation.")
+            return False
+        return True
+
+    def _prepare(self, completed: List[DatasetEvalCaseResult]) -> Tuple[List[DatasetEvalCaseResult], DatasetEvalResult]:
+        """Build the pending work items, skipping the ones completed before an interruption"""
+        cases = self.get_cases()
+        result = DatasetEvalResult(
+            run_id=self.run_id, num_cases=len(cases), num_iterations=self.num_iterations, results=completed
+        )
+        result.resumed = len(result.results)
+        done = {(r.case_id, r.iteration) for r in result.results}
+        pending = [
+            DatasetEvalCaseResult(case_id=case.id, iteration=i, input=case.input, expected_output=case.expected_output)  # type: ignore[arg-type]
+            for case in cases
+            for i in range(1, self.num_iterations + 1)
+            if (case.id, i) not in done
+        ]
+        if result.resumed:
+            log_info(f"Resuming dataset evaluation {self.run_id}: {result.resumed} evaluations already completed")
+        return pending, result
+
+    def _session_id(self, item: DatasetEvalCaseResult) -> str:
+        return f"eval_{self.run_id}_{item.case_id}_{item.iteration}"
+
+    def _generate(self, item: DatasetEvalCaseResult) -> Tuple[DatasetEvalCaseResult, Optional[str]]:
+        """Run the agent or team on the case. Returns the item and its output, None if the run failed."""
+        start = time.perf_counter()
+        try:
+            component: Union[Agent, Team] = self.agent if self.agent is not None else self.team  # type: ignore[assignment]
+            response = component.run(input=item.input, session_id=self._session_id(item), stream=False)
+            return self._set_output(item, response.content, start)
+        except Exception as e:
+            return self._set_error(item, e, start)
+
+    async def _agenerate(self, item: DatasetEvalCaseResult) -> Tuple[DatasetEvalCaseResult, Optional[str]]:
+        start = time.perf_counter()
+        try:
+            component: Union[Agent, Team] = self.agent if self.agent is not None else self.team  # type: ignore[assignment]
+            response = await component.arun(input=item.input, session_id=self._session_id(item), stream=False)  # type: ignore[misc]
+            return self._set_output(item, response.content, start)
+        except Exception as e:
+            return self._set_error(item, e, start)
+
+    def _set_output(
+        self, item: DatasetEvalCaseResult, content: Any, start: float
+    ) -> Tuple[DatasetEvalCaseResult, Optional[str]]:
+        item.duration = time.perf_counter() - start
+        if not content:
+            item.error = "The run returned an empty output"
+            return item, None
+        item.output = content if isinstance(content, str) else str(content)
+        return item, item.output
+
+    def _set_error(
+        self, item: DatasetEvalCaseResult, error: Exception, start: float
+    ) -> Tuple[DatasetEvalCaseResult, Optional[str]]:
+        logger.warning(f"Run failed on case {item.case_id}, iteration {item.iteration}: {error}")
+        item.duration = time.perf_counter() - start
+        item.error = f"{type(error).__name__}: {error}"
+        return item, None
+
+    def _get_judge_batch_size(self, evaluator_agent: Agent) -> int:
+        """Outputs judged per judge call: judge_batch_size if the judge model supports structured outputs, else 1"""
+        if self.judge_batch_size == 1:
+            return 1
+        model = evaluator_agent.model
+        if model is None or not (model.supports_native_structured_outputs or model.supports_json_schema_outputs):
+            log_warning("The judge model does not support structured outputs, judging one output per call")
+            return 1
+        return self.judge_batch_size
+
+    @staticmethod
+    def _judge_batches(
+        generated: Sequence[Tuple[DatasetEvalCaseResult, Optional[str]]], batch_size: int
+    ) -> List[List[DatasetEvalCaseResult]]:
+        items = [item for item, output in generated if output is not None]
+        return [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+    def _judge(
+        self, batch: List[DatasetEvalCaseResult], evaluator_agent: Agent
+    ) -> Tuple[List[DatasetEvalCaseResult], int]:
+        """Judge a batch of outputs. Returns the batch and the number of judge calls made."""
+        if len(batch) == 1:
+            self._judge_single(batch[0], evaluator_agent)
+            return batch, 1
+
+        calls = 1
+        try:
+            response = evaluator_agent.run(
+                self._batch_prompt(batch), stream=False, output_schema=self._batch_response_schema()
+            )
+            unjudged = self._apply_batch_response(batch, response.content)
+        except Exception as e:
+            logger.warning(f"Batch judge call failed, judging outputs one by one: {e}")
+            unjudged = batch
+        for item in unjudged:
+            self._judge_single(item, evaluator_agent)
+            calls += 1
+        self._run_on_fail_callbacks(batch)
+        return batch, calls
+
+    async def _ajudge(
+        self, batch: List[DatasetEvalCaseResult], evaluator_agent: Agent
+    ) -> Tuple[List[DatasetEvalCaseResult], int]:
+        if len(batch) == 1:
+            await self._ajudge_single(batch[0], evaluator_agent)
+            return batch, 1
+
+        calls = 1
+        try:
+            response = await evaluator_agent.arun(
+                self._batch_prompt(batch), stream=False, output_schema=self._batch_response_schema()
+            )
+            unjudged = self._apply_batch_response(batch, response.content)
+        except Exception as e:
+            logger.warning(f"Batch judge call failed, judging outputs one by one: {e}")
+            unjudged = batch
+        for item in unjudged:
+            await self._ajudge_single(item, evaluator_agent)
+            calls += 1
+        self._run_on_fail_callbacks(batch)
+        return batch, calls
+
+    def _judge_single(self, item: DatasetEvalCaseResult, evaluator_agent: Agent) -> None:
+        if isinstance(self.evaluation, AccuracyEval):
+            accuracy = self.evaluation.evaluate_answer(
+                input=item.input,
+                evaluator_agent=evaluator_agent,
+                evaluation_input=self._accuracy_prompt(item),
+                evaluator_expected_output=item.expected_output or "",
+                agent_output=item.output or "",
+            )
+            self._set_judgement(item, accuracy.score if accuracy else None, None, accuracy.reason if accuracy else None)
+        else:
+            judged = self.evaluation._evaluate(
+                input=item.input, output=item.output or "", evaluator_agent=evaluator_agent
+            )
+            self._set_judgement(
+                item,
+                judged.score if judged else None,
+                judged.passed if judged else None,
+                judged.reason if judged else None,
+            )
+
+    async def _ajudge_single(self, item: DatasetEvalCaseResult, evaluator_agent: Agent) -> None:
+        if isinstance(self.evaluation, AccuracyEval):
+            accuracy = await self.evaluation.aevaluate_answer(
+                input=item.input,
+                evaluator_agent=evaluator_agent,
+                evaluation_input=self._accuracy_prompt(item),
+                evaluator_expected_output=item.expected_output or "",
+                agent_output=item.output or "",
+            )
+            self._set_judgement(item, accuracy.score if accuracy else None, None, accuracy.reason if accuracy else None)
+        else:
+            judged = await self.evaluation._aevaluate(
+                input=item.input, output=item.output or "", evaluator_agent=evaluator_agent
+            )
+            self._set_judgement(
+                item,
+                judged.score if judged else None,
+                judged.passed if judged else None,
+                judged.reason if judged else None,
+            )
+
+    def _set_judgement(
+        self, item: DatasetEvalCaseResult, score: Optional[int], passed: Optional[bool], reason: Optional[str]
+    ) -> None:
+        if reason is None:
+            item.error = "The judge returned an invalid response"
+            return
+        item.score = score
+        item.passed = passed
+        item.reason = reason
+
+    def _accuracy_prompt(self, item: DatasetEvalCaseResult) -> str:
+        return dedent(f"""\
+            <agent_input>
+            {item.input}
+            </agent_input>
+
+            <expected_output>
+            {item.expected_output}
+            </expected_output>
+
+            <agent_output>
+            {item.output}
+            </agent_output>\
+            """)
+
+    def _batch_prompt(self, batch: List[DatasetEvalCaseResult]) -> str:
+        cases = []
+        for index, item in enumerate(batch):
+            if isinstance(self.evaluation, AccuracyEval):
+                body = self._accuracy_prompt(item)
+            else:
+                body = f"<input>\n{item.input}\n</input>\n\n<output>\n{item.output}\n</output>"
+            cases.append(f'<case index="{index}">\n{body}\n</case>')
+        return (
+            f"Evaluate each of the following {len(batch)} cases independently, following your instructions. "
+            "Return exactly one evaluation per case, with the index of the case.\n\n" + "\n\n".join(cases)
+        )
+
+    def _batch_response_schema(self) -> Type[BaseModel]:
+        if isinstance(self.evaluation, AccuracyEval):
+            return _AccuracyBatchResponse
+        if self.evaluation.scoring_strategy == "numeric":
+            return _NumericJudgeBatchResponse
+        return _BinaryJudgeBatchResponse
+
+    def _apply_batch_response(self, batch: List[DatasetEvalCaseResult], content: Any) -> List[DatasetEvalCaseResult]:
+        """Set the judgements of a batch response on the batch. Returns the items the response did not judge."""
+        if not isinstance(content, (_AccuracyBatchResponse, _NumericJudgeBatchResponse, _BinaryJudgeBatchResponse)):
+            raise ValueError(f"Invalid batch judge response: {content}")
+
+        judged: Set[int] = set()
+        for evaluation in content.evaluations:
+            if not 0 <= evaluation.case_index < len(batch) or evaluation.case_index in judged:
+                continue
+            item = batch[evaluation.case_index]
+            if isinstance(evaluation, _IndexedAccuracyResponse):
+                self._set_judgement(item, evaluation.accuracy_score, None, evaluation.accuracy_reason)
+            elif isinstance(evaluation, _IndexedNumericJudgeResponse):
+                threshold = self.evaluation.threshold  # type: ignore[union-attr]
+                self._set_judgement(item, evaluation.score, evaluation.score >= threshold, evaluation.reason)
+            else:
+                self._set_judgement(item, None, evaluation.passed, evaluation.reason)
+            judged.add(evaluation.case_index)
+        return [item for index, item in enumerate(batch) if index not in judged]
+
+    def _run_on_fail_callbacks(self, batch: List[DatasetEvalCaseResult]) -> None:
+        """Batch judgements bypass AgentAsJudgeEval._evaluate, which calls on_fail for single judgements"""
+        if not isinstance(self.evaluation, AgentAsJudgeEval) or self.evaluation.on_fail is None:
+            return
+        for item in batch:
+            if item.passed is False:
+                try:
+                    self.evaluation.on_fail(
+                        AgentAsJudgeEvaluation(
+                            input=item.input,
+                            output=item.output or "",
+                            criteria=self.evaluation.criteria,
+                            score=item.score,
+                            reason=item.reason or "",
+                            passed=False,
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(f"on_fail callback error: {e}")
+
+    def _log_progress(self, result: DatasetEvalResult, start: float) -> None:
+        total = result.num_cases * result.num_iterations
+        completed = len(result.results) - result.resumed
+        rate = completed / (time.perf_counter() - start) if completed else 0.0
+        log_info(f"Dataset evaluation {self.run_id}: {len(result.results)}/{total} evaluations ({rate:.2f}/s)")
+
+    def _complete(self, result: DatasetEvalResult, start: float) -> DatasetEvalResult:
+        result.duration = time.perf_counter() - start
+        completed = len(result.results) - result.resumed
+        result.throughput = completed / result.duration if result.duration > 0 else 0.0
+        result.compute_stats()
+        self.result = result
+        return result
+
+    def _finish(self, result: DatasetEvalResult, start: float, print_summary: bool) -> DatasetEvalResult:
+        self._complete(result, start)
+        if self.db is not None:
+            log_eval_run(db=self.db, **self._eval_run_kwargs(result))  # type: ignore[arg-type]
+            if self._checkpoint_ids:
+                self.db.delete_eval_runs(self._checkpoint_ids)  # type: ignore[union-attr]
+        if self.print_summary or print_summary:
+            result.print_summary()
+        return result
+
+    async def _afinish(self, result: DatasetEvalResult, start: float, print_summary: bool) -> DatasetEvalResult:
+        self._complete(result, start)
+        if self.db is not None:
+            await async_log_eval(db=self.db, **self._eval_run_kwargs(result))
+            if self._checkpoint_ids:
+                if isinstance(self.db, AsyncBaseDb):
+                    await self.db.delete_eval_runs(self._checkpoint_ids)
+                else:
+                    self.db.delete_eval_runs(self._checkpoint_ids)
+        if self.print_summary or print_summary:
+            result.print_summary()
+        return result
+
+    def _component_info(self) -> Dict[str, Any]:
+        component: Union[Agent, Team] = self.agent if self.agent is not None else self.team  # type: ignore[assignment]
+        return {
+            "agent_id": self.agent.id if self.agent is not None else None,
+            "team_id": self.team.id if self.team is not None else None,
+            "model_id": component.model.id if component.model is not None else None,
+            "model_provider": component.model.provider if component.model is not None else None,
+            "evaluated_component_name": component.name,
+        }
+
+    def _eval_run_kwargs(self, result: DatasetEvalResult) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "run_data": asdict(result),
+            "eval_type": self.eval_type,
+            "name": self.name,
+            "eval_input": {
+                "num_cases": result.num_cases,
+                "num_iterations": self.num_iterations,
+                "max_concurrency": self.max_concurrency,
+                "judge_batch_size": self.judge_batch_size,
+            },
+            **self._component_info(),
+        }
+
+    # Checkpoints are eval runs with IDs "{run_id}-checkpoint-{n}", numbered without gaps, holding the results of a
+    # window, plus those of the previous windows whose checkpoint could not be stored. Failed evaluations are left out,
+    # so they are run again when resuming. Checkpoints are deleted once the final eval run is stored.
+
+    def _checkpoint_id(self, checkpoint: int) -> str:
+        return f"{self.run_id}-checkpoint-{checkpoint}"
+
+    def _checkpoint_record(self, checkpoint: int, results: List[DatasetEvalCaseResult]) -> EvalRunRecord:
+        return EvalRunRecord(
+            run_id=self._checkpoint_id(checkpoint),
+            eval_type=self.eval_type,
+            eval_data={"results": [asdict(r) for r in results if r.error is None]},
+            eval_input={"dataset_run_id": self.run_id, "checkpoint": checkpoint},
+            name=f"{self.name or 'Dataset eval'} (checkpoint {checkpoint})",
+            **self._component_info(),
+        )
+
+    def _log_checkpoint(self, checkpoint: int, results: List[DatasetEvalCaseResult]) -> bool:
+        """Store a checkpoint. Returns True if it was stored."""
+        if self.db is None:
+            return False
+        try:
+            self.db.create_eval_run(self._checkpoint_record(checkpoint, results))  # type: ignore[union-attr]
+            self._checkpoint_ids.append(self._checkpoint_id(checkpoint))
+            return True
+        except Exception as e:
+            log_warning(f"Could not store checkpoint {checkpoint} of dataset evaluation {self.run_id}: {e}")
+            return False
+
+    async def _alog_checkpoint(self, checkpoint: int, results: List[DatasetEvalCaseResult]) -> bool:
+        if self.db is None:
+            return False
+        try:
+            if isinstance(self.db, AsyncBaseDb):
+                await self.db.create_eval_run(self._checkpoint_record(checkpoint, results))
+            else:
+                self.db.create_eval_run(self._checkpoint_record(checkpoint, results))
+            self._checkpoint_ids.append(self._checkpoint_id(checkpoint))
+            return True
+        except Exception as e:
+            log_warning(f"Could not store checkpoint {checkpoint} of dataset evaluation {self.run_id}: {e}")
+            return False
+
+    def _load_previous_run(self) -> Tuple[Optional[DatasetEvalResult], List[DatasetEvalCaseResult]]:
+        """Load a previous run with the same run_id: its result if it finished, the results of its checkpoints otherwise"""
+        self._checkpoint_ids.clear()
+        if self.db is None:
+            return None, []
+        finished = self.db.get_eval_run(self.run_id)  # type: ignore[union-attr]
+        if finished is not None:
+            return self._restore_result(finished), []
+        results: List[DatasetEvalCaseResult] = []
+        while True:
+            record = self.db.get_eval_run(self._checkpoint_id(len(self._checkpoint_ids)))  # type: ignore[union-attr]
+            if record is None:
+                return None, results
+            results.extend(self._restore_checkpoint(record))
+
+    async def _aload_previous_run(self) -> Tuple[Optional[DatasetEvalResult], List[DatasetEvalCaseResult]]:
+        self._checkpoint_ids.clear()
+        if self.db is None:
+            return None, []
+
+        async def get_eval_run(run_id: str) -> Any:
+            if isinstance(self.db, AsyncBaseDb):
+                return await self.db.get_eval_run(run_id)
+            return self.db.get_eval_run(run_id)  # type: ignore[union-attr]
+
+        finished = await get_eval_run(self.run_id)
+        if finished is not None:
+            return self._restore_result(finished), []
+        results: List[DatasetEvalCaseResult] = []
+        while True:
+            record = await get_eval_run(self._checkpoint_id(len(self._checkpoint_ids)))
+            if record is None:
+                return None, results
+            results.extend(self._restore_checkpoint(record))
+
+    def _restore_result(self, record: Any) -> DatasetEvalResult:
+        log_info(f"Dataset evaluation {self.run_id} already finished, returning its stored result")
+        data = dict(self._eval_data(record))
+        data["results"] = [DatasetEvalCaseResult(**r) for r in data.get("results", [])]
+        for key in ("failed", "avg_score", "pass_rate"):
+            data.pop(key, None)
+        return DatasetEvalResult(**data)
+
+    def _restore_checkpoint(self, record: Any) -> List[DatasetEvalCaseResult]:
+        self._checkpoint_ids.append(self._checkpoint_id(len(self._checkpoint_ids)))
+        return [DatasetEvalCaseResult(**r) for r in self._eval_data(record).get("results", [])]
+
+    @staticmethod
+    def _eval_data(record: Any) -> Dict[str, Any]:
+        return record.eval_data if isinstance(record, EvalRunRecord) else record["eval_data"]
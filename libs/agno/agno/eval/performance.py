@@ -1,9 +1,12 @@
 import asyncio
 import gc
+import inspect
 import tracemalloc
-from dataclasses import dataclass, field
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
 from os import getenv
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Union
 from uuid import uuid4
 
 from agno.db.base import AsyncBaseDb, BaseDb
@@ -176,6 +179,139 @@ class PerformanceResult:
         console.print(results_table)
 
 
+@dataclass
+class LoadTestResult:
+    """
+    Holds latency, throughput and error statistics of a load test.
+    Latencies and times to first token are in seconds, percentiles are computed over successful requests.
+    """
+
+    # Latency of each successful request
+    latencies: List[float] = field(default_factory=list)
+    # Time to first token of each successful streamed request
+    times_to_first_token: List[float] = field(default_factory=list)
+    # Event loop lag samples, only collected by arun_load_test()
+    loop_lags: List[float] = field(default_factory=list)
+    # Error message of each failed request
+    errors: List[str] = field(default_factory=list)
+    num_requests: int = 0
+    output_tokens: int = 0
+    # Wall-clock duration of the load test
+    duration: float = 0.0
+    concurrency: int = 0
+    arrival_rate: Optional[float] = None
+
+    avg_latency: float = field(init=False)
+    p50_latency: float = field(init=False)
+    p95_latency: float = field(init=False)
+    p99_latency: float = field(init=False)
+    max_latency: float = field(init=False)
+    p50_time_to_first_token: Optional[float] = field(init=False)
+    p95_time_to_first_token: Optional[float] = field(init=False)
+    p99_time_to_first_token: Optional[float] = field(init=False)
+    # Requests completed per second
+    throughput: float = field(init=False)
+    tokens_per_second: float = field(init=False)
+    error_rate: float = field(init=False)
+    avg_loop_lag: Optional[float] = field(init=False)
+    p99_loop_lag: Optional[float] = field(init=False)
+    max_loop_lag: Optional[float] = field(init=False)
+
+    def __post_init__(self):
+        self.compute_stats()
+
+    def compute_stats(self):
+        """Compute the latency percentiles and rates."""
+        import statistics
+
+        def percentiles(data: List[float]):
+            """p50, p95 and p99 of a non-empty list of floats."""
+            if len(data) == 1:
+                return data[0], data[0], data[0]
+            quantiles = statistics.quantiles(data, n=100, method="inclusive")
+            return quantiles[49], quantiles[94], quantiles[98]
+
+        if self.latencies:
+            self.avg_latency = statistics.mean(self.latencies)
+            self.p50_latency, self.p95_latency, self.p99_latency = percentiles(self.latencies)
+            self.max_latency = max(self.latencies)
+        else:
+            self.avg_latency = self.p50_latency = self.p95_latency = self.p99_latency = self.max_latency = 0
+
+        if self.times_to_first_token:
+            (
+                self.p50_time_to_first_token,
+                self.p95_time_to_first_token,
+                self.p99_time_to_first_token,
+            ) = percentiles(self.times_to_first_token)
+        else:
+            self.p50_time_to_first_token = self.p95_time_to_first_token = self.p99_time_to_first_token = None
+
+        if self.loop_lags:
+            self.avg_loop_lag = statistics.mean(self.loop_lags)
+            _, _, self.p99_loop_lag = percentiles(self.loop_lags)
+            self.max_loop_lag = max(self.loop_lags)
+        else:
+            self.avg_loop_lag = self.p99_loop_lag = self.max_loop_lag = None
+
+        self.throughput = len(self.latencies) / self.duration if self.duration > 0 else 0
+        self.tokens_per_second = self.output_tokens / self.duration if self.duration > 0 else 0
+        self.error_rate = len(self.errors) / self.num_requests if self.num_requests > 0 else 0
+
+    def print_summary(self, console: Optional["Console"] = None):
+        """
+        Prints a summary table of the computed stats.
+        """
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        load = f"{self.arrival_rate:g} requests/s" if self.arrival_rate else f"{self.concurrency} concurrent requests"
+        summary_table = Table(title=f"Load Test Summary ({load})", show_header=True, header_style="bold magenta")
+        summary_table.add_column("Metric", style="cyan")
+        summary_table.add_column("Value", style="green")
+
+        summary_table.add_row("Requests", f"{self.num_requests} ({len(self.errors)} failed)")
+        summary_table.add_row("Error rate", f"{self.error_rate:.2%}")
+        summary_table.add_row("Duration", f"{self.duration:.3f} s")
+        summary_table.add_row("Throughput", f"{self.throughput:.2f} requests/s")
+        summary_table.add_row("Output tokens/s", f"{self.tokens_per_second:.2f}")
+        summary_table.add_row(
+            "Latency p50 / p95 / p99", _format_seconds(self.p50_latency, self.p95_latency, self.p99_latency)
+        )
+        summary_table.add_row("Latency max", _format_seconds(self.max_latency))
+        if self.p50_time_to_first_token is not None:
+            summary_table.add_row(
+                "Time to first token p50 / p95 / p99",
+                _format_seconds(
+                    self.p50_time_to_first_token, self.p95_time_to_first_token, self.p99_time_to_first_token
+                ),
+            )
+        if self.avg_loop_lag is not None:
+            summary_table.add_row(
+                "Event loop lag avg / p99 / max",
+                _format_seconds(self.avg_loop_lag, self.p99_loop_lag, self.max_loop_lag),
+            )
+
+        console.print(summary_table)
+
+
+def _format_seconds(*values: Optional[float]) -> str:
+    return " / ".join(f"{value:.6f}" for value in values if value is not None) + " s"
+
+
+@dataclass
+class _LoadTestSample:
+    """Measurements of one load test request"""
+
+    latency: float
+    time_to_first_token: Optional[float] = None
+    output_tokens: int = 0
+    error: Optional[str] = None
+
+
 @dataclass
 class PerformanceEval:
     """
@@ -184,6 +320,7 @@ class PerformanceEval:
     - Warm-up runs are included to avoid measuring overhead on the first execution(s).
     - Debug mode can show top memory allocations using tracemalloc snapshots.
     - Optionally, you can enable cProfile for CPU profiling stats.
+    - run_load_test() and arun_load_test() measure latency, throughput and errors under concurrent requests.
     """
 
     # Function to evaluate
@@ -211,6 +348,18 @@ class PerformanceEval:
     # Number of memory allocations to track
     top_n_memory_allocations: int = 5
 
+    # -*- Load test settings, used by run_load_test() and arun_load_test()
+    # Number of requests to send
+    num_requests: int = 100
+    # Maximum number of requests in flight
+    concurrency: int = 10
+    # Requests started per second. If None, a new request starts as soon as one completes
+    arrival_rate: Optional[float] = None
+    # Interval in seconds between event loop lag samples
+    loop_lag_interval: float = 0.01
+    # Result of the load test
+    load_test_result: Optional[LoadTestResult] = None
+
     # Agent and Team information
     agent_id: Optional[str] = None
     team_id: Optional[str] = None
@@ -767,8 +916,314 @@ class PerformanceEval:
         log_debug(f"*********** Evaluation End: {run_id} ***********")
         return self.result
 
-    def _get_telemetry_data(self) -> Dict[str, Any]:
+    def _record_load_test_item(self, sample: _LoadTestSample, item: Any, start: float, streamed: bool) -> None:
+        """Update the sample with a returned or streamed item: errors, time to first token and output tokens."""
+        from agno.run.agent import RunEvent
+        from agno.run.base import RunStatus
+        from agno.run.team import TeamRunEvent
+        from agno.run.workflow import WorkflowRunEvent
+
+        if getattr(item, "status", None) == RunStatus.error or getattr(item, "event", None) in (
+            RunEvent.run_error.value,
+            TeamRunEvent.run_error.value,
+            WorkflowRunEvent.workflow_error.value,
+        ):
+            sample.error = str(getattr(item, "content", None) or "Run failed")
+            return
+
+        if (
+            streamed
+            and sample.time_to_first_token is None
+            and (isinstance(item, str) or getattr(item, "content", None))
+        ):
+            sample.time_to_first_token = perf_counter() - start
+
+        # Streams report the run metrics on their completed event, or on the run output with yield_run_output=True
+        output_tokens = getattr(getattr(item, "metrics", None), "output_tokens", None)
+        if isinstance(output_tokens, int) and output_tokens > 0:
+            sample.output_tokens = output_tokens
+
+    def _load_test_request(self, scheduled_at: Optional[float] = None) -> _LoadTestSample:
+        """Send one request and measure it. With an arrival rate, latency includes the time spent waiting to start."""
+        start = scheduled_at if scheduled_at is not None else perf_counter()
+        sample = _LoadTestSample(latency=0.0)
+        try:
+            result = self.func()
+            if isinstance(result, Iterator):
+                for item in result:
+                    self._record_load_test_item(sample, item, start, streamed=True)
+            else:
+                self._record_load_test_item(sample, result, start, streamed=False)
+        except Exception as e:
+            sample.error = f"{type(e).__name__}: {e}"
+        sample.latency = perf_counter() - start
+        return sample
+
+    async def _async_load_test_request(self, scheduled_at: Optional[float] = None) -> _LoadTestSample:
+        """Send one request and measure it. With an arrival rate, latency includes the time spent waiting to start."""
+        start = scheduled_at if scheduled_at is not None else perf_counter()
+        sample = _LoadTestSample(latency=0.0)
+        try:
+            result = self.func()
+            if inspect.isawaitable(result):
+                result = await result
+            if isinstance(result, AsyncIterator):
+                async for item in result:
+                    self._record_load_test_item(sample, item, start, streamed=True)
+            elif isinstance(result, Iterator):
+                for item in result:
+                    self._record_load_test_item(sample, item, start, streamed=True)
+            else:
+                self._record_load_test_item(sample, result, start, streamed=False)
+        except Exception as e:
+            sample.error = f"{type(e).__name__}: {e}"
+        sample.latency = perf_counter() - start
+        return sample
+
+    async def _sample_loop_lag(self, loop_lags: List[float]) -> None:
+        """Measure how late the event loop wakes up from sleeps of loop_lag_interval, until cancelled."""
+        while True:
+            start = perf_counter()
+            try:
+                await asyncio.sleep(self.loop_lag_interval)
+            except asyncio.CancelledError:
+                # Keep the interval in progress if the loop was already late for it
+                lag = perf_counter() - start - self.loop_lag_interval
+                if lag > 0:
+                    loop_lags.append(lag)
+                raise
+            loop_lags.append(max(0.0, perf_counter() - start - self.loop_lag_interval))
+
+    def _build_load_test_result(
+        self, samples: List[_LoadTestSample], duration: float, loop_lags: Optional[List[float]] = None
+    ) -> LoadTestResult:
+        return LoadTestResult(
+            latencies=[sample.latency for sample in samples if sample.error is None],
+            times_to_first_token=[
+                sample.time_to_first_token
+                for sample in samples
+                if sample.error is None and sample.time_to_first_token is not None
+            ],
+            loop_lags=loop_lags or [],
+            errors=[sample.error for sample in samples if sample.error is not None],
+            num_requests=len(samples),
+            output_tokens=sum(sample.output_tokens for sample in samples if sample.error is None),
+            duration=duration,
+            concurrency=self.concurrency,
+            arrival_rate=self.arrival_rate,
+        )
+
+    def _parse_load_test_data(self) -> dict:
+        """Parse the load test result into a dictionary with the data we want for monitoring."""
+        if self.load_test_result is None:
+            return {}
+
+        result = asdict(self.load_test_result)
+        # Keep the summary and the errors, the per-request samples can be large
+        for key in ("latencies", "times_to_first_token", "loop_lags"):
+            result.pop(key)
+        return {"load_test": result}
+
+    def _log_load_test(self) -> Dict[str, Any]:
+        """Arguments to log the load test as an eval run."""
+        return dict(
+            run_id=self.eval_id,
+            run_data=self._parse_load_test_data(),
+            eval_type=EvalType.PERFORMANCE,
+            name=self.name if self.name is not None else None,
+            evaluated_component_name=self.func.__name__,
+            agent_id=self.agent_id,
+            team_id=self.team_id,
+            model_id=self.model_id,
+            model_provider=self.model_provider,
+            eval_input={
+                "num_requests": self.num_requests,
+                "concurrency": self.concurrency,
+                "arrival_rate": self.arrival_rate,
+                "warmup_runs": self.warmup_runs,
+            },
+        )
+
+    def run_load_test(self, *, print_summary: bool = False) -> LoadTestResult:
+        """
+        Run the function concurrently in threads and measure latency, throughput and errors.
+        1. Do optional warm-up runs.
+        2. Send num_requests requests, keeping at most `concurrency` in flight, started at `arrival_rate` if set
+        3. Collect results
+        4. Save results if requested
+        5. Print results as requested
+        6. Log results to the Agno platform if requested
+
+        The function can return a run output, or an iterator of streamed events to also measure time to first token.
+        """
+        if isinstance(self.db, AsyncBaseDb):
+            raise ValueError("run_load_test() is not supported with an async DB. Please use arun_load_test() instead.")
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        from rich.console import Console
+        from rich.live import Live
+        from rich.status import Status
+
+        run_id = str(uuid4())
+        self._set_log_level()
+        log_debug(f"************ Load Test Start: {run_id} ************")
+
+        console = Console()
+        with Live(console=console, transient=True) as live_log:
+            # 1. Do optional warm-up runs.
+            if self.warmup_runs is not None:
+                live_log.update(Status(f"Warm-up runs ({self.warmup_runs})...", spinner="dots", speed=1.0))
+                for _ in range(self.warmup_runs):
+                    self._load_test_request()
+                    self._set_log_level()  # Set log level incase function changed it
+
+            # 2. Send the requests
+            live_log.update(Status(f"Load test ({self.num_requests} requests)...", spinner="dots", speed=1.0))
+            start = perf_counter()
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                futures = []
+                for i in range(self.num_requests):
+                    scheduled_at = None
+                    if self.arrival_rate:
+                        scheduled_at = start + i / self.arrival_rate
+                        delay = scheduled_at - perf_counter()
+                        if delay > 0:
+                            sleep(delay)
+                    futures.append(executor.submit(self._load_test_request, scheduled_at))
+                samples = [future.result() for future in futures]
+            duration = perf_counter() - start
+            self._set_log_level()  # Set log level incase function changed it
+
+        # 3. Collect results
+        self.load_test_result = self._build_load_test_result(samples, duration)
+
+        # 4. Save result to file if requested
+        if self.file_path_to_save_results is not None:
+            store_result_in_file(
+                file_path=self.file_path_to_save_results,
+                name=self.name,
+                eval_id=self.eval_id,
+                result=self.load_test_result,
+            )
+
+        # 5. Print results if requested
+        if self.print_summary or print_summary:
+            self.load_test_result.print_summary(console)
+
+        # 6. Log results to the Agno platform if requested
+        if self.db:
+            log_eval_run(db=self.db, **self._log_load_test())  # type: ignore
+
+        if self.telemetry:
+            from agno.api.evals import EvalRunCreate, create_eval_run_telemetry
+
+            create_eval_run_telemetry(
+                eval_run=EvalRunCreate(
+                    run_id=self.eval_id, eval_type=EvalType.PERFORMANCE, data=self._get_telemetry_data(load_test=True)
+                ),
+            )
+
+        log_debug(f"*********** Load Test End: {run_id} ***********")
+        return self.load_test_result
+
+    async def arun_load_test(self, *, print_summary: bool = False) -> LoadTestResult:
+        """
+        Run the function concurrently as asyncio tasks and measure latency, throughput, errors and event loop lag.
+        1. Do optional warm-up runs.
+        2. Send num_requests requests, keeping at most `concurrency` in flight, started at `arrival_rate` if set
+        3. Collect results
+        4. Save results if requested
+        5. Print results as requested
+        6. Log results to the Agno platform if requested
+
+        The function can return a coroutine, or an async iterator of streamed events to also measure time to first
+        token. Blocking work done by the function shows up as event loop lag.
+        """
+        from rich.console import Console
+        from rich.live import Live
+        from rich.status import Status
+
+        run_id = str(uuid4())
+        self._set_log_level()
+        log_debug(f"************ Load Test Start: {run_id} ************")
+
+        console = Console()
+        with Live(console=console, transient=True) as live_log:
+            # 1. Do optional warm-up runs.
+            if self.warmup_runs is not None:
+                live_log.update(Status(f"Warm-up runs ({self.warmup_runs})...", spinner="dots", speed=1.0))
+                for _ in range(self.warmup_runs):
+                    await self._async_load_test_request()
+                    self._set_log_level()  # Set log level incase function changed it
+
+            # 2. Send the requests, sampling the event loop lag meanwhile
+            live_log.update(Status(f"Load test ({self.num_requests} requests)...", spinner="dots", speed=1.0))
+            semaphore = asyncio.Semaphore(self.concurrency)
+            loop_lags: List[float] = []
+            start = perf_counter()
+
+            async def request(i: int) -> _LoadTestSample:
+                scheduled_at = None
+                if self.arrival_rate:
+                    scheduled_at = start + i / self.arrival_rate
+                    await asyncio.sleep(max(0.0, scheduled_at - perf_counter()))
+                async with semaphore:
+                    return await self._async_load_test_request(scheduled_at)
+
+            loop_lag_sampler = asyncio.create_task(self._sample_loop_lag(loop_lags))
+            try:
+                samples = await asyncio.gather(*(request(i) for i in range(self.num_requests)))
+            finally:
+                loop_lag_sampler.cancel()
+                with suppress(asyncio.CancelledError):
+                    await loop_lag_sampler
+            duration = perf_counter() - start
+            self._set_log_level()  # Set log level incase function changed it
+
+        # 3. Collect results
+        self.load_test_result = self._build_load_test_result(list(samples), duration, loop_lags)
+
+        # 4. Save result to file if requested
+        if self.file_path_to_save_results is not None:
+            store_result_in_file(
+                file_path=self.file_path_to_save_results,
+                name=self.name,
+                eval_id=self.eval_id,
+                result=self.load_test_result,
+            )
+
+        # 5. Print results if requested
+        if self.print_summary or print_summary:
+            self.load_test_result.print_summary(console)
+
+        # 6. Log results to the Agno platform if requested
+        if self.db:
+            await async_log_eval(db=self.db, **self._log_load_test())
+
+        if self.telemetry:
+            from agno.api.evals import EvalRunCreate, async_create_eval_run_telemetry
+
+            await async_create_eval_run_telemetry(
+                eval_run=EvalRunCreate(
+                    run_id=self.eval_id, eval_type=EvalType.PERFORMANCE, data=self._get_telemetry_data(load_test=True)
+                ),
+            )
+
+        log_debug(f"*********** Load Test End: {run_id} ***********")
+        return self.load_test_result
+
+    def _get_telemetry_data(self, load_test: bool = False) -> Dict[str, Any]:
         """Get the telemetry data for the evaluation"""
+        if load_test:
+            return {
+                "model_id": self.model_id,
+                "model_provider": self.model_provider,
+                "load_test": True,
+                "num_requests": self.num_requests,
+                "concurrency": self.concurrency,
+                "arrival_rate": self.arrival_rate,
+            }
         return {
             "model_id": self.model_id,
             "model_provider": self.model_provider,
@@ -1,6 +1,27 @@
+from typing import TYPE_CHECKING
+
 from agno.guardrails.base import BaseGuardrail
-from agno.guardrails.openai import OpenAIModerationGuardrail
-from agno.guardrails.pii import PIIDetectionGuardrail
-from agno.guardrails.prompt_injection import PromptInjectionGuardrail
+
+if TYPE_CHECKING:
+    from agno.guardrails.openai import OpenAIModerationGuardrail
+    from agno.guardrails.pii import PIIDetectionGuardrail
+    from agno.guardrails.prompt_injection import PromptInjectionGuardrail
 
 __all__ = ["BaseGuardrail", "OpenAIModerationGuardrail", "PIIDetectionGuardrail", "PromptInjectionGuardrail"]
+
+
+def __getattr__(name: str):
+    """Lazy import for guardrail implementations, so hooks can check for BaseGuardrail without loading them."""
+    if name == "OpenAIModerationGuardrail":
+        from agno.guardrails.openai import OpenAIModerationGuardrail
+
+        return OpenAIModerationGuardrail
+    elif name == "PIIDetectionGuardrail":
+        from agno.guardrails.pii import PIIDetectionGuardrail
+
+        return PIIDetectionGuardrail
+    elif name == "PromptInjectionGuardrail":
+        from agno.guardrails.prompt_injection import PromptInjectionGuardrail
+
+        return PromptInjectionGuardrail
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
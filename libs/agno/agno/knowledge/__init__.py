@@ -1,9 +1,29 @@
-from agno.knowledge.filesystem import FileSystemKnowledge
-from agno.knowledge.knowledge import Knowledge
-from agno.knowledge.protocol import KnowledgeProtocol
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agno.knowledge.filesystem import FileSystemKnowledge
+    from agno.knowledge.knowledge import Knowledge
+    from agno.knowledge.protocol import KnowledgeProtocol
 
 __all__ = [
     "FileSystemKnowledge",
     "Knowledge",
     "KnowledgeProtocol",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy import, so importing a knowledge submodule (e.g. agno.knowledge.types) does not load the whole package."""
+    if name == "FileSystemKnowledge":
+        from agno.knowledge.filesystem import FileSystemKnowledge
+
+        return FileSystemKnowledge
+    elif name == "Knowledge":
+        from agno.knowledge.knowledge import Knowledge
+
+        return Knowledge
+    elif name == "KnowledgeProtocol":
+        from agno.knowledge.protocol import KnowledgeProtocol
+
+        return KnowledgeProtocol
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
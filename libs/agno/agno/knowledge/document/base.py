@@ -13,6 +13,7 @@ class Document:
     name: Optional[str] = None
     meta_data: Dict[str, Any] = field(default_factory=dict)
     embedder: Optional["Embedder"] = None
+    # A list of floats, or a float32 numpy array when embedded with Embedder.use_numpy
     embedding: Optional[List[float]] = None
     usage: Optional[Dict[str, Any]] = None
     reranking_score: Optional[float] = None
@@ -19,6 +19,8 @@ except ImportError:
 class AzureOpenAIEmbedder(Embedder):
     id: str = "text-embedding-3-small"  # This has to match the model that you deployed at the provided URL
     dimensions: int = 1536
+    # Azure OpenAI caps the total number of tokens in one embeddings request
+    max_batch_tokens: Optional[int] = 300_000
     encoding_format: Literal["float", "base64"] = "float"
     user: Optional[str] = None
     api_key: Optional[str] = getenv("AZURE_EMBEDDER_OPENAI_API_KEY")
@@ -154,11 +156,30 @@ class AzureOpenAIEmbedder(Embedder):
         usage = response.usage
         return embedding, usage.model_dump()
 
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        req: Dict[str, Any] = {
+            "input": texts,
+            "model": self.id,
+            "encoding_format": self.encoding_format,
+        }
+        if self.user is not None:
+            req["user"] = self.user
+        if self.id.startswith("text-embedding-3"):
+            req["dimensions"] = self.dimensions
+        if self.request_params:
+            req.update(self.request_params)
+
+        response: CreateEmbeddingResponse = await self.aclient.embeddings.create(**req)
+        batch_embeddings = [data.embedding for data in response.data]
+        # For each embedding in the batch, add the same usage information
+        usage_dict = response.usage.model_dump() if response.usage else None
+        return batch_embeddings, [usage_dict] * len(batch_embeddings)
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
         """
-        Get embeddings and usage for multiple texts in batches.
+        Get embeddings and usage for multiple texts in batches, with up to max_concurrent_batches requests in flight.
 
         Args:
             texts: List of text strings to embed
@@ -166,44 +187,4 @@ class AzureOpenAIEmbedder(Embedder):
         Returns:
             Tuple of (List of embedding vectors, List of usage dictionaries)
         """
-        all_embeddings = []
-        all_usage = []
-        logger.info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
-
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-
-            req: Dict[str, Any] = {
-                "input": batch_texts,
-                "model": self.id,
-                "encoding_format": self.encoding_format,
-            }
-            if self.user is not None:
-                req["user"] = self.user
-            if self.id.startswith("text-embedding-3"):
-                req["dimensions"] = self.dimensions
-            if self.request_params:
-                req.update(self.request_params)
-
-            try:
-                response: CreateEmbeddingResponse = await self.aclient.embeddings.create(**req)
-                batch_embeddings = [data.embedding for data in response.data]
-                all_embeddings.extend(batch_embeddings)
-
-                # For each embedding in the batch, add the same usage information
-                usage_dict = response.usage.model_dump() if response.usage else None
-                all_usage.extend([usage_dict] * len(batch_embeddings))
-            except Exception as e:
-                logger.warning(f"Error in async batch embedding: {e}")
-                # Fallback to individual calls for this batch
-                for text in batch_texts:
-                    try:
-                        embedding, usage = await self.async_get_embedding_and_usage(text)
-                        all_embeddings.append(embedding)
-                        all_usage.append(usage)
-                    except Exception as e2:
-                        logger.warning(f"Error in individual async embedding fallback: {e2}")
-                        all_embeddings.append([])
-                        all_usage.append(None)
-
-        return all_embeddings, all_usage
+        return await self._async_embed_batches(texts)
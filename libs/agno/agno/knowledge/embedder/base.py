@@ -1,5 +1,10 @@
+import asyncio
+import random
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from time import monotonic
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from agno.utils.log import log_debug, log_info, log_warning
 
 
 @dataclass
@@ -8,7 +13,17 @@ class Embedder:
 
     dimensions: Optional[int] = 1536
     enable_batch: bool = False
-    batch_size: int = 100  # Number of texts to process in each API call
+    batch_size: int = 100  # Maximum number of texts to process in each API call
+    # Maximum estimated tokens per API call, batches are cut at whichever of batch_size or max_batch_tokens comes first
+    max_batch_tokens: Optional[int] = None
+    # Number of batch API calls in flight at once
+    max_concurrent_batches: int = 4
+    # Retries with exponential backoff when a batch is rate limited
+    rate_limit_retries: int = 5
+    rate_limit_base_delay: float = 1.0
+    # Return batch embeddings as float32 numpy arrays (rows of one contiguous matrix) instead of lists of floats.
+    # Only use with vector dbs that accept arrays, e.g. PgVector, LanceDb and Qdrant
+    use_numpy: bool = False
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
@@ -21,3 +36,160 @@ class Embedder:
 
     async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings_array(self, texts: List[str]) -> Any:
+        """Get the embeddings of texts as a (len(texts), dimensions) float32 numpy array."""
+        return to_float32_matrix([self.get_embedding(text) for text in texts])
+
+    async def async_get_embeddings_array(self, texts: List[str]) -> Any:
+        """Async version of get_embeddings_array, using concurrent batch API calls when the embedder supports them."""
+        if type(self)._async_embed_batch is not Embedder._async_embed_batch:
+            embeddings, _ = await self._async_embed_batches(texts)
+        else:
+            embeddings = await asyncio.gather(*[self.async_get_embedding(text) for text in texts])
+        return to_float32_matrix(embeddings)
+
+    def _format_batch_embeddings(self, embeddings: Sequence[Any]) -> List[Any]:
+        """Return batch embeddings as float32 array rows if use_numpy is set, otherwise as lists of floats.
+
+        Failed embeddings stay empty lists either way.
+        """
+        if not self.use_numpy:
+            if hasattr(embeddings, "tolist"):
+                return embeddings.tolist()
+            return [embedding.tolist() if hasattr(embedding, "tolist") else embedding for embedding in embeddings]
+        if hasattr(embeddings, "ndim") and embeddings.ndim == 2:
+            return list(to_float32_matrix(embeddings))
+        embedded = [i for i, embedding in enumerate(embeddings) if len(embedding) > 0]
+        matrix = to_float32_matrix([embeddings[i] for i in embedded])
+        rows: List[Any] = [[] for _ in embeddings]
+        for row, i in enumerate(embedded):
+            rows[i] = matrix[row]
+        return rows
+
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed texts in a single API call, raising on failure. Implemented by embedders with batch support."""
+        raise NotImplementedError
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Cheap upper-bound estimate of the number of tokens in a text, used to size batches."""
+        return len(text) // 3 + 1
+
+    def _get_batches(self, texts: List[str]) -> List[Tuple[int, int]]:
+        """Split texts into (start, end) ranges bounded by batch_size and max_batch_tokens."""
+        batches: List[Tuple[int, int]] = []
+        start = 0
+        batch_tokens = 0
+        for i, text in enumerate(texts):
+            tokens = self._estimate_tokens(text)
+            over_token_budget = self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens
+            if i > start and (i - start >= self.batch_size or over_token_budget):
+                batches.append((start, i))
+                start = i
+                batch_tokens = 0
+            batch_tokens += tokens
+        if start < len(texts):
+            batches.append((start, len(texts)))
+        return batches
+
+    def _is_rate_limit_error(self, error: Exception) -> bool:
+        """Check if the error is a rate limiting error."""
+        if getattr(error, "status_code", None) == 429 or type(error).__name__ == "RateLimitError":
+            return True
+        error_str = str(error).lower()
+        return any(
+            phrase in error_str
+            for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
+        )
+
+    def _is_input_error(self, error: Exception) -> bool:
+        """Check if the error is caused by the texts of the request, e.g. an invalid or too long input."""
+        if getattr(error, "status_code", None) in (400, 413, 422) or type(error).__name__ in (
+            "BadRequestError",
+            "UnprocessableEntityError",
+        ):
+            return True
+        error_str = str(error).lower()
+        return any(
+            phrase in error_str
+            for phrase in ["invalid input", "too long", "maximum context length", "token limit", "too many tokens"]
+        )
+
+    async def _async_embed_batch_with_retry(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a batch, retrying with exponential backoff while the provider rate limits it."""
+        attempt = 0
+        while True:
+            try:
+                return await self._async_embed_batch(texts)
+            except Exception as e:
+                if not self._is_rate_limit_error(e) or attempt >= self.rate_limit_retries:
+                    raise
+                delay = self.rate_limit_base_delay * (2**attempt) + random.uniform(0, self.rate_limit_base_delay)
+                log_debug(f"Rate limited, waiting {delay:.2f} seconds before retry (attempt {attempt + 1})")
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _async_embed_batches(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed texts in batches, with up to max_concurrent_batches API calls in flight.
+
+        Rate-limited batches are retried with exponential backoff and the error is raised once retries run out.
+        Batches rejected because of their texts are split in half until the failing texts are isolated, which get an
+        empty embedding. Other errors (authentication, network, server errors) would fail every split as well, so
+        they are raised at once.
+        """
+        embeddings: List[List[float]] = [[] for _ in texts]
+        usages: List[Optional[Dict]] = [None for _ in texts]
+        batches = self._get_batches(texts)
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_batches))
+        log_info(
+            f"Getting embeddings and usage for {len(texts)} texts in {len(batches)} batches "
+            f"({self.max_concurrent_batches} concurrent)"
+        )
+
+        async def embed_range(start: int, end: int) -> None:
+            try:
+                async with semaphore:
+                    batch_embeddings, batch_usage = await self._async_embed_batch_with_retry(texts[start:end])
+                if len(batch_embeddings) != end - start:
+                    raise ValueError(f"Expected {end - start} embeddings, got {len(batch_embeddings)}")
+            except Exception as e:
+                # A batch returning the wrong number of embeddings is split as well, to isolate the text causing it
+                if self._is_rate_limit_error(e) or not (isinstance(e, ValueError) or self._is_input_error(e)):
+                    raise
+                if end - start == 1:
+                    log_warning(f"Error in async embedding: {e}")
+                    return
+                log_debug(f"Error in async batch embedding, splitting batch of {end - start}: {e}")
+                middle = (start + end) // 2
+                await asyncio.gather(embed_range(start, middle), embed_range(middle, end))
+                return
+            embeddings[start:end] = batch_embeddings
+            usages[start:end] = batch_usage if len(batch_usage) == end - start else [None] * (end - start)
+
+        start_time = monotonic()
+        tasks = [asyncio.ensure_future(embed_range(start, end)) for start, end in batches]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the remaining batches once one fails for a reason other than its texts
+            for task in tasks:
+                task.cancel()
+            raise
+        log_debug(f"Embedded {len(texts)} texts in {monotonic() - start_time:.2f}s")
+        return self._format_batch_embeddings(embeddings), usages
+
+
+def to_float32_matrix(embeddings: Sequence[Any]) -> Any:
+    """Stack embeddings (lists or arrays) into one (n, dimensions) float32 array, failed (empty) rows become NaN."""
+    import numpy as np
+
+    if hasattr(embeddings, "dtype") and getattr(embeddings, "ndim", 0) == 2:
+        return np.asarray(embeddings, dtype=np.float32)
+    dimensions = max((len(embedding) for embedding in embeddings), default=0)
+    matrix = np.empty((len(embeddings), dimensions), dtype=np.float32)
+    for i, embedding in enumerate(embeddings):
+        if len(embedding) == dimensions:
+            matrix[i] = embedding
+        else:
+            matrix[i] = np.nan
+    return matrix
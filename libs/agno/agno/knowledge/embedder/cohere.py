@@ -78,16 +78,6 @@ class CohereEmbedder(Embedder):
 
         return request_params
 
-    def _is_rate_limit_error(self, error: Exception) -> bool:
-        """Check if the error is a rate limiting error."""
-        if hasattr(error, "status_code") and error.status_code == 429:
-            return True
-        error_str = str(error).lower()
-        return any(
-            phrase in error_str
-            for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-        )
-
     def _exponential_backoff_sleep(self, attempt: int, base_delay: float = 1.0) -> None:
         """Sleep with exponential backoff."""
         delay = base_delay * (2**attempt) + (time.time() % 1)  # Add jitter
@@ -114,7 +104,27 @@ class CohereEmbedder(Embedder):
         )
         await asyncio.sleep(delay)
 
-    async def _async_batch_with_retry(
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        request_params = self._get_batch_request_params()
+        response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = await self.aclient.embed(
+            texts=texts, **request_params
+        )
+
+        # Extract embeddings from response
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            batch_embeddings = response.embeddings
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            batch_embeddings = response.embeddings.float_ if response.embeddings.float_ else []
+        else:
+            log_warning("No embeddings found in response")
+            batch_embeddings = []
+
+        # Extract usage information
+        usage = response.meta.billed_units if response.meta else None
+        usage_dict = usage.model_dump() if usage else None
+        return batch_embeddings, [usage_dict] * len(batch_embeddings)
+
+    async def _async_embed_batch_with_retry(
         self, texts: List[str], max_retries: int = 3
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
         """Execute async batch embedding with rate-limit-aware backoff for rate limiting."""
@@ -123,25 +133,7 @@ class CohereEmbedder(Embedder):
 
         for attempt in range(max_retries + 1):
             try:
-                request_params = self._get_batch_request_params()
-                response: Union[
-                    EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse
-                ] = await self.aclient.embed(texts=texts, **request_params)
-
-                # Extract embeddings from response
-                if isinstance(response, EmbeddingsFloatsEmbedResponse):
-                    batch_embeddings = response.embeddings
-                elif isinstance(response, EmbeddingsByTypeEmbedResponse):
-                    batch_embeddings = response.embeddings.float_ if response.embeddings.float_ else []
-                else:
-                    log_warning("No embeddings found in response")
-                    batch_embeddings = []
-
-                # Extract usage information
-                usage = response.meta.billed_units if response.meta else None
-                usage_dict = usage.model_dump() if usage else None
-                all_usage = [usage_dict] * len(batch_embeddings)
-
+                batch_embeddings, all_usage = await self._async_embed_batch(texts)
                 log_debug(f"Async batch embedding succeeded on attempt {attempt + 1}")
                 return batch_embeddings, all_usage
 
@@ -254,70 +246,12 @@ class CohereEmbedder(Embedder):
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
         """
-                Get embeddings and usage for multiple texts in batches (async version).
+        Get embeddings and usage for multiple texts in batches, with up to max_concurrent_batches requests in flight.
 
-                Args:
-                    texts: List of text strings to embed
+        Args:
+            texts: List of text strings to embed
 
-                Returns:
-        s, List of usage dictionaries)
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
         """
-        all_embeddings = []
-        all_usage = []
-        log_info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size} (async)")
-
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-
-            try:
-                # Use retry logic for batch processing
-                batch_embeddings, batch_usage = await self._async_batch_with_retry(batch_texts)
-                all_embeddings.extend(batch_embeddings)
-                all_usage.extend(batch_usage)
-
-            except Exception as e:
-                log_warning(f"Async batch embedding failed after retries: {e}")
-
-                # Check if this is a rate limit error and backoff is disabled
-                if self._is_rate_limit_error(e) and not self.exponential_backoff:
-                    log_warning("Rate limit hit and backoff is disabled. Failing immediately.")
-                    raise e
-
-                # Only fall back to individual calls for non-rate-limit errors
-                # For rate limit errors, we should reduce batch size instead
-                if self._is_rate_limit_error(e):
-                    log_warning("Rate limit hit even after retries. Consider reducing batch_size or upgrading API key.")
-                    # Try with smaller batch size
-                    if len(batch_texts) > 1:
-                        smaller_batch_size = max(1, len(batch_texts) // 2)
-                        log_info(f"Retrying with smaller batch size: {smaller_batch_size}")
-                        for j in range(0, len(batch_texts), smaller_batch_size):
-                            small_batch = batch_texts[j : j + smaller_batch_size]
-                            try:
-                                small_embeddings, small_usage = await self._async_batch_with_retry(small_batch)
-                                all_embeddings.extend(small_embeddings)
-                                all_usage.extend(small_usage)
-                            except Exception as e3:
-                                log_error(f"Failed even with reduced batch size: {e3}")
-                                # Fall back to empty results for this batch
-                                all_embeddings.extend([[] for _ in small_batch])
-                                all_usage.extend([None for _ in small_batch])
-                    else:
-                        # Single item already failed, add empty result
-                        log_debug("Single item failed, adding empty result")
-                        all_embeddings.append([])
-                        all_usage.append(None)
-                else:
-                    # For non-rate-limit errors, fall back to individual calls
-                    log_debug("Non-rate-limit error, falling back to individual calls")
-                    for text in batch_texts:
-                        try:
-                            embedding, usage = await self.async_get_embedding_and_usage(text)
-                            all_embeddings.append(embedding)
-                            all_usage.append(usage)
-                        except Exception as e2:
-                            log_warning(f"Error in individual async embedding fallback: {e2}")
-                            all_embeddings.append([])
-                            all_usage.append(None)
-
-        return all_embeddings, all_usage
+        return await self._async_embed_batches(texts)
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.knowledge.embedder.base import Embedder
 from agno.utils.log import logger
@@ -18,16 +19,68 @@ except ImportError:
     raise ImportError("fastembed not installed, use pip install fastembed")
 
 
+def _encode_with_fastembed(model: TextEmbedding, texts: List[str]):
+    return np.stack(list(model.embed(texts)))
+
+
+def _load_fastembed(model_id: str):
+    """Load the model in a worker process and return its encoder."""
+    return partial(_encode_with_fastembed, TextEmbedding(model_name=model_id))
+
+
 @dataclass
 class FastEmbedEmbedder(Embedder):
     """Using BAAI/bge-small-en-v1.5 model, more models available: https://qdrant.github.io/fastembed/examples/Supported_Models/"""
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: Optional[int] = 384
+    # Run the model in this many worker processes, batching requests from concurrent callers
+    num_workers: Optional[int] = None
+    worker_batch_size: int = 64
+    max_batch_wait_ms: float = 5.0
+    _model: Optional[Any] = field(default=None, init=False, repr=False)
+    _pool: Optional[Any] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.num_workers:
+            from agno.knowledge.embedder.pool import LocalEmbeddingPool
+
+            if self.dimensions is None:
+                raise ValueError("dimensions must be set to use a worker pool")
+            self._pool = LocalEmbeddingPool(
+                partial(_load_fastembed, self.id),
+                dimensions=self.dimensions,
+                num_workers=self.num_workers,
+                max_batch_size=self.worker_batch_size,
+                max_wait_ms=self.max_batch_wait_ms,
+            )
+
+    @property
+    def model(self) -> TextEmbedding:
+        # Load the model once instead of on every call
+        if self._model is None:
+            self._model = TextEmbedding(model_name=self.id)
+        return self._model
+
+    def get_embeddings_array(self, texts: List[str]) -> Any:
+        """Get the embeddings of texts as a (len(texts), dimensions) float32 array."""
+        if self._pool is not None:
+            return self._pool.embed(texts)
+        return _encode_with_fastembed(self.model, texts).astype(np.float32, copy=False)
+
+    async def async_get_embeddings_array(self, texts: List[str]) -> Any:
+        """Async version of get_embeddings_array, encoding in the worker pool or a thread executor."""
+        if self._pool is not None:
+            return await self._pool.aembed(texts)
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_embeddings_array, texts)
 
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
+        if self._pool is not None:
+            return self._pool.embed([text])[0].tolist()
+        embeddings = self.model.embed(text)
         embedding_list = list(embeddings)[0]
         if isinstance(embedding_list, np.ndarray):
             return embedding_list.tolist()
@@ -46,7 +99,10 @@ class FastEmbedEmbedder(Embedder):
         return embedding, usage
 
     async def async_get_embedding(self, text: str) -> List[float]:
-        """Async version using thread executor for CPU-bound operations."""
+        """Async version using the worker pool, or a thread executor for CPU-bound operations."""
+        if self._pool is not None:
+            return (await self._pool.aembed([text]))[0].tolist()
+
         import asyncio
 
         loop = asyncio.get_event_loop()
@@ -54,9 +110,25 @@ class FastEmbedEmbedder(Embedder):
         return await loop.run_in_executor(None, self.get_embedding, text)
 
     async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
-        """Async version using thread executor for CPU-bound operations."""
+        """Async version using the worker pool, or a thread executor for CPU-bound operations."""
+        if self._pool is not None:
+            return await self.async_get_embedding(text), None
+
         import asyncio
 
         loop = asyncio.get_event_loop()
         # Run the CPU-bound operation in a thread executor
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Get embeddings for multiple texts in one model call."""
+        embeddings = await self.async_get_embeddings_array(texts)
+        return self._format_batch_embeddings(embeddings), [None] * len(texts)
+
+    def close(self) -> None:
+        """Stop the worker pool, if any."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
@@ -139,11 +139,18 @@ class JinaEmbedder(Embedder):
                 response.raise_for_status()
                 return await response.json()
 
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        result = await self._async_batch_response(texts)
+        batch_embeddings = [data["embedding"] for data in result["data"]]
+        # For each embedding in the batch, add the same usage information
+        usage_dict = result.get("usage")
+        return batch_embeddings, [usage_dict] * len(batch_embeddings)
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
         """
-        Get embeddings and usage for multiple texts in batches.
+        Get embeddings and usage for multiple texts in batches, with up to max_concurrent_batches requests in flight.
 
         Args:
             texts: List of text strings to embed
@@ -151,32 +158,4 @@ class JinaEmbedder(Embedder):
         Returns:
             Tuple of (List of embedding vectors, List of usage dictionaries)
         """
-        all_embeddings = []
-        all_usage = []
-        logger.info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
-
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-
-            try:
-                result = await self._async_batch_response(batch_texts)
-                batch_embeddings = [data["embedding"] for data in result["data"]]
-                all_embeddings.extend(batch_embeddings)
-
-                # For each embedding in the batch, add the same usage information
-                usage_dict = result.get("usage")
-                all_usage.extend([usage_dict] * len(batch_embeddings))
-            except Exception as e:
-                logger.warning(f"Error in async batch embedding: {e}")
-                # Fallback to individual calls for this batch
-                for text in batch_texts:
-                    try:
-                        embedding, usage = await self.async_get_embedding_and_usage(text)
-                        all_embeddings.append(embedding)
-                        all_usage.append(usage)
-                    except Exception as e2:
-                        logger.warning(f"Error in individual async embedding fallback: {e2}")
-                        all_embeddings.append([])
-                        all_usage.append(None)
-
-        return all_embeddings, all_usage
+        return await self._async_embed_batches(texts)
@@ -3,7 +3,7 @@ from os import getenv
 from typing import Any, Dict, List, Optional, Tuple
 
 from agno.knowledge.embedder.base import Embedder
-from agno.utils.log import log_error, log_info, log_warning
+from agno.utils.log import log_error, log_warning
 
 try:
     from mistralai import Mistral  # type: ignore
@@ -138,11 +138,36 @@ class MistralEmbedder(Embedder):
             log_warning(f"Error getting embedding and usage: {e}")
             return [], {}
 
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+        _request_params: Dict[str, Any] = {
+            "inputs": texts,  # Mistral API expects a list for batch processing
+            "model": self.id,
+        }
+        if self.request_params:
+            _request_params.update(self.request_params)
+
+        # Check if the client has an async version of embeddings.create
+        if hasattr(self.client.embeddings, "create_async"):
+            response: EmbeddingResponse = await self.client.embeddings.create_async(**_request_params)
+        else:
+            # Fallback to running sync method in thread executor
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            response: EmbeddingResponse = await loop.run_in_executor(  # type: ignore
+                None, lambda: self.client.embeddings.create(**_request_params)
+            )
+
+        batch_embeddings = [data.embedding or [] for data in response.data] if response.data else []
+        # Add same usage info for each embedding in the batch
+        usage_dict = response.usage.model_dump() if response.usage else None
+        return batch_embeddings, [usage_dict] * len(batch_embeddings)
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
         """
-        Get embeddings and usage for multiple texts in batches.
+        Get embeddings and usage for multiple texts in batches, with up to max_concurrent_batches requests in flight.
 
         Args:
             texts: List of text strings to embed
@@ -150,57 +175,4 @@ class MistralEmbedder(Embedder):
         Returns:
             Tuple of (List of embedding vectors, List of usage dictionaries)
         """
-        all_embeddings = []
-        all_usage = []
-        log_info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
-
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-
-            _request_params: Dict[str, Any] = {
-                "inputs": batch_texts,  # Mistral API expects a list for batch processing
-                "model": self.id,
-            }
-            if self.request_params:
-                _request_params.update(self.request_params)
-
-            try:
-                # Check if the client has an async version of embeddings.create
-                if hasattr(self.client.embeddings, "create_async"):
-                    response: EmbeddingResponse = await self.client.embeddings.create_async(**_request_params)
-                else:
-                    # Fallback to running sync method in thread executor
-                    import asyncio
-
-                    loop = asyncio.get_running_loop()
-                    response: EmbeddingResponse = await loop.run_in_executor(  # type: ignore
-                        None, lambda: self.client.embeddings.create(**_request_params)
-                    )
-
-                # Extract embeddings from batch response
-                if response.data:
-                    batch_embeddings = [data.embedding for data in response.data if data.embedding]
-                    all_embeddings.extend(batch_embeddings)
-                else:
-                    # If no embeddings, add empty lists for each text in batch
-                    all_embeddings.extend([[] for _ in batch_texts])
-
-                # Extract usage information
-                usage_dict = response.usage.model_dump() if response.usage else None
-                # Add same usage info for each embedding in the batch
-                all_usage.extend([usage_dict] * len(batch_texts))
-
-            except Exception as e:
-                log_warning(f"Error in async batch embedding: {e}")
-                # Fallback to individual calls for this batch
-                for text in batch_texts:
-                    try:
-                        embedding, usage = await self.async_get_embedding_and_usage(text)
-                        all_embeddings.append(embedding)
-                        all_usage.append(usage)
-                    except Exception as e2:
-                        log_warning(f"Error in individual async embedding fallback: {e2}")
-                        all_embeddings.append([])
-                        all_usage.append(None)
-
-        return all_embeddings, all_usage
+        return await self._async_embed_batches(texts)
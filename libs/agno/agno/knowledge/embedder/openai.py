@@ -1,10 +1,11 @@
+import base64
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 from typing_extensions import Literal
 
 from agno.knowledge.embedder.base import Embedder
-from agno.utils.log import log_info, log_warning
+from agno.utils.log import log_warning
 
 try:
     from openai import AsyncOpenAI
@@ -18,6 +19,8 @@ except ImportError:
 class OpenAIEmbedder(Embedder):
     id: str = "text-embedding-3-small"
     dimensions: Optional[int] = None
+    # OpenAI caps the total number of tokens in one embeddings request
+    max_batch_tokens: Optional[int] = 300_000
     encoding_format: Literal["float", "base64"] = "float"
     user: Optional[str] = None
     api_key: Optional[str] = None
@@ -143,11 +146,42 @@ class OpenAIEmbedder(Embedder):
             log_warning(f"Error getting embedding: {e}")
             return [], None
 
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[Any], List[Optional[Dict]]]:
+        # With use_numpy, fetch base64 vectors and decode them straight into float32 arrays instead of parsing floats
+        encoding_format = "base64" if self.use_numpy else self.encoding_format
+        req: Dict[str, Any] = {
+            "input": texts,
+            "model": self.id,
+            "encoding_format": encoding_format,
+        }
+        if self.user is not None:
+            req["user"] = self.user
+        # Pass dimensions for text-embedding-3 models or when using custom base_url (third-party APIs)
+        if self.id.startswith("text-embedding-3") or self.base_url is not None:
+            req["dimensions"] = self.dimensions
+        if self.request_params:
+            req.update(self.request_params)
+
+        response: CreateEmbeddingResponse = await self.aclient.embeddings.create(**req)
+        batch_embeddings: List[Any]
+        if encoding_format == "base64":
+            import numpy as np
+
+            batch_embeddings = [
+                np.frombuffer(base64.b64decode(data.embedding), dtype=np.float32)  # type: ignore[arg-type]
+                for data in response.data
+            ]
+        else:
+            batch_embeddings = [data.embedding for data in response.data]
+        # For each embedding in the batch, add the same usage information
+        usage_dict = response.usage.model_dump() if response.usage else None
+        return batch_embeddings, [usage_dict] * len(batch_embeddings)
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
         """
-        Get embeddings and usage for multiple texts in batches (async version).
+        Get embeddings and usage for multiple texts in batches, with up to max_concurrent_batches requests in flight.
 
         Args:
             texts: List of text strings to embed
@@ -155,45 +189,4 @@ class OpenAIEmbedder(Embedder):
         Returns:
             Tuple of (List of embedding vectors, List of usage dictionaries)
         """
-        all_embeddings = []
-        all_usage = []
-        log_info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size} (async)")
-
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-
-            req: Dict[str, Any] = {
-                "input": batch_texts,
-                "model": self.id,
-                "encoding_format": self.encoding_format,
-            }
-            if self.user is not None:
-                req["user"] = self.user
-            # Pass dimensions for text-embedding-3 models or when using custom base_url (third-party APIs)
-            if self.id.startswith("text-embedding-3") or self.base_url is not None:
-                req["dimensions"] = self.dimensions
-            if self.request_params:
-                req.update(self.request_params)
-
-            try:
-                response: CreateEmbeddingResponse = await self.aclient.embeddings.create(**req)
-                batch_embeddings = [data.embedding for data in response.data]
-                all_embeddings.extend(batch_embeddings)
-
-                # For each embedding in the batch, add the same usage information
-                usage_dict = response.usage.model_dump() if response.usage else None
-                all_usage.extend([usage_dict] * len(batch_embeddings))
-            except Exception as e:
-                log_warning(f"Error in async batch embedding: {e}")
-                # Fallback to individual calls for this batch
-                for text in batch_texts:
-                    try:
-                        embedding, usage = await self.async_get_embedding_and_usage(text)
-                        all_embeddings.append(embedding)
-                        all_usage.append(usage)
-                    except Exception as e2:
-                        log_warning(f"Error in individual async embedding fallback: {e2}")
-                        all_embeddings.append([])
-                        all_usage.append(None)
-
-        return all_embeddings, all_usage
+        return await self._async_embed_batches(texts)
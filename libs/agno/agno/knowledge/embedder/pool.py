@@ -0,0 +1,218 @@
+import asyncio
+import os
+import queue
+import threading
+from concurrent.futures import Future, InvalidStateError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from time import monotonic
+from typing import Any, Callable, List, Optional, Tuple
+
+from agno.utils.log import log_debug, log_warning
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("numpy not installed, use `pip install numpy`")
+
+# Takes a list of texts and returns a (len(texts), dimensions) array
+Encoder = Callable[[List[str]], Any]
+
+# The encoder loaded in each worker process
+_worker_encoder: Optional[Encoder] = None
+
+
+def _init_worker(load_encoder: Callable[[], Encoder]) -> None:
+    global _worker_encoder
+    _worker_encoder = load_encoder()
+
+
+def _encode_into_shared_memory(texts: List[str], shm_name: str, dimensions: int) -> None:
+    """Encode texts in a worker and write the float32 vectors straight into the caller's shared memory block."""
+    if _worker_encoder is None:
+        raise RuntimeError("Embedding worker not initialized")
+    shm = SharedMemory(name=shm_name)
+    try:
+        output: Any = np.ndarray((len(texts), dimensions), dtype=np.float32, buffer=shm.buf)
+        output[:] = np.asarray(_worker_encoder(texts), dtype=np.float32)
+        del output
+    finally:
+        shm.close()
+
+
+class LocalEmbeddingPool:
+    """Runs a local embedding model in a pool of worker processes.
+
+    Requests from concurrent callers are packed into micro-batches of up to max_batch_size texts, waiting at most
+    max_wait_ms for a batch to fill. Workers write their output into shared memory, and callers get float32 arrays.
+    If a worker dies (e.g. killed for running out of memory), the requests of its batches fail with BrokenProcessPool
+    and the workers are started again for the next batches.
+
+    Args:
+        load_encoder: Picklable callable that loads the model in a worker and returns its Encoder,
+            e.g. functools.partial of a module-level function.
+        dimensions: Size of the embedding vectors.
+        num_workers: Number of worker processes. Defaults to the number of CPUs.
+        max_batch_size: Maximum number of texts encoded in one call.
+        max_wait_ms: Maximum time a request waits for other requests to fill its batch.
+        start_method: Multiprocessing start method of the workers.
+    """
+
+    def __init__(
+        self,
+        load_encoder: Callable[[], Encoder],
+        dimensions: int,
+        num_workers: Optional[int] = None,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        start_method: str = "spawn",
+    ):
+        self.dimensions = dimensions
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        # Number of micro-batches encoded so far
+        self.num_batches = 0
+
+        self._load_encoder = load_encoder
+        self._start_method = start_method
+        self._executor = self._create_executor()
+        # Keep each worker busy with one batch queued behind it; further requests wait and grow the next batch
+        self._slots = threading.BoundedSemaphore(self.num_workers * 2)
+        self._queue: "queue.Queue[Optional[Tuple[List[str], Future]]]" = queue.Queue()
+        self._closed = False
+        self._dispatcher = threading.Thread(target=self._dispatch, name="agno-embedding-pool", daemon=True)
+        self._dispatcher.start()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=get_context(self._start_method),
+            initializer=_init_worker,
+            initargs=(self._load_encoder,),
+        )
+
+    def submit(self, texts: List[str]) -> "Future[Any]":
+        """Queue texts for encoding, returning a future of their (len(texts), dimensions) float32 array."""
+        if self._closed:
+            raise RuntimeError("LocalEmbeddingPool is closed")
+        future: "Future[Any]" = Future()
+        self._queue.put((texts, future))
+        return future
+
+    def _submit_chunks(self, texts: List[str]) -> List["Future[Any]"]:
+        return [self.submit(texts[i : i + self.max_batch_size]) for i in range(0, len(texts), self.max_batch_size)]
+
+    def _concatenate(self, arrays: List[Any]) -> Any:
+        if not arrays:
+            return np.empty((0, self.dimensions), dtype=np.float32)
+        return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+    def embed(self, texts: List[str]) -> Any:
+        """Encode texts, blocking until done."""
+        return self._concatenate([future.result() for future in self._submit_chunks(texts)])
+
+    async def aembed(self, texts: List[str]) -> Any:
+        """Encode texts without blocking the event loop."""
+        futures = [asyncio.wrap_future(future) for future in self._submit_chunks(texts)]
+        return self._concatenate(list(await asyncio.gather(*futures)))
+
+    def _dispatch(self) -> None:
+        stopping = False
+        # The request that did not fit in the previous batch, which starts the next one
+        carried: Optional[Tuple[List[str], Future]] = None
+        while carried is not None or not stopping:
+            request = carried if carried is not None else self._queue.get()
+            carried = None
+            if request is None:
+                return
+            batch = [request]
+            batch_size = len(request[0])
+            # Wait for a free worker slot, then top up the batch until it is full or max_wait has passed
+            self._slots.acquire()
+            deadline = monotonic() + self.max_wait
+            while batch_size < self.max_batch_size:
+                timeout = deadline - monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                if batch_size + len(request[0]) > self.max_batch_size:
+                    carried = request
+                    break
+                batch.append(request)
+                batch_size += len(request[0])
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: List[Tuple[List[str], Future]]) -> None:
+        texts = [text for request_texts, _ in batch for text in request_texts]
+        shm = SharedMemory(create=True, size=max(1, len(texts) * self.dimensions * 4))
+        self.num_batches += 1
+        log_debug(f"Encoding micro-batch of {len(texts)} texts from {len(batch)} requests")
+        try:
+            try:
+                result = self._executor.submit(_encode_into_shared_memory, texts, shm.name, self.dimensions)
+            except BrokenProcessPool:
+                # A worker died, failing the batches it was running: start new workers for this batch and the next
+                log_warning("Embedding worker died, restarting the embedding workers")
+                self._executor.shutdown(wait=False)
+                self._executor = self._create_executor()
+                result = self._executor.submit(_encode_into_shared_memory, texts, shm.name, self.dimensions)
+        except Exception as e:
+            self._finish_batch(batch, shm, len(texts), error=e)
+            return
+        result.add_done_callback(lambda f: self._finish_batch(batch, shm, len(texts), error=f.exception()))
+
+    def _finish_batch(
+        self, batch: List[Tuple[List[str], Future]], shm: SharedMemory, num_texts: int, error: Optional[BaseException]
+    ) -> None:
+        try:
+            if error is not None:
+                for _, future in batch:
+                    self._resolve(future, error=error)
+                return
+            output: Any = np.ndarray((num_texts, self.dimensions), dtype=np.float32, buffer=shm.buf)
+            offset = 0
+            for request_texts, future in batch:
+                self._resolve(future, result=output[offset : offset + len(request_texts)].copy())
+                offset += len(request_texts)
+            del output
+        finally:
+            shm.close()
+            shm.unlink()
+            self._slots.release()
+
+    @staticmethod
+    def _resolve(future: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+        # Callers can cancel their request (e.g. a cancelled aembed) while its batch is encoded, which must not keep
+        # the other requests of the batch from being resolved
+        if future.done():
+            return
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            log_debug("Embedding request was cancelled before its batch finished")
+
+    def close(self) -> None:
+        """Finish queued requests and stop the workers."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "LocalEmbeddingPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agno.knowledge.embedder.base import Embedder
 from agno.utils.log import logger
@@ -17,6 +18,12 @@ except ImportError:
     raise ImportError("numpy not installed, use `pip install numpy`")
 
 
+def _load_sentence_transformer(model_id: str, prompt: Optional[str], normalize_embeddings: bool):
+    """Load the model in a worker process and return its encoder."""
+    model = SentenceTransformer(model_name_or_path=model_id)
+    return partial(model.encode, prompt=prompt, normalize_embeddings=normalize_embeddings, convert_to_numpy=True)
+
+
 @dataclass
 class SentenceTransformerEmbedder(Embedder):
     id: str = "sentence-transformers/all-MiniLM-L6-v2"
@@ -24,13 +31,51 @@ class SentenceTransformerEmbedder(Embedder):
     sentence_transformer_client: Optional[SentenceTransformer] = None
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
+    # Run the model in this many worker processes, batching requests from concurrent callers
+    num_workers: Optional[int] = None
+    worker_batch_size: int = 64
+    max_batch_wait_ms: float = 5.0
+    _pool: Optional[Any] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
+        if self.num_workers:
+            from agno.knowledge.embedder.pool import LocalEmbeddingPool
+
+            self._pool = LocalEmbeddingPool(
+                partial(_load_sentence_transformer, self.id, self.prompt, self.normalize_embeddings),
+                dimensions=self.dimensions,
+                num_workers=self.num_workers,
+                max_batch_size=self.worker_batch_size,
+                max_wait_ms=self.max_batch_wait_ms,
+            )
         # Initialize the SentenceTransformer model eagerly to avoid race conditions in async contexts
-        if self.sentence_transformer_client is None:
+        elif self.sentence_transformer_client is None:
             self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.id)
 
+    def get_embeddings_array(self, texts: List[str]) -> Any:
+        """Get the embeddings of texts as a (len(texts), dimensions) float32 array."""
+        if self._pool is not None:
+            return self._pool.embed(texts)
+        if self.sentence_transformer_client is None:
+            raise RuntimeError("SentenceTransformer model not initialized")
+        embeddings = self.sentence_transformer_client.encode(
+            texts, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings, convert_to_numpy=True
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+
+    async def async_get_embeddings_array(self, texts: List[str]) -> Any:
+        """Async version of get_embeddings_array, encoding in the worker pool or a thread executor."""
+        if self._pool is not None:
+            return await self._pool.aembed(texts)
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_embeddings_array, texts)
+
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+        if self._pool is not None:
+            embeddings = self._pool.embed([text] if isinstance(text, str) else text)
+            return embeddings[0].tolist() if isinstance(text, str) else embeddings.tolist()
         if self.sentence_transformer_client is None:
             raise RuntimeError("SentenceTransformer model not initialized")
         model = self.sentence_transformer_client
@@ -48,7 +93,11 @@ class SentenceTransformerEmbedder(Embedder):
         return self.get_embedding(text=text), None
 
     async def async_get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        """Async version using thread executor for CPU-bound operations."""
+        """Async version using the worker pool, or a thread executor for CPU-bound operations."""
+        if self._pool is not None:
+            embeddings = await self._pool.aembed([text] if isinstance(text, str) else text)
+            return embeddings[0].tolist() if isinstance(text, str) else embeddings.tolist()
+
         import asyncio
 
         loop = asyncio.get_event_loop()
@@ -56,8 +105,24 @@ class SentenceTransformerEmbedder(Embedder):
         return await loop.run_in_executor(None, self.get_embedding, text)
 
     async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
-        """Async version using thread executor for CPU-bound operations."""
+        """Async version using the worker pool, or a thread executor for CPU-bound operations."""
+        if self._pool is not None:
+            return await self.async_get_embedding(text), None
+
         import asyncio
 
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Get embeddings for multiple texts in one model call."""
+        embeddings = await self.async_get_embeddings_array(texts)
+        return self._format_batch_embeddings(embeddings), [None] * len(texts)
+
+    def close(self) -> None:
+        """Stop the worker pool, if any."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
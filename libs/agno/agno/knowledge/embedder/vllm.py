@@ -210,6 +210,19 @@ class VLLMEmbedder(Embedder):
                 logger.warning(f"Error in async local embedding: {e}")
                 return [], None
 
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        req: Dict[str, Any] = {
+            "input": texts,
+            "model": self.id,
+        }
+        if self.request_params:
+            req.update(self.request_params)
+        response: "CreateEmbeddingResponse" = await self._get_async_remote_client().embeddings.create(**req)
+        batch_embeddings = [data.embedding for data in response.data]
+        # For each embedding in the batch, add the same usage information
+        usage_dict = response.usage.model_dump() if response.usage else None
+        return batch_embeddings, [usage_dict] * len(batch_embeddings)
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
@@ -222,41 +235,16 @@ class VLLMEmbedder(Embedder):
         Returns:
             Tuple of (List of embedding vectors, List of usage dictionaries)
         """
+        if self.is_remote:
+            # Remote mode: batch API calls, with up to max_concurrent_batches requests in flight
+            return await self._async_embed_batches(texts)
+
+        # Local mode: the model runs in this process, so process texts individually using thread executor
         all_embeddings = []
         all_usage = []
-        logger.info(f"Getting embeddings for {len(texts)} texts in batches of {self.batch_size} (async)")
-
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-
-            try:
-                if self.is_remote:
-                    # Remote mode: use batch API
-                    req: Dict[str, Any] = {
-                        "input": batch_texts,
-                        "model": self.id,
-                    }
-                    if self.request_params:
-                        req.update(self.request_params)
-                    response: "CreateEmbeddingResponse" = await self._get_async_remote_client().embeddings.create(**req)
-                    batch_embeddings = [data.embedding for data in response.data]
-                    all_embeddings.extend(batch_embeddings)
-
-                    # For each embedding in the batch, add the same usage information
-                    usage_dict = response.usage.model_dump() if response.usage else None
-                    all_usage.extend([usage_dict] * len(batch_embeddings))
-                else:
-                    # Local mode: process individually using thread executor
-                    for text in batch_texts:
-                        embedding, usage = await self.async_get_embedding_and_usage(text)
-                        all_embeddings.append(embedding)
-                        all_usage.append(usage)
-
-            except Exception as e:
-                logger.warning(f"Error in async batch embedding: {e}")
-                # Fallback: add empty results for failed batch
-                for _ in batch_texts:
-                    all_embeddings.append([])
-                    all_usage.append(None)
-
+        logger.info(f"Getting embeddings for {len(texts)} texts (async)")
+        for text in texts:
+            embedding, usage = await self.async_get_embedding_and_usage(text)
+            all_embeddings.append(embedding)
+            all_usage.append(usage)
         return all_embeddings, all_usage
@@ -115,11 +115,25 @@ class VoyageAIEmbedder(Embedder):
             logger.warning(f"Error getting embedding and usage: {e}")
             return [], None
 
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        req: Dict[str, Any] = {
+            "texts": texts,
+            "model": self.id,
+        }
+        if self.request_params:
+            req.update(self.request_params)
+
+        response: EmbeddingsObject = await self.aclient.embed(**req)
+        batch_embeddings = [[float(x) for x in emb] for emb in response.embeddings]
+        # For each embedding in the batch, add the same usage information
+        usage_dict = {"total_tokens": response.total_tokens}
+        return batch_embeddings, [usage_dict] * len(batch_embeddings)
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
         """
-        Get embeddings and usage for multiple texts in batches.
+        Get embeddings and usage for multiple texts in batches, with up to max_concurrent_batches requests in flight.
 
         Args:
             texts: List of text strings to embed
@@ -127,39 +141,4 @@ class VoyageAIEmbedder(Embedder):
         Returns:
             Tuple of (List of embedding vectors, List of usage dictionaries)
         """
-        all_embeddings: List[List[float]] = []
-        all_usage: List[Optional[Dict]] = []
-        logger.info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
-
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-
-            req: Dict[str, Any] = {
-                "texts": batch_texts,
-                "model": self.id,
-            }
-            if self.request_params:
-                req.update(self.request_params)
-
-            try:
-                response: EmbeddingsObject = await self.aclient.embed(**req)
-                batch_embeddings = [[float(x) for x in emb] for emb in response.embeddings]
-                all_embeddings.extend(batch_embeddings)
-
-                # For each embedding in the batch, add the same usage information
-                usage_dict = {"total_tokens": response.total_tokens}
-                all_usage.extend([usage_dict] * len(batch_embeddings))
-            except Exception as e:
-                logger.warning(f"Error in async batch embedding: {e}")
-                # Fallback to individual calls for this batch
-                for text in batch_texts:
-                    try:
-                        embedding, usage = await self.async_get_embedding_and_usage(text)
-                        all_embeddings.append(embedding)
-                        all_usage.append(usage)
-                    except Exception as e2:
-                        logger.warning(f"Error in individual async embedding fallback: {e2}")
-                        all_embeddings.append([])
-                        all_usage.append(None)
-
-        return all_embeddings, all_usage
+        return await self._async_embed_batches(texts)
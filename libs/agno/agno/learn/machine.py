@@ -12,9 +12,14 @@ Coordinates multiple learning stores to give agents:
 Plus maintenance via the Curator for keeping memories healthy.
 """
 
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from os import getenv
-from typing import Any, Callable, Dict, List, Optional, Union
+from threading import Event, Lock
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from agno.learn.config import (
     DecisionLogConfig,
@@ -69,6 +74,12 @@ class LearningMachine:
 
         namespace: Default namespace for entity_memory and learned_knowledge.
         custom_stores: Additional stores implementing LearningStore protocol.
+
+        concurrent: Run stores concurrently in process/recall/build_context.
+        max_workers: Max threads used on the sync path. Defaults to one per store.
+        store_timeout: Per-store timeout in seconds, counted from when the store starts running, also when stores
+            run one at a time. Slow stores are skipped.
+
         debug_mode: Enable debug logging.
     """
 
@@ -90,12 +101,23 @@ class LearningMachine:
     # Custom stores
     custom_stores: Optional[Dict[str, LearningStore]] = None
 
+    # Concurrency: stores are independent, so fan out across them
+    concurrent: bool = True
+    max_workers: Optional[int] = None
+    store_timeout: Optional[float] = None
+
     # Debug mode
     debug_mode: bool = False
 
     # Internal state (lazy initialization)
     _stores: Optional[Dict[str, LearningStore]] = field(default=None, init=False)
     _curator: Optional[Any] = field(default=None, init=False)
+    # Latency (seconds) of each store for the last call of each operation, replaced as a whole under the lock
+    _store_latencies: Dict[str, Dict[str, float]] = field(default_factory=dict, init=False)
+    _store_latencies_lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+    # Thread pool running the stores on the sync path, reused across calls
+    _executor: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False, compare=False)
+    _executor_lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
 
     # =========================================================================
     # Initialization (Lazy)
@@ -343,6 +365,186 @@ class LearningMachine:
         """True if any store was updated in the last operation."""
         return any(getattr(store, "was_updated", False) for store in self.stores.values())
 
+    @property
+    def store_latencies(self) -> Dict[str, Dict[str, float]]:
+        """Per-store latency in seconds of the last call, keyed by operation then store name.
+
+        Calls from concurrent runs replace each other, so pass `store_latencies` to `recall` or `build_context`
+        to get the latencies of one call.
+
+        Example:
+            >>> learning.store_latencies
+            {"recall": {"user_profile": 0.004, "learned_knowledge": 0.31}}
+        """
+        with self._store_latencies_lock:
+            return {operation: dict(latencies) for operation, latencies in self._store_latencies.items()}
+
+    # =========================================================================
+    # Store Fan-out
+    # =========================================================================
+
+    def _run_stores(
+        self,
+        operation: str,
+        call: Callable[[LearningStore], Any],
+        store_latencies: Optional[Dict[str, float]] = None,
+    ) -> List[Tuple[str, Any]]:
+        """Run `call` against every store and return (name, result) pairs in store order.
+
+        Stores run concurrently on the thread pool of the machine when `concurrent` is
+        enabled, and one at a time otherwise. Stores that raise or exceed `store_timeout`
+        are logged and left out of the results. The latency of each store is added to
+        `store_latencies` if given.
+        """
+        stores = list(self.stores.items())
+        latencies: Dict[str, float] = {}
+        # Set when each store starts running, at its start time
+        running: Dict[str, Event] = {name: Event() for name, _ in stores}
+        start_times: Dict[str, float] = {}
+
+        def timed(name: str, store: LearningStore) -> Any:
+            start = perf_counter()
+            start_times[name] = start
+            running[name].set()
+            try:
+                return call(store)
+            finally:
+                latencies[name] = perf_counter() - start
+
+        outcomes: List[Tuple[str, Any]] = []
+        if not self.concurrent or len(stores) <= 1:
+            for name, store in stores:
+                if self.store_timeout is None:
+                    try:
+                        outcomes.append((name, timed(name, store)))
+                    except Exception as e:
+                        log_warning(f"Error in {operation} for {name}: {e}")
+                else:
+                    # Sync stores can't be interrupted, so run them on the pool to stop waiting at the timeout
+                    future = self._get_executor().submit(timed, name, store)
+                    self._collect(operation, name, future, running[name], start_times, outcomes)
+        else:
+            executor = self._get_executor()
+            futures = [(name, executor.submit(timed, name, store)) for name, store in stores]
+            for name, future in futures:
+                self._collect(operation, name, future, running[name], start_times, outcomes)
+
+        # Stores that timed out are still running, and their latencies are left out
+        latencies = dict(latencies)
+        self._record_latencies(operation, latencies, store_latencies)
+        return outcomes
+
+    def _collect(
+        self,
+        operation: str,
+        name: str,
+        future: "Future[Any]",
+        running: Event,
+        start_times: Dict[str, float],
+        outcomes: List[Tuple[str, Any]],
+    ) -> None:
+        timeout = None
+        if self.store_timeout is not None:
+            # Stores queued behind others on the pool are not timed out, the timeout starts when the store does.
+            # Futures cancelled by a shutdown of the pool never run, so they wake up the wait too.
+            future.add_done_callback(lambda _: running.set())
+            running.wait()
+            start_time = start_times.get(name)
+            timeout = max(start_time + self.store_timeout - perf_counter(), 0) if start_time is not None else 0
+        try:
+            outcomes.append((name, future.result(timeout=timeout)))
+        except FutureTimeoutError:
+            log_warning(
+                f"Timed out in {operation} for {name} after {self.store_timeout}s. "
+                "Running stores can't be cancelled, so it finishes in the background."
+            )
+        except Exception as e:
+            log_warning(f"Error in {operation} for {name}: {e}")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """The thread pool running the stores on the sync path, created on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers or max(len(self.stores), 1), thread_name_prefix="agno-learn"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the thread pool of the machine, without waiting for stores that timed out."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "LearningMachine":
+        """Deep copy the machine, giving the copy a thread pool of its own."""
+        from copy import deepcopy
+
+        cls = self.__class__
+        copied_obj = cls.__new__(cls)
+        memo[id(self)] = copied_obj
+        for k, v in self.__dict__.items():
+            if k == "_executor":
+                setattr(copied_obj, k, None)
+            elif k in ("_executor_lock", "_store_latencies_lock"):
+                setattr(copied_obj, k, Lock())
+            else:
+                setattr(copied_obj, k, deepcopy(v, memo))
+        return copied_obj
+
+    async def _arun_stores(
+        self,
+        operation: str,
+        call: Callable[[LearningStore], Awaitable[Any]],
+        store_latencies: Optional[Dict[str, float]] = None,
+    ) -> List[Tuple[str, Any]]:
+        """Async version of _run_stores, using asyncio.gather."""
+        stores = list(self.stores.items())
+        latencies: Dict[str, float] = {}
+
+        async def timed(name: str, store: LearningStore) -> Any:
+            start = perf_counter()
+            try:
+                if self.store_timeout is not None:
+                    return await asyncio.wait_for(call(store), timeout=self.store_timeout)
+                return await call(store)
+            finally:
+                latencies[name] = perf_counter() - start
+
+        if not self.concurrent or len(stores) <= 1:
+            results: List[Any] = []
+            for name, store in stores:
+                try:
+                    results.append(await timed(name, store))
+                except Exception as e:
+                    results.append(e)
+        else:
+            results = await asyncio.gather(*[timed(name, store) for name, store in stores], return_exceptions=True)
+
+        outcomes: List[Tuple[str, Any]] = []
+        for (name, _), result in zip(stores, results):
+            if isinstance(result, asyncio.TimeoutError):
+                log_warning(f"Timed out in {operation} for {name} after {self.store_timeout}s")
+            elif isinstance(result, Exception):
+                log_warning(f"Error in {operation} for {name}: {result}")
+            else:
+                outcomes.append((name, result))
+
+        self._record_latencies(operation, latencies, store_latencies)
+        return outcomes
+
+    def _record_latencies(
+        self, operation: str, latencies: Dict[str, float], store_latencies: Optional[Dict[str, float]]
+    ) -> None:
+        with self._store_latencies_lock:
+            self._store_latencies[operation] = latencies
+        if store_latencies is not None:
+            store_latencies.update(latencies)
+        if latencies:
+            timings = ", ".join(f"{name}={elapsed:.3f}s" for name, elapsed in latencies.items())
+            log_debug(f"LearningMachine {operation} latencies: {timings}")
+
     # =========================================================================
     # Main API
     # =========================================================================
@@ -357,6 +559,7 @@ class LearningMachine:
         namespace: Optional[str] = None,
         agent_id: Optional[str] = None,
         team_id: Optional[str] = None,
+        store_latencies: Optional[Dict[str, float]] = None,
         **kwargs,
     ) -> str:
         """Build memory context for the agent's system prompt.
@@ -372,6 +575,7 @@ class LearningMachine:
             namespace: Namespace filter for entity_memory and learned_knowledge.
             agent_id: Optional agent context.
             team_id: Optional team context.
+            store_latencies: Filled with the latency in seconds of each store in this call.
 
         Returns:
             Context string to inject into the agent's system prompt.
@@ -385,6 +589,7 @@ class LearningMachine:
             namespace=namespace or self.namespace,
             agent_id=agent_id,
             team_id=team_id,
+            store_latencies=store_latencies,
             **kwargs,
         )
 
@@ -400,6 +605,7 @@ class LearningMachine:
         namespace: Optional[str] = None,
         agent_id: Optional[str] = None,
         team_id: Optional[str] = None,
+        store_latencies: Optional[Dict[str, float]] = None,
         **kwargs,
     ) -> str:
         """Async version of build_context."""
@@ -412,6 +618,7 @@ class LearningMachine:
             namespace=namespace or self.namespace,
             agent_id=agent_id,
             team_id=team_id,
+            store_latencies=store_latencies,
             **kwargs,
         )
 
@@ -528,13 +735,10 @@ class LearningMachine:
             **kwargs,
         }
 
+        self._run_stores("process", lambda store: store.process(**context))
         for name, store in self.stores.items():
-            try:
-                store.process(**context)
-                if getattr(store, "was_updated", False):
-                    log_debug(f"Store {name} was updated")
-            except Exception as e:
-                log_warning(f"Error processing through {name}: {e}")
+            if getattr(store, "was_updated", False):
+                log_debug(f"Store {name} was updated")
 
     async def aprocess(
         self,
@@ -557,13 +761,10 @@ class LearningMachine:
             **kwargs,
         }
 
+        await self._arun_stores("process", lambda store: store.aprocess(**context))
         for name, store in self.stores.items():
-            try:
-                await store.aprocess(**context)
-                if getattr(store, "was_updated", False):
-                    log_debug(f"Store {name} was updated")
-            except Exception as e:
-                log_warning(f"Error processing through {name}: {e}")
+            if getattr(store, "was_updated", False):
+                log_debug(f"Store {name} was updated")
 
     # =========================================================================
     # Lower-Level API
@@ -579,11 +780,13 @@ class LearningMachine:
         namespace: Optional[str] = None,
         agent_id: Optional[str] = None,
         team_id: Optional[str] = None,
+        store_latencies: Optional[Dict[str, float]] = None,
         **kwargs,
     ) -> Dict[str, Any]:
         """Retrieve raw data from all stores.
 
-        Most users should use `build_context()` instead.
+        Most users should use `build_context()` instead. `store_latencies` is filled with
+        the latency in seconds of each store in this call.
 
         Returns:
             Dict mapping store names to their recalled data.
@@ -602,16 +805,12 @@ class LearningMachine:
             **kwargs,
         }
 
-        for name, store in self.stores.items():
+        for name, result in self._run_stores("recall", lambda store: store.recall(**context), store_latencies):
+            results[name] = result
             try:
-                result = store.recall(**context)
-                results[name] = result
-                try:
-                    log_debug(f"Recalled from {name}: {result}")
-                except Exception:
-                    pass
-            except Exception as e:
-                log_warning(f"Error recalling from {name}: {e}")
+                log_debug(f"Recalled from {name}: {result}")
+            except Exception:
+                pass
 
         return results
 
@@ -625,6 +824,7 @@ class LearningMachine:
         namespace: Optional[str] = None,
         agent_id: Optional[str] = None,
         team_id: Optional[str] = None,
+        store_latencies: Optional[Dict[str, float]] = None,
         **kwargs,
     ) -> Dict[str, Any]:
         """Async version of recall."""
@@ -642,17 +842,13 @@ class LearningMachine:
             **kwargs,
         }
 
-        for name, store in self.stores.items():
-            try:
-                result = await store.arecall(**context)
-                if result is not None:
-                    results[name] = result
-                    try:
-                        log_debug(f"Recalled from {name}: {result}")
-                    except Exception:
-                        pass
-            except Exception as e:
-                log_warning(f"Error recalling from {name}: {e}")
+        for name, result in await self._arun_stores("recall", lambda store: store.arecall(**context), store_latencies):
+            if result is not None:
+                results[name] = result
+                try:
+                    log_debug(f"Recalled from {name}: {result}")
+                except Exception:
+                    pass
 
         return results
 
@@ -1,12 +1,30 @@
+from base64 import b64encode
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
 
 from agno.utils.log import log_error
 
 
+def _encode_base64_once(media: Any, content: bytes) -> str:
+    """Base64-encode content, reusing the encoding cached on the media object for the same bytes"""
+    cached = media._base64_cache
+    if cached is not None and cached[0] is content:
+        return cached[1]
+    encoded = b64encode(content).decode("utf-8")
+    media._base64_cache = (content, encoded)
+    return encoded
+
+
+def _seed_base64_cache(media: Any, base64_content: str) -> None:
+    """Keep the base64 string a media object was decoded from, so it is not re-encoded on serialization"""
+    content = media.content
+    if isinstance(content, bytes) and len(base64_content) == ((len(content) + 2) // 3) * 4:
+        media._base64_cache = (content, base64_content)
+
+
 class Image(BaseModel):
     """Unified Image class for all use cases (input, output, artifacts)"""
 
@@ -14,6 +32,7 @@ class Image(BaseModel):
     url: Optional[str] = None  # Remote location
     filepath: Optional[Union[Path, str]] = None  # Local file path
     content: Optional[bytes] = None  # Raw image bytes (standardized to bytes)
+    media_ref: Optional[str] = None  # Content-addressed id in a MediaStore, persisted instead of the content
 
     # Metadata fields
     id: Optional[str] = None  # For tracking/referencing
@@ -30,13 +49,15 @@ class Image(BaseModel):
     revised_prompt: Optional[str] = None  # Revised generation prompt
     alt_text: Optional[str] = None  # Alt text description
 
+    _base64_cache: Optional[Tuple[bytes, str]] = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     def validate_and_normalize_content(cls, data: Any):
         """Ensure exactly one content source and normalize to bytes"""
         if isinstance(data, dict):
             url = data.get("url")
             filepath = data.get("filepath")
-            content = data.get("content")
+            content = data.get("content") if data.get("content") is not None else data.get("media_ref")
 
             # Count non-None sources
             sources = [x for x in [url, filepath, content] if x is not None]
@@ -66,13 +87,18 @@ class Image(BaseModel):
 
     def to_base64(self) -> Optional[str]:
         """Convert content to base64 string for transmission/storage"""
+        if self.content:
+            return _encode_base64_once(self, self.content)
         content_bytes = self.get_content_bytes()
         if content_bytes:
-            import base64
-
-            return base64.b64encode(content_bytes).decode("utf-8")
+            return b64encode(content_bytes).decode("utf-8")
         return None
 
+    def get_content_view(self) -> Optional[memoryview]:
+        """Get a read-only view over the content bytes, for slicing and hashing without copies"""
+        content_bytes = self.get_content_bytes()
+        return memoryview(content_bytes) if content_bytes is not None else None
+
     @classmethod
     def from_base64(
         cls,
@@ -90,7 +116,9 @@ class Image(BaseModel):
         except Exception:
             content_bytes = base64_content.encode("utf-8")
 
-        return cls(content=content_bytes, id=id or str(uuid4()), mime_type=mime_type, format=format, **kwargs)
+        media = cls(content=content_bytes, id=id or str(uuid4()), mime_type=mime_type, format=format, **kwargs)
+        _seed_base64_cache(media, base64_content)
+        return media
 
     def to_dict(self, include_base64_content: bool = True) -> Dict[str, Any]:
         """Convert to dict, optionally including base64-encoded content"""
@@ -106,7 +134,9 @@ class Image(BaseModel):
             "alt_text": self.alt_text,
         }
 
-        if include_base64_content and self.content:
+        if self.media_ref is not None:
+            result["media_ref"] = self.media_ref
+        elif include_base64_content and self.content:
             result["content"] = self.to_base64()
 
         return {k: v for k, v in result.items() if v is not None}
@@ -119,6 +149,7 @@ class Audio(BaseModel):
     url: Optional[str] = None
     filepath: Optional[Union[Path, str]] = None
     content: Optional[bytes] = None  # Raw audio bytes (standardized to bytes)
+    media_ref: Optional[str] = None  # Content-addressed id in a MediaStore, persisted instead of the content
 
     # Metadata fields
     id: Optional[str] = None
@@ -134,13 +165,15 @@ class Audio(BaseModel):
     transcript: Optional[str] = None  # Text transcript of audio
     expires_at: Optional[int] = None  # Expiration timestamp for temporary URLs
 
+    _base64_cache: Optional[Tuple[bytes, str]] = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     def validate_and_normalize_content(cls, data: Any):
         """Ensure exactly one content source and normalize to bytes"""
         if isinstance(data, dict):
             url = data.get("url")
             filepath = data.get("filepath")
-            content = data.get("content")
+            content = data.get("content") if data.get("content") is not None else data.get("media_ref")
 
             sources = [x for x in [url, filepath, content] if x is not None]
             if len(sources) == 0:
@@ -168,13 +201,18 @@ class Audio(BaseModel):
 
     def to_base64(self) -> Optional[str]:
         """Convert content to base64 string"""
+        if self.content:
+            return _encode_base64_once(self, self.content)
         content_bytes = self.get_content_bytes()
         if content_bytes:
-            import base64
-
-            return base64.b64encode(content_bytes).decode("utf-8")
+            return b64encode(content_bytes).decode("utf-8")
         return None
 
+    def get_content_view(self) -> Optional[memoryview]:
+        """Get a read-only view over the content bytes, for slicing and hashing without copies"""
+        content_bytes = self.get_content_bytes()
+        return memoryview(content_bytes) if content_bytes is not None else None
+
     @classmethod
     def from_base64(
         cls,
@@ -196,7 +234,7 @@ class Audio(BaseModel):
             # If not valid base64, encode as UTF-8 bytes
             content_bytes = base64_content.encode("utf-8")
 
-        return cls(
+        audio = cls(
             content=content_bytes,
             id=id or str(uuid4()),
             mime_type=mime_type,
@@ -206,6 +244,8 @@ class Audio(BaseModel):
             channels=channels,
             **kwargs,
         )
+        _seed_base64_cache(audio, base64_content)
+        return audio
 
     def to_dict(self, include_base64_content: bool = True) -> Dict[str, Any]:
         """Convert to dict, optionally including base64-encoded content"""
@@ -222,7 +262,9 @@ class Audio(BaseModel):
             "expires_at": self.expires_at,
         }
 
-        if include_base64_content and self.content:
+        if self.media_ref is not None:
+            result["media_ref"] = self.media_ref
+        elif include_base64_content and self.content:
             result["content"] = self.to_base64()
 
         return {k: v for k, v in result.items() if v is not None}
@@ -235,6 +277,7 @@ class Video(BaseModel):
     url: Optional[str] = None
     filepath: Optional[Union[Path, str]] = None
     content: Optional[bytes] = None  # Raw video bytes (standardized to bytes)
+    media_ref: Optional[str] = None  # Content-addressed id in a MediaStore, persisted instead of the content
 
     # Metadata fields
     id: Optional[str] = None
@@ -252,13 +295,15 @@ class Video(BaseModel):
     original_prompt: Optional[str] = None
     revised_prompt: Optional[str] = None
 
+    _base64_cache: Optional[Tuple[bytes, str]] = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     def validate_and_normalize_content(cls, data: Any):
         """Ensure exactly one content source and normalize to bytes"""
         if isinstance(data, dict):
             url = data.get("url")
             filepath = data.get("filepath")
-            content = data.get("content")
+            content = data.get("content") if data.get("content") is not None else data.get("media_ref")
 
             sources = [x for x in [url, filepath, content] if x is not None]
             if len(sources) == 0:
@@ -286,13 +331,18 @@ class Video(BaseModel):
 
     def to_base64(self) -> Optional[str]:
         """Convert content to base64 string"""
+        if self.content:
+            return _encode_base64_once(self, self.content)
         content_bytes = self.get_content_bytes()
         if content_bytes:
-            import base64
-
-            return base64.b64encode(content_bytes).decode("utf-8")
+            return b64encode(content_bytes).decode("utf-8")
         return None
 
+    def get_content_view(self) -> Optional[memoryview]:
+        """Get a read-only view over the content bytes, for slicing and hashing without copies"""
+        content_bytes = self.get_content_bytes()
+        return memoryview(content_bytes) if content_bytes is not None else None
+
     @classmethod
     def from_base64(
         cls,
@@ -310,7 +360,9 @@ class Video(BaseModel):
         except Exception:
             content_bytes = base64_content.encode("utf-8")
 
-        return cls(content=content_bytes, id=id or str(uuid4()), mime_type=mime_type, format=format, **kwargs)
+        media = cls(content=content_bytes, id=id or str(uuid4()), mime_type=mime_type, format=format, **kwargs)
+        _seed_base64_cache(media, base64_content)
+        return media
 
     def to_dict(self, include_base64_content: bool = True) -> Dict[str, Any]:
         """Convert to dict, optionally including base64-encoded content"""
@@ -329,7 +381,9 @@ class Video(BaseModel):
             "revised_prompt": self.revised_prompt,
         }
 
-        if include_base64_content and self.content:
+        if self.media_ref is not None:
+            result["media_ref"] = self.media_ref
+        elif include_base64_content and self.content:
             result["content"] = self.to_base64()
 
         return {k: v for k, v in result.items() if v is not None}
@@ -341,6 +395,8 @@ class File(BaseModel):
     filepath: Optional[Union[Path, str]] = None
     # Raw bytes content of a file
     content: Optional[Any] = None
+    # Content-addressed id in a MediaStore, persisted instead of the content
+    media_ref: Optional[str] = None
     mime_type: Optional[str] = None
 
     file_type: Optional[str] = None
@@ -351,11 +407,15 @@ class File(BaseModel):
     format: Optional[str] = None  # E.g. `pdf`, `txt`, `csv`, `xml`, etc.
     name: Optional[str] = None  # Name of the file, mandatory for AWS Bedrock document input
 
+    _base64_cache: Optional[Tuple[bytes, str]] = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     @classmethod
     def check_at_least_one_source(cls, data):
         """Ensure at least one of url, filepath, or content is provided."""
-        if isinstance(data, dict) and not any(data.get(field) for field in ["url", "filepath", "content", "external"]):
+        if isinstance(data, dict) and not any(
+            data.get(field) for field in ["url", "filepath", "content", "external", "media_ref"]
+        ):
             raise ValueError("At least one of url, filepath, content or external must be provided")
         return data
 
@@ -411,7 +471,7 @@ class File(BaseModel):
             # which is stored as UTF-8 strings, not base64
             content_bytes = base64_content.encode("utf-8")
 
-        return cls(
+        file = cls(
             content=content_bytes,
             id=id,
             mime_type=mime_type,
@@ -419,6 +479,8 @@ class File(BaseModel):
             name=name,
             format=format,
         )
+        _seed_base64_cache(file, base64_content)
+        return file
 
     @property
     def file_url_content(self) -> Optional[Tuple[bytes, str]]:
@@ -441,32 +503,31 @@ class File(BaseModel):
             return None
         content_normalised: Union[str, bytes] = self.content
         if content_normalised and isinstance(content_normalised, bytes):
-            from base64 import b64encode
-
             try:
                 if self.mime_type and self.mime_type.startswith("text/"):
                     content_normalised = content_normalised.decode("utf-8")
                 else:
-                    content_normalised = b64encode(content_normalised).decode("utf-8")
+                    content_normalised = _encode_base64_once(self, content_normalised)
             except UnicodeDecodeError:
                 if isinstance(self.content, bytes):
-                    content_normalised = b64encode(self.content).decode("utf-8")
+                    content_normalised = _encode_base64_once(self, self.content)
             except Exception:
                 try:
                     if isinstance(self.content, bytes):
-                        content_normalised = b64encode(self.content).decode("utf-8")
+                        content_normalised = _encode_base64_once(self, self.content)
                 except Exception:
                     pass
         return content_normalised
 
     def to_dict(self) -> Dict[str, Any]:
-        content_normalised = self._normalise_content()
+        content_normalised = self._normalise_content() if self.media_ref is None else None
 
         response_dict = {
             "id": self.id,
             "url": self.url,
             "filepath": str(self.filepath) if self.filepath else None,
             "content": content_normalised,
+            "media_ref": self.media_ref,
             "mime_type": self.mime_type,
             "file_type": self.file_type,
             "filename": self.filename,
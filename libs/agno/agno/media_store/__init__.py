@@ -0,0 +1,9 @@
+from agno.media_store.base import MediaStore
+from agno.media_store.in_memory import InMemoryMediaStore
+from agno.media_store.local import LocalMediaStore
+
+__all__ = [
+    "MediaStore",
+    "InMemoryMediaStore",
+    "LocalMediaStore",
+]
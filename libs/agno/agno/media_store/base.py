@@ -0,0 +1,164 @@
+from abc import ABC, abstractmethod
+from hashlib import sha256
+from time import time
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from agno.db.base import AsyncBaseDb, BaseDb
+
+# Sessions read per page when scanning a database for the payloads it references
+_SCAN_PAGE_SIZE = 100
+
+
+class MediaStore(ABC):
+    """Content-addressed store for media payloads.
+
+    Runs persist the returned reference instead of the inline base64 content, so a large image is written once
+    instead of being re-serialized with the session on every upsert. Identical payloads share one stored copy, across
+    sessions and processes, so payloads are never deleted with a session: `collect_garbage` deletes the payloads no
+    stored session references anymore.
+    """
+
+    @staticmethod
+    def content_id(content: Union[bytes, memoryview]) -> str:
+        """Compute the content-addressed id of a payload"""
+        return sha256(content).hexdigest()
+
+    def put(self, content: Union[bytes, memoryview]) -> str:
+        """Store content, returning its content-addressed id. Stores each distinct payload once."""
+        media_ref = self.content_id(content)
+        if self._exists(media_ref):
+            # Restart the grace period of collect_garbage, as the new reference may not be stored yet
+            self._touch(media_ref)
+        else:
+            self._write(media_ref, content)
+        return media_ref
+
+    def get(self, media_ref: str) -> Optional[bytes]:
+        """Get the content stored under a reference, or None if it is not in the store"""
+        return self._read(media_ref)
+
+    def exists(self, media_ref: str) -> bool:
+        return self._exists(media_ref)
+
+    def delete(self, media_ref: str) -> None:
+        """Delete a payload, even if sessions still reference it"""
+        self._delete(media_ref)
+
+    def collect_garbage(self, *dbs: "BaseDb", min_age: float = 3600) -> int:
+        """Delete the payloads not referenced by the sessions of any of the given databases. Returns how many.
+
+        Every database with sessions referencing the store must be given. Payloads stored in the last min_age
+        seconds are kept, as the sessions referencing them may not be saved yet.
+        """
+        referenced: Set[str] = set()
+        for db in dbs:
+            for session_type in _get_session_types():
+                cursor: Optional[str] = None
+                while True:
+                    sessions, _ = db.get_sessions(  # type: ignore[misc]
+                        session_type=session_type,
+                        sort_by="created_at",
+                        limit=_SCAN_PAGE_SIZE,
+                        cursor=cursor,
+                        deserialize=False,
+                        columns=["session_id", "runs", "created_at"],
+                        count_total=False,
+                    )
+                    cursor = _collect_media_refs(sessions, referenced)
+                    if cursor is None:
+                        break
+        return self._delete_unreferenced(referenced, min_age)
+
+    async def acollect_garbage(self, *dbs: Union["BaseDb", "AsyncBaseDb"], min_age: float = 3600) -> int:
+        """Delete the payloads not referenced by the sessions of any of the given databases. Returns how many.
+
+        Every database with sessions referencing the store must be given. Payloads stored in the last min_age
+        seconds are kept, as the sessions referencing them may not be saved yet.
+        """
+        from agno.db.base import AsyncBaseDb
+
+        referenced: Set[str] = set()
+        for db in dbs:
+            for session_type in _get_session_types():
+                cursor: Optional[str] = None
+                while True:
+                    kwargs: Any = dict(
+                        session_type=session_type,
+                        sort_by="created_at",
+                        limit=_SCAN_PAGE_SIZE,
+                        cursor=cursor,
+                        deserialize=False,
+                        columns=["session_id", "runs", "created_at"],
+                        count_total=False,
+                    )
+                    if isinstance(db, AsyncBaseDb):
+                        sessions, _ = await db.get_sessions(**kwargs)  # type: ignore[misc]
+                    else:
+                        sessions, _ = db.get_sessions(**kwargs)  # type: ignore[misc]
+                    cursor = _collect_media_refs(sessions, referenced)
+                    if cursor is None:
+                        break
+        return self._delete_unreferenced(referenced, min_age)
+
+    def _delete_unreferenced(self, referenced: Set[str], min_age: float) -> int:
+        cutoff = time() - min_age
+        deleted = 0
+        for media_ref, stored_at in list(self._list()):
+            if media_ref not in referenced and stored_at <= cutoff:
+                self._delete(media_ref)
+                deleted += 1
+        return deleted
+
+    @abstractmethod
+    def _write(self, media_ref: str, content: Union[bytes, memoryview]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _read(self, media_ref: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _exists(self, media_ref: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _touch(self, media_ref: str) -> None:
+        """Record that the payload was stored again now"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _list(self) -> Iterator[Tuple[str, float]]:
+        """Yield the reference of every stored payload, with the time it was last stored"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, media_ref: str) -> None:
+        raise NotImplementedError
+
+
+def _get_session_types() -> Tuple[Any, ...]:
+    from agno.db.base import SessionType
+
+    return (SessionType.AGENT, SessionType.TEAM, SessionType.WORKFLOW)
+
+
+def _iter_media_refs(value: Any) -> Iterator[str]:
+    if isinstance(value, dict):
+        media_ref = value.get("media_ref")
+        if isinstance(media_ref, str):
+            yield media_ref
+        for item in value.values():
+            yield from _iter_media_refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_media_refs(item)
+
+
+def _collect_media_refs(sessions: Any, referenced: Set[str]) -> Optional[str]:
+    """Add the references held by the runs of a page of raw sessions, returning the cursor of the next page"""
+    from agno.db.utils import get_next_cursor
+
+    for session in sessions:
+        referenced.update(_iter_media_refs(session.get("runs")))
+    return get_next_cursor(sessions, "session_id", "created_at", _SCAN_PAGE_SIZE)
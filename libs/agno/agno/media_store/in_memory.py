@@ -0,0 +1,35 @@
+from time import time
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from agno.media_store.base import MediaStore
+
+
+class InMemoryMediaStore(MediaStore):
+    """Media store keeping payloads in process memory. Useful for tests and as a stand-in for blob storage."""
+
+    def __init__(self):
+        self._blobs: Dict[str, bytes] = {}
+        # When each payload was last stored
+        self._stored_at: Dict[str, float] = {}
+
+    def _write(self, media_ref: str, content: Union[bytes, memoryview]) -> None:
+        # bytes() is a no-op for bytes and copies a memoryview once so the caller's buffer can be reused
+        self._blobs[media_ref] = content if isinstance(content, bytes) else bytes(content)
+        self._stored_at[media_ref] = time()
+
+    def _read(self, media_ref: str) -> Optional[bytes]:
+        return self._blobs.get(media_ref)
+
+    def _exists(self, media_ref: str) -> bool:
+        return media_ref in self._blobs
+
+    def _touch(self, media_ref: str) -> None:
+        self._stored_at[media_ref] = time()
+
+    def _list(self) -> Iterator[Tuple[str, float]]:
+        for media_ref, stored_at in list(self._stored_at.items()):
+            yield media_ref, stored_at
+
+    def _delete(self, media_ref: str) -> None:
+        self._blobs.pop(media_ref, None)
+        self._stored_at.pop(media_ref, None)
@@ -0,0 +1,48 @@
+import os
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+from agno.media_store.base import MediaStore
+
+
+class LocalMediaStore(MediaStore):
+    """Media store writing each payload to a content-addressed file under a local directory."""
+
+    def __init__(self, directory: Union[str, Path] = "tmp/media"):
+        self.directory = Path(directory).resolve()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _get_path(self, media_ref: str) -> Path:
+        if not media_ref.isalnum():
+            raise ValueError(f"Invalid media reference: {media_ref}")
+        return self.directory / media_ref[:2] / media_ref
+
+    def _write(self, media_ref: str, content: Union[bytes, memoryview]) -> None:
+        path = self._get_path(media_ref)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename, so concurrent readers never see a partial payload
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def _read(self, media_ref: str) -> Optional[bytes]:
+        path = self._get_path(media_ref)
+        if not path.exists():
+            return None
+        return path.read_bytes()
+
+    def _exists(self, media_ref: str) -> bool:
+        return self._get_path(media_ref).exists()
+
+    def _touch(self, media_ref: str) -> None:
+        os.utime(self._get_path(media_ref))
+
+    def _list(self) -> Iterator[Tuple[str, float]]:
+        for path in self.directory.glob("*/*"):
+            # Skips the temp files of writes in progress
+            if path.name.isalnum():
+                yield path.name, path.stat().st_mtime
+
+    def _delete(self, media_ref: str) -> None:
+        self._get_path(media_ref).unlink(missing_ok=True)
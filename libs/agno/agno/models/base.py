@@ -4,7 +4,6 @@ import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from hashlib import md5
-from pathlib import Path
 from time import sleep, time
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
@@ -31,6 +30,7 @@ from pydantic import BaseModel
 
 from agno.exceptions import AgentRunException, ModelProviderError, RetryableModelProviderError
 from agno.media import Audio, File, Image, Video
+from agno.models.cache import ResponseCache, get_default_response_cache
 from agno.models.message import Citations, Message
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
@@ -149,7 +149,10 @@ class Model(ABC):
     # Cache model responses to avoid redundant API calls during development
     cache_response: bool = False
     cache_ttl: Optional[int] = None
+    # Directory of the default sqlite cache, used when no response_cache is set
     cache_dir: Optional[str] = None
+    # Cache backend, e.g. TieredResponseCache([InMemoryResponseCache(), RedisResponseCache(...)]). Shared by copies.
+    response_cache: Optional[ResponseCache] = None
 
     # Retry configuration for model provider errors
     # Number of retries to attempt when a ModelProviderError occurs
@@ -433,89 +436,114 @@ class Model(ABC):
         return self.provider or self.name or self.__class__.__name__
 
     def _get_model_cache_key(self, messages: List[Message], stream: bool, **kwargs: Any) -> str:
-        """Generate a cache key based on model messages and core parameters."""
+        """Generate a cache key based on model messages, tool definitions and core parameters."""
         message_data = []
         for msg in messages:
             msg_dict = {
                 "role": msg.role,
                 "content": msg.content,
+                "name": msg.name,
+                "tool_call_id": msg.tool_call_id,
+                "tool_calls": msg.tool_calls,
             }
             message_data.append(msg_dict)
 
-        # Include tools parameter in cache key
-        has_tools = bool(kwargs.get("tools"))
+        # Include the tool definitions so adding, removing or changing a tool invalidates the cache
+        tool_data = []
+        for tool in kwargs.get("tools") or []:
+            tool_data.append(tool.to_dict() if isinstance(tool, Function) else tool)
+
+        response_format = kwargs.get("response_format")
+        if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            response_format = response_format.model_json_schema()
 
         cache_data = {
             "model_id": self.id,
             "messages": message_data,
-            "has_tools": has_tools,
-            "response_format": kwargs.get("response_format"),
+            "tools": tool_data,
+            "response_format": response_format,
             "stream": stream,
         }
 
-        cache_str = json.dumps(cache_data, sort_keys=True)
+        cache_str = json.dumps(cache_data, sort_keys=True, default=str)
         return md5(cache_str.encode()).hexdigest()
 
-    def _get_model_cache_file_path(self, cache_key: str) -> Path:
-        """Get the file path for a cache key."""
-        if self.cache_dir:
-            cache_dir = Path(self.cache_dir)
-        else:
-            cache_dir = Path.home() / ".agno" / "cache" / "model_responses"
-
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / f"{cache_key}.json"
+    def _get_response_cache(self) -> ResponseCache:
+        """Get the configured response cache, or the default one shared per cache_dir."""
+        if self.response_cache is None:
+            self.response_cache = get_default_response_cache(self.cache_dir)
+        return self.response_cache
 
     def _get_cached_model_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Retrieve a cached response if it exists and is not expired."""
-        cache_file = self._get_model_cache_file_path(cache_key)
+        cached_data = self._get_response_cache().get(cache_key)
+        if cached_data is None:
+            return None
 
-        if not cache_file.exists():
+        # Check TTL if set (None means no expiration)
+        if self.cache_ttl is not None and time() - cached_data.get("timestamp", 0) > self.cache_ttl:
             return None
 
-        try:
-            with open(cache_file, "r") as f:
-                cached_data = json.load(f)
+        return cached_data
 
-            # Check TTL if set (None means no expiration)
-            if self.cache_ttl is not None:
-                if time() - cached_data["timestamp"] > self.cache_ttl:
-                    return None
+    def _claim_model_cache_key(self, cache_key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Claim a missed cache key so identical concurrent requests wait for this one instead of calling the provider.
 
-            return cached_data
-        except Exception:
-            return None
+        Returns the cached response if another request filled the key while waiting, and whether the key was claimed.
+        A claimed key must be released once the response is cached. If the identical request is still in flight
+        after the timeout of the cache, the key is not claimed and the provider is called without waiting longer.
+        """
+        response_cache = self._get_response_cache()
+        try:
+            waited = response_cache.acquire(cache_key)
+        except TimeoutError as e:
+            log_warning(f"{e}, calling the provider without the cache")
+            return self._get_cached_model_response(cache_key), False
+        if waited:
+            cached_data = self._get_cached_model_response(cache_key)
+            if cached_data is not None:
+                response_cache.release(cache_key)
+                return cached_data, False
+        return None, True
+
+    async def _aclaim_model_cache_key(self, cache_key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Async variant of `_claim_model_cache_key`."""
+        response_cache = self._get_response_cache()
+        try:
+            waited = await response_cache.aacquire(cache_key)
+        except TimeoutError as e:
+            log_warning(f"{e}, calling the provider without the cache")
+            return self._get_cached_model_response(cache_key), False
+        if waited:
+            cached_data = self._get_cached_model_response(cache_key)
+            if cached_data is not None:
+                response_cache.arelease(cache_key)
+                return cached_data, False
+        return None, True
 
     def _save_model_response_to_cache(self, cache_key: str, result: ModelResponse, is_streaming: bool = False) -> None:
         """Save a model response to cache."""
         try:
-            cache_file = self._get_model_cache_file_path(cache_key)
-
             cache_data = {
                 "timestamp": int(time()),
                 "is_streaming": is_streaming,
                 "result": result.to_dict(),
             }
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
-        except Exception:
-            pass
+            self._get_response_cache().set(cache_key, cache_data, ttl=self.cache_ttl)
+        except Exception as e:
+            log_warning(f"Failed to cache model response: {e}")
 
     def _save_streaming_responses_to_cache(self, cache_key: str, responses: List[ModelResponse]) -> None:
         """Save streaming responses to cache."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        cache_data = {
-            "timestamp": int(time()),
-            "is_streaming": True,
-            "streaming_responses": [r.to_dict() for r in responses],
-        }
-
         try:
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
-        except Exception:
-            pass
+            cache_data = {
+                "timestamp": int(time()),
+                "is_streaming": True,
+                "streaming_responses": [r.to_dict() for r in responses],
+            }
+            self._get_response_cache().set(cache_key, cache_data, ttl=self.cache_ttl)
+        except Exception as e:
+            log_warning(f"Failed to cache model response: {e}")
 
     def _model_response_from_cache(self, cached_data: Dict[str, Any]) -> ModelResponse:
         """Reconstruct a ModelResponse from cached data."""
@@ -624,6 +652,7 @@ class Model(ABC):
             run_response: Run response to use
             send_media_to_model: Whether to send media to the model
         """
+        cache_claimed = False
         try:
             # Check cache if enabled
             if self.cache_response:
@@ -631,6 +660,9 @@ class Model(ABC):
                     messages, stream=False, response_format=response_format, tools=tools
                 )
                 cached_data = self._get_cached_model_response(cache_key)
+                if cached_data is None:
+                    # Wait for an identical in-flight request instead of calling the provider twice
+                    cached_data, cache_claimed = self._claim_model_cache_key(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for model response")
@@ -802,6 +834,8 @@ class Model(ABC):
             if self.cache_response:
                 self._save_model_response_to_cache(cache_key, model_response, is_streaming=False)
         finally:
+            if cache_claimed:
+                self._get_response_cache().release(cache_key)
             # Close the Gemini client
             if self.__class__.__name__ == "Gemini" and self.client is not None:  # type: ignore
                 try:
@@ -830,6 +864,7 @@ class Model(ABC):
         Generate an asynchronous response from the model.
         """
 
+        cache_claimed = False
         try:
             # Check cache if enabled
             if self.cache_response:
@@ -837,6 +872,9 @@ class Model(ABC):
                     messages, stream=False, response_format=response_format, tools=tools
                 )
                 cached_data = self._get_cached_model_response(cache_key)
+                if cached_data is None:
+                    # Wait for an identical in-flight request instead of calling the provider twice
+                    cached_data, cache_claimed = await self._aclaim_model_cache_key(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for model response")
@@ -1006,6 +1044,8 @@ class Model(ABC):
             if self.cache_response:
                 self._save_model_response_to_cache(cache_key, model_response, is_streaming=False)
         finally:
+            if cache_claimed:
+                self._get_response_cache().arelease(cache_key)
             # Close the Gemini client
             if self.__class__.__name__ == "Gemini" and self.client is not None:
                 try:
@@ -1255,6 +1295,7 @@ class Model(ABC):
         """
         Generate a streaming response from the model.
         """
+        cache_claimed = False
         try:
             # Check cache if enabled - capture key BEFORE streaming to avoid mismatch
             cache_key = None
@@ -1263,6 +1304,9 @@ class Model(ABC):
                     messages, stream=True, response_format=response_format, tools=tools
                 )
                 cached_data = self._get_cached_model_response(cache_key)
+                if cached_data is None:
+                    # Wait for an identical in-flight request instead of calling the provider twice
+                    cached_data, cache_claimed = self._claim_model_cache_key(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for streaming model response")
@@ -1441,6 +1485,8 @@ class Model(ABC):
             if self.cache_response and cache_key and streaming_responses:
                 self._save_streaming_responses_to_cache(cache_key, streaming_responses)
         finally:
+            if cache_claimed and cache_key is not None:
+                self._get_response_cache().release(cache_key)
             # Close the Gemini client
             if self.__class__.__name__ == "Gemini" and self.client is not None:
                 try:
@@ -1499,6 +1545,7 @@ class Model(ABC):
         """
         Generate an asynchronous streaming response from the model.
         """
+        cache_claimed = False
         try:
             # Check cache if enabled - capture key BEFORE streaming to avoid mismatch
             cache_key = None
@@ -1507,6 +1554,9 @@ class Model(ABC):
                     messages, stream=True, response_format=response_format, tools=tools
                 )
                 cached_data = self._get_cached_model_response(cache_key)
+                if cached_data is None:
+                    # Wait for an identical in-flight request instead of calling the provider twice
+                    cached_data, cache_claimed = await self._aclaim_model_cache_key(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for async streaming model response")
@@ -1686,6 +1736,8 @@ class Model(ABC):
                 self._save_streaming_responses_to_cache(cache_key, streaming_responses)
 
         finally:
+            if cache_claimed and cache_key is not None:
+                self._get_response_cache().arelease(cache_key)
             # Close the Gemini client
             if self.__class__.__name__ == "Gemini" and self.client is not None:
                 try:
@@ -2771,6 +2823,10 @@ class Model(ABC):
             if k in {"client", "async_client", "http_client", "mistral_client", "model_client"}:
                 setattr(new_model, k, None)
                 continue
+            # Copies share the response cache and its in-flight requests
+            if k == "response_cache":
+                setattr(new_model, k, v)
+                continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
             except Exception:
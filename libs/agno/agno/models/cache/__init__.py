@@ -0,0 +1,49 @@
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional
+
+from agno.models.cache.base import CacheStats, ResponseCache, TieredResponseCache
+from agno.models.cache.in_memory import InMemoryResponseCache
+from agno.models.cache.sqlite import SqliteResponseCache
+
+__all__ = [
+    "CacheStats",
+    "InMemoryResponseCache",
+    "ResponseCache",
+    "SqliteResponseCache",
+    "TieredResponseCache",
+    "get_default_response_cache",
+    "get_shared_response_cache",
+]
+
+_default_caches: Dict[str, ResponseCache] = {}
+_default_caches_lock = Lock()
+
+
+def get_shared_response_cache(db_file: Path) -> ResponseCache:
+    """Get the process-wide cache for a sqlite file: an in-memory LRU in front of the file."""
+    cache_key = str(db_file.resolve())
+    with _default_caches_lock:
+        cache = _default_caches.get(cache_key)
+        if cache is None:
+            cache = TieredResponseCache([InMemoryResponseCache(), SqliteResponseCache(db_file)])
+            _default_caches[cache_key] = cache
+        return cache
+
+
+def get_default_response_cache(cache_dir: Optional[str] = None) -> ResponseCache:
+    """Get the cache used by models with cache_response=True and no response_cache.
+
+    Responses are stored in a sqlite file in cache_dir (defaults to ~/.agno/cache/model_responses).
+    """
+    path = Path(cache_dir) if cache_dir else Path.home() / ".agno" / "cache" / "model_responses"
+    return get_shared_response_cache(path / "responses.db")
+
+
+def __getattr__(name: str):
+    """Lazy import for cache backends with optional dependencies."""
+    if name == "RedisResponseCache":
+        from agno.models.cache.redis import RedisResponseCache
+
+        return RedisResponseCache
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,179 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+# Seconds a request waits for an identical in-flight request before calling the provider itself
+DEFAULT_INFLIGHT_TIMEOUT = 60.0
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters of a response cache"""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    # Requests that waited for an identical in-flight request instead of calling the provider
+    coalesced: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class ResponseCache(ABC):
+    """Backend for cached model responses.
+
+    Entries are JSON-serializable dicts, stored as JSON strings so callers always get a fresh copy.
+    `acquire`/`release` (and their async variants) implement per-key single-flight: the first request for a key
+    holds it while calling the provider, identical concurrent requests wait and then read its cached response.
+    Waits are bounded by `inflight_timeout` seconds, so a slow or stuck request only delays the others that long.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+        self.inflight_timeout: Optional[float] = DEFAULT_INFLIGHT_TIMEOUT
+        self._inflight_lock = Lock()
+        self._inflight: Dict[str, List[Any]] = {}
+        self._async_inflight: Dict[str, List[Any]] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the entry stored under a key, or None if it is missing or expired"""
+        try:
+            payload = self._get(key)
+        except Exception:
+            payload = None
+        if payload is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return json.loads(payload)
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store an entry, expiring it after ttl seconds if given"""
+        self._set(key, json.dumps(value), ttl)
+        self.stats.sets += 1
+
+    def delete(self, key: str) -> None:
+        self._delete(key)
+
+    def clear(self) -> None:
+        self._clear()
+
+    def _claim(self, registry: Dict[str, List[Any]], key: str, lock_factory: Any) -> List[Any]:
+        with self._inflight_lock:
+            entry = registry.get(key)
+            if entry is None:
+                entry = registry[key] = [lock_factory(), 0]
+            entry[1] += 1
+            return entry
+
+    def _unclaim(self, registry: Dict[str, List[Any]], key: str) -> Optional[Any]:
+        with self._inflight_lock:
+            entry = registry.get(key)
+            if entry is None:
+                return None
+            entry[1] -= 1
+            if entry[1] == 0:
+                del registry[key]
+            return entry[0]
+
+    def acquire(self, key: str) -> bool:
+        """Claim a key, waiting while another request for the same key is in flight.
+
+        Returns True if it had to wait, in which case the cache should be checked again.
+        Raises TimeoutError, without claiming the key, if it is still in flight after `inflight_timeout` seconds.
+        """
+        lock = self._claim(self._inflight, key, Lock)[0]
+        if lock.acquire(blocking=False):
+            return False
+        self.stats.coalesced += 1
+        if not lock.acquire(timeout=self.inflight_timeout if self.inflight_timeout is not None else -1):
+            self._unclaim(self._inflight, key)
+            raise TimeoutError(f"Request for {key} still in flight after {self.inflight_timeout}s")
+        return True
+
+    def release(self, key: str) -> None:
+        lock = self._unclaim(self._inflight, key)
+        if lock is not None:
+            lock.release()
+
+    async def aacquire(self, key: str) -> bool:
+        """Async variant of `acquire`"""
+        lock = self._claim(self._async_inflight, key, asyncio.Lock)[0]
+        if not lock.locked():
+            # Acquired without yielding to the event loop, so identical requests started next see the key claimed
+            await lock.acquire()
+            return False
+        self.stats.coalesced += 1
+        try:
+            await asyncio.wait_for(lock.acquire(), timeout=self.inflight_timeout)
+        except asyncio.TimeoutError:
+            self._unclaim(self._async_inflight, key)
+            raise TimeoutError(f"Request for {key} still in flight after {self.inflight_timeout}s")
+        return True
+
+    def arelease(self, key: str) -> None:
+        lock = self._unclaim(self._async_inflight, key)
+        if lock is not None:
+            lock.release()
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _set(self, key: str, payload: str, ttl: Optional[int]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _clear(self) -> None:
+        raise NotImplementedError
+
+
+class TieredResponseCache(ResponseCache):
+    """Chains caches from fastest to slowest, e.g. an in-memory LRU in front of a shared Redis cache.
+
+    Reads check each tier in order and copy hits back into the faster tiers; writes go to every tier.
+    """
+
+    def __init__(self, tiers: List[ResponseCache]):
+        super().__init__()
+        if not tiers:
+            raise ValueError("TieredResponseCache needs at least one tier")
+        self.tiers = tiers
+
+    def _get(self, key: str) -> Optional[str]:
+        missed: List[ResponseCache] = []
+        for tier in self.tiers:
+            payload = tier._get(key)
+            if payload is not None:
+                for faster_tier in missed:
+                    faster_tier._set(key, payload, None)
+                return payload
+            missed.append(tier)
+        return None
+
+    def _set(self, key: str, payload: str, ttl: Optional[int]) -> None:
+        for tier in self.tiers:
+            tier._set(key, payload, ttl)
+
+    def _delete(self, key: str) -> None:
+        for tier in self.tiers:
+            tier._delete(key)
+
+    def _clear(self) -> None:
+        for tier in self.tiers:
+            tier._clear()
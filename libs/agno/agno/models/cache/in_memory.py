@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from threading import Lock
+from time import time
+from typing import Optional, Tuple
+
+from agno.models.cache.base import ResponseCache
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Process-local LRU cache, bounded by entry count and optionally by total payload size"""
+
+    def __init__(self, max_entries: int = 1024, max_size_bytes: Optional[int] = None):
+        super().__init__()
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        # key -> (expires_at, payload), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = Lock()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at is not None and expires_at <= time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _set(self, key: str, payload: str, ttl: Optional[int]) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time() + ttl if ttl is not None else None, payload)
+            self._size_bytes += len(payload)
+            while len(self._entries) > self.max_entries or (
+                self.max_size_bytes is not None and self._size_bytes > self.max_size_bytes and len(self._entries) > 1
+            ):
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, payload = self._entries.pop(key)
+        self._size_bytes -= len(payload)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,43 @@
+from typing import Optional, Union
+
+from agno.models.cache.base import ResponseCache
+
+try:
+    from redis import Redis, RedisCluster
+except ImportError:
+    raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+
+class RedisResponseCache(ResponseCache):
+    """Cache shared across processes and hosts, relying on Redis key expiry and its maxmemory eviction policy"""
+
+    def __init__(
+        self,
+        redis_client: Optional[Union[Redis, RedisCluster]] = None,
+        db_url: Optional[str] = None,
+        key_prefix: str = "agno:model_response:",
+    ):
+        super().__init__()
+        if redis_client is None:
+            if db_url is None:
+                raise ValueError("One of redis_client or db_url must be provided")
+            redis_client = Redis.from_url(db_url, decode_responses=True)
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+
+    def _get(self, key: str) -> Optional[str]:
+        payload = self.redis_client.get(self.key_prefix + key)
+        if payload is None:
+            return None
+        return payload.decode("utf-8") if isinstance(payload, bytes) else payload
+
+    def _set(self, key: str, payload: str, ttl: Optional[int]) -> None:
+        self.redis_client.set(self.key_prefix + key, payload, ex=ttl)
+
+    def _delete(self, key: str) -> None:
+        self.redis_client.delete(self.key_prefix + key)
+
+    def _clear(self) -> None:
+        keys = list(self.redis_client.scan_iter(match=f"{self.key_prefix}*"))
+        if keys:
+            self.redis_client.delete(*keys)
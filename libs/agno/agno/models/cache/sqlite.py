@@ -0,0 +1,106 @@
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Optional, Union
+
+from agno.models.cache.base import ResponseCache
+
+
+class SqliteResponseCache(ResponseCache):
+    """Single-file cache shared by all processes on a host, evicting least recently used entries by total size.
+
+    The database is opened in WAL mode and memory-mapped, so lookups are served from the page cache. The total size
+    is checked each time a process wrote a sixteenth of max_size_bytes, so each process can exceed it by that much.
+    """
+
+    def __init__(
+        self,
+        db_file: Union[str, Path],
+        max_size_bytes: int = 256 * 1024 * 1024,
+        mmap_size_bytes: int = 64 * 1024 * 1024,
+    ):
+        super().__init__()
+        self.db_file = Path(db_file)
+        self.max_size_bytes = max_size_bytes
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Bytes written since the total size was last checked. Other processes write to the same file, so the total is
+        # summed again once a sixteenth of the budget was written here, instead of on every set.
+        self._unchecked_bytes = 0
+        self._check_every_bytes = max(max_size_bytes // 16, 1)
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(f"PRAGMA mmap_size={int(mmap_size_bytes)}")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS model_responses ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_model_responses_accessed_at ON model_responses (accessed_at)"
+        )
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload, expires_at FROM model_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            payload, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._connection.execute("DELETE FROM model_responses WHERE key = ?", (key,))
+                return None
+            self._connection.execute("UPDATE model_responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return payload
+
+    def _set(self, key: str, payload: str, ttl: Optional[int]) -> None:
+        now = time()
+        size = len(payload.encode("utf-8"))
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO model_responses (key, payload, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, size, now + ttl if ttl is not None else None, now),
+            )
+            self._unchecked_bytes += size
+            if self._unchecked_bytes >= self._check_every_bytes:
+                self._unchecked_bytes = 0
+                self._evict(keep=key)
+
+    def _evict(self, keep: str) -> None:
+        """Drop expired entries, then least recently used ones until the cache fits in max_size_bytes"""
+        self._connection.execute(
+            "DELETE FROM model_responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (time(),)
+        )
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM model_responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+        rows = self._connection.execute(
+            "SELECT key, size FROM model_responses WHERE key != ? ORDER BY accessed_at", (keep,)
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_size_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM model_responses WHERE key = ?", evicted)
+        self.stats.evictions += len(evicted)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM model_responses WHERE key = ?", (key,))
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM model_responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
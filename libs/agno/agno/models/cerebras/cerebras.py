@@ -261,7 +261,7 @@ class Cerebras(Model):
         assistant_message.metrics.start_timer()
         provider_response = self.get_client().chat.completions.create(
             model=self.id,
-            messages=[self._format_message(m, compress_tool_results) for m in messages],  # type: ignore
+            messages=self._format_messages(messages, compress_tool_results),  # type: ignore
             **self.get_request_params(response_format=response_format, tools=tools),
         )
         assistant_message.metrics.stop_timer()
@@ -295,7 +295,7 @@ class Cerebras(Model):
         assistant_message.metrics.start_timer()
         provider_response = await self.get_async_client().chat.completions.create(
             model=self.id,
-            messages=[self._format_message(m, compress_tool_results) for m in messages],  # type: ignore
+            messages=self._format_messages(messages, compress_tool_results),  # type: ignore
             **self.get_request_params(response_format=response_format, tools=tools),
         )
         assistant_message.metrics.stop_timer()
@@ -330,7 +330,7 @@ class Cerebras(Model):
 
         for chunk in self.get_client().chat.completions.create(
             model=self.id,
-            messages=[self._format_message(m, compress_tool_results) for m in messages],  # type: ignore
+            messages=self._format_messages(messages, compress_tool_results),  # type: ignore
             stream=True,
             **self.get_request_params(response_format=response_format, tools=tools),
         ):
@@ -364,7 +364,7 @@ class Cerebras(Model):
 
         async_stream = await self.get_async_client().chat.completions.create(
             model=self.id,
-            messages=[self._format_message(m, compress_tool_results) for m in messages],  # type: ignore
+            messages=self._format_messages(messages, compress_tool_results),  # type: ignore
             stream=True,
             **self.get_request_params(response_format=response_format, tools=tools),
         )
@@ -431,6 +431,20 @@ class Cerebras(Model):
 
         return message_dict
 
+    def _format_messages(self, messages: List[Message], compress_tool_results: bool = False) -> List[Dict[str, Any]]:
+        """
+        Format messages into the format expected by the Cerebras API, reusing payloads formatted in earlier iterations.
+
+        Args:
+            messages (List[Message]): The messages to format.
+            compress_tool_results: Whether to compress tool results.
+
+        Returns:
+            List[Dict[str, Any]]: The formatted messages.
+        """
+        cache_key = (self.__class__, compress_tool_results)
+        return [m.get_formatted(cache_key, self._format_message, compress_tool_results) for m in messages]
+
     def _parse_provider_response(self, response: ChatCompletionResponse, **kwargs) -> ModelResponse:
         """
         Parse the Cerebras response into a ModelResponse.
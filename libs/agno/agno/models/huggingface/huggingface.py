@@ -235,6 +235,20 @@ class HuggingFace(Model):
 
         return message_dict
 
+    def _format_messages(self, messages: List[Message], compress_tool_results: bool = False) -> List[Dict[str, Any]]:
+        """
+        Format messages into the format expected by HuggingFace, reusing payloads formatted in earlier iterations.
+
+        Args:
+            messages (List[Message]): The messages to format.
+            compress_tool_results: Whether to compress tool results.
+
+        Returns:
+            List[Dict[str, Any]]: The formatted messages.
+        """
+        cache_key = (self.__class__, compress_tool_results)
+        return [m.get_formatted(cache_key, self._format_message, compress_tool_results) for m in messages]
+
     def invoke(
         self,
         messages: List[Message],
@@ -255,7 +269,7 @@ class HuggingFace(Model):
             assistant_message.metrics.start_timer()
             provider_response = self.get_client().chat.completions.create(
                 model=self.id,
-                messages=[self._format_message(m, compress_tool_results) for m in messages],
+                messages=self._format_messages(messages, compress_tool_results),
                 **self.get_request_params(tools=tools, tool_choice=tool_choice),
             )
             assistant_message.metrics.stop_timer()
@@ -289,7 +303,7 @@ class HuggingFace(Model):
             assistant_message.metrics.start_timer()
             provider_response = await self.get_async_client().chat.completions.create(
                 model=self.id,
-                messages=[self._format_message(m, compress_tool_results) for m in messages],
+                messages=self._format_messages(messages, compress_tool_results),
                 **self.get_request_params(tools=tools, tool_choice=tool_choice),
             )
             assistant_message.metrics.stop_timer()
@@ -324,7 +338,7 @@ class HuggingFace(Model):
 
             stream = self.get_client().chat.completions.create(
                 model=self.id,
-                messages=[self._format_message(m, compress_tool_results) for m in messages],
+                messages=self._format_messages(messages, compress_tool_results),
                 stream=True,
                 stream_options=ChatCompletionInputStreamOptions(include_usage=True),  # type: ignore
                 **self.get_request_params(tools=tools, tool_choice=tool_choice),
@@ -362,7 +376,7 @@ class HuggingFace(Model):
             assistant_message.metrics.start_timer()
             provider_response = await self.get_async_client().chat.completions.create(
                 model=self.id,
-                messages=[self._format_message(m, compress_tool_results) for m in messages],
+                messages=self._format_messages(messages, compress_tool_results),
                 stream=True,
                 stream_options=ChatCompletionInputStreamOptions(include_usage=True),  # type: ignore
                 **self.get_request_params(tools=tools, tool_choice=tool_choice),
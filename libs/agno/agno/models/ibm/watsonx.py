@@ -159,6 +159,20 @@ class WatsonX(Model):
             message_dict["content"] = message.get_content(use_compressed_content=True)
         return message_dict
 
+    def _format_messages(self, messages: List[Message], compress_tool_results: bool = False) -> List[Dict[str, Any]]:
+        """
+        Format messages into the format expected by WatsonX, reusing payloads formatted in earlier iterations.
+
+        Args:
+            messages (List[Message]): The messages to format.
+            compress_tool_results: Whether to compress tool results.
+
+        Returns:
+            List[Dict[str, Any]]: The formatted messages.
+        """
+        cache_key = (self.__class__, compress_tool_results)
+        return [m.get_formatted(cache_key, self._format_message, compress_tool_results) for m in messages]
+
     def invoke(
         self,
         messages: List[Message],
@@ -178,7 +192,7 @@ class WatsonX(Model):
 
             client = self.get_client()
 
-            formatted_messages = [self._format_message(m, compress_tool_results) for m in messages]
+            formatted_messages = self._format_messages(messages, compress_tool_results)
             request_params = self.get_request_params(
                 response_format=response_format, tools=tools, tool_choice=tool_choice
             )
@@ -213,7 +227,7 @@ class WatsonX(Model):
                 run_response.metrics.set_time_to_first_token()
 
             client = self.get_client()
-            formatted_messages = [self._format_message(m, compress_tool_results) for m in messages]
+            formatted_messages = self._format_messages(messages, compress_tool_results)
 
             request_params = self.get_request_params(
                 response_format=response_format, tools=tools, tool_choice=tool_choice
@@ -246,7 +260,7 @@ class WatsonX(Model):
         """
         try:
             client = self.get_client()
-            formatted_messages = [self._format_message(m, compress_tool_results) for m in messages]
+            formatted_messages = self._format_messages(messages, compress_tool_results)
 
             request_params = self.get_request_params(
                 response_format=response_format, tools=tools, tool_choice=tool_choice
@@ -284,7 +298,7 @@ class WatsonX(Model):
                 run_response.metrics.set_time_to_first_token()
 
             client = self.get_client()
-            formatted_messages = [self._format_message(m, compress_tool_results) for m in messages]
+            formatted_messages = self._format_messages(messages, compress_tool_results)
 
             # Get parameters for chat
             request_params = self.get_request_params(
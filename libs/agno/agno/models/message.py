@@ -1,14 +1,16 @@
 import json
 from time import time
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar, Union
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from agno.media import Audio, File, Image, Video
 from agno.models.metrics import Metrics
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 
+FormattedT = TypeVar("FormattedT")
+
 
 class MessageReferences(BaseModel):
     """References added to user message"""
@@ -120,6 +122,35 @@ class Message(BaseModel):
 
     model_config = ConfigDict(extra="allow", populate_by_name=True, arbitrary_types_allowed=True)
 
+    # Provider payloads formatted from this message, keyed by provider and formatting options
+    _format_cache: Dict[Hashable, Tuple[Tuple[int, ...], Any]] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_"):
+            # Replace rather than clear: copies of this message share the cache dict
+            self._format_cache = {}
+        super().__setattr__(name, value)
+
+    def _format_fingerprint(self) -> Tuple[int, ...]:
+        """Lengths of the list fields, to detect in-place changes that don't go through attribute assignment"""
+        return tuple(
+            len(v) if isinstance(v, (list, tuple)) else -1
+            for v in (self.content, self.tool_calls, self.images, self.audio, self.videos, self.files)
+        )
+
+    def get_formatted(self, key: Hashable, formatter: Callable[..., FormattedT], *args: Any) -> FormattedT:
+        """Return formatter(self, *args), reusing the payload formatted under the same key if the message is unchanged.
+
+        The key must identify everything the payload depends on besides the message itself (provider, formatting
+        options). Callers must not mutate the returned payload.
+        """
+        cached = self._format_cache.get(key)
+        if cached is not None and cached[0] == self._format_fingerprint():
+            return cached[1]
+        formatted = formatter(self, *args)
+        self._format_cache[key] = (self._format_fingerprint(), formatted)
+        return formatted
+
     def get_content_string(self) -> str:
         """Returns the content as a string."""
         if isinstance(self.content, str):
@@ -0,0 +1,9 @@
+from agno.models.mock.mock import MockModel, MockToolCall
+from agno.models.mock.replay import RecordReplayTransport, use_cassette
+
+__all__ = [
+    "MockModel",
+    "MockToolCall",
+    "RecordReplayTransport",
+    "use_cassette",
+]
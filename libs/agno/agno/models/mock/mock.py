@@ -0,0 +1,245 @@
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field, replace
+from random import Random
+from threading import Lock
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+from agno.run.agent import RunOutput
+from agno.run.team import TeamRunOutput
+
+
+@dataclass
+class MockToolCall:
+    """A tool call scripted in the responses of a MockModel"""
+
+    name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    # Generated from the position of the call if not set
+    id: Optional[str] = None
+
+
+# A scripted response: text, one or more tool calls or a full ModelResponse
+ScriptedResponse = Union[str, MockToolCall, List[MockToolCall], ModelResponse]
+# An exception in the responses is raised instead
+MockResponse = Union[ScriptedResponse, Exception]
+
+# A latency in seconds, or a function sampling it from the seeded random generator of the model
+Latency = Union[float, Callable[[Random], float]]
+
+
+@dataclass
+class MockModel(Model):
+    """
+    A deterministic model that returns scripted responses without calling a model provider.
+
+    Useful to run Agents, Teams and Workflows offline: in tests, in CI and to measure the overhead of the framework.
+
+    Attributes:
+        responses: The responses to return, one per model call. When exhausted, they are cycled.
+            A response is a string, a MockToolCall or a list of them, a ModelResponse or an exception to raise.
+        latency: Seconds to wait before the response, or before its first chunk when streaming.
+        chunk_latency: Seconds to wait between streamed chunks.
+        chunk_size: Number of words per streamed chunk.
+        seed: Seed of the random generator passed to latency functions.
+
+    Example:
+        >>> model = MockModel(
+        ...     responses=[MockToolCall(name="get_weather", arguments={"city": "Paris"}), "It is sunny in Paris."],
+        ...     # Log-normal latency with a median of ~200ms, identical across runs
+        ...     latency=lambda rng: rng.lognormvariate(-1.6, 0.5),
+        ... )
+    """
+
+    id: str = "mock-model"
+    name: str = "MockModel"
+    provider: str = "Mock"
+
+    responses: List[MockResponse] = field(default_factory=lambda: ["This is a mock response."])
+    latency: Latency = 0.0
+    chunk_latency: Latency = 0.0
+    chunk_size: int = 1
+    seed: int = 0
+
+    _call_count: int = 0
+    _call_count_lock: Lock = field(default_factory=Lock)
+    _random: Optional[Random] = None
+
+    def _next_response(self) -> Tuple[int, ScriptedResponse]:
+        with self._call_count_lock:
+            call_index = self._call_count
+            self._call_count += 1
+        response = self.responses[call_index % len(self.responses)]
+        if isinstance(response, Exception):
+            raise response
+        return call_index, response
+
+    def _sample_latency(self, latency: Latency) -> float:
+        if not callable(latency):
+            return latency
+        # The generator is shared by concurrent calls, so the sequence of samples stays the same across runs
+        with self._call_count_lock:
+            if self._random is None:
+                self._random = Random(self.seed)
+            return max(0.0, latency(self._random))
+
+    def _chunks(self, content: str) -> List[str]:
+        words = re.findall(r"\S+\s*", content)
+        return ["".join(words[i : i + self.chunk_size]) for i in range(0, len(words), self.chunk_size)]
+
+    def _build_response(self, call_index: int, response: ScriptedResponse, messages: List[Message]) -> ModelResponse:
+        """Build the ModelResponse returned for a scripted response."""
+        if isinstance(response, ModelResponse):
+            # Scripted responses are cycled, so each call gets its own copy
+            model_response = replace(response)
+        elif isinstance(response, str):
+            model_response = ModelResponse(role="assistant", content=response)
+        else:
+            mock_tool_calls = [response] if isinstance(response, MockToolCall) else response
+            model_response = ModelResponse(
+                role="assistant",
+                tool_calls=[
+                    {
+                        "id": tool_call.id or f"call_{call_index}_{i}",
+                        "type": "function",
+                        "function": {"name": tool_call.name, "arguments": json.dumps(tool_call.arguments)},
+                    }
+                    for i, tool_call in enumerate(mock_tool_calls)
+                ],
+            )
+
+        if model_response.response_usage is None:
+            # Whitespace-separated words stand in for tokens, so usage is deterministic
+            input_tokens = sum(len(str(m.content).split()) for m in messages if m.content is not None)
+            output_tokens = len(str(model_response.content).split()) if model_response.content else 0
+            output_tokens += sum(
+                len(tool_call["function"]["arguments"].split()) for tool_call in model_response.tool_calls
+            )
+            model_response.response_usage = Metrics(
+                input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens
+            )
+        return model_response
+
+    def _build_response_deltas(self, model_response: ModelResponse) -> List[ModelResponse]:
+        """Split a ModelResponse into the deltas streamed for it: content chunks, then tool calls, then usage."""
+        deltas = []
+        if isinstance(model_response.content, str):
+            deltas = [ModelResponse(role="assistant", content=chunk) for chunk in self._chunks(model_response.content)]
+        if model_response.tool_calls:
+            deltas.append(ModelResponse(role="assistant", tool_calls=model_response.tool_calls))
+        deltas.append(ModelResponse(role="assistant", response_usage=model_response.response_usage))
+        return deltas
+
+    def invoke(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
+        compress_tool_results: bool = False,
+    ) -> ModelResponse:
+        """Return the next scripted response after the configured latency."""
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        latency = self._sample_latency(self.latency)
+        if latency > 0:
+            time.sleep(latency)
+        call_index, response = self._next_response()
+        assistant_message.metrics.stop_timer()
+
+        return self._parse_provider_response(self._build_response(call_index, response, messages))
+
+    async def ainvoke(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
+        compress_tool_results: bool = False,
+    ) -> ModelResponse:
+        """Return the next scripted response after the configured latency, without blocking the event loop."""
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        latency = self._sample_latency(self.latency)
+        if latency > 0:
+            await asyncio.sleep(latency)
+        call_index, response = self._next_response()
+        assistant_message.metrics.stop_timer()
+
+        return self._parse_provider_response(self._build_response(call_index, response, messages))
+
+    def invoke_stream(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
+        compress_tool_results: bool = False,
+    ) -> Iterator[ModelResponse]:
+        """Stream the next scripted response: its content in chunks of chunk_size words, then its tool calls."""
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        latency = self._sample_latency(self.latency)
+        if latency > 0:
+            time.sleep(latency)
+        call_index, response = self._next_response()
+        for i, delta in enumerate(self._build_response_deltas(self._build_response(call_index, response, messages))):
+            chunk_latency = self._sample_latency(self.chunk_latency) if i > 0 and delta.content else 0
+            if chunk_latency > 0:
+                time.sleep(chunk_latency)
+            yield self._parse_provider_response_delta(delta)
+        assistant_message.metrics.stop_timer()
+
+    async def ainvoke_stream(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
+        compress_tool_results: bool = False,
+    ) -> AsyncIterator[ModelResponse]:
+        """Stream the next scripted response without blocking the event loop."""
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        latency = self._sample_latency(self.latency)
+        if latency > 0:
+            await asyncio.sleep(latency)
+        call_index, response = self._next_response()
+        for i, delta in enumerate(self._build_response_deltas(self._build_response(call_index, response, messages))):
+            chunk_latency = self._sample_latency(self.chunk_latency) if i > 0 and delta.content else 0
+            if chunk_latency > 0:
+                await asyncio.sleep(chunk_latency)
+            yield self._parse_provider_response_delta(delta)
+        assistant_message.metrics.stop_timer()
+
+    def _parse_provider_response(self, response: ModelResponse, **kwargs) -> ModelResponse:
+        """Scripted responses are built as ModelResponses already."""
+        return response
+
+    def _parse_provider_response_delta(self, response: ModelResponse) -> ModelResponse:
+        """Scripted response deltas are built as ModelResponses already."""
+        return response
@@ -0,0 +1,234 @@
+import asyncio
+import base64
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Literal, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from agno.utils.log import log_debug, log_error
+
+CASSETTE_VERSION = 1
+
+# Credentials some providers send in the query string. They are never written to a cassette.
+_SENSITIVE_QUERY_PARAMS = {"key", "api_key", "api-key", "access_token"}
+# Response headers that do not apply to the replayed body, which is stored decoded
+_DROPPED_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+
+class RecordReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    An httpx transport that records the HTTP exchanges with a model provider to a cassette file and replays them.
+
+    Record the exchanges of a run once, against the real provider, then replay them offline: without network, cost
+    or provider latency, and with the exact payloads the provider returns, including streamed ones.
+
+    Modes:
+        - "once": replay the cassette if it exists, otherwise record it
+        - "record": send every request to the provider and (re)write the cassette
+        - "replay": never send a request, requests missing from the cassette fail
+
+    Requests are matched on method, URL and body, ignoring headers. A request sent more times than it was recorded
+    cycles through its recorded responses. Request headers and credentials in the query string are not recorded.
+
+    Args:
+        path: Path of the cassette file.
+        mode: One of "once", "record" or "replay".
+        simulate_latency: If True, replayed responses take as long as they took when recorded.
+        transport: Transport sending the requests when recording. Defaults to httpx.HTTPTransport.
+        async_transport: Transport sending async requests when recording. Defaults to httpx.AsyncHTTPTransport.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        mode: Literal["once", "record", "replay"] = "once",
+        simulate_latency: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.path = Path(path)
+        if mode == "once":
+            mode = "replay" if self.path.exists() else "record"
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self.transport = transport
+        self.async_transport = async_transport
+
+        self.exchanges: List[Dict[str, Any]] = []
+        self._exchanges_by_key: Dict[str, List[Dict[str, Any]]] = {}
+        self._replay_counts: Dict[str, int] = {}
+        self._lock = Lock()
+
+        if self.mode == "replay":
+            if not self.path.exists():
+                raise FileNotFoundError(f"Cassette not found: {self.path}")
+            cassette = json.loads(self.path.read_text())
+            for exchange in cassette.get("exchanges", []):
+                self._add_exchange(exchange)
+
+    def _add_exchange(self, exchange: Dict[str, Any]) -> None:
+        self.exchanges.append(exchange)
+        self._exchanges_by_key.setdefault(_exchange_key(exchange["request"]), []).append(exchange)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode == "replay":
+            exchange = self._find_exchange(request.method, str(request.url), request.read())
+            if self.simulate_latency:
+                time.sleep(exchange["elapsed"])
+            return _build_response(exchange["response"])
+
+        if self.transport is None:
+            self.transport = httpx.HTTPTransport()
+        start = time.perf_counter()
+        response = self.transport.handle_request(request)
+        # The body is read fully to be recorded, which also decodes it
+        content = response.read()
+        response.close()
+        recorded = self._record(request, response, content, time.perf_counter() - start)
+        return _build_response(recorded)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode == "replay":
+            exchange = self._find_exchange(request.method, str(request.url), await request.aread())
+            if self.simulate_latency:
+                await asyncio.sleep(exchange["elapsed"])
+            return _build_response(exchange["response"])
+
+        if self.async_transport is None:
+            self.async_transport = httpx.AsyncHTTPTransport()
+        start = time.perf_counter()
+        response = await self.async_transport.handle_async_request(request)
+        # The body is read fully to be recorded, which also decodes it
+        content = await response.aread()
+        await response.aclose()
+        recorded = self._record(request, response, content, time.perf_counter() - start)
+        return _build_response(recorded)
+
+    def _find_exchange(self, method: str, url: str, body: bytes) -> Dict[str, Any]:
+        key = _exchange_key({"method": method, "url": _sanitize_url(url), "body": _decode_request_body(body)})
+        with self._lock:
+            exchanges = self._exchanges_by_key.get(key)
+            if not exchanges:
+                log_error(f"No exchange recorded for {method} {_sanitize_url(url)} in {self.path}")
+                raise ValueError(f"No exchange recorded for {method} {_sanitize_url(url)} in {self.path}")
+            replay_count = self._replay_counts.get(key, 0)
+            self._replay_counts[key] = replay_count + 1
+        return exchanges[replay_count % len(exchanges)]
+
+    def _record(
+        self, request: httpx.Request, response: httpx.Response, content: bytes, elapsed: float
+    ) -> Dict[str, Any]:
+        try:
+            body, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+        recorded_response = {
+            "status_code": response.status_code,
+            "headers": {
+                name: value for name, value in response.headers.items() if name.lower() not in _DROPPED_RESPONSE_HEADERS
+            },
+            "body": body,
+            "encoding": encoding,
+        }
+        recorded_request = {
+            "method": request.method,
+            "url": _sanitize_url(str(request.url)),
+            "body": _decode_request_body(request.content),
+        }
+        exchange = {"request": recorded_request, "response": recorded_response, "elapsed": elapsed}
+        with self._lock:
+            self._add_exchange(exchange)
+            # Written after every exchange, so an interrupted recording keeps what it recorded
+            self.save()
+        log_debug(f"Recorded {request.method} {recorded_request['url']} to {self.path}")
+        return recorded_response
+
+    def save(self) -> None:
+        """Write the recorded exchanges to the cassette file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({"version": CASSETTE_VERSION, "exchanges": self.exchanges}, indent=2))
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+
+    async def aclose(self) -> None:
+        if self.async_transport is not None:
+            await self.async_transport.aclose()
+
+
+@contextmanager
+def use_cassette(
+    path: Union[str, Path],
+    mode: Literal["once", "record", "replay"] = "once",
+    simulate_latency: bool = False,
+) -> Iterator[RecordReplayTransport]:
+    """
+    Record or replay the HTTP exchanges of the model providers using the default httpx clients.
+
+    Models create their provider client on first use, from the default httpx clients, and keep it. Create the models
+    inside the block so they record or replay, and do not reuse them outside of it.
+    Models given their own http_client can use the yielded transport instead.
+
+    Example:
+        >>> with use_cassette("tests/cassettes/weather_agent.json"):
+        ...     agent = Agent(model=OpenAIChat(id="gpt-4o-mini"), tools=[get_weather])
+        ...     agent.run("What is the weather in Paris?")
+    """
+    from agno.utils import http
+
+    transport = RecordReplayTransport(path, mode=mode, simulate_latency=simulate_latency)
+    sync_client = httpx.Client(transport=transport, follow_redirects=True)
+    async_client = httpx.AsyncClient(transport=transport, follow_redirects=True)
+
+    with http._sync_client_lock:
+        previous_sync_client = http._global_sync_client
+        http._global_sync_client = sync_client
+    with http._async_client_lock:
+        previous_async_client = http._global_async_client
+        http._global_async_client = async_client
+    try:
+        yield transport
+    finally:
+        with http._sync_client_lock:
+            http._global_sync_client = previous_sync_client
+        with http._async_client_lock:
+            http._global_async_client = previous_async_client
+        # Also closes the transport
+        sync_client.close()
+
+
+def _sanitize_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = [(name, value) for name, value in parse_qsl(parts.query) if name.lower() not in _SENSITIVE_QUERY_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _decode_request_body(body: bytes) -> Any:
+    """The request body, parsed if it is JSON"""
+    if not body:
+        return None
+    try:
+        return json.loads(body)
+    except ValueError:
+        try:
+            return body.decode("utf-8")
+        except UnicodeDecodeError:
+            return base64.b64encode(body).decode("ascii")
+
+
+def _exchange_key(request: Dict[str, Any]) -> str:
+    return f"{request['method']} {request['url']} {json.dumps(request['body'], sort_keys=True)}"
+
+
+def _build_response(recorded_response: Dict[str, Any]) -> httpx.Response:
+    body = recorded_response["body"]
+    content = base64.b64decode(body) if recorded_response.get("encoding") == "base64" else body.encode("utf-8")
+    return httpx.Response(
+        status_code=recorded_response["status_code"], headers=recorded_response["headers"], content=content
+    )
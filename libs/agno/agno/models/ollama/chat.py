@@ -214,6 +214,20 @@ class Ollama(Model):
 
         return _message
 
+    def _format_messages(self, messages: List[Message], compress_tool_results: bool = False) -> List[Dict[str, Any]]:
+        """
+        Format messages into the format expected by Ollama, reusing payloads formatted in earlier iterations.
+
+        Args:
+            messages (List[Message]): The messages to format.
+            compress_tool_results: Whether to compress tool results.
+
+        Returns:
+            List[Dict[str, Any]]: The formatted messages.
+        """
+        cache_key = (self.__class__, compress_tool_results)
+        return [m.get_formatted(cache_key, self._format_message, compress_tool_results) for m in messages]
+
     def _prepare_request_kwargs_for_invoke(
         self,
         response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
@@ -249,7 +263,7 @@ class Ollama(Model):
 
         provider_response = self.get_client().chat(
             model=self.id.strip(),
-            messages=[self._format_message(m, compress_tool_results) for m in messages],  # type: ignore
+            messages=self._format_messages(messages, compress_tool_results),  # type: ignore
             **request_kwargs,
         )  # type: ignore
 
@@ -280,7 +294,7 @@ class Ollama(Model):
 
         provider_response = await self.get_async_client().chat(
             model=self.id.strip(),
-            messages=[self._format_message(m, compress_tool_results) for m in messages],  # type: ignore
+            messages=self._format_messages(messages, compress_tool_results),  # type: ignore
             **request_kwargs,
         )  # type: ignore
 
@@ -309,7 +323,7 @@ class Ollama(Model):
 
         for chunk in self.get_client().chat(
             model=self.id,
-            messages=[self._format_message(m, compress_tool_results) for m in messages],  # type: ignore
+            messages=self._format_messages(messages, compress_tool_results),  # type: ignore
             stream=True,
             **self.get_request_params(tools=tools),
         ):
@@ -337,7 +351,7 @@ class Ollama(Model):
 
         async for chunk in await self.get_async_client().chat(
             model=self.id.strip(),
-            messages=[self._format_message(m, compress_tool_results) for m in messages],  # type: ignore
+            messages=self._format_messages(messages, compress_tool_results),  # type: ignore
             stream=True,
             **self.get_request_params(tools=tools),
         ):
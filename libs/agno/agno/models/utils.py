@@ -139,6 +139,11 @@ def _get_model_class(model_id: str, model_provider: str) -> Model:
 
         return MistralChat(id=model_id)
 
+    elif model_provider == "mock":
+        from agno.models.mock import MockModel
+
+        return MockModel(id=model_id)
+
     elif model_provider == "moonshot":
         from agno.models.moonshot import MoonShot
 
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from functools import partial
 from os import getenv
@@ -91,13 +92,15 @@ async def http_client_lifespan(_):
 
 @asynccontextmanager
 async def db_lifespan(app: FastAPI, agent_os: "AgentOS"):
-    """Initializes databases in the event loop and closes them on shutdown."""
+    """Initializes databases in the event loop, and writes pending sessions and closes them on shutdown."""
     if agent_os.auto_provision_dbs:
         agent_os._initialize_sync_databases()
         await agent_os._initialize_async_databases()
+    agent_os._attach_session_writers()
 
     yield
 
+    await agent_os._flush_session_writers()
     await agent_os._close_databases()
 
 
@@ -924,6 +927,32 @@ class AgentOS:
             except Exception as e:
                 log_warning(f"Failed to initialize async {db.__class__.__name__} (id: {db.id}): {e}")
 
+    def _get_session_writers(self) -> List[Any]:
+        """Get the unique session writers of the agents and teams."""
+        from itertools import chain
+
+        session_writers: Dict[int, Any] = {}
+        for entity in chain(self.agents or [], self.teams or []):
+            writer = getattr(entity, "session_writer", None)
+            if writer is not None:
+                session_writers[id(writer)] = writer
+        return list(session_writers.values())
+
+    def _attach_session_writers(self) -> None:
+        """Let the session writers of the agents and teams write to async databases in the background of the app."""
+        loop = asyncio.get_running_loop()
+        for writer in self._get_session_writers():
+            writer.attach(loop)
+
+    async def _flush_session_writers(self) -> None:
+        """Write the sessions still pending in the session writers of the agents and teams."""
+        for writer in self._get_session_writers():
+            writer.detach()
+            try:
+                await writer.aflush()
+            except Exception as e:
+                log_warning(f"Failed to flush session writer: {e}")
+
     async def _close_databases(self) -> None:
         """Close all database connections and release connection pools."""
         from itertools import chain
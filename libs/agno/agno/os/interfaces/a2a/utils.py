@@ -324,7 +324,7 @@ async def stream_a2a_response(
                 final=False,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # 2. Send all content and secondary events
 
@@ -340,7 +340,7 @@ async def stream_a2a_response(
                 metadata={"agno_content_category": "content"},
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=message)
-            yield f"event: Message\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: Message\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Send tool call events
         elif isinstance(event, (ToolCallStartedEvent, TeamToolCallStartedEvent)):
@@ -360,7 +360,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, (ToolCallCompletedEvent, TeamToolCallCompletedEvent)):
             metadata = {"agno_event_type": "tool_call_completed"}
@@ -379,7 +379,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Send reasoning events
         elif isinstance(event, (ReasoningStartedEvent, TeamReasoningStartedEvent)):
@@ -391,7 +391,7 @@ async def stream_a2a_response(
                 metadata={"agno_event_type": "reasoning_started"},
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, (ReasoningStepEvent, TeamReasoningStepEvent)):
             if event.reasoning_content:
@@ -414,7 +414,7 @@ async def stream_a2a_response(
                     metadata={"agno_content_category": "reasoning", "agno_event_type": "reasoning_step"},
                 )
                 response = SendStreamingMessageSuccessResponse(id=request_id, result=reasoning_message)
-                yield f"event: Message\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+                yield f"event: Message\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, (ReasoningCompletedEvent, TeamReasoningCompletedEvent)):
             status_event = TaskStatusUpdateEvent(
@@ -425,7 +425,7 @@ async def stream_a2a_response(
                 metadata={"agno_event_type": "reasoning_completed"},
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Send memory update events
         elif isinstance(event, (MemoryUpdateStartedEvent, TeamMemoryUpdateStartedEvent)):
@@ -437,7 +437,7 @@ async def stream_a2a_response(
                 metadata={"agno_event_type": "memory_update_started"},
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, (MemoryUpdateCompletedEvent, TeamMemoryUpdateCompletedEvent)):
             status_event = TaskStatusUpdateEvent(
@@ -448,7 +448,7 @@ async def stream_a2a_response(
                 metadata={"agno_event_type": "memory_update_completed"},
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Send workflow events
         elif isinstance(event, WorkflowStepStartedEvent):
@@ -464,7 +464,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, WorkflowStepCompletedEvent):
             metadata = {"agno_event_type": "workflow_step_completed"}
@@ -479,7 +479,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, WorkflowStepErrorEvent):
             metadata = {"agno_event_type": "workflow_step_error"}
@@ -496,7 +496,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Send loop events
         elif isinstance(event, LoopExecutionStartedEvent):
@@ -514,7 +514,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, LoopIterationStartedEvent):
             metadata = {"agno_event_type": "loop_iteration_started"}
@@ -533,7 +533,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, LoopIterationCompletedEvent):
             metadata = {"agno_event_type": "loop_iteration_completed"}
@@ -552,7 +552,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, LoopExecutionCompletedEvent):
             metadata = {"agno_event_type": "loop_execution_completed"}
@@ -569,7 +569,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Send parallel events
         elif isinstance(event, ParallelExecutionStartedEvent):
@@ -587,7 +587,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, ParallelExecutionCompletedEvent):
             metadata = {"agno_event_type": "parallel_execution_completed"}
@@ -604,7 +604,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Send condition events
         elif isinstance(event, ConditionExecutionStartedEvent):
@@ -622,7 +622,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, ConditionExecutionCompletedEvent):
             metadata = {"agno_event_type": "condition_execution_completed"}
@@ -641,7 +641,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Send router events
         elif isinstance(event, RouterExecutionStartedEvent):
@@ -659,7 +659,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, RouterExecutionCompletedEvent):
             metadata = {"agno_event_type": "router_execution_completed"}
@@ -678,7 +678,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Send steps events
         elif isinstance(event, StepsExecutionStartedEvent):
@@ -696,7 +696,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         elif isinstance(event, StepsExecutionCompletedEvent):
             metadata = {"agno_event_type": "steps_execution_completed"}
@@ -715,7 +715,7 @@ async def stream_a2a_response(
                 metadata=metadata,
             )
             response = SendStreamingMessageSuccessResponse(id=request_id, result=status_event)
-            yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+            yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Capture completion event for final task construction
         elif isinstance(event, (RunCompletedEvent, TeamRunCompletedEvent, WorkflowCompletedEvent)):
@@ -747,7 +747,7 @@ async def stream_a2a_response(
             final=True,
         )
     response = SendStreamingMessageSuccessResponse(id=request_id, result=final_status_event)
-    yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+    yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
     # 4. Send final task
     # Handle cancelled case
@@ -777,7 +777,7 @@ async def stream_a2a_response(
             history=[final_message],
         )
         response = SendStreamingMessageSuccessResponse(id=request_id, result=task)
-        yield f"event: Task\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+        yield f"event: Task\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
         return
 
     # Build from completion_event if available, otherwise use accumulated content
@@ -879,7 +879,7 @@ async def stream_a2a_response(
         artifacts=artifacts if artifacts else None,
     )
     response = SendStreamingMessageSuccessResponse(id=request_id, result=task)
-    yield f"event: Task\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+    yield f"event: Task\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
 
 async def stream_a2a_response_with_error_handling(
@@ -903,7 +903,7 @@ async def stream_a2a_response_with_error_handling(
             final=True,
         )
         response = SendStreamingMessageSuccessResponse(id=request_id, result=failed_status_event)
-        yield f"event: TaskStatusUpdateEvent\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+        yield f"event: TaskStatusUpdateEvent\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
 
         # Send failed Task
         error_message = A2AMessage(
@@ -920,4 +920,4 @@ async def stream_a2a_response_with_error_handling(
         )
 
         response = SendStreamingMessageSuccessResponse(id=request_id, result=failed_task)
-        yield f"event: Task\ndata: {json.dumps(response.model_dump(exclude_none=True))}\n\n"
+        yield f"event: Task\ndata: {response.model_dump_json(exclude_none=True)}\n\n"
@@ -11,6 +11,7 @@ from fastmcp.server.http import (
 
 from agno.db.base import AsyncBaseDb, BaseDb, SessionType
 from agno.db.schemas import UserMemory
+from agno.db.utils import SESSION_SUMMARY_COLUMNS
 from agno.os.routers.memory.schemas import (
     UserMemorySchema,
 )
@@ -151,6 +152,7 @@ def get_mcp_server(
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                columns=SESSION_SUMMARY_COLUMNS,
             )
         else:
             sessions, total_count = db.get_sessions(
@@ -163,6 +165,7 @@ def get_mcp_server(
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                columns=SESSION_SUMMARY_COLUMNS,
             )
 
         return {
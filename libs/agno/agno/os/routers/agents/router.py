@@ -34,6 +34,7 @@ from agno.os.utils import (
     format_sse_event,
     get_agent_by_id,
     get_request_kwargs,
+    get_stream_encoder,
     process_audio,
     process_document,
     process_image,
@@ -42,6 +43,7 @@ from agno.os.utils import (
 from agno.registry import Registry
 from agno.run.agent import RunErrorEvent, RunOutput
 from agno.utils.log import log_debug, log_error, log_warning
+from agno.utils.sse import DeltaStreamEncoder
 
 if TYPE_CHECKING:
     from agno.os.app import AgentOS
@@ -58,6 +60,7 @@ async def agent_response_streamer(
     files: Optional[List[FileMedia]] = None,
     background_tasks: Optional[BackgroundTasks] = None,
     auth_token: Optional[str] = None,
+    encoder: Optional[DeltaStreamEncoder] = None,
     **kwargs: Any,
 ) -> AsyncGenerator:
     try:
@@ -87,7 +90,7 @@ async def agent_response_streamer(
             **kwargs,
         )
         async for run_response_chunk in run_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+            yield format_sse_event(run_response_chunk, encoder)  # type: ignore
     except (InputCheckError, OutputCheckError) as e:
         error_response = RunErrorEvent(
             content=str(e),
@@ -95,7 +98,7 @@ async def agent_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event(error_response, encoder)
     except Exception as e:
         import traceback
 
@@ -103,7 +106,7 @@ async def agent_response_streamer(
         error_response = RunErrorEvent(
             content=str(e),
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event(error_response, encoder)
 
 
 async def agent_continue_response_streamer(
@@ -114,6 +117,7 @@ async def agent_continue_response_streamer(
     user_id: Optional[str] = None,
     background_tasks: Optional[BackgroundTasks] = None,
     auth_token: Optional[str] = None,
+    encoder: Optional[DeltaStreamEncoder] = None,
 ) -> AsyncGenerator:
     try:
         # Build kwargs for remote agent auth
@@ -132,7 +136,7 @@ async def agent_continue_response_streamer(
             **extra_kwargs,
         )
         async for run_response_chunk in continue_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+            yield format_sse_event(run_response_chunk, encoder)  # type: ignore
     except (InputCheckError, OutputCheckError) as e:
         error_response = RunErrorEvent(
             content=str(e),
@@ -140,7 +144,7 @@ async def agent_continue_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event(error_response, encoder)
 
     except Exception as e:
         import traceback
@@ -151,7 +155,7 @@ async def agent_continue_response_streamer(
             error_type=e.type if hasattr(e, "type") else None,
             error_id=e.error_id if hasattr(e, "error_id") else None,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event(error_response, encoder)
         return
 
 
@@ -189,7 +193,8 @@ def get_agent_router(
             "- Real-time streaming responses with Server-Sent Events (SSE)\n"
             "- User and session context preservation\n\n"
             "**Streaming Response:**\n"
-            "When `stream=true`, returns SSE events with `event` and `data` fields."
+            "When `stream=true`, returns SSE events with `event` and `data` fields. "
+            "Set `stream_format=delta` to receive content events as compact deltas after the first one of each run."
         ),
         responses={
             200: {
@@ -216,6 +221,7 @@ def get_agent_router(
         background_tasks: BackgroundTasks,
         message: str = Form(...),
         stream: bool = Form(True),
+        stream_format: str = Form("full"),
         session_id: Optional[str] = Form(None),
         user_id: Optional[str] = Form(None),
         files: Optional[List[UploadFile]] = File(None),
@@ -346,6 +352,7 @@ def get_agent_router(
 
         # Extract auth token for remote agents
         auth_token = get_auth_token_from_request(request)
+        encoder = get_stream_encoder(stream_format) if stream else None
 
         if stream:
             return StreamingResponse(
@@ -360,6 +367,7 @@ def get_agent_router(
                     files=input_files if input_files else None,
                     background_tasks=background_tasks,
                     auth_token=auth_token,
+                    encoder=encoder,
                     **kwargs,
                 ),
                 media_type="text/event-stream",
@@ -458,6 +466,7 @@ def get_agent_router(
         session_id: Optional[str] = Form(None),
         user_id: Optional[str] = Form(None),
         stream: bool = Form(True),
+        stream_format: str = Form("full"),
     ):
         if hasattr(request.state, "user_id") and request.state.user_id is not None:
             user_id = request.state.user_id
@@ -491,6 +500,7 @@ def get_agent_router(
 
         # Extract auth token for remote agents
         auth_token = get_auth_token_from_request(request)
+        encoder = get_stream_encoder(stream_format) if stream else None
 
         if stream:
             return StreamingResponse(
@@ -502,6 +512,7 @@ def get_agent_router(
                     user_id=user_id,
                     background_tasks=background_tasks,
                     auth_token=auth_token,
+                    encoder=encoder,
                 ),
                 media_type="text/event-stream",
             )
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from agno.agent import Agent, RemoteAgent
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas.evals import EvalFilterType, EvalType
+from agno.db.utils import get_next_cursor
 from agno.models.utils import get_model
 from agno.os.auth import get_auth_token_from_request, get_authentication_dependency
 from agno.os.routers.evals.schemas import (
@@ -32,7 +33,7 @@ from agno.os.schema import (
     ValidationErrorResponse,
 )
 from agno.os.settings import AgnoAPISettings
-from agno.os.utils import get_agent_by_id, get_db, get_team_by_id
+from agno.os.utils import get_agent_by_id, get_db, get_team_by_id, validate_cursor
 from agno.remote.base import RemoteDb
 from agno.team import RemoteTeam, Team
 from agno.utils.log import log_warning
@@ -122,10 +123,15 @@ def attach_routes(
         page: Optional[int] = Query(default=1, description="Page number", ge=0),
         sort_by: Optional[str] = Query(default="created_at", description="Field to sort by"),
         sort_order: Optional[SortOrder] = Query(default="desc", description="Sort order (asc or desc)"),
+        cursor: Optional[str] = Query(
+            default=None, description="Cursor from the previous page's meta.next_cursor. Takes precedence over page"
+        ),
+        count_total: bool = Query(default=True, description="Whether to count all matching eval runs"),
         db_id: Optional[str] = Query(default=None, description="The ID of the database to use"),
         table: Optional[str] = Query(default=None, description="The database table to use"),
     ) -> PaginatedResponse[EvalSchema]:
         db = await get_db(dbs, db_id, table)
+        validate_cursor(cursor)
 
         if isinstance(db, RemoteDb):
             auth_token = get_auth_token_from_request(request)
@@ -141,6 +147,8 @@ def attach_routes(
                 model_id=model_id,
                 eval_types=eval_types,
                 filter_type=filter_type.value if filter_type else None,
+                cursor=cursor,
+                count_total=count_total,
                 headers=headers,
             )
 
@@ -158,6 +166,8 @@ def attach_routes(
                 eval_type=eval_types,
                 filter_type=filter_type,
                 deserialize=False,
+                cursor=cursor,
+                count_total=count_total,
             )
         else:
             eval_runs, total_count = db.get_eval_runs(  # type: ignore
@@ -172,6 +182,8 @@ def attach_routes(
                 eval_type=eval_types,
                 filter_type=filter_type,
                 deserialize=False,
+                cursor=cursor,
+                count_total=count_total,
             )
 
         return PaginatedResponse(
@@ -181,6 +193,7 @@ def attach_routes(
                 limit=limit,
                 total_count=total_count,  # type: ignore
                 total_pages=(total_count + limit - 1) // limit if limit is not None and limit > 0 else 0,  # type: ignore
+                next_cursor=get_next_cursor(eval_runs, "run_id", sort_by or "created_at", limit),  # type: ignore
             ),
         )
 
@@ -8,6 +8,7 @@ from fastapi.routing import APIRouter
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas import UserMemory
+from agno.db.utils import get_next_cursor
 from agno.models.utils import get_model
 from agno.os.auth import get_auth_token_from_request, get_authentication_dependency
 from agno.os.routers.memory.schemas import (
@@ -29,7 +30,7 @@ from agno.os.schema import (
     ValidationErrorResponse,
 )
 from agno.os.settings import AgnoAPISettings
-from agno.os.utils import get_db
+from agno.os.utils import get_db, validate_cursor
 from agno.remote.base import RemoteDb
 
 logger = logging.getLogger(__name__)
@@ -260,10 +261,15 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
         page: Optional[int] = Query(default=1, description="Page number for pagination", ge=0),
         sort_by: Optional[str] = Query(default="updated_at", description="Field to sort memories by"),
         sort_order: Optional[SortOrder] = Query(default="desc", description="Sort order (asc or desc)"),
+        cursor: Optional[str] = Query(
+            default=None, description="Cursor from the previous page's meta.next_cursor. Takes precedence over page"
+        ),
+        count_total: bool = Query(default=True, description="Whether to count all matching memories"),
         db_id: Optional[str] = Query(default=None, description="Database ID to query memories from"),
         table: Optional[str] = Query(default=None, description="The database table to use"),
     ) -> PaginatedResponse[UserMemorySchema]:
         db = await get_db(dbs, db_id, table)
+        validate_cursor(cursor)
 
         if hasattr(request.state, "user_id") and request.state.user_id is not None:
             user_id = request.state.user_id
@@ -281,6 +287,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 page=page,
                 sort_by=sort_by,
                 sort_order=sort_order.value if sort_order else "desc",
+                cursor=cursor,
+                count_total=count_total,
                 db_id=db_id,
                 table=table,
                 headers=headers,
@@ -299,6 +307,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                cursor=cursor,
+                count_total=count_total,
             )
         else:
             user_memories, total_count = db.get_user_memories(  # type: ignore
@@ -312,6 +322,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                cursor=cursor,
+                count_total=count_total,
             )
 
         memories = [UserMemorySchema.from_dict(user_memory) for user_memory in user_memories]  # type: ignore
@@ -322,6 +334,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 limit=limit,
                 total_count=total_count,  # type: ignore
                 total_pages=math.ceil(total_count / limit) if limit is not None and limit > 0 else 0,  # type: ignore
+                next_cursor=get_next_cursor(user_memories, "memory_id", sort_by, limit),  # type: ignore
             ),
         )
 
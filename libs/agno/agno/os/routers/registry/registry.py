@@ -135,10 +135,8 @@ def attach_routes(router: APIRouter, registry: Registry) -> APIRouter:
                     default_params = {"type": "object", "properties": {}, "required": []}
                     if func_params == default_params and func.entrypoint and not func.skip_entrypoint_processing:
                         try:
-                            # Create a copy to avoid modifying the original
-                            func_copy = func.model_copy(deep=False)
-                            func_copy.process_entrypoint(strict=False)
-                            func_params = func_copy.parameters
+                            # Processed on a copy, so the original is not modified
+                            func_params = func.get_processed_copy(strict=False).parameters
                         except Exception:
                             # If processing fails, use original parameters
                             pass
@@ -170,10 +168,8 @@ def attach_routes(router: APIRouter, registry: Registry) -> APIRouter:
                 default_params = {"type": "object", "properties": {}, "required": []}
                 if func_params == default_params and tool.entrypoint and not tool.skip_entrypoint_processing:
                     try:
-                        # Create a copy to avoid modifying the original
-                        tool_copy = tool.model_copy(deep=False)
-                        tool_copy.process_entrypoint(strict=False)
-                        func_params = tool_copy.parameters
+                        # Processed on a copy, so the original is not modified
+                        func_params = tool.get_processed_copy(strict=False).parameters
                     except Exception:
                         # If processing fails, use original parameters
                         pass
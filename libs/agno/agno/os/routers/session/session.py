@@ -6,6 +6,7 @@ from uuid import uuid4
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request
 
 from agno.db.base import AsyncBaseDb, BaseDb, SessionType
+from agno.db.utils import SESSION_SUMMARY_COLUMNS, get_next_cursor
 from agno.os.auth import get_auth_token_from_request, get_authentication_dependency
 from agno.os.schema import (
     AgentSessionDetailSchema,
@@ -28,7 +29,7 @@ from agno.os.schema import (
     WorkflowSessionDetailSchema,
 )
 from agno.os.settings import AgnoAPISettings
-from agno.os.utils import get_db
+from agno.os.utils import get_db, validate_cursor
 from agno.remote.base import RemoteDb
 from agno.session import AgentSession, TeamSession, WorkflowSession
 
@@ -111,6 +112,10 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
         page: Optional[int] = Query(default=1, description="Page number for pagination", ge=0),
         sort_by: Optional[str] = Query(default="created_at", description="Field to sort sessions by"),
         sort_order: Optional[SortOrder] = Query(default="desc", description="Sort order (asc or desc)"),
+        cursor: Optional[str] = Query(
+            default=None, description="Cursor from the previous page's meta.next_cursor. Takes precedence over page"
+        ),
+        count_total: bool = Query(default=True, description="Whether to count all matching sessions"),
         db_id: Optional[str] = Query(default=None, description="Database ID to query sessions from"),
         table: Optional[str] = Query(default=None, description="The database table to use"),
     ) -> PaginatedResponse[SessionSchema]:
@@ -118,6 +123,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             db = await get_db(dbs, db_id, table)
         except Exception as e:
             raise HTTPException(status_code=404, detail=f"{e}")
+        validate_cursor(cursor)
 
         if hasattr(request.state, "user_id") and request.state.user_id is not None:
             user_id = request.state.user_id
@@ -134,6 +140,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 page=page,
                 sort_by=sort_by,
                 sort_order=sort_order.value if sort_order else None,
+                cursor=cursor,
+                count_total=count_total,
                 db_id=db_id,
                 table=table,
                 headers=headers,
@@ -151,6 +159,9 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                columns=SESSION_SUMMARY_COLUMNS,
+                cursor=cursor,
+                count_total=count_total,
             )
         else:
             sessions, total_count = db.get_sessions(  # type: ignore
@@ -163,6 +174,9 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 sort_by=sort_by,
                 sort_order=sort_order,
                 deserialize=False,
+                columns=SESSION_SUMMARY_COLUMNS,
+                cursor=cursor,
+                count_total=count_total,
             )
 
         return PaginatedResponse(
@@ -172,6 +186,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 limit=limit,
                 total_count=total_count,  # type: ignore
                 total_pages=(total_count + limit - 1) // limit if limit is not None and limit > 0 else 0,  # type: ignore
+                next_cursor=get_next_cursor(sessions, "session_id", sort_by, limit),  # type: ignore
             ),
         )
 
@@ -30,6 +30,7 @@ from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
     format_sse_event,
     get_request_kwargs,
+    get_stream_encoder,
     get_team_by_id,
     process_audio,
     process_document,
@@ -41,6 +42,7 @@ from agno.run.team import RunErrorEvent as TeamRunErrorEvent
 from agno.team.remote import RemoteTeam
 from agno.team.team import Team
 from agno.utils.log import log_warning, logger
+from agno.utils.sse import DeltaStreamEncoder
 
 if TYPE_CHECKING:
     from agno.os.app import AgentOS
@@ -57,6 +59,7 @@ async def team_response_streamer(
     files: Optional[List[FileMedia]] = None,
     background_tasks: Optional[BackgroundTasks] = None,
     auth_token: Optional[str] = None,
+    encoder: Optional[DeltaStreamEncoder] = None,
     **kwargs: Any,
 ) -> AsyncGenerator:
     """Run the given team asynchronously and yield its response"""
@@ -87,7 +90,7 @@ async def team_response_streamer(
             **kwargs,
         )
         async for run_response_chunk in run_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+            yield format_sse_event(run_response_chunk, encoder)  # type: ignore
     except (InputCheckError, OutputCheckError) as e:
         error_response = TeamRunErrorEvent(
             content=str(e),
@@ -95,7 +98,7 @@ async def team_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event(error_response, encoder)
 
     except BaseException as e:
         import traceback
@@ -106,7 +109,7 @@ async def team_response_streamer(
             error_type=e.type if hasattr(e, "type") else None,
             error_id=e.error_id if hasattr(e, "error_id") else None,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event(error_response, encoder)
         return
 
 
@@ -142,7 +145,8 @@ def get_team_router(
             "- Real-time streaming responses with Server-Sent Events (SSE)\n"
             "- User and session context preservation\n\n"
             "**Streaming Response:**\n"
-            "When `stream=true`, returns SSE events with `event` and `data` fields."
+            "When `stream=true`, returns SSE events with `event` and `data` fields. "
+            "Set `stream_format=delta` to receive content events as compact deltas after the first one of each run."
         ),
         responses={
             200: {
@@ -164,6 +168,7 @@ def get_team_router(
         background_tasks: BackgroundTasks,
         message: str = Form(...),
         stream: bool = Form(True),
+        stream_format: str = Form("full"),
         monitor: bool = Form(True),
         session_id: Optional[str] = Form(None),
         user_id: Optional[str] = Form(None),
@@ -265,6 +270,7 @@ def get_team_router(
 
         # Extract auth token for remote teams
         auth_token = get_auth_token_from_request(request)
+        encoder = get_stream_encoder(stream_format) if stream else None
 
         if stream:
             return StreamingResponse(
@@ -279,6 +285,7 @@ def get_team_router(
                     files=document_files if document_files else None,
                     background_tasks=background_tasks,
                     auth_token=auth_token,
+                    encoder=encoder,
                     **kwargs,
                 ),
                 media_type="text/event-stream",
@@ -5,6 +5,7 @@ from fastapi import Depends, HTTPException, Query, Request
 from fastapi.routing import APIRouter
 
 from agno.db.base import AsyncBaseDb, BaseDb
+from agno.db.utils import get_next_cursor
 from agno.os.auth import get_auth_token_from_request, get_authentication_dependency
 from agno.os.routers.traces.schemas import (
     TraceDetail,
@@ -22,7 +23,7 @@ from agno.os.schema import (
     ValidationErrorResponse,
 )
 from agno.os.settings import AgnoAPISettings
-from agno.os.utils import get_db, timestamp_to_datetime
+from agno.os.utils import get_db, timestamp_to_datetime, validate_cursor
 from agno.remote.base import RemoteDb
 from agno.utils.log import log_error
 
@@ -128,11 +129,17 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
         ),
         page: int = Query(default=1, description="Page number (1-indexed)", ge=0),
         limit: int = Query(default=20, description="Number of traces per page", ge=1),
+        cursor: Optional[str] = Query(
+            default=None, description="Cursor from the previous page's meta.next_cursor. Takes precedence over page"
+        ),
+        count_total: bool = Query(default=True, description="Whether to count all matching traces"),
         db_id: Optional[str] = Query(default=None, description="Database ID to query traces from"),
     ):
         """Get list of traces with optional filters and pagination"""
         import time as time_module
 
+        validate_cursor(cursor)
+
         # Get database using db_id or default to first available
         db = await get_db(dbs, db_id)
 
@@ -151,6 +158,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 end_time=end_time,
                 limit=limit,
                 page=page,
+                cursor=cursor,
+                count_total=count_total,
                 db_id=db_id,
                 headers=headers,
             )
@@ -175,6 +184,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                     end_time=end_time_dt,
                     limit=limit,
                     page=page,
+                    cursor=cursor,
+                    count_total=count_total,
                 )
             else:
                 traces, total_count = db.get_traces(
@@ -189,6 +200,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                     end_time=end_time_dt,
                     limit=limit,
                     page=page,
+                    cursor=cursor,
+                    count_total=count_total,
                 )
 
             end_time_ms = time_module.time() * 1000
@@ -222,6 +235,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                     total_pages=total_pages,
                     total_count=total_count,
                     search_time_ms=search_time_ms,
+                    next_cursor=get_next_cursor([trace.to_dict() for trace in traces], "trace_id", "start_time", limit),
                 ),
             )
 
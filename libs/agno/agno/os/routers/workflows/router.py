@@ -36,12 +36,14 @@ from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
     format_sse_event,
     get_request_kwargs,
+    get_stream_encoder,
     get_workflow_by_id,
 )
 from agno.run.base import RunStatus
 from agno.run.workflow import WorkflowErrorEvent
 from agno.utils.log import log_debug, log_warning, logger
 from agno.utils.serialize import json_serializer
+from agno.utils.sse import DeltaStreamEncoder
 from agno.workflow.remote import RemoteWorkflow
 from agno.workflow.workflow import Workflow
 
@@ -293,6 +295,7 @@ async def workflow_response_streamer(
     user_id: Optional[str] = None,
     background_tasks: Optional[BackgroundTasks] = None,
     auth_token: Optional[str] = None,
+    encoder: Optional[DeltaStreamEncoder] = None,
     **kwargs: Any,
 ) -> AsyncGenerator:
     try:
@@ -319,7 +322,7 @@ async def workflow_response_streamer(
         )
 
         async for run_response_chunk in run_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+            yield format_sse_event(run_response_chunk, encoder)  # type: ignore
 
     except (InputCheckError, OutputCheckError) as e:
         error_response = WorkflowErrorEvent(
@@ -328,7 +331,7 @@ async def workflow_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event(error_response, encoder)
 
     except Exception as e:
         import traceback
@@ -339,7 +342,7 @@ async def workflow_response_streamer(
             error_type=e.type if hasattr(e, "type") else None,
             error_id=e.error_id if hasattr(e, "error_id") else None,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event(error_response, encoder)
         return
 
 
@@ -606,6 +609,7 @@ def get_workflow_router(
             "Execute a workflow with the provided input data. Workflows can run in streaming or batch mode.\n\n"
             "**Execution Modes:**\n"
             "- **Streaming (`stream=true`)**: Real-time step-by-step execution updates via SSE\n"
+            "- **Delta streaming (`stream_format=delta`)**: Content events sent as compact deltas after the first\n"
             "- **Non-Streaming (`stream=false`)**: Complete workflow execution with final result\n\n"
             "**Workflow Execution Process:**\n"
             "1. Input validation against workflow schema\n"
@@ -637,6 +641,7 @@ def get_workflow_router(
         background_tasks: BackgroundTasks,
         message: str = Form(...),
         stream: bool = Form(True),
+        stream_format: str = Form("full"),
         session_id: Optional[str] = Form(None),
         user_id: Optional[str] = Form(None),
         version: Optional[int] = Form(None),
@@ -687,6 +692,7 @@ def get_workflow_router(
 
         # Extract auth token for remote workflows
         auth_token = get_auth_token_from_request(request)
+        encoder = get_stream_encoder(stream_format) if stream else None
 
         # Return based on stream parameter
         try:
@@ -699,6 +705,7 @@ def get_workflow_router(
                         user_id=user_id,
                         background_tasks=background_tasks,
                         auth_token=auth_token,
+                        encoder=encoder,
                         **kwargs,
                     ),
                     media_type="text/event-stream",
@@ -181,6 +181,7 @@ class SessionSchema(BaseModel):
     session_id: str = Field(..., description="Unique identifier for the session")
     session_name: str = Field(..., description="Human-readable name for the session")
     session_state: Optional[dict] = Field(None, description="Current state data of the session")
+    run_count: Optional[int] = Field(None, description="Number of runs in the session")
     created_at: Optional[datetime] = Field(None, description="Timestamp when session was created")
     updated_at: Optional[datetime] = Field(None, description="Timestamp when session was last updated")
 
@@ -217,6 +218,7 @@ class SessionSchema(BaseModel):
             session_id=session.get("session_id", ""),
             session_name=session_name,
             session_state=session_data.get("session_state", None),
+            run_count=session.get("run_count"),
             created_at=created_at,
             updated_at=updated_at,
         )
@@ -550,6 +552,9 @@ class PaginationInfo(BaseModel):
     total_pages: int = Field(0, description="Total number of pages", ge=0)
     total_count: int = Field(0, description="Total count of items", ge=0)
     search_time_ms: float = Field(0, description="Search execution time in milliseconds", ge=0)
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor to pass as `cursor` to get the next page. Only set for cursor-paginated endpoints."
+    )
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
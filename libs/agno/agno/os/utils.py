@@ -9,6 +9,7 @@ from starlette.middleware.cors import CORSMiddleware
 
 from agno.agent import Agent, RemoteAgent
 from agno.db.base import AsyncBaseDb, BaseDb
+from agno.db.utils import decode_cursor
 from agno.knowledge.knowledge import Knowledge
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
@@ -22,6 +23,7 @@ from agno.run.workflow import WorkflowRunOutputEvent
 from agno.team import RemoteTeam, Team
 from agno.tools import Function, Toolkit
 from agno.utils.log import log_warning, logger
+from agno.utils.sse import STREAM_FORMATS, DeltaStreamEncoder
 from agno.workflow import RemoteWorkflow, Workflow
 
 
@@ -161,11 +163,31 @@ async def get_request_kwargs(request: Request, endpoint_func: Callable) -> Dict[
     return kwargs
 
 
-def format_sse_event(event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRunOutputEvent]) -> str:
+def get_stream_encoder(stream_format: Optional[str]) -> Optional[DeltaStreamEncoder]:
+    """Return the encoder for the requested stream format, or None for the default full format.
+
+    Raises:
+        HTTPException: If the stream format is not supported
+    """
+    if stream_format is None or stream_format == "full":
+        return None
+    if stream_format not in STREAM_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid stream_format '{stream_format}'. Must be one of: {', '.join(STREAM_FORMATS)}",
+        )
+    return DeltaStreamEncoder()
+
+
+def format_sse_event(
+    event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRunOutputEvent],
+    encoder: Optional[DeltaStreamEncoder] = None,
+) -> str:
     """Parse JSON data into SSE-compliant format.
 
     Args:
         event_dict: Dictionary containing the event data
+        encoder: Delta stream encoder of the current stream, when the delta stream format was requested
 
     Returns:
         SSE-formatted response:
@@ -178,6 +200,9 @@ def format_sse_event(event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRu
         data: { ... }
         ```
     """
+    if encoder is not None:
+        return encoder.format_sse_event(event)
+
     try:
         # Parse the JSON to extract the event type
         event_type = event.event or "message"
@@ -356,7 +381,9 @@ def get_session_name(session: Dict[str, Any]) -> str:
             if message.get("role") == "user" and message.get("content"):
                 return message["content"]
 
-        run_input = r.get("input")
+        run_input = run_dict.get("input")
+        if isinstance(run_input, dict) and run_input.get("input_content") is not None:
+            return stringify_input_content(run_input["input_content"])
         if run_input is not None:
             return stringify_input_content(run_input)
 
@@ -963,6 +990,23 @@ def timestamp_to_datetime(datetime_str: str, param_name: str = "datetime") -> "d
         )
 
 
+def validate_cursor(cursor: Optional[str]) -> None:
+    """Check that a pagination cursor received from a client can be decoded.
+
+    Args:
+        cursor: The cursor query parameter, if any
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if cursor is None:
+        return
+    try:
+        decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 def format_team_tools(team_tools: List[Union[Function, dict]]):
     formatted_tools: List[Dict] = []
     if team_tools is not None:
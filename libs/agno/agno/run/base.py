@@ -1,6 +1,8 @@
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Type, Union
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -28,36 +30,78 @@ class RunContext:
     output_schema: Optional[Union[Type[BaseModel], Dict[str, Any]]] = None
 
 
+# Fields serialized by dedicated handlers in BaseRunOutputEvent.to_dict
+EVENT_EXCLUDED_FIELDS = frozenset(
+    [
+        "tools",
+        "tool",
+        "metadata",
+        "image",
+        "images",
+        "videos",
+        "audio",
+        "response_audio",
+        "citations",
+        "member_responses",
+        "reasoning_messages",
+        "reasoning_steps",
+        "references",
+        "additional_input",
+        "session_summary",
+        "metrics",
+        "run_input",
+        "requirements",
+        "memories",
+    ]
+)
+
+# Values that asdict() would return unchanged
+_ATOMIC_TYPES = (str, int, float, bool)
+
+
+@lru_cache(maxsize=None)
+def get_event_field_names(cls: type, excluded: FrozenSet[str] = frozenset()) -> Tuple[str, ...]:
+    """Names of the dataclass fields of an event class, minus the excluded ones. Computed once per class."""
+    return tuple(f.name for f in fields(cls) if f.name not in excluded)
+
+
+def _copy_field_value(value: Any) -> Any:
+    """Copy a field value the way dataclasses.asdict() does, skipping the copy for atomic values"""
+    if isinstance(value, _ATOMIC_TYPES) or isinstance(value, Enum):
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if type(value) is list:
+        return [_copy_field_value(v) for v in value]
+    if type(value) is tuple:
+        return tuple(_copy_field_value(v) for v in value)
+    if type(value) is dict:
+        return {_copy_field_value(k): _copy_field_value(v) for k, v in value.items()}
+    return deepcopy(value)
+
+
+def event_fields_to_dict(event: Any, excluded: FrozenSet[str] = frozenset()) -> Dict[str, Any]:
+    """
+    Equivalent of `{k: v for k, v in asdict(event).items() if v is not None and k not in excluded}`,
+    that only visits the fields it keeps instead of deep-copying the whole event first.
+    """
+    _dict: Dict[str, Any] = {}
+    for name in get_event_field_names(event.__class__, excluded):
+        value = getattr(event, name)
+        if value is None:
+            continue
+        if name == "content" and isinstance(value, BaseModel):
+            # Replaced by the model dump in to_dict, no need to copy it
+            _dict[name] = value
+        else:
+            _dict[name] = _copy_field_value(value)
+    return _dict
+
+
 @dataclass
 class BaseRunOutputEvent:
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "tools",
-                "tool",
-                "metadata",
-                "image",
-                "images",
-                "videos",
-                "audio",
-                "response_audio",
-                "citations",
-                "member_responses",
-                "reasoning_messages",
-                "reasoning_steps",
-                "references",
-                "additional_input",
-                "session_summary",
-                "metrics",
-                "run_input",
-                "requirements",
-                "memories",
-            ]
-        }
+        _dict = event_fields_to_dict(self, EVENT_EXCLUDED_FIELDS)
 
         if hasattr(self, "metadata") and self.metadata is not None:
             _dict["metadata"] = self.metadata
@@ -154,7 +198,7 @@ class BaseRunOutputEvent:
     def to_json(self, separators=(", ", ": "), indent: Optional[int] = 2) -> str:
         import json
 
-        from agno.utils.serialize import json_serializer
+        from agno.utils.serialize import dumps_compact_json, json_serializer
 
         try:
             _dict = self.to_dict()
@@ -162,7 +206,9 @@ class BaseRunOutputEvent:
             log_error("Failed to convert response event to json", exc_info=True)
             raise
 
-        if indent is None:
+        if indent is None and tuple(separators) == (",", ":"):
+            return dumps_compact_json(_dict)
+        elif indent is None:
             return json.dumps(_dict, separators=separators, default=json_serializer, ensure_ascii=False)
         else:
             return json.dumps(_dict, indent=indent, separators=separators, default=json_serializer, ensure_ascii=False)
@@ -1,9 +1,22 @@
+from typing import TYPE_CHECKING
+
 from agno.run.cancellation_management.base import BaseRunCancellationManager
 from agno.run.cancellation_management.in_memory_cancellation_manager import InMemoryRunCancellationManager
-from agno.run.cancellation_management.redis_cancellation_manager import RedisRunCancellationManager
+
+if TYPE_CHECKING:
+    from agno.run.cancellation_management.redis_cancellation_manager import RedisRunCancellationManager
 
 __all__ = [
     "BaseRunCancellationManager",
     "InMemoryRunCancellationManager",
     "RedisRunCancellationManager",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy import, so redis is only imported when the Redis cancellation manager is used."""
+    if name == "RedisRunCancellationManager":
+        from agno.run.cancellation_management.redis_cancellation_manager import RedisRunCancellationManager
+
+        return RedisRunCancellationManager
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 
 from agno.media import Audio, Image, Video
 from agno.run.agent import RunEvent, RunOutput, run_output_event_from_dict
-from agno.run.base import BaseRunOutputEvent, RunStatus
+from agno.run.base import BaseRunOutputEvent, RunStatus, event_fields_to_dict
 from agno.run.team import TeamRunEvent, TeamRunOutput, team_run_output_event_from_dict
 from agno.utils.media import (
     reconstruct_audio_list,
@@ -60,6 +60,10 @@ class WorkflowRunEvent(str, Enum):
     custom_event = "CustomEvent"
 
 
+# Fields serialized through their own to_dict in BaseWorkflowRunOutputEvent.to_dict
+WORKFLOW_EVENT_EXCLUDED_FIELDS = frozenset(["step_results", "step_response", "iteration_results", "all_results"])
+
+
 @dataclass
 class BaseWorkflowRunOutputEvent(BaseRunOutputEvent):
     """Base class for all workflow run response events"""
@@ -76,7 +80,7 @@ class BaseWorkflowRunOutputEvent(BaseRunOutputEvent):
     parent_step_id: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {k: v for k, v in asdict(self).items() if v is not None}
+        _dict = event_fields_to_dict(self, WORKFLOW_EVENT_EXCLUDED_FIELDS)
 
         if hasattr(self, "content") and self.content and isinstance(self.content, BaseModel):
             _dict["content"] = self.content.model_dump(exclude_none=True)
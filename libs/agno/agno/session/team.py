@@ -10,6 +10,7 @@ from agno.run.agent import RunOutput, RunStatus
 from agno.run.team import TeamRunOutput
 from agno.session.summary import SessionSummary
 from agno.utils.log import log_debug, log_warning
+from agno.utils.message import get_history_messages
 
 
 @dataclass
@@ -101,8 +102,9 @@ class TeamSession:
         if not self.runs:
             self.runs = []
 
-        for i, existing_run in enumerate(self.runs or []):
-            if existing_run.run_id == run_response.run_id:
+        # The run is usually the latest one, so search from the end
+        for i in range(len(self.runs) - 1, -1, -1):
+            if self.runs[i].run_id == run_response.run_id:
                 self.runs[i] = run_response
                 break
         else:
@@ -137,19 +139,6 @@ class TeamSession:
             A list of Messages belonging to the session.
         """
 
-        def _should_skip_message(
-            message: Message, skip_roles: Optional[List[str]] = None, skip_history_messages: bool = True
-        ) -> bool:
-            """Processes a message for history"""
-            # Skip messages that were tagged as history in previous runs
-            if hasattr(message, "from_history") and message.from_history and skip_history_messages:
-                return True
-
-            # Skip messages with specified role
-            if skip_roles and message.role in skip_roles:
-                return True
-            return False
-
         if member_ids is not None and skip_member_messages:
             log_debug("Member IDs to filter by were provided. The skip_member_messages flag will be ignored.")
             skip_member_messages = False
@@ -160,70 +149,26 @@ class TeamSession:
         if skip_statuses is None:
             skip_statuses = [RunStatus.paused, RunStatus.cancelled, RunStatus.error]
 
-        session_runs = self.runs
-
-        # Filter by team_id and member_ids
-        if team_id:
-            session_runs = [run for run in session_runs if hasattr(run, "team_id") and run.team_id == team_id]  # type: ignore
-        if member_ids:
-            session_runs = [run for run in session_runs if hasattr(run, "agent_id") and run.agent_id in member_ids]  # type: ignore
-
-        if skip_member_messages:
+        def _include_run(run: Union[TeamRunOutput, RunOutput]) -> bool:
+            # Filter by team_id and member_ids
+            if team_id and getattr(run, "team_id", None) != team_id:
+                return False
+            if member_ids and getattr(run, "agent_id", None) not in member_ids:
+                return False
             # Filter for the top-level runs (main team runs or agent runs when sharing session)
-            session_runs = [run for run in session_runs if run.parent_run_id is None]  # type: ignore
-
-        # Filter by status
-        session_runs = [run for run in session_runs if hasattr(run, "status") and run.status not in skip_statuses]  # type: ignore
-
-        messages_from_history = []
-        system_message = None
-
-        # Limit the number of messages returned if limit is set
-        if limit is not None:
-            for run_response in session_runs:
-                if not run_response or not run_response.messages:
-                    continue
-
-                for message in run_response.messages or []:
-                    if _should_skip_message(message, skip_roles, skip_history_messages):
-                        continue
-
-                    if message.role == "system":
-                        # Only add the system message once
-                        if system_message is None:
-                            system_message = message
-                    else:
-                        messages_from_history.append(message)
-
-            if system_message:
-                messages_from_history = [system_message] + messages_from_history[
-                    -(limit - 1) :
-                ]  # Grab one less message then add the system message
-            else:
-                messages_from_history = messages_from_history[-limit:]
-
-            # Remove tool result messages that don't have an associated assistant message with tool calls
-            while len(messages_from_history) > 0 and messages_from_history[0].role == "tool":
-                messages_from_history.pop(0)
-        else:
-            # Filter by last_n runs
-            runs_to_process = session_runs[-last_n_runs:] if last_n_runs is not None else session_runs
-
-            for run_response in runs_to_process:
-                if not (run_response and run_response.messages):
-                    continue
-
-                for message in run_response.messages or []:
-                    if _should_skip_message(message, skip_roles, skip_history_messages):
-                        continue
-
-                    if message.role == "system":
-                        # Only add the system message once
-                        if system_message is None:
-                            system_message = message
-                            messages_from_history.append(system_message)
-                    else:
-                        messages_from_history.append(message)
+            if skip_member_messages and run.parent_run_id is not None:
+                return False
+            # Filter by status
+            return hasattr(run, "status") and run.status not in skip_statuses  # type: ignore
+
+        messages_from_history = get_history_messages(
+            self.runs,
+            _include_run,
+            last_n_runs=last_n_runs,
+            limit=limit,
+            skip_roles=skip_roles,
+            skip_history_messages=skip_history_messages,
+        )
 
         log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
         return messages_from_history
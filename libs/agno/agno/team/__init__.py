@@ -1,22 +1,26 @@
-from agno.run.team import (
-    MemoryUpdateCompletedEvent,
-    MemoryUpdateStartedEvent,
-    ReasoningCompletedEvent,
-    ReasoningStartedEvent,
-    ReasoningStepEvent,
-    RunCancelledEvent,
-    RunCompletedEvent,
-    RunContentEvent,
-    RunErrorEvent,
-    RunStartedEvent,
-    TeamRunEvent,
-    TeamRunOutput,
-    TeamRunOutputEvent,
-    ToolCallCompletedEvent,
-    ToolCallStartedEvent,
-)
-from agno.team.remote import RemoteTeam
-from agno.team.team import Team, get_team_by_id, get_teams
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agno.run.team import (
+        MemoryUpdateCompletedEvent,
+        MemoryUpdateStartedEvent,
+        ReasoningCompletedEvent,
+        ReasoningStartedEvent,
+        ReasoningStepEvent,
+        RunCancelledEvent,
+        RunCompletedEvent,
+        RunContentEvent,
+        RunErrorEvent,
+        RunStartedEvent,
+        TeamRunEvent,
+        TeamRunOutput,
+        TeamRunOutputEvent,
+        ToolCallCompletedEvent,
+        ToolCallStartedEvent,
+    )
+    from agno.team.remote import RemoteTeam
+    from agno.team.team import Team, get_team_by_id, get_teams
 
 __all__ = [
     "Team",
@@ -39,3 +43,37 @@ __all__ = [
     "get_team_by_id",
     "get_teams",
 ]
+
+# Module each name is imported from on first access
+_LAZY_IMPORTS = {
+    "Team": "agno.team.team",
+    "get_team_by_id": "agno.team.team",
+    "get_teams": "agno.team.team",
+    "RemoteTeam": "agno.team.remote",
+    "TeamRunOutput": "agno.run.team",
+    "TeamRunOutputEvent": "agno.run.team",
+    "TeamRunEvent": "agno.run.team",
+    "RunContentEvent": "agno.run.team",
+    "RunCancelledEvent": "agno.run.team",
+    "RunErrorEvent": "agno.run.team",
+    "RunStartedEvent": "agno.run.team",
+    "RunCompletedEvent": "agno.run.team",
+    "MemoryUpdateStartedEvent": "agno.run.team",
+    "MemoryUpdateCompletedEvent": "agno.run.team",
+    "ReasoningStartedEvent": "agno.run.team",
+    "ReasoningStepEvent": "agno.run.team",
+    "ReasoningCompletedEvent": "agno.run.team",
+    "ToolCallStartedEvent": "agno.run.team",
+    "ToolCallCompletedEvent": "agno.run.team",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import, so importing agno.team (e.g. for its run events) does not load the Team and its dependencies."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(import_module(module_path), name)
+    # Cached, so later accesses do not go through __getattr__
+    globals()[name] = value
+    return value
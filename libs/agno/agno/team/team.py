@@ -8,8 +8,10 @@ from collections import ChainMap, deque
 from concurrent.futures import Future
 from copy import copy
 from dataclasses import dataclass
+from importlib import import_module
 from os import getenv
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -32,28 +34,22 @@ from uuid import uuid4
 from pydantic import BaseModel
 
 from agno.agent import Agent
-from agno.compression.manager import CompressionManager
 from agno.db.base import AsyncBaseDb, BaseDb, ComponentType, SessionType, UserMemory
 from agno.db.utils import db_from_dict
-from agno.eval.base import BaseEval
 from agno.exceptions import (
     InputCheckError,
     OutputCheckError,
     RunCancelledException,
 )
 from agno.filters import FilterExpr
-from agno.guardrails import BaseGuardrail
-from agno.knowledge.protocol import KnowledgeProtocol
 from agno.knowledge.types import KnowledgeFilter
 from agno.media import Audio, File, Image, Video
-from agno.memory import MemoryManager
 from agno.models.base import Model
 from agno.models.message import Message, MessageReferences
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent
 from agno.models.utils import get_model
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
-from agno.registry.registry import Registry
 from agno.run import RunContext, RunStatus
 from agno.run.agent import RunEvent, RunOutput, RunOutputEvent
 from agno.run.cancel import (
@@ -104,6 +100,8 @@ from agno.utils.agent import (
     get_session_metrics_util,
     get_session_name_util,
     get_session_state_util,
+    load_media_into_messages,
+    offload_media_from_run_output,
     scrub_history_messages_from_run_output,
     scrub_media_from_run_output,
     scrub_tool_results_from_run_output,
@@ -115,7 +113,8 @@ from agno.utils.agent import (
     wait_for_open_threads,
     wait_for_thread_tasks_stream,
 )
-from agno.utils.common import is_typed_dict
+from agno.utils.common import LazyAnnotations, is_typed_dict
+from agno.utils.context_assembly import ContextAssembly
 from agno.utils.events import (
     add_team_error_event,
     create_team_compression_completed_event,
@@ -166,12 +165,6 @@ from agno.utils.log import (
 )
 from agno.utils.merge_dict import merge_dictionaries
 from agno.utils.message import filter_tool_calls, get_text_from_message
-from agno.utils.print_response.team import (
-    aprint_response,
-    aprint_response_stream,
-    print_response,
-    print_response_stream,
-)
 from agno.utils.reasoning import (
     add_reasoning_metrics_to_metadata,
     add_reasoning_step_to_metadata,
@@ -195,6 +188,49 @@ from agno.utils.team import (
 )
 from agno.utils.timer import Timer
 
+# Optional subsystems are imported on first use, so that importing the Team stays fast
+if TYPE_CHECKING:
+    from agno.compression.manager import CompressionManager
+    from agno.db.session_writer import SessionWriter
+    from agno.eval.base import BaseEval
+    from agno.guardrails import BaseGuardrail
+    from agno.knowledge.protocol import KnowledgeProtocol
+    from agno.media_store import MediaStore
+    from agno.memory import MemoryManager
+    from agno.registry.registry import Registry
+
+# Module each of the names above is imported from on first access
+_LAZY_IMPORTS = {
+    "CompressionManager": "agno.compression.manager",
+    "SessionWriter": "agno.db.session_writer",
+    "BaseEval": "agno.eval.base",
+    "BaseGuardrail": "agno.guardrails",
+    "KnowledgeProtocol": "agno.knowledge.protocol",
+    "MediaStore": "agno.media_store",
+    "MemoryManager": "agno.memory",
+    "Registry": "agno.registry.registry",
+}
+
+
+def __getattr__(name: str):
+    """
+    Lazy import of the optional subsystems used in annotations, e.g. agno.team.team.MemoryManager.
+    """
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(import_module(module_path), name)
+    # Cached, so later accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def _import_lazy_names() -> None:
+    """Import every lazy name, so typing.get_type_hints() can resolve the annotations of the Team."""
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
 
 @dataclass(init=False)
 class Team:
@@ -249,6 +285,8 @@ class Team:
     overwrite_db_session_state: bool = False
     # If True, cache the current Team session in memory for faster access
     cache_session: bool = False
+    # Write the session to the database in the background, off the critical path of runs
+    session_writer: Optional["SessionWriter"] = None
 
     # Add this flag to control if the workflow should send the team history to the members. This means sending the team-level history to the members, not the agent-level history.
     add_team_history_to_members: bool = False
@@ -350,6 +388,8 @@ class Team:
     send_media_to_model: bool = True
     # If True, store media in run output
     store_media: bool = True
+    # Store media content here and persist references in the session instead of inline base64
+    media_store: Optional[MediaStore] = None
     # If True, store tool results in run output
     store_tool_messages: bool = True
     # If True, store history messages in run output
@@ -501,6 +541,7 @@ class Team:
         overwrite_db_session_state: bool = False,
         resolve_in_context: bool = True,
         cache_session: bool = False,
+        session_writer: Optional["SessionWriter"] = None,
         add_team_history_to_members: bool = False,
         num_team_history_runs: int = 3,
         search_session_history: Optional[bool] = False,
@@ -535,6 +576,7 @@ class Team:
         add_search_knowledge_instructions: bool = True,
         read_chat_history: bool = False,
         store_media: bool = True,
+        media_store: Optional[MediaStore] = None,
         store_tool_messages: bool = True,
         store_history_messages: bool = True,
         send_media_to_model: bool = True,
@@ -607,6 +649,7 @@ class Team:
         self.overwrite_db_session_state = overwrite_db_session_state
         self.resolve_in_context = resolve_in_context
         self.cache_session = cache_session
+        self.session_writer = session_writer
 
         self.add_history_to_context = add_history_to_context
         self.num_history_runs = num_history_runs
@@ -660,6 +703,7 @@ class Team:
         self.read_chat_history = read_chat_history
 
         self.store_media = store_media
+        self.media_store = media_store
         self.store_tool_messages = store_tool_messages
         self.store_history_messages = store_history_messages
         self.send_media_to_model = send_media_to_model
@@ -874,6 +918,8 @@ class Team:
             log_warning("Database not provided. Memories will not be stored.")
 
         if self.memory_manager is None:
+            from agno.memory import MemoryManager
+
             self.memory_manager = MemoryManager(model=self.model, db=self.db)
         else:
             if self.memory_manager.model is None:
@@ -901,6 +947,8 @@ class Team:
 
     def _set_compression_manager(self) -> None:
         if self.compress_tool_results and self.compression_manager is None:
+            from agno.compression.manager import CompressionManager
+
             self.compression_manager = CompressionManager(
                 model=self.model,
             )
@@ -1474,11 +1522,17 @@ class Team:
         log_debug(f"Team Run Start: {run_response.run_id}", center=True)
 
         memory_future = None
+        context_assembly: Optional[ContextAssembly] = None
         try:
             # Set up retry logic
             num_attempts = self.retries + 1
             for attempt in range(num_attempts):
                 try:
+                    # Start reading the context for the system message, concurrently with the run setup
+                    if context_assembly is not None:
+                        context_assembly.cancel()
+                    context_assembly = self._start_context_assembly(run_context=run_context)
+
                     # 1. Execute pre-hooks
                     run_input = cast(TeamRunInput, run_response.input)
                     self.model = cast(Model, self.model)
@@ -1538,8 +1592,10 @@ class Team:
                         add_dependencies_to_context=add_dependencies_to_context,
                         add_session_state_to_context=add_session_state_to_context,
                         tools=_tools,
+                        context_assembly=context_assembly,
                         **kwargs,
                     )
+                    self._record_context_assembly(run_response, context_assembly)
                     if len(run_messages.messages) == 0:
                         log_error("No messages to be sent to the model.")
 
@@ -1691,6 +1747,8 @@ class Team:
 
                     return run_response
         finally:
+            if context_assembly is not None:
+                context_assembly.cancel()
             # Cancel background futures on error (wait_for_open_threads handles waiting on success)
             if memory_future is not None and not memory_future.done():
                 memory_future.cancel()
@@ -1733,6 +1791,7 @@ class Team:
         log_debug(f"Team Run Start: {run_response.run_id}", center=True)
 
         memory_future = None
+        context_assembly: Optional[ContextAssembly] = None
         try:
             # Set up retry logic
             num_attempts = self.retries + 1
@@ -1741,6 +1800,11 @@ class Team:
                     log_debug(f"Retrying Team run {run_response.run_id}. Attempt {attempt + 1} of {num_attempts}...")
 
                 try:
+                    # Start reading the context for the system message, concurrently with the run setup
+                    if context_assembly is not None:
+                        context_assembly.cancel()
+                    context_assembly = self._start_context_assembly(run_context=run_context)
+
                     # 1. Execute pre-hooks
                     run_input = cast(TeamRunInput, run_response.input)
                     self.model = cast(Model, self.model)
@@ -1801,8 +1865,10 @@ class Team:
                         add_dependencies_to_context=add_dependencies_to_context,
                         add_session_state_to_context=add_session_state_to_context,
                         tools=_tools,
+                        context_assembly=context_assembly,
                         **kwargs,
                     )
+                    self._record_context_assembly(run_response, context_assembly)
                     if len(run_messages.messages) == 0:
                         log_error("No messages to be sent to the model.")
 
@@ -2046,6 +2112,8 @@ class Team:
                     self._cleanup_and_store(run_response=run_response, session=session)
                     yield run_error
         finally:
+            if context_assembly is not None:
+                context_assembly.cancel()
             # Cancel background futures on error (wait_for_thread_tasks_stream handles waiting on success)
             if memory_future is not None and not memory_future.done():
                 memory_future.cancel()
@@ -2351,6 +2419,7 @@ class Team:
         await aregister_run(run_context.run_id)
         log_debug(f"Team Run Start: {run_response.run_id}", center=True)
         memory_task = None
+        context_assembly: Optional[ContextAssembly] = None
 
         try:
             # Set up retry logic
@@ -2360,6 +2429,11 @@ class Team:
                     log_debug(f"Retrying Team run {run_response.run_id}. Attempt {attempt + 1} of {num_attempts}...")
 
                 try:
+                    # Start reading the context for the system message, concurrently with the run setup
+                    if context_assembly is not None:
+                        context_assembly.cancel()
+                    context_assembly = self._astart_context_assembly(run_context=run_context)
+
                     if run_context.dependencies is not None:
                         await self._aresolve_run_dependencies(run_context=run_context)
 
@@ -2444,8 +2518,10 @@ class Team:
                         add_dependencies_to_context=add_dependencies_to_context,
                         add_session_state_to_context=add_session_state_to_context,
                         tools=_tools,
+                        context_assembly=context_assembly,
                         **kwargs,
                     )
+                    self._record_context_assembly(run_response, context_assembly)
 
                     self.model = cast(Model, self.model)
 
@@ -2602,6 +2678,8 @@ class Team:
 
                     return run_response
         finally:
+            if context_assembly is not None:
+                context_assembly.cancel()
             # Always disconnect connectable tools
             self._disconnect_connectable_tools()
             await self._disconnect_mcp_tools()
@@ -2657,6 +2735,7 @@ class Team:
         await aregister_run(run_context.run_id)
 
         memory_task = None
+        context_assembly: Optional[ContextAssembly] = None
 
         try:
             # Set up retry logic
@@ -2666,6 +2745,11 @@ class Team:
                     log_debug(f"Retrying Team run {run_response.run_id}. Attempt {attempt + 1} of {num_attempts}...")
 
                 try:
+                    # Start reading the context for the system message, concurrently with the run setup
+                    if context_assembly is not None:
+                        context_assembly.cancel()
+                    context_assembly = self._astart_context_assembly(run_context=run_context)
+
                     # 1. Resolve dependencies
                     if run_context.dependencies is not None:
                         await self._aresolve_run_dependencies(run_context=run_context)
@@ -2750,8 +2834,10 @@ class Team:
                         add_dependencies_to_context=add_dependencies_to_context,
                         add_session_state_to_context=add_session_state_to_context,
                         tools=_tools,
+                        context_assembly=context_assembly,
                         **kwargs,
                     )
+                    self._record_context_assembly(run_response, context_assembly)
 
                     # 7. Start memory creation in background task
                     memory_task = await self._astart_memory_task(
@@ -2995,6 +3081,8 @@ class Team:
                     yield run_error
 
         finally:
+            if context_assembly is not None:
+                context_assembly.cancel()
             # Always disconnect connectable tools
             self._disconnect_connectable_tools()
             await self._disconnect_mcp_tools()
@@ -4036,8 +4124,11 @@ class Team:
         if run_response.metrics:
             run_response.metrics.stop_timer()
 
-        # Add RunOutput to Agent Session
-        session.upsert_run(run_response=run_response)
+        # Add RunOutput to Agent Session, storing its media in the media store if set
+        if self.media_store is not None:
+            session.upsert_run(run_response=offload_media_from_run_output(run_response, self.media_store))
+        else:
+            session.upsert_run(run_response=run_response)
 
         # Calculate session metrics
         self._update_session_metrics(session=session, run_response=run_response)
@@ -4053,8 +4144,11 @@ class Team:
         if run_response.metrics:
             run_response.metrics.stop_timer()
 
-        # Add RunOutput to Agent Session
-        session.upsert_run(run_response=run_response)
+        # Add RunOutput to Agent Session, storing its media in the media store if set
+        if self.media_store is not None:
+            session.upsert_run(run_response=offload_media_from_run_output(run_response, self.media_store))
+        else:
+            session.upsert_run(run_response=run_response)
 
         # Calculate session metrics
         self._update_session_metrics(session=session, run_response=run_response)
@@ -4619,6 +4713,8 @@ class Team:
         if show_member_responses is None:
             show_member_responses = self.show_members_responses
 
+        from agno.utils.print_response.team import print_response, print_response_stream
+
         if stream:
             print_response_stream(
                 team=self,
@@ -4724,6 +4820,8 @@ class Team:
         if show_member_responses is None:
             show_member_responses = self.show_members_responses
 
+        from agno.utils.print_response.team import aprint_response, aprint_response_stream
+
         if stream:
             await aprint_response_stream(
                 team=self,
@@ -5439,12 +5537,10 @@ class Team:
                     if name in _function_names:
                         continue
                     _function_names.append(name)
-                    _func = _func.model_copy(deep=True)
-
-                    _func._team = self
                     # Respect the function's explicit strict setting if set
                     effective_strict = strict if _func.strict is None else _func.strict
-                    _func.process_entrypoint(strict=effective_strict)
+                    _func = _func.get_processed_copy(strict=effective_strict)
+                    _func._team = self
                     if strict and _func.strict is None:
                         _func.strict = True
                     if self.tool_hooks:
@@ -5462,11 +5558,10 @@ class Team:
                 if tool.name in _function_names:
                     continue
                 _function_names.append(tool.name)
-                tool = tool.model_copy(deep=True)
-                tool._team = self
                 # Respect the function's explicit strict setting if set
                 effective_strict = strict if tool.strict is None else tool.strict
-                tool.process_entrypoint(strict=effective_strict)
+                tool = tool.get_processed_copy(strict=effective_strict)
+                tool._team = self
                 if strict and tool.strict is None:
                     tool.strict = True
                 if self.tool_hooks:
@@ -5483,8 +5578,7 @@ class Team:
             elif callable(tool):
                 # We add the tools, which are callable functions
                 try:
-                    _func = Function.from_callable(tool, strict=strict)
-                    _func = _func.model_copy(deep=True)
+                    _func = Function.from_callable_cached(tool, strict=strict)
                     if _func.name in _function_names:
                         continue
                     _function_names.append(_func.name)
@@ -5561,6 +5655,83 @@ class Team:
 
         return system_message_content
 
+    def _start_context_assembly(self, run_context: RunContext) -> ContextAssembly:
+        """Start reading the memories for the system message.
+
+        They don't depend on the pre-hooks or tools, so they are read concurrently with those.
+        """
+        context_assembly = ContextAssembly()
+        if self.system_message is not None or not self.add_memories_to_context:
+            return context_assembly
+
+        memory_manager = self.memory_manager
+        if memory_manager is None:
+            from agno.memory import MemoryManager
+
+            memory_manager = MemoryManager(model=self.model, db=self.db)
+        user_id = run_context.user_id or "default"
+        context_assembly.add("memories", lambda: memory_manager.get_user_memories(user_id=user_id))
+        return context_assembly
+
+    def _astart_context_assembly(self, run_context: RunContext) -> ContextAssembly:
+        """Start reading the memories for the system message.
+
+        They don't depend on the session, pre-hooks or tools, so they are read concurrently with those.
+        """
+        context_assembly = ContextAssembly()
+        if self.system_message is not None or not self.add_memories_to_context:
+            return context_assembly
+
+        memory_manager = self.memory_manager
+        if memory_manager is None:
+            from agno.memory import MemoryManager
+
+            memory_manager = MemoryManager(model=self.model, db=self.db)
+        user_id = run_context.user_id or "default"
+        if self._has_async_db():
+            context_assembly.aadd("memories", lambda: memory_manager.aget_user_memories(user_id=user_id))
+        else:
+            context_assembly.add("memories", lambda: memory_manager.get_user_memories(user_id=user_id))
+        return context_assembly
+
+    def _start_knowledge_search(
+        self, context_assembly: ContextAssembly, input_message: Any, run_context: RunContext, **kwargs: Any
+    ) -> None:
+        """Start searching the knowledge for references to add to the user message, while the system message is built."""
+        if not (self.add_knowledge_to_context and isinstance(input_message, str)):
+            return
+        context_assembly.add(
+            "knowledge",
+            lambda: self.get_relevant_docs_from_knowledge(
+                query=input_message, filters=run_context.knowledge_filters, run_context=run_context, **kwargs
+            ),
+        )
+
+    def _astart_knowledge_search(
+        self, context_assembly: ContextAssembly, input_message: Any, run_context: RunContext, **kwargs: Any
+    ) -> None:
+        """Start searching the knowledge for references to add to the user message, while the system message is built."""
+        if not (self.add_knowledge_to_context and isinstance(input_message, str)):
+            return
+        context_assembly.aadd(
+            "knowledge",
+            lambda: self.aget_relevant_docs_from_knowledge(
+                query=input_message, filters=run_context.knowledge_filters, run_context=run_context, **kwargs
+            ),
+        )
+
+    def _record_context_assembly(self, run_response: TeamRunOutput, context_assembly: ContextAssembly) -> None:
+        """Add the time spent in each stage of the context assembly to the run metrics."""
+        if not context_assembly.timings:
+            return
+        if run_response.metrics is None:
+            run_response.metrics = Metrics()
+        if run_response.metrics.additional_metrics is None:
+            run_response.metrics.additional_metrics = {}
+        run_response.metrics.additional_metrics["context_assembly"] = {
+            name: round(elapsed, 4) for name, elapsed in context_assembly.timings.items()
+        }
+
     def get_system_message(
         self,
         session: TeamSession,
@@ -5571,6 +5742,7 @@ class Team:
         files: Optional[Sequence[File]] = None,
         tools: Optional[List[Union[Function, dict]]] = None,
         add_session_state_to_context: Optional[bool] = None,
+        context_assembly: Optional[ContextAssembly] = None,
     ) -> Optional[Message]:
         """Get the system message for the team.
 
@@ -5737,10 +5909,13 @@ class Team:
             _memory_manager_not_set = False
             if not user_id:
                 user_id = "default"
-            if self.memory_manager is None:
-                self._set_memory_manager()
-                _memory_manager_not_set = True
-            user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
+            if context_assembly is not None and context_assembly.has("memories"):
+                user_memories = context_assembly.result("memories")
+            else:
+                if self.memory_manager is None:
+                    self._set_memory_manager()
+                    _memory_manager_not_set = True
+                user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
             if user_memories and len(user_memories) > 0:
                 system_message_content += "You have access to user info and preferences from previous interactions that you can use to personalize your response:\n\n"
                 system_message_content += "<memories_from_previous_interactions>"
@@ -5872,6 +6047,7 @@ class Team:
         files: Optional[Sequence[File]] = None,
         tools: Optional[List[Union[Function, dict]]] = None,
         add_session_state_to_context: Optional[bool] = None,
+        context_assembly: Optional[ContextAssembly] = None,
     ) -> Optional[Message]:
         """Get the system message for the team."""
 
@@ -6033,14 +6209,17 @@ class Team:
             _memory_manager_not_set = False
             if not user_id:
                 user_id = "default"
-            if self.memory_manager is None:
-                self._set_memory_manager()
-                _memory_manager_not_set = True
-
-            if self._has_async_db():
-                user_memories = await self.memory_manager.aget_user_memories(user_id=user_id)  # type: ignore
+            if context_assembly is not None and context_assembly.has("memories"):
+                user_memories = await context_assembly.aresult("memories")
             else:
-                user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
+                if self.memory_manager is None:
+                    self._set_memory_manager()
+                    _memory_manager_not_set = True
+
+                if self._has_async_db():
+                    user_memories = await self.memory_manager.aget_user_memories(user_id=user_id)  # type: ignore
+                else:
+                    user_memories = self.memory_manager.get_user_memories(user_id=user_id)  # type: ignore
 
             if user_memories and len(user_memories) > 0:
                 system_message_content += "You have access to user info and preferences from previous interactions that you can use to personalize your response:\n\n"
@@ -6182,6 +6361,7 @@ class Team:
         add_dependencies_to_context: Optional[bool] = None,
         add_session_state_to_context: Optional[bool] = None,
         tools: Optional[List[Union[Function, dict]]] = None,
+        context_assembly: Optional[ContextAssembly] = None,
         **kwargs: Any,
     ) -> RunMessages:
         """This function returns a RunMessages object with the following attributes:
@@ -6200,6 +6380,12 @@ class Team:
         # Initialize the RunMessages object
         run_messages = RunMessages()
 
+        # Search the knowledge for the user message while the system message is built
+        if context_assembly is not None:
+            self._start_knowledge_search(
+                context_assembly, input_message=input_message, run_context=run_context, user_id=user_id, **kwargs
+            )
+
         # 1. Add system message to run_messages
         system_message = self.get_system_message(
             session=session,
@@ -6210,6 +6396,7 @@ class Team:
             files=files,
             add_session_state_to_context=add_session_state_to_context,
             tools=tools,
+            context_assembly=context_assembly,
         )
         if system_message is not None:
             run_messages.system_message = system_message
@@ -6244,8 +6431,6 @@ class Team:
 
         # 3. Add history to run_messages
         if add_history_to_context:
-            from copy import deepcopy
-
             # Only skip messages from history when system_message_role is NOT a standard conversation role.
             # Standard conversation roles ("user", "assistant", "tool") should never be filtered
             # to preserve conversation continuity.
@@ -6261,17 +6446,19 @@ class Team:
             )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Tag shallow copies of the history messages as coming from history. Copies share their content, and
+                # nested objects such as media, with the messages of the stored runs, so they must only be changed by
+                # assigning fields. Shared objects are replaced by changed copies, never mutated in place
+                history_copy = [msg.model_copy(update={"from_history": True}) for msg in history]
 
                 # Filter tool calls from history messages
                 if self.max_tool_calls_from_history is not None:
                     filter_tool_calls(history_copy, self.max_tool_calls_from_history)
 
+                # Only the media of the history window are read from the media store, into copies of the media
+                if self.media_store is not None:
+                    load_media_into_messages(history_copy, self.media_store)
+
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
                 # Extend the messages with the history
@@ -6289,6 +6476,7 @@ class Team:
             videos=videos,
             files=files,
             add_dependencies_to_context=add_dependencies_to_context,
+            context_assembly=context_assembly,
             **kwargs,
         )
         # Add user message to run_messages
@@ -6314,6 +6502,7 @@ class Team:
         add_dependencies_to_context: Optional[bool] = None,
         add_session_state_to_context: Optional[bool] = None,
         tools: Optional[List[Union[Function, dict]]] = None,
+        context_assembly: Optional[ContextAssembly] = None,
         **kwargs: Any,
     ) -> RunMessages:
         """This function returns a RunMessages object with the following attributes:
@@ -6332,6 +6521,12 @@ class Team:
         # Initialize the RunMessages object
         run_messages = RunMessages()
 
+        # Search the knowledge for the user message while the system message is built
+        if context_assembly is not None:
+            self._astart_knowledge_search(
+                context_assembly, input_message=input_message, run_context=run_context, user_id=user_id, **kwargs
+            )
+
         # 1. Add system message to run_messages
         system_message = await self.aget_system_message(
             session=session,
@@ -6342,6 +6537,7 @@ class Team:
             files=files,
             add_session_state_to_context=add_session_state_to_context,
             tools=tools,
+            context_assembly=context_assembly,
         )
         if system_message is not None:
             run_messages.system_message = system_message
@@ -6376,8 +6572,6 @@ class Team:
 
         # 3. Add history to run_messages
         if add_history_to_context:
-            from copy import deepcopy
-
             # Only skip messages from history when system_message_role is NOT a standard conversation role.
             # Standard conversation roles ("user", "assistant", "tool") should never be filtered
             # to preserve conversation continuity.
@@ -6392,17 +6586,19 @@ class Team:
             )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Tag shallow copies of the history messages as coming from history. Copies share their content, and
+                # nested objects such as media, with the messages of the stored runs, so they must only be changed by
+                # assigning fields. Shared objects are replaced by changed copies, never mutated in place
+                history_copy = [msg.model_copy(update={"from_history": True}) for msg in history]
 
                 # Filter tool calls from history messages
                 if self.max_tool_calls_from_history is not None:
                     filter_tool_calls(history_copy, self.max_tool_calls_from_history)
 
+                # Only the media of the history window are read from the media store, into copies of the media
+                if self.media_store is not None:
+                    load_media_into_messages(history_copy, self.media_store)
+
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
                 # Extend the messages with the history
@@ -6420,6 +6616,7 @@ class Team:
             videos=videos,
             files=files,
             add_dependencies_to_context=add_dependencies_to_context,
+            context_assembly=context_assembly,
             **kwargs,
         )
         # Add user message to run_messages
@@ -6440,6 +6637,7 @@ class Team:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         add_dependencies_to_context: Optional[bool] = None,
+        context_assembly: Optional[ContextAssembly] = None,
         **kwargs,
     ):
         # Get references from the knowledge base to use in the user message
@@ -6520,26 +6718,32 @@ class Team:
                         raise Exception("input must be a string or a callable when add_references is True")
 
                     try:
-                        retrieval_timer = Timer()
-                        retrieval_timer.start()
-                        docs_from_knowledge = self.get_relevant_docs_from_knowledge(
-                            query=user_msg_content,
-                            filters=run_context.knowledge_filters,
-                            run_context=run_context,
-                            **kwargs,
-                        )
+                        if context_assembly is not None and context_assembly.has("knowledge"):
+                            # The search started with the run messages
+                            docs_from_knowledge = context_assembly.result("knowledge")
+                            retrieval_time = context_assembly.timings["knowledge"]
+                        else:
+                            retrieval_timer = Timer()
+                            retrieval_timer.start()
+                            docs_from_knowledge = self.get_relevant_docs_from_knowledge(
+                                query=user_msg_content,
+                                filters=run_context.knowledge_filters,
+                                run_context=run_context,
+                                **kwargs,
+                            )
+                            retrieval_timer.stop()
+                            retrieval_time = retrieval_timer.elapsed
                         if docs_from_knowledge is not None:
                             references = MessageReferences(
                                 query=user_msg_content,
                                 references=docs_from_knowledge,
-                                time=round(retrieval_timer.elapsed, 4),
+                                time=round(retrieval_time, 4),
                             )
                             # Add the references to the run_response
                             if run_response.references is None:
                                 run_response.references = []
                             run_response.references.append(references)
-                        retrieval_timer.stop()
-                        log_debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+                        log_debug(f"Time to get references: {retrieval_time:.4f}s")
                     except Exception as e:
                         log_warning(f"Failed to get references: {e}")
 
@@ -6594,6 +6798,7 @@ class Team:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         add_dependencies_to_context: Optional[bool] = None,
+        context_assembly: Optional[ContextAssembly] = None,
         **kwargs,
     ):
         # Get references from the knowledge base to use in the user message
@@ -6674,26 +6879,32 @@ class Team:
                         raise Exception("input must be a string or a callable when add_references is True")
 
                     try:
-                        retrieval_timer = Timer()
-                        retrieval_timer.start()
-                        docs_from_knowledge = await self.aget_relevant_docs_from_knowledge(
-                            query=user_msg_content,
-                            filters=run_context.knowledge_filters,
-                            run_context=run_context,
-                            **kwargs,
-                        )
+                        if context_assembly is not None and context_assembly.has("knowledge"):
+                            # The search started with the run messages
+                            docs_from_knowledge = await context_assembly.aresult("knowledge")
+                            retrieval_time = context_assembly.timings["knowledge"]
+                        else:
+                            retrieval_timer = Timer()
+                            retrieval_timer.start()
+                            docs_from_knowledge = await self.aget_relevant_docs_from_knowledge(
+                                query=user_msg_content,
+                                filters=run_context.knowledge_filters,
+                                run_context=run_context,
+                                **kwargs,
+                            )
+                            retrieval_timer.stop()
+                            retrieval_time = retrieval_timer.elapsed
                         if docs_from_knowledge is not None:
                             references = MessageReferences(
                                 query=user_msg_content,
                                 references=docs_from_knowledge,
-                                time=round(retrieval_timer.elapsed, 4),
+                                time=round(retrieval_time, 4),
                             )
                             # Add the references to the run_response
                             if run_response.references is None:
                                 run_response.references = []
                             run_response.references.append(references)
-                        retrieval_timer.stop()
-                        log_debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+                        log_debug(f"Time to get references: {retrieval_time:.4f}s")
                     except Exception as e:
                         log_warning(f"Failed to get references: {e}")
 
@@ -6988,7 +7199,7 @@ class Team:
             Returns:
                 str: A string indicating the status of the update.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = self.memory_manager.update_memory_task(task=task, user_id=user_id)
             return response
 
@@ -7004,7 +7215,7 @@ class Team:
             Returns:
                 str: A string indicating the status of the update.
             """
-            self.memory_manager = cast(MemoryManager, self.memory_manager)
+            self.memory_manager = cast("MemoryManager", self.memory_manager)
             response = await self.memory_manager.aupdate_memory_task(task=task, user_id=user_id)
             return response
 
@@ -7240,8 +7451,6 @@ class Team:
             return Function.from_callable(get_previous_session_messages, name="get_previous_session_messages")
 
     def _get_history_for_member_agent(self, session: TeamSession, member_agent: Union[Agent, "Team"]) -> List[Message]:
-        from copy import deepcopy
-
         log_debug(f"Adding messages from history for {member_agent.name}")
 
         member_agent_id = member_agent.id if isinstance(member_agent, Agent) else None
@@ -7264,12 +7473,12 @@ class Team:
         )
 
         if len(history) > 0:
-            # Create a deep copy of the history messages to avoid modifying the original messages
-            history_copy = [deepcopy(msg) for msg in history]
-
-            # Tag each message as coming from history
-            for _msg in history_copy:
-                _msg.from_history = True
+            # Tag shallow copies of the history messages as coming from history. Copies share their content, and
+            # nested objects such as media, with the messages of the stored runs, so they must only be changed by
+            # assigning fields. Shared objects are replaced by changed copies, never mutated in place
+            history_copy = [msg.model_copy(update={"from_history": True}) for msg in history]
+            if self.media_store is not None:
+                load_media_into_messages(history_copy, self.media_store)
 
             return history_copy
         return []
@@ -7454,7 +7663,10 @@ class Team:
                     member_agent._scrub_run_output_for_storage(member_agent_run_response)  # type: ignore
 
                 # Add the member run to the team session
-                session.upsert_run(member_agent_run_response)
+                if self.media_store is not None:
+                    session.upsert_run(offload_media_from_run_output(member_agent_run_response, self.media_store))
+                else:
+                    session.upsert_run(member_agent_run_response)
 
             # Update team session state
             merge_dictionaries(run_context.session_state, member_session_state_copy)  # type: ignore
@@ -8022,6 +8234,8 @@ class Team:
         try:
             if not self.db:
                 raise ValueError("Db not initialized")
+            if self.session_writer is not None:
+                self.session_writer.wait_for_writes(self.db, session_id)
             session = self.db.get_session(session_id=session_id, session_type=session_type)
             return session  # type: ignore
         except Exception as e:
@@ -8039,6 +8253,8 @@ class Team:
             if not self.db:
                 raise ValueError("Db not initialized")
             self.db = cast(AsyncBaseDb, self.db)
+            if self.session_writer is not None:
+                await self.session_writer.await_for_writes(self.db, session_id)
             session = await self.db.get_session(session_id=session_id, session_type=session_type)
             return session  # type: ignore
         except Exception as e:
@@ -9138,6 +9354,9 @@ class Team:
                         else:
                             # Scrub individual member responses based on their storage flags
                             self._scrub_member_responses(run.member_responses)
+            if self.session_writer is not None:
+                self.session_writer.save(self.db, session)  # type: ignore
+                return
             self._upsert_session(session=session)
             log_debug(f"Created or updated TeamSession record: {session.session_id}")
 
@@ -9160,6 +9379,9 @@ class Team:
                     if hasattr(run, "member_responses"):
                         run.member_responses = []
 
+            if self.session_writer is not None:
+                await self.session_writer.asave(self.db, session)
+                return
             if self._has_async_db():
                 await self._aupsert_session(session=session)
             else:
@@ -9381,6 +9603,7 @@ class Team:
         """Delete the current session and save to storage"""
         if self.db is None:
             return
+
         await self.db.delete_session(session_id=session_id)  # type: ignore
 
     def get_session_messages(
@@ -10253,6 +10476,7 @@ class Team:
             "compression_manager",
             "learning",
             "skills",
+            "session_writer",
         ):
             return field_value
 
@@ -10286,6 +10510,9 @@ class Team:
             return field_value
 
 
+Team.__annotations__ = LazyAnnotations(Team.__annotations__, _import_lazy_names)
+
+
 def get_team_by_id(
     db: "BaseDb",
     id: str,
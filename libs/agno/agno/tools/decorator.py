@@ -77,6 +77,7 @@ def tool(
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    result_cache: Optional[Any] = None,
 ) -> Callable[[F], Function]: ...
 
 
@@ -106,6 +107,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         cache_results: bool - If True, enable caching of function results
         cache_dir: Optional[str] - Directory to store cache files
         cache_ttl: int - Time-to-live for cached results in seconds
+        result_cache: Optional[ResponseCache] - Backend for cached results, e.g. a RedisResponseCache shared by workers
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -144,6 +146,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "result_cache",
         }
     )
 
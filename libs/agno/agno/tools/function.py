@@ -1,7 +1,22 @@
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from functools import partial
 from importlib.metadata import version
-from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Type, TypeVar, get_type_hints
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    get_type_hints,
+)
+from weakref import WeakKeyDictionary
 
 from docstring_parser import parse
 from packaging.version import Version
@@ -12,8 +27,14 @@ from agno.media import Audio, File, Image, Video
 from agno.run import RunContext
 from agno.utils.log import log_debug, log_error, log_exception, log_warning
 
+if TYPE_CHECKING:
+    from agno.models.cache import ResponseCache
+
 T = TypeVar("T")
 
+# Functions built from plain callables, keyed weakly by the callable and then by the strict flag
+_callable_functions: "WeakKeyDictionary[Callable, Dict[bool, Function]]" = WeakKeyDictionary()
+
 
 def get_entrypoint_docstring(entrypoint: Callable) -> str:
     from inspect import getdoc
@@ -128,6 +149,9 @@ class Function(BaseModel):
     cache_results: bool = False
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
+    # Backend for cached results (an agno.models.cache.ResponseCache), e.g. a RedisResponseCache shared by workers.
+    # Defaults to an in-memory LRU in front of a sqlite file in cache_dir, shared by all functions in the process.
+    result_cache: Optional[Any] = None
 
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
@@ -143,6 +167,9 @@ class Function(BaseModel):
     _audios: Optional[Sequence[Audio]] = None
     _files: Optional[Sequence[File]] = None
 
+    # Processed schemas by strict flag, with the processing inputs they were built from
+    _compiled: Optional[Dict[bool, Tuple[Tuple[Any, ...], Dict[str, Any], "Function"]]] = None
+
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump(
             exclude_none=True,
@@ -202,6 +229,65 @@ class Function(BaseModel):
             # For shallow copy, use the default Pydantic behavior
             return super().model_copy(deep=False)
 
+    def _processing_key(self, strict: bool) -> Tuple[Any, ...]:
+        """The inputs of process_entrypoint, apart from parameters which are compared separately"""
+        return (
+            strict,
+            self.entrypoint,
+            self.description,
+            self.skip_entrypoint_processing,
+            self.requires_user_input,
+            tuple(self.user_input_fields) if self.user_input_fields is not None else None,
+        )
+
+    def _overlay(self, compiled: "Function") -> "Function":
+        """Create a lightweight per-run copy of this Function that shares the processed schema of `compiled`."""
+        data = dict(self.__dict__)
+        data["parameters"] = compiled.parameters
+        data["description"] = compiled.description
+        data["entrypoint"] = compiled.entrypoint
+        # User input values are filled in per run, so each copy gets its own fields
+        data["user_input_schema"] = (
+            [copy(field) for field in compiled.user_input_schema] if compiled.user_input_schema is not None else None
+        )
+        return self.__class__.model_construct(**data)
+
+    def get_processed_copy(self, strict: bool = False) -> "Function":
+        """
+        Return a copy of this Function with its entrypoint processed for an agent run.
+
+        The processed schema is built once and shared by later copies while the inputs to processing are unchanged,
+        so runs do not repeat signature introspection, docstring parsing and JSON schema generation.
+        The shared schema must be treated as read-only.
+        """
+        key = self._processing_key(strict)
+        cached = self._compiled.get(strict) if self._compiled is not None else None
+        if cached is not None and cached[0] == key and cached[1] == self.parameters:
+            return self._overlay(cached[2])
+
+        compiled = self.model_copy(deep=True)
+        compiled.process_entrypoint(strict=strict)
+        if self._compiled is None:
+            self._compiled = {}
+        self._compiled[strict] = (key, deepcopy(self.parameters), compiled)
+        return self._overlay(compiled)
+
+    @classmethod
+    def from_callable_cached(cls, c: Callable, strict: bool = False) -> "Function":
+        """Like from_callable, but reuses the Function built for the same callable on earlier runs."""
+        try:
+            cached = _callable_functions.get(c)
+        except TypeError:
+            # Not weak-referenceable or not hashable, so it cannot be cached
+            return cls.from_callable(c, strict=strict)
+
+        if cached is None:
+            cached = {}
+            _callable_functions[c] = cached
+        if strict not in cached:
+            cached[strict] = cls.from_callable(c, strict=strict)
+        return cached[strict]._overlay(cached[strict])
+
     @classmethod
     def from_callable(cls, c: Callable, name: Optional[str] = None, strict: bool = False) -> "Function":
         from inspect import getdoc, signature
@@ -583,51 +669,62 @@ class Function(BaseModel):
         key_str = f"{self.name}:{args_str}:{kwargs_str}"
         return md5(key_str.encode()).hexdigest()
 
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
-        from pathlib import Path
-        from tempfile import gettempdir
+    def _get_result_cache(self) -> "ResponseCache":
+        """Get the configured result cache, or the default one shared per cache_dir."""
+        if self.result_cache is None:
+            from pathlib import Path
+            from tempfile import gettempdir
+
+            from agno.models.cache import get_shared_response_cache
 
-        base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
+            base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
+            self.result_cache = get_shared_response_cache(Path(base_cache_dir) / "functions" / "results.db")
+        return self.result_cache
 
-    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
+    def _get_cached_result(self, cache_key: str) -> Optional[Any]:
         """Retrieve cached result if valid."""
-        import json
-        from pathlib import Path
         from time import time
 
-        cache_path = Path(cache_file)
-        if not cache_path.exists():
-            return None
-
         try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
+            cache_data = self._get_result_cache().get(cache_key)
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            return None
 
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
+        if cache_data is None or time() - cache_data.get("timestamp", 0) > self.cache_ttl:
+            return None
+        return cache_data.get("result")
 
-            if time() - timestamp <= self.cache_ttl:
-                return result
+    def _claim_cache_key(self, cache_key: str) -> Optional[Any]:
+        """Claim a missed cache key so identical concurrent calls wait for this one instead of running the function.
 
-            # Remove expired entry
-            cache_path.unlink()
-        except Exception as e:
-            log_error(f"Error reading cache: {e}")
+        Returns the cached result if another call filled the key while waiting; otherwise the key stays claimed
+        and must be released once the call is done.
+        """
+        result_cache = self._get_result_cache()
+        if result_cache.acquire(cache_key):
+            cached_result = self._get_cached_result(cache_key)
+            if cached_result is not None:
+                result_cache.release(cache_key)
+                return cached_result
+        return None
 
+    async def _aclaim_cache_key(self, cache_key: str) -> Optional[Any]:
+        """Async variant of `_claim_cache_key`."""
+        result_cache = self._get_result_cache()
+        if await result_cache.aacquire(cache_key):
+            cached_result = self._get_cached_result(cache_key)
+            if cached_result is not None:
+                result_cache.arelease(cache_key)
+                return cached_result
         return None
 
-    def _save_to_cache(self, cache_file: str, result: Any):
+    def _save_to_cache(self, cache_key: str, result: Any):
         """Save result to cache."""
-        import json
         from time import time
 
         try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
+            self._get_result_cache().set(cache_key, {"timestamp": time(), "result": result}, ttl=self.cache_ttl)
         except Exception as e:
             log_error(f"Error writing cache: {e}")
 
@@ -865,10 +962,15 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
+        cache_key: Optional[str] = None
+        cache_claimed = False
         if self.function.cache_results and not isgeneratorfunction(self.function.entrypoint):
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cached_result = self.function._get_cached_result(cache_key)
+            if cached_result is None:
+                # Wait for an identical in-flight call instead of running the function twice
+                cached_result = self.function._claim_cache_key(cache_key)
+                cache_claimed = cached_result is None
 
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
@@ -900,10 +1002,8 @@ class FunctionCall(BaseModel):
             else:
                 self.result = result
                 # Only cache non-generator results
-                if self.function.cache_results:
-                    cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                if self.function.cache_results and cache_key is not None:
+                    self.function._save_to_cache(cache_key, self.result)
 
                 updated_session_state = None
                 if entrypoint_args.get("run_context") is not None:
@@ -930,6 +1030,8 @@ class FunctionCall(BaseModel):
             execution_result = FunctionExecutionResult(status="failure", error=str(e))
 
         finally:
+            if cache_claimed and cache_key is not None:
+                self.function._get_result_cache().release(cache_key)
             self._handle_post_hook()
 
         if exception_to_raise is not None:
@@ -1076,12 +1178,17 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
+        cache_key: Optional[str] = None
+        cache_claimed = False
         if self.function.cache_results and not (
             isasyncgenfunction(self.function.entrypoint) or isgeneratorfunction(self.function.entrypoint)
         ):
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cached_result = self.function._get_cached_result(cache_key)
+            if cached_result is None:
+                # Wait for an identical in-flight call instead of running the function twice
+                cached_result = await self.function._aclaim_cache_key(cache_key)
+                cache_claimed = cached_result is None
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
@@ -1113,10 +1220,8 @@ class FunctionCall(BaseModel):
                     self.result = result  # Sync function, result is already computed
 
             # Only cache if not a generator
-            if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
-                cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+            if cache_key is not None and not (isgenerator(self.result) or isasyncgen(self.result)):
+                self.function._save_to_cache(cache_key, self.result)
 
             # For generators, don't capture updated_session_state -
             # session_state is passed by reference, so mutations made during
@@ -1150,6 +1255,8 @@ class FunctionCall(BaseModel):
             execution_result = FunctionExecutionResult(status="failure", error=str(e))
 
         finally:
+            if cache_claimed and cache_key is not None:
+                self.function._get_result_cache().arelease(cache_key)
             if iscoroutinefunction(self.function.post_hook):
                 await self._handle_post_hook_async()
             else:
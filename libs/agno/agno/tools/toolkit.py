@@ -29,6 +29,7 @@ class Toolkit:
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
         auto_register: bool = True,
+        result_cache: Optional[Any] = None,
     ):
         """Initialize a new Toolkit.
 
@@ -48,6 +49,7 @@ class Toolkit:
             cache_ttl (int): Time-to-live for cached results in seconds.
             cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
             auto_register (bool): Whether to automatically register all methods in the class.
+            result_cache (Optional[ResponseCache]): Backend for cached results. Defaults to an in-memory LRU in front of a sqlite file in cache_dir.
             stop_after_tool_call_tools (Optional[List[str]]): List of function names that should stop the agent after execution.
             show_result_tools (Optional[List[str]]): List of function names whose results should be shown.
         """
@@ -79,6 +81,7 @@ class Toolkit:
         self.cache_results: bool = cache_results
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
+        self.result_cache: Optional[Any] = result_cache
 
         # Automatically register all methods if auto_register is True
         if auto_register:
@@ -188,6 +191,7 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                result_cache=self.result_cache,
                 requires_confirmation=tool_name in self.requires_confirmation_tools,
                 external_execution=tool_name in self.external_execution_required_tools,
                 stop_after_tool_call=tool_name in self.stop_after_tool_call_tools,
@@ -291,6 +295,7 @@ class Toolkit:
             cache_results=function.cache_results if function.cache_results else self.cache_results,
             cache_dir=function.cache_dir if function.cache_dir else self.cache_dir,
             cache_ttl=function.cache_ttl if function.cache_ttl != 3600 else self.cache_ttl,
+            result_cache=function.result_cache if function.result_cache is not None else self.result_cache,
         )
 
         if is_async:
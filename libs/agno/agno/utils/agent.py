@@ -1,5 +1,7 @@
 import asyncio
 from asyncio import Future, Task
+from copy import copy
+from dataclasses import replace
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -12,12 +14,14 @@ from typing import (
     Optional,
     Sequence,
     Type,
+    TypeVar,
     Union,
 )
 
 from pydantic import BaseModel
 
 from agno.media import Audio, File, Image, Video
+from agno.media_store import MediaStore
 from agno.models.message import Message
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse
@@ -525,6 +529,155 @@ def scrub_history_messages_from_run_output(run_response: Union[RunOutput, TeamRu
         run_response.messages = [msg for msg in run_response.messages if not msg.from_history]
 
 
+def _iter_message_media(message: Message) -> Iterator[Union[Image, Audio, Video, File]]:
+    """Yield every media object held by a message."""
+    for message_media in (message.images, message.videos, message.audio, message.files):
+        yield from message_media or []
+    for output in (message.audio_output, message.image_output, message.video_output, message.file_output):
+        if output is not None:
+            yield output
+
+
+def _iter_run_output_media(run_response: Union[RunOutput, TeamRunOutput]) -> Iterator[Union[Image, Audio, Video, File]]:
+    """Yield every media object held by a run output, its messages and its member responses."""
+    if run_response.input is not None:
+        for input_media in (
+            run_response.input.images,
+            run_response.input.videos,
+            run_response.input.audios,
+            run_response.input.files,
+        ):
+            yield from input_media or []
+
+    for output_media in (run_response.images, run_response.videos, run_response.audio, run_response.files):
+        yield from output_media or []
+    if run_response.response_audio is not None:
+        yield run_response.response_audio
+
+    for messages in (run_response.messages, run_response.additional_input, run_response.reasoning_messages):
+        for message in messages or []:
+            yield from _iter_message_media(message)
+
+    if isinstance(run_response, TeamRunOutput):
+        for member_response in run_response.member_responses or []:
+            yield from _iter_run_output_media(member_response)
+
+
+MediaT = TypeVar("MediaT", Image, Audio, Video, File)
+
+
+def _offload_media(media: MediaT, media_store: MediaStore) -> MediaT:
+    if media.media_ref is not None or not isinstance(media.content, bytes):
+        return media
+    # The copy shares the content bytes, but serializes the reference instead
+    return media.model_copy(update={"media_ref": media_store.put(media.content)})
+
+
+def _offload_media_list(media_list: Optional[Sequence[MediaT]], media_store: MediaStore) -> Optional[List[MediaT]]:
+    if media_list is None:
+        return None
+    return [_offload_media(media, media_store) for media in media_list]
+
+
+def _offload_message_media(message: Message, media_store: MediaStore) -> Message:
+    update: Dict[str, Any] = {}
+    for field in ("images", "videos", "audio", "files"):
+        if getattr(message, field):
+            update[field] = _offload_media_list(getattr(message, field), media_store)
+    for field in ("audio_output", "image_output", "video_output", "file_output"):
+        if getattr(message, field) is not None:
+            update[field] = _offload_media(getattr(message, field), media_store)
+    return message.model_copy(update=update) if update else message
+
+
+def offload_media_from_run_output(
+    run_response: Union[RunOutput, TeamRunOutput], media_store: MediaStore
+) -> Union[RunOutput, TeamRunOutput]:
+    """
+    Return a copy of the run output to persist, whose media reference their content in the media store instead of
+    serializing it inline. The run output itself is left unchanged, so it still serializes its media content.
+    """
+    stored_run = copy(run_response)
+    if run_response.input is not None:
+        stored_run.input = replace(  # type: ignore[type-var]
+            run_response.input,
+            images=_offload_media_list(run_response.input.images, media_store),
+            videos=_offload_media_list(run_response.input.videos, media_store),
+            audios=_offload_media_list(run_response.input.audios, media_store),
+            files=_offload_media_list(run_response.input.files, media_store),
+        )
+    stored_run.images = _offload_media_list(run_response.images, media_store)
+    stored_run.videos = _offload_media_list(run_response.videos, media_store)
+    stored_run.audio = _offload_media_list(run_response.audio, media_store)
+    stored_run.files = _offload_media_list(run_response.files, media_store)
+    if run_response.response_audio is not None:
+        stored_run.response_audio = _offload_media(run_response.response_audio, media_store)
+
+    for field in ("messages", "additional_input", "reasoning_messages"):
+        messages = getattr(run_response, field)
+        if messages is not None:
+            setattr(stored_run, field, [_offload_message_media(message, media_store) for message in messages])
+
+    if isinstance(run_response, TeamRunOutput) and run_response.member_responses:
+        stored_run.member_responses = [  # type: ignore[union-attr]
+            offload_media_from_run_output(member_response, media_store)
+            for member_response in run_response.member_responses
+        ]
+    return stored_run
+
+
+def _load_media(media: Union[Image, Audio, Video, File], media_store: MediaStore) -> None:
+    if media.content is None and media.media_ref is not None:
+        media.content = media_store.get(media.media_ref)
+
+
+def _with_loaded_content(media: MediaT, media_store: MediaStore) -> MediaT:
+    if media.content is None and media.media_ref is not None:
+        return media.model_copy(update={"content": media_store.get(media.media_ref)})
+    return media
+
+
+def load_media_into_messages(messages: List[Message], media_store: MediaStore) -> None:
+    """
+    Resolve the media references of copies of history messages back into content bytes.
+
+    The media of the messages are replaced by loaded copies, as they are shared with the stored runs of the session.
+    """
+    for message in messages:
+        for field in ("images", "videos", "audio", "files"):
+            media_list = getattr(message, field)
+            if media_list:
+                setattr(message, field, [_with_loaded_content(media, media_store) for media in media_list])
+        for field in ("audio_output", "image_output", "video_output", "file_output"):
+            media = getattr(message, field)
+            if media is not None:
+                setattr(message, field, _with_loaded_content(media, media_store))
+
+
+def load_media_into_run_output(run_response: Union[RunOutput, TeamRunOutput], media_store: MediaStore) -> None:
+    """Resolve the media references of a run read from the database back into content bytes."""
+    for media in _iter_run_output_media(run_response):
+        _load_media(media, media_store)
+
+
+def load_media_into_session(
+    session: Union[AgentSession, TeamSession, WorkflowSession], media_store: MediaStore
+) -> None:
+    """Resolve the media references of every run of a session read from the database back into content bytes."""
+    for run_response in session.runs or []:
+        if isinstance(run_response, (RunOutput, TeamRunOutput)):
+            load_media_into_run_output(run_response, media_store)
+
+
+def _load_run_output_media(
+    entity: Union["Agent", "Team"], run_response: Union[RunOutput, TeamRunOutput]
+) -> Union[RunOutput, TeamRunOutput]:
+    """Resolve the media references of a run read from the database, when the entity has a media store."""
+    if entity.media_store is not None:
+        load_media_into_run_output(run_response, entity.media_store)
+    return run_response
+
+
 def get_run_output_util(
     entity: Union["Agent", "Team"], run_id: str, session_id: Optional[str] = None
 ) -> Optional[
@@ -548,7 +701,7 @@ def get_run_output_util(
         if session is not None:
             run_response = session.get_run(run_id=run_id)
             if run_response is not None:
-                return run_response  # type: ignore
+                return _load_run_output_media(entity, run_response)  # type: ignore
             else:
                 log_warning(f"RunOutput {run_id} not found in Session {session_id}")
     elif entity.cached_session is not None:
@@ -576,7 +729,7 @@ async def aget_run_output_util(
         if session is not None:
             run_response = session.get_run(run_id=run_id)
             if run_response is not None:
-                return run_response  # type: ignore
+                return _load_run_output_media(entity, run_response)  # type: ignore
             else:
                 log_warning(f"RunOutput {run_id} not found in Session {session_id}")
     elif entity.cached_session is not None:
@@ -610,10 +763,10 @@ def get_last_run_output_util(
             for run_output in reversed(session.runs):
                 if entity.__class__.__name__ == "Agent":
                     if hasattr(run_output, "agent_id") and run_output.agent_id == entity.id:
-                        return run_output  # type: ignore
+                        return _load_run_output_media(entity, run_output)  # type: ignore
                 elif entity.__class__.__name__ == "Team":
                     if hasattr(run_output, "team_id") and run_output.team_id == entity.id:
-                        return run_output  # type: ignore
+                        return _load_run_output_media(entity, run_output)  # type: ignore
         else:
             log_warning(f"No run responses found in Session {session_id}")
 
@@ -650,10 +803,10 @@ async def aget_last_run_output_util(
             for run_output in reversed(session.runs):
                 if entity.__class__.__name__ == "Agent":
                     if hasattr(run_output, "agent_id") and run_output.agent_id == entity.id:
-                        return run_output  # type: ignore
+                        return _load_run_output_media(entity, run_output)  # type: ignore
                 elif entity.__class__.__name__ == "Team":
                     if hasattr(run_output, "team_id") and run_output.team_id == entity.id:
-                        return run_output  # type: ignore
+                        return _load_run_output_media(entity, run_output)  # type: ignore
         else:
             log_warning(f"No run responses found in Session {session_id}")
 
@@ -1,5 +1,25 @@
 from dataclasses import asdict
-from typing import Any, List, Optional, Set, Type, Union, get_type_hints
+from typing import Any, Callable, Dict, List, Optional, Set, Type, Union, get_type_hints
+
+
+class LazyAnnotations(dict):
+    """Annotations of a class using names its module imports lazily, with a module-level __getattr__.
+
+    typing.get_type_hints() evaluates annotations in the module namespace without going through __getattr__, so the
+    lazy names are imported into the namespace when the annotations are read.
+    """
+
+    def __init__(self, annotations: Dict[str, Any], import_lazy_names: Callable[[], None]):
+        super().__init__(annotations)
+        self._import_lazy_names = import_lazy_names
+
+    def items(self):  # type: ignore[override]
+        self._import_lazy_names()
+        return super().items()
+
+    def values(self):  # type: ignore[override]
+        self._import_lazy_names()
+        return super().values()
 
 
 def isinstanceany(obj: Any, class_list: List[Type]) -> bool:
@@ -0,0 +1,124 @@
+import asyncio
+from concurrent.futures import Future
+from threading import Lock, Thread
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Sequence, Union
+
+
+class ContextAssembly:
+    """
+    Concurrent assembly of the context of a run.
+
+    The independent steps that build the context of a run (reading memories, cultural knowledge and learnings,
+    searching knowledge) are added as named stages, which start at once and run concurrently with each other and with
+    the rest of the run setup. A stage can depend on other stages: it starts once they are done, and receives their
+    results as positional arguments. The time spent in each stage is recorded in timings.
+
+    Sync stages run on a thread of their own, so they are never queued behind the stages of other runs, and a stage
+    can wait for other stages or runs (e.g. a knowledge retriever running an agent). Runs add a few stages at most.
+    Async stages run as tasks on the running event loop, and can depend on sync stages, but not the other way around.
+    """
+
+    def __init__(self) -> None:
+        # Seconds spent in each stage, once it is done
+        self.timings: Dict[str, float] = {}
+        # Finer timings filled by the stages themselves, keyed by stage name (e.g. the latency of each learning store)
+        self.stage_timings: Dict[str, Dict[str, float]] = {}
+        self._stages: Dict[str, Union["Future[Any]", "asyncio.Task[Any]"]] = {}
+        self._lock = Lock()
+
+    def add(self, name: str, fn: Callable[..., Any], depends_on: Sequence[str] = ()) -> None:
+        """Start a sync stage on a thread, once the stages it depends on are done."""
+        dependencies = self._get_dependencies(name, depends_on)
+        for dependency in dependencies:
+            if not isinstance(dependency, Future):
+                raise ValueError(f"Sync stage {name} can't depend on an async stage")
+
+        future: "Future[Any]" = Future()
+        self._stages[name] = future
+        remaining = [len(dependencies)]
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                # Dependencies are done, so this doesn't block
+                args = [dependency.result() for dependency in dependencies]
+                start = perf_counter()
+                try:
+                    result = fn(*args)
+                finally:
+                    self.timings[name] = perf_counter() - start
+                future.set_result(result)
+            except BaseException as e:
+                future.set_exception(e)
+
+        def on_dependency_done(_: Any) -> None:
+            with self._lock:
+                remaining[0] -= 1
+                ready = remaining[0] == 0
+            if ready:
+                _start_thread(name, run)
+
+        if not dependencies:
+            _start_thread(name, run)
+        for dependency in dependencies:
+            dependency.add_done_callback(on_dependency_done)  # type: ignore[arg-type]
+
+    def aadd(self, name: str, fn: Callable[..., Awaitable[Any]], depends_on: Sequence[str] = ()) -> None:
+        """Start an async stage as a task on the running event loop, once the stages it depends on are done."""
+        self._get_dependencies(name, depends_on)
+
+        async def run() -> Any:
+            args = [await self.aresult(dependency) for dependency in depends_on]
+            start = perf_counter()
+            try:
+                return await fn(*args)
+            finally:
+                self.timings[name] = perf_counter() - start
+
+        self._stages[name] = asyncio.get_running_loop().create_task(run())
+
+    def has(self, name: str) -> bool:
+        """Return True if the stage was added."""
+        return name in self._stages
+
+    def result(self, name: str) -> Any:
+        """Wait for a sync stage and return its result, raising its exception if it failed."""
+        stage = self._stages[name]
+        if not isinstance(stage, Future):
+            raise ValueError(f"Stage {name} is async, use aresult()")
+        return stage.result()
+
+    async def aresult(self, name: str) -> Any:
+        """Wait for a stage without blocking the event loop and return its result, raising its exception if it failed."""
+        stage = self._stages[name]
+        if isinstance(stage, Future):
+            return await asyncio.wrap_future(stage)
+        return await stage
+
+    def cancel(self) -> None:
+        """Cancel the stages that have not started. Stages already running are left to finish."""
+        for stage in self._stages.values():
+            if isinstance(stage, Future):
+                stage.cancel()
+            elif not stage.done():
+                stage.cancel()
+            elif not stage.cancelled():
+                # Results of unused stages are dropped, so retrieve their exceptions
+                stage.exception()
+
+    def _get_dependencies(
+        self, name: str, depends_on: Sequence[str]
+    ) -> Sequence[Union["Future[Any]", "asyncio.Task[Any]"]]:
+        if name in self._stages:
+            raise ValueError(f"Stage {name} already added")
+        for dependency in depends_on:
+            if dependency not in self._stages:
+                raise ValueError(f"Stage {name} depends on unknown stage {dependency}")
+        return [self._stages[dependency] for dependency in depends_on]
+
+
+def _start_thread(name: str, run: Callable[[], None]) -> None:
+    # Daemon threads don't hold up the interpreter exit for the stages of an abandoned run
+    Thread(target=run, name=f"agno-context-{name}", daemon=True).start()
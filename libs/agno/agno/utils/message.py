@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from pydantic import BaseModel
 
@@ -65,6 +65,90 @@ def filter_tool_calls(messages: List[Message], max_tool_calls: int) -> None:
     log_debug(f"Filtered {num_filtered} tool calls, kept {len(tool_call_ids_to_keep)}")
 
 
+def get_history_messages(
+    runs: Sequence[Any],
+    include_run: Callable[[Any], bool],
+    last_n_runs: Optional[int] = None,
+    limit: Optional[int] = None,
+    skip_roles: Optional[List[str]] = None,
+    skip_history_messages: bool = True,
+) -> List[Message]:
+    """
+    Return the messages of the runs, oldest first, to add to the context as history.
+
+    Runs are stored oldest first, so they are walked from the latest and only as far back as the window of
+    last_n_runs runs or limit messages needs: the cost depends on the window, not on the length of the session.
+
+    Args:
+        runs: The runs of the session, oldest first.
+        include_run: Whether the messages of a run can be part of the history.
+        last_n_runs: The number of runs to return messages from, counting from the latest. Defaults to all runs.
+        limit: The number of messages to return, counting from the latest. Overrides last_n_runs.
+        skip_roles: Skip messages with these roles.
+        skip_history_messages: Skip messages that were tagged as history in previous runs.
+    """
+
+    def include_message(message: Message) -> bool:
+        # Skip messages that were tagged as history in previous runs
+        if skip_history_messages and message.from_history:
+            return False
+        # Skip messages with specified role
+        return not (skip_roles and message.role in skip_roles)
+
+    # The runs in the window, latest first
+    window: List[Any] = []
+    num_messages = 0
+    for run in reversed(runs):
+        if not include_run(run):
+            continue
+        if limit is not None:
+            if num_messages >= limit:
+                break
+            num_messages += sum(1 for m in run.messages or [] if m.role != "system" and include_message(m))
+        elif last_n_runs and len(window) >= last_n_runs:
+            break
+        window.append(run)
+
+    messages: List[Message] = []
+    system_message = None
+    for run in reversed(window):
+        for message in run.messages or []:
+            if not include_message(message):
+                continue
+            if message.role == "system":
+                # Only add the system message once. With a limit, it is the first of the session, found below
+                if limit is None and system_message is None:
+                    system_message = message
+                    messages.append(message)
+            else:
+                messages.append(message)
+
+    if limit is None:
+        return messages
+
+    # The system message can be older than the window, but is rarely further than the first run
+    if not (skip_roles and "system" in skip_roles):
+        for run in runs:
+            if include_run(run):
+                system_message = next(
+                    (m for m in run.messages or [] if m.role == "system" and include_message(m)), None
+                )
+                if system_message is not None:
+                    break
+
+    if system_message is not None:
+        # Grab one less message then add the system message
+        num_messages = max(limit - 1, 0)
+        messages = [system_message] + (messages[-num_messages:] if num_messages > 0 else [])
+    else:
+        messages = messages[-limit:] if limit > 0 else []
+
+    # Remove tool result messages that don't have an associated assistant message with tool calls
+    while len(messages) > 0 and messages[0].role == "tool":
+        messages.pop(0)
+    return messages
+
+
 def get_text_from_message(message: Union[List, Dict, str, Message, BaseModel]) -> str:
     """Return the user texts from the message"""
     import json
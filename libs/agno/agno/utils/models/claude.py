@@ -221,106 +221,125 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
     return None
 
 
-def format_messages(
-    messages: List[Message], compress_tool_results: bool = False
-) -> Tuple[List[Dict[str, Union[str, list]]], str]:
+def _format_message(message: Message, compress_tool_results: bool = False) -> Optional[Dict[str, Union[str, list]]]:
     """
-    Process the list of messages and separate them into API messages and system messages.
+    Format a non-system message into the format expected by the Anthropic API.
 
     Args:
-        messages (List[Message]): The list of messages to process.
+        message (Message): The message to format.
         compress_tool_results: Whether to compress tool results.
 
     Returns:
-        Tuple[List[Dict[str, Union[str, list]]], str]: A tuple containing the list of API messages and the concatenated system messages.
+        Optional[Dict[str, Union[str, list]]]: The formatted message, or None for empty assistant responses.
     """
-    chat_messages: List[Dict[str, Union[str, list]]] = []
-    system_messages: List[str] = []
+    content = message.content or ""
+    if message.role == "user":
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
 
-    for message in messages:
-        content = message.content or ""
-        # Both "system" and "developer" roles should be extracted as system messages
-        if message.role in ("system", "developer"):
-            if content is not None:
-                system_messages.append(content)  # type: ignore
-            continue
-        elif message.role == "user":
-            if isinstance(content, str):
-                content = [{"type": "text", "text": content}]
+        if message.images is not None:
+            for image in message.images:
+                image_content = _format_image_for_message(image)
+                if image_content:
+                    content.append(image_content)
+
+        if message.files is not None:
+            for file in message.files:
+                file_content = _format_file_for_message(file)
+                if file_content:
+                    content.append(file_content)
+
+        if message.audio is not None and len(message.audio) > 0:
+            log_warning("Audio input is currently unsupported.")
 
-            if message.images is not None:
-                for image in message.images:
-                    image_content = _format_image_for_message(image)
-                    if image_content:
-                        content.append(image_content)
+        if message.videos is not None and len(message.videos) > 0:
+            log_warning("Video input is currently unsupported.")
 
-            if message.files is not None:
-                for file in message.files:
-                    file_content = _format_file_for_message(file)
-                    if file_content:
-                        content.append(file_content)
+    elif message.role == "assistant":
+        content = []
 
-            if message.audio is not None and len(message.audio) > 0:
-                log_warning("Audio input is currently unsupported.")
+        if message.reasoning_content is not None and message.provider_data is not None:
+            from anthropic.types import RedactedThinkingBlock, ThinkingBlock
+
+            content.append(
+                ThinkingBlock(
+                    thinking=message.reasoning_content,
+                    signature=message.provider_data.get("signature"),
+                    type="thinking",
+                )
+            )
 
-            if message.videos is not None and len(message.videos) > 0:
-                log_warning("Video input is currently unsupported.")
+        if message.redacted_reasoning_content is not None:
+            from anthropic.types import RedactedThinkingBlock
 
-        elif message.role == "assistant":
-            content = []
+            content.append(
+                RedactedThinkingBlock(data=message.redacted_reasoning_content, type="redacted_reasoning_content")
+            )
 
-            if message.reasoning_content is not None and message.provider_data is not None:
-                from anthropic.types import RedactedThinkingBlock, ThinkingBlock
+        if isinstance(message.content, str) and message.content and len(message.content.strip()) > 0:
+            content.append(TextBlock(text=message.content, type="text"))
 
+        if message.tool_calls:
+            for tool_call in message.tool_calls:
                 content.append(
-                    ThinkingBlock(
-                        thinking=message.reasoning_content,
-                        signature=message.provider_data.get("signature"),
-                        type="thinking",
+                    ToolUseBlock(
+                        id=tool_call["id"],
+                        input=json.loads(tool_call["function"]["arguments"])
+                        if "arguments" in tool_call["function"]
+                        else {},
+                        name=tool_call["function"]["name"],
+                        type="tool_use",
                     )
                 )
+    elif message.role == "tool":
+        content = []
 
-            if message.redacted_reasoning_content is not None:
-                from anthropic.types import RedactedThinkingBlock
+        # Use compressed content for tool messages if compression is active
+        tool_result = message.get_content(use_compressed_content=compress_tool_results)
 
-                content.append(
-                    RedactedThinkingBlock(data=message.redacted_reasoning_content, type="redacted_reasoning_content")
-                )
+        content.append(
+            {
+                "type": "tool_result",
+                "tool_use_id": message.tool_call_id,
+                "content": str(tool_result),
+            }
+        )
 
-            if isinstance(message.content, str) and message.content and len(message.content.strip()) > 0:
-                content.append(TextBlock(text=message.content, type="text"))
-
-            if message.tool_calls:
-                for tool_call in message.tool_calls:
-                    content.append(
-                        ToolUseBlock(
-                            id=tool_call["id"],
-                            input=json.loads(tool_call["function"]["arguments"])
-                            if "arguments" in tool_call["function"]
-                            else {},
-                            name=tool_call["function"]["name"],
-                            type="tool_use",
-                        )
-                    )
-        elif message.role == "tool":
-            content = []
+    # Skip empty assistant responses
+    if message.role == "assistant" and not content:
+        return None
 
-            # Use compressed content for tool messages if compression is active
-            tool_result = message.get_content(use_compressed_content=compress_tool_results)
+    return {"role": ROLE_MAP[message.role], "content": content}  # type: ignore
 
-            content.append(
-                {
-                    "type": "tool_result",
-                    "tool_use_id": message.tool_call_id,
-                    "content": str(tool_result),
-                }
-            )
 
-        # Skip empty assistant responses
-        if message.role == "assistant" and not content:
+def format_messages(
+    messages: List[Message], compress_tool_results: bool = False
+) -> Tuple[List[Dict[str, Union[str, list]]], str]:
+    """
+    Process the list of messages and separate them into API messages and system messages.
+    Each message keeps its formatted payload, so later iterations of the tool loop only format new messages.
+
+    Args:
+        messages (List[Message]): The list of messages to process.
+        compress_tool_results: Whether to compress tool results.
+
+    Returns:
+        Tuple[List[Dict[str, Union[str, list]]], str]: A tuple containing the list of API messages and the concatenated system messages.
+    """
+    chat_messages: List[Dict[str, Union[str, list]]] = []
+    system_messages: List[str] = []
+
+    for message in messages:
+        # Both "system" and "developer" roles should be extracted as system messages
+        if message.role in ("system", "developer"):
+            content = message.content or ""
+            if content is not None:
+                system_messages.append(content)  # type: ignore
             continue
 
-        chat_messages.append({"role": ROLE_MAP[message.role], "content": content})  # type: ignore
+        chat_message = message.get_formatted(("claude", compress_tool_results), _format_message, compress_tool_results)
+        if chat_message is not None:
+            chat_messages.append(chat_message)
     return chat_messages, " ".join(system_messages)
 
 
@@ -46,9 +46,54 @@ def _format_images_for_message(message: Message, images: Sequence[Image]) -> Lis
     return message_content_with_image
 
 
+def _format_message(message: Message, compress_tool_results: bool = False) -> Dict[str, Any]:
+    """
+    Format a message for the Cohere API.
+
+    Args:
+        message (Message): The message to format.
+        compress_tool_results: Whether to compress tool results.
+
+    Returns:
+        Dict[str, Any]: The formatted message.
+    """
+    # Use compressed content for tool messages if compression is active
+    content = message.content
+
+    if message.role == "tool":
+        content = message.get_content(use_compressed_content=compress_tool_results)
+
+    message_dict = {
+        "role": message.role,
+        "content": content,
+        "name": message.name,
+        "tool_call_id": message.tool_call_id,
+        "tool_calls": message.tool_calls,
+    }
+
+    if message.images is not None and len(message.images) > 0:
+        # Ignore non-string message content
+        if isinstance(message.content, str):
+            message_content_with_image = _format_images_for_message(message=message, images=message.images)
+            if len(message_content_with_image) > 1:
+                message_dict["content"] = message_content_with_image
+
+    if message.videos is not None and len(message.videos) > 0:
+        log_warning("Video input is currently unsupported.")
+
+    if message.audio is not None and len(message.audio) > 0:
+        log_warning("Audio input is currently unsupported.")
+
+    if message.files is not None and len(message.files) > 0:
+        log_warning("File input is currently unsupported.")
+
+    return {k: v for k, v in message_dict.items() if v is not None}
+
+
 def format_messages(messages: List[Message], compress_tool_results: bool = False) -> List[Dict[str, Any]]:
     """
     Format messages for the Cohere API.
+    Each message keeps its formatted payload, so later iterations of the tool loop only format new messages.
 
     Args:
         messages (List[Message]): The list of messages.
@@ -57,38 +102,7 @@ def format_messages(messages: List[Message], compress_tool_results: bool = False
     Returns:
         List[Dict[str, Any]]: The formatted messages.
     """
-    formatted_messages = []
-    for message in messages:
-        # Use compressed content for tool messages if compression is active
-        content = message.content
-
-        if message.role == "tool":
-            content = message.get_content(use_compressed_content=compress_tool_results)
-
-        message_dict = {
-            "role": message.role,
-            "content": content,
-            "name": message.name,
-            "tool_call_id": message.tool_call_id,
-            "tool_calls": message.tool_calls,
-        }
-
-        if message.images is not None and len(message.images) > 0:
-            # Ignore non-string message content
-            if isinstance(message.content, str):
-                message_content_with_image = _format_images_for_message(message=message, images=message.images)
-                if len(message_content_with_image) > 1:
-                    message_dict["content"] = message_content_with_image
-
-        if message.videos is not None and len(message.videos) > 0:
-            log_warning("Video input is currently unsupported.")
-
-        if message.audio is not None and len(message.audio) > 0:
-            log_warning("Audio input is currently unsupported.")
-
-        if message.files is not None and len(message.files) > 0:
-            log_warning("File input is currently unsupported.")
-
-        message_dict = {k: v for k, v in message_dict.items() if v is not None}
-        formatted_messages.append(message_dict)
-    return formatted_messages
+    return [
+        message.get_formatted(("cohere", compress_tool_results), _format_message, compress_tool_results)
+        for message in messages
+    ]
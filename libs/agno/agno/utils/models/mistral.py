@@ -48,53 +48,56 @@ def _format_image_for_message(image: Image) -> Optional[ImageURLChunk]:
     return None
 
 
-def format_messages(messages: List[Message], compress_tool_results: bool = False) -> List[MistralMessage]:
-    mistral_messages: List[MistralMessage] = []
-
-    for message in messages:
-        mistral_message: MistralMessage
-        if message.role == "user":
-            if message.audio is not None and len(message.audio) > 0:
-                log_warning("Audio input is currently unsupported.")
-
-            if message.files is not None and len(message.files) > 0:
-                log_warning("File input is currently unsupported.")
-
-            if message.videos is not None and len(message.videos) > 0:
-                log_warning("Video input is currently unsupported.")
-
-            if message.images is not None:
-                content: List[Any] = [TextChunk(type="text", text=message.content)]
-                for image in message.images:
-                    image_content = _format_image_for_message(image)
-                    if image_content:
-                        content.append(image_content)
-                mistral_message = UserMessage(role="user", content=content)
-            else:
-                mistral_message = UserMessage(role="user", content=message.content)
-        elif message.role == "assistant":
-            if message.reasoning_content is not None:
-                mistral_message = UserMessage(role="user", content=message.content)
-            elif message.tool_calls is not None:
-                mistral_message = AssistantMessage(
-                    role="assistant", content=message.content, tool_calls=message.tool_calls
-                )
-            else:
-                mistral_message = AssistantMessage(role=message.role, content=message.content)
-        elif message.role == "system":
-            mistral_message = SystemMessage(role="system", content=message.content)
-        elif message.role == "tool":
-            # Get compressed content if compression is active
-            tool_content = message.get_content(use_compressed_content=compress_tool_results)
-            mistral_message = ToolMessage(name="tool", content=tool_content, tool_call_id=message.tool_call_id)
+def _format_message(message: Message, compress_tool_results: bool = False) -> MistralMessage:
+    mistral_message: MistralMessage
+    if message.role == "user":
+        if message.audio is not None and len(message.audio) > 0:
+            log_warning("Audio input is currently unsupported.")
+
+        if message.files is not None and len(message.files) > 0:
+            log_warning("File input is currently unsupported.")
+
+        if message.videos is not None and len(message.videos) > 0:
+            log_warning("Video input is currently unsupported.")
+
+        if message.images is not None:
+            content: List[Any] = [TextChunk(type="text", text=message.content)]
+            for image in message.images:
+                image_content = _format_image_for_message(image)
+                if image_content:
+                    content.append(image_content)
+            mistral_message = UserMessage(role="user", content=content)
+        else:
+            mistral_message = UserMessage(role="user", content=message.content)
+    elif message.role == "assistant":
+        if message.reasoning_content is not None:
+            mistral_message = UserMessage(role="user", content=message.content)
+        elif message.tool_calls is not None:
+            mistral_message = AssistantMessage(role="assistant", content=message.content, tool_calls=message.tool_calls)
         else:
-            raise ValueError(f"Unknown role: {message.role}")
+            mistral_message = AssistantMessage(role=message.role, content=message.content)
+    elif message.role == "system":
+        mistral_message = SystemMessage(role="system", content=message.content)
+    elif message.role == "tool":
+        # Get compressed content if compression is active
+        tool_content = message.get_content(use_compressed_content=compress_tool_results)
+        mistral_message = ToolMessage(name="tool", content=tool_content, tool_call_id=message.tool_call_id)
+    else:
+        raise ValueError(f"Unknown role: {message.role}")
+    return mistral_message
 
-        mistral_messages.append(mistral_message)
+
+def format_messages(messages: List[Message], compress_tool_results: bool = False) -> List[MistralMessage]:
+    # Formatted messages are kept on each Message, so the tool loop only formats new messages
+    mistral_messages: List[MistralMessage] = [
+        message.get_formatted(("mistral", compress_tool_results), _format_message, compress_tool_results)
+        for message in messages
+    ]
 
     # Check if the last message is an assistant message
     if mistral_messages and hasattr(mistral_messages[-1], "role") and mistral_messages[-1].role == "assistant":
         # Set prefix=True for the last assistant message to allow it as the last message
-        mistral_messages[-1].prefix = True
+        # Copy it first, the formatted message is shared with later requests
+        mistral_messages[-1] = mistral_messages[-1].model_copy(update={"prefix": True})
 
     return mistral_messages
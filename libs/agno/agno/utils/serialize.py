@@ -1,9 +1,15 @@
 """JSON serialization utilities for handling datetime and enum objects."""
 
+import json
 from datetime import date, datetime, time
 from enum import Enum
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 def json_serializer(obj: Any) -> Any:
     """Custom JSON serializer for objects not serializable by default json module.
@@ -30,3 +36,23 @@ def json_serializer(obj: Any) -> Any:
 
     # Fallback to string
     return str(obj)
+
+
+def dumps_compact_json(obj: Any) -> str:
+    """Serialize to compact JSON (no whitespace, non-ASCII kept as-is), as used for streamed events.
+
+    Uses orjson when it is installed, falling back to the standard json module for values orjson rejects.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        The JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=json_serializer, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+
+    return json.dumps(obj, separators=(",", ":"), default=json_serializer, ensure_ascii=False)
@@ -0,0 +1,120 @@
+"""Delta stream format for server-sent run events.
+
+In the default ("full") format every streamed event carries its complete payload, including identity fields such as
+run_id, session_id, agent_id and model details. In the "delta" format, the first content event of a run is sent in
+full and establishes a template; every following content event of that run whose identity fields are unchanged is sent
+as a compact payload holding only the event type, a sequence number and the content delta:
+
+    event: RunContent
+    data: {"event":"RunContent","seq":12,"delta":"Hello"}
+
+`run_id` is added when the event belongs to a different run than the previous delta of the same type (e.g. team member
+runs), and `created_at` is added when it differs from the template. All other events are sent in full.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from agno.run.agent import RunEvent
+from agno.run.team import TeamRunEvent
+from agno.utils.log import log_warning
+from agno.utils.serialize import dumps_compact_json
+
+STREAM_FORMATS = ("full", "delta")
+
+# Event types that can be sent as deltas, mapped to the field holding the delta
+DELTA_EVENT_FIELDS: Dict[str, str] = {
+    RunEvent.run_content.value: "content",
+    RunEvent.reasoning_content_delta.value: "reasoning_content",
+    TeamRunEvent.run_content.value: "content",
+    TeamRunEvent.reasoning_content_delta.value: "reasoning_content",
+}
+
+# Fields that change between deltas without breaking the template
+_VARIABLE_FIELDS = ("created_at",)
+
+
+class _DeltaTemplates:
+    """State shared by the encoder and the decoder, so both sides reconstruct the same templates"""
+
+    def __init__(self) -> None:
+        self.seq = 0
+        # (event type, run_id) -> identity fields of the last full event
+        self.templates: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        # event type -> run_id of the last event of that type
+        self.last_run_id: Dict[str, Optional[str]] = {}
+
+    def remember(self, event_type: str, delta_field: str, data: Dict[str, Any]) -> None:
+        run_id = data.get("run_id")
+        self.templates[(event_type, run_id)] = {k: v for k, v in data.items() if k != delta_field}
+        self.last_run_id[event_type] = run_id
+
+
+class DeltaStreamEncoder(_DeltaTemplates):
+    """Encodes the events of one stream in the delta format. Use a new encoder for every stream."""
+
+    def encode(self, event: Any) -> Dict[str, Any]:
+        """Return the payload to send for the given event"""
+        self.seq += 1
+        data = event.to_dict()
+        event_type: str = data.get("event", "")
+        delta_field = DELTA_EVENT_FIELDS.get(event_type)
+        if delta_field is None or not isinstance(data.get(delta_field), str):
+            return data
+
+        run_id = data.get("run_id")
+        template = self.templates.get((event_type, run_id))
+        if (
+            template is None
+            # A template field is missing from this event
+            or len(template) != len(data) - 1
+            or any(template.get(k) != v for k, v in data.items() if k != delta_field and k not in _VARIABLE_FIELDS)
+        ):
+            self.remember(event_type, delta_field, data)
+            return data
+
+        payload: Dict[str, Any] = {"event": event_type, "seq": self.seq, "delta": data[delta_field]}
+        if self.last_run_id.get(event_type) != run_id:
+            payload["run_id"] = run_id
+            self.last_run_id[event_type] = run_id
+        for key in _VARIABLE_FIELDS:
+            if key in data and template.get(key) != data[key]:
+                payload[key] = data[key]
+                template[key] = data[key]
+        return payload
+
+    def format_sse_event(self, event: Any) -> str:
+        """Return the SSE frame for the given event"""
+        payload = self.encode(event)
+        return f"event: {payload.get('event') or 'message'}\ndata: {dumps_compact_json(payload)}\n\n"
+
+
+class DeltaStreamDecoder(_DeltaTemplates):
+    """Expands the payloads of one stream back into full event dictionaries. Full-format streams pass through."""
+
+    def decode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the full event dictionary for a received payload"""
+        self.seq += 1
+        event_type: str = data.get("event", "")
+        delta_field = DELTA_EVENT_FIELDS.get(event_type)
+        if delta_field is None:
+            return data
+
+        if "seq" not in data or "delta" not in data:
+            if isinstance(data.get(delta_field), str):
+                self.remember(event_type, delta_field, data)
+            return data
+
+        if data["seq"] != self.seq:
+            log_warning(f"Delta stream out of sequence: expected {self.seq}, received {data['seq']}")
+            self.seq = data["seq"]
+
+        run_id = data["run_id"] if "run_id" in data else self.last_run_id.get(event_type)
+        template = self.templates.get((event_type, run_id))
+        if template is None:
+            raise ValueError(f"Received a {event_type} delta before its first full event")
+        self.last_run_id[event_type] = run_id
+        for key in _VARIABLE_FIELDS:
+            if key in data:
+                template[key] = data[key]
+
+        return {**template, delta_field: data["delta"]}
@@ -157,8 +157,19 @@ class LanceDb(VectorDb):
 
         log_debug(f"Initialized LanceDb with table: '{self.table_name}'")
 
-    def _prepare_vector(self, embedding) -> List[float]:
+    def _prepare_vector(self, embedding) -> Any:
         """Prepare vector embedding for insertion, ensuring correct dimensions and type."""
+        if hasattr(embedding, "dtype") and len(embedding) > 0:
+            # float32 array (Embedder.use_numpy): pyarrow reads its buffer directly, no per-element conversion
+            import numpy as np
+
+            array = np.asarray(embedding, dtype=np.float32)
+            if self.dimensions and len(array) != self.dimensions:
+                resized = np.zeros(self.dimensions, dtype=np.float32)
+                resized[: min(len(array), self.dimensions)] = array[: self.dimensions]
+                log_debug(f"Resized vector from {len(array)} to {self.dimensions} dimensions")
+                return resized
+            return array
         if embedding is not None and len(embedding) > 0:
             # Convert to list of floats
             vector = [float(x) for x in embedding]
@@ -285,7 +296,7 @@ class LanceDb(VectorDb):
             # Only embed if the document doesn't already have a valid embedding
             # This prevents duplicate embedding when called from async_insert or async_upsert
             # Check for both None and empty list (async embedding failures return [])
-            if document.embedding is None or (isinstance(document.embedding, list) and len(document.embedding) == 0):
+            if document.embedding is None or len(document.embedding) == 0:
                 document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             # Include content_hash in ID to ensure uniqueness across different content hashes
@@ -0,0 +1,9 @@
+from agno.vectordb.distance import Distance
+from agno.vectordb.local.local_vector_db import LocalVectorDb
+from agno.vectordb.search import SearchType
+
+__all__ = [
+    "Distance",
+    "LocalVectorDb",
+    "SearchType",
+]
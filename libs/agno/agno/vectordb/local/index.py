@@ -0,0 +1,305 @@
+import json
+import os
+import re
+from collections import Counter
+from math import log
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+from agno.filters import AND, EQ, GT, IN, LT, NOT, OR, FilterExpr
+from agno.vectordb.distance import Distance
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("numpy not installed, use `pip install numpy`")
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Fields of a stored document that can be filtered on alongside its metadata
+INDEXED_FIELDS = ("name", "content_id", "content_hash")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write a file so readers see either the old or the new contents, never a partial write."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _flatten(metadata: Dict[str, Any], prefix: str = "") -> List[Tuple[str, Hashable]]:
+    """List the (key, value) pairs of a document's metadata, nested dicts as dotted keys and lists as one pair per item."""
+    pairs: List[Tuple[str, Hashable]] = []
+    for key, value in metadata.items():
+        full_key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            pairs.extend(_flatten(value, prefix=f"{full_key}."))
+        elif isinstance(value, (list, tuple, set)):
+            pairs.extend((full_key, item) for item in value if isinstance(item, Hashable))
+        elif isinstance(value, Hashable):
+            pairs.append((full_key, value))
+    return pairs
+
+
+class Segment:
+    """A file of float32 vectors, read through a memory map, with the documents they embed.
+
+    Vectors are never rewritten: deleted rows are tombstoned until compaction merges segments, and metadata updates only
+    rewrite the documents file. Metadata is served from an inverted index and content from BM25 term postings.
+    """
+
+    def __init__(self, directory: Path, name: str, records: List[Dict[str, Any]], vectors: Any):
+        self.directory = directory
+        self.name = name
+        self.records = records
+        self.vectors = vectors
+        self.live = np.ones(len(records), dtype=bool)
+        # Squared norms of the vectors, used for l2 distance
+        self.norms = np.einsum("ij,ij->i", vectors, vectors)
+        # IVF list of each row, set when the collection has an IVF index
+        self.assignments: Optional[Any] = None
+        # Bumped on every delete or metadata update, so compaction can detect changes made while it ran
+        self.version = 0
+        self._build_postings()
+        self._build_terms()
+
+    @classmethod
+    def write(cls, directory: Path, name: str, records: List[Dict[str, Any]], vectors: Any) -> "Segment":
+        atomic_write(directory / f"{name}.f32", np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        atomic_write(directory / f"{name}.json", json.dumps(records, default=str).encode("utf-8"))
+        return cls.load(directory, name, dimensions=vectors.shape[1])
+
+    @classmethod
+    def load(cls, directory: Path, name: str, dimensions: int, deleted: Optional[List[int]] = None) -> "Segment":
+        records = json.loads((directory / f"{name}.json").read_text(encoding="utf-8"))
+        vectors = np.memmap(directory / f"{name}.f32", dtype=np.float32, mode="r", shape=(len(records), dimensions))
+        segment = cls(directory, name, records, vectors)
+        if deleted:
+            segment.live[deleted] = False
+        return segment
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def files(self) -> List[Path]:
+        return [self.directory / f"{self.name}.f32", self.directory / f"{self.name}.json"]
+
+    @property
+    def deleted(self) -> List[int]:
+        return np.flatnonzero(~self.live).tolist()
+
+    def delete(self, rows: Any) -> None:
+        self.live[rows] = False
+        self.version += 1
+
+    def update_metadata(self, rows: Any, metadata: Dict[str, Any]) -> None:
+        for row in rows:
+            self.records[row]["meta_data"].update(metadata)
+        atomic_write(self.directory / f"{self.name}.json", json.dumps(self.records, default=str).encode("utf-8"))
+        self._build_postings()
+        self.version += 1
+
+    def _build_postings(self) -> None:
+        postings: Dict[str, Dict[Hashable, List[int]]] = {}
+        for row, record in enumerate(self.records):
+            pairs = _flatten(record["meta_data"])
+            pairs.extend((field, record[field]) for field in INDEXED_FIELDS if record.get(field) is not None)
+            for key, value in pairs:
+                postings.setdefault(key, {}).setdefault(value, []).append(row)
+        self.postings = {
+            key: {value: np.array(rows, dtype=np.int64) for value, rows in values.items()}
+            for key, values in postings.items()
+        }
+
+    def _build_terms(self) -> None:
+        term_rows: Dict[str, Tuple[List[int], List[int]]] = {}
+        self.lengths = np.zeros(len(self.records), dtype=np.float32)
+        for row, record in enumerate(self.records):
+            counts = Counter(tokenize(record["content"]))
+            self.lengths[row] = sum(counts.values())
+            for term, count in counts.items():
+                rows, frequencies = term_rows.setdefault(term, ([], []))
+                rows.append(row)
+                frequencies.append(count)
+        self.terms = {
+            term: (np.array(rows, dtype=np.int64), np.array(frequencies, dtype=np.float32))
+            for term, (rows, frequencies) in term_rows.items()
+        }
+
+    def filter_mask(self, filters: Union[Dict[str, Any], List[FilterExpr]]) -> Any:
+        """Rows matching the filters: a dict of equality filters or a list of filter expressions, all of which must match."""
+        if isinstance(filters, dict):
+            expressions: List[FilterExpr] = [EQ(key, value) for key, value in filters.items()]
+        else:
+            expressions = list(filters)
+        mask = np.ones(len(self.records), dtype=bool)
+        for expression in expressions:
+            mask &= self._evaluate(expression)
+        return mask
+
+    def _rows_where(self, key: str, match: Any) -> Any:
+        mask = np.zeros(len(self.records), dtype=bool)
+        for value, rows in self.postings.get(key, {}).items():
+            try:
+                if match(value):
+                    mask[rows] = True
+            except TypeError:
+                continue
+        return mask
+
+    def _evaluate(self, expression: FilterExpr) -> Any:
+        if isinstance(expression, EQ):
+            mask = np.zeros(len(self.records), dtype=bool)
+            try:
+                rows = self.postings.get(expression.key, {}).get(expression.value)
+            except TypeError:
+                rows = None
+            if rows is not None:
+                mask[rows] = True
+            return mask
+        if isinstance(expression, IN):
+            mask = np.zeros(len(self.records), dtype=bool)
+            for value in expression.values:
+                mask |= self._evaluate(EQ(expression.key, value))
+            return mask
+        if isinstance(expression, GT):
+            return self._rows_where(expression.key, lambda value: value > expression.value)
+        if isinstance(expression, LT):
+            return self._rows_where(expression.key, lambda value: value < expression.value)
+        if isinstance(expression, AND):
+            mask = np.ones(len(self.records), dtype=bool)
+            for sub_expression in expression.expressions:
+                mask &= self._evaluate(sub_expression)
+            return mask
+        if isinstance(expression, OR):
+            mask = np.zeros(len(self.records), dtype=bool)
+            for sub_expression in expression.expressions:
+                mask |= self._evaluate(sub_expression)
+            return mask
+        if isinstance(expression, NOT):
+            return ~self._evaluate(expression.expression)
+        raise ValueError(f"Unsupported filter expression: {type(expression).__name__}")
+
+    def vector_scores(self, query: Any, query_norm: float, rows: Any, distance: Distance) -> Any:
+        """Similarity of the query to the given rows, higher is closer. l2 scores are negated squared distances."""
+        if len(rows) == len(self.records):
+            # Every row selected: multiply the memory map directly instead of gathering a copy
+            dots = np.asarray(self.vectors @ query)
+            norms = self.norms
+        else:
+            dots = np.asarray(self.vectors[rows]) @ query
+            norms = self.norms[rows]
+        if distance == Distance.l2:
+            return 2 * dots - norms - query_norm
+        return dots
+
+
+class IvfIndex:
+    """Inverted file index: vectors are clustered around centroids, and a search only scans the nprobe closest lists."""
+
+    def __init__(self, centroids: Any):
+        self.centroids = centroids
+        self._centroid_norms = np.einsum("ij,ij->i", centroids, centroids)
+
+    @classmethod
+    def train(cls, vectors: Any, num_lists: int, iterations: int = 10, seed: int = 0) -> "IvfIndex":
+        """Cluster a sample of the vectors with k-means."""
+        rng = np.random.default_rng(seed)
+        num_lists = max(1, min(num_lists, len(vectors)))
+        sample_size = min(len(vectors), num_lists * 64)
+        sample = np.asarray(vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))], dtype=np.float32)
+        index = cls(sample[rng.choice(sample_size, num_lists, replace=False)].copy())
+        for _ in range(iterations):
+            assignments = index.assign(sample)
+            sums = np.zeros_like(index.centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=num_lists)
+            filled = counts > 0
+            centroids = index.centroids.copy()
+            centroids[filled] = sums[filled] / counts[filled, None]
+            index = cls(centroids)
+        return index
+
+    @classmethod
+    def load(cls, path: Path) -> "IvfIndex":
+        return cls(np.load(path))
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, self.centroids)
+        os.replace(tmp_path, path)
+
+    def __len__(self) -> int:
+        return len(self.centroids)
+
+    def assign(self, vectors: Any, chunk_size: int = 65536) -> Any:
+        """Nearest centroid of each vector, computed in chunks to bound memory."""
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), chunk_size):
+            chunk = np.asarray(vectors[start : start + chunk_size])
+            distances = self._centroid_norms - 2 * (chunk @ self.centroids.T)
+            assignments[start : start + chunk_size] = np.argmin(distances, axis=1)
+        return assignments
+
+    def probe(self, query: Any, nprobe: int, distance: Distance) -> Any:
+        """Lists closest to the query."""
+        if distance == Distance.max_inner_product:
+            scores = self.centroids @ query
+        else:
+            scores = 2 * (self.centroids @ query) - self._centroid_norms
+        if nprobe >= len(scores):
+            return np.arange(len(scores))
+        return np.argpartition(-scores, nprobe - 1)[:nprobe]
+
+
+def bm25_scores(segments: List[Segment], masks: List[Any], query: str, k1: float, b: float) -> List[Optional[Any]]:
+    """BM25 score of each row of each segment, over the rows selected by masks. None for segments without a match."""
+    terms = set(tokenize(query))
+    num_docs = sum(int(mask.sum()) for mask in masks)
+    if not terms or num_docs == 0:
+        return [None for _ in segments]
+    average_length = sum(float(segment.lengths[mask].sum()) for segment, mask in zip(segments, masks)) / num_docs
+    average_length = average_length or 1.0
+    idf: Dict[str, float] = {}
+    for term in terms:
+        doc_freq = sum(
+            int(mask[segment.terms[term][0]].sum()) for segment, mask in zip(segments, masks) if term in segment.terms
+        )
+        if doc_freq:
+            idf[term] = log(1 + (num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    results: List[Optional[Any]] = []
+    for segment, mask in zip(segments, masks):
+        scores: Optional[Any] = None
+        for term, term_idf in idf.items():
+            if term not in segment.terms:
+                continue
+            rows, frequencies = segment.terms[term]
+            if scores is None:
+                scores = np.zeros(len(segment), dtype=np.float32)
+            norm = k1 * (1 - b + b * segment.lengths[rows] / average_length)
+            scores[rows] += term_idf * frequencies * (k1 + 1) / (frequencies + norm)
+        if scores is not None:
+            scores[~mask] = 0
+        results.append(scores)
+    return results
+
+
+def top_k(scores: Any, k: int) -> Any:
+    """Indices of the k highest scores, best first."""
+    if k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
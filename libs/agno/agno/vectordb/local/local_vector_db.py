@@ -0,0 +1,703 @@
+import asyncio
+import json
+import shutil
+from hashlib import md5
+from math import sqrt
+from pathlib import Path
+from threading import Lock, RLock, Thread
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from agno.filters import FilterExpr
+from agno.knowledge.document import Document
+from agno.knowledge.embedder import Embedder
+from agno.knowledge.reranker.base import Reranker
+from agno.utils.log import log_debug, log_error, log_info, log_warning, logger
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+from agno.vectordb.local.index import IvfIndex, Segment, atomic_write, bm25_scores, top_k
+from agno.vectordb.search import SearchType
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("numpy not installed, use `pip install numpy`")
+
+Filters = Union[Dict[str, Any], List[FilterExpr]]
+
+# A search hit: (score, segment, row)
+Hit = Tuple[float, Segment, int]
+
+
+class LocalVectorDb(VectorDb):
+    """
+    In-process vector database storing its data in a local directory, with numpy as its only dependency.
+
+    Every insert writes an immutable segment: a float32 vector file, searched through a memory map, and a JSON file with
+    the documents. Deletes are tombstones, and segments are merged in a background thread once there are more than
+    max_segments of them or more than compaction_threshold of the rows are deleted. Compaction also trains an IVF-flat
+    index once the collection holds ivf_min_vectors vectors; smaller collections are searched exactly.
+
+    Args:
+        collection: Name of the collection, stored in path/collection. If not provided, derived from 'name'.
+        name: Name of the vector database. Also used as collection name if 'collection' is not provided.
+        description: Description of the vector database.
+        id: Unique identifier for this vector database instance.
+        embedder: The embedder to use when embedding the document contents.
+        distance: The distance metric to use when searching for documents.
+        path: Directory holding the collections.
+        search_type: The search type to use when searching for documents.
+            - SearchType.vector: Vector similarity search (default)
+            - SearchType.keyword: BM25 keyword search over document contents
+            - SearchType.hybrid: Combines vector and keyword search with Reciprocal Rank Fusion
+        reranker: The reranker to use when reranking documents.
+        hybrid_rrf_k: RRF (Reciprocal Rank Fusion) constant for hybrid search.
+        nprobe: Number of IVF lists scanned per search. Higher values trade latency for recall.
+        ivf_min_vectors: Number of vectors from which compaction trains an IVF index.
+        exact_search_threshold: Filtered searches matching at most this many documents skip the IVF index.
+        max_segments: Number of segments that triggers a compaction.
+        compaction_threshold: Fraction of deleted rows that triggers a compaction.
+        background_compaction: Compact in a background thread after writes, until close(). If False, call optimize()
+            to compact.
+        bm25_k1: BM25 term frequency saturation.
+        bm25_b: BM25 document length normalization.
+    """
+
+    def __init__(
+        self,
+        collection: Optional[str] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        id: Optional[str] = None,
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        path: str = "tmp/local_vectordb",
+        search_type: SearchType = SearchType.vector,
+        reranker: Optional[Reranker] = None,
+        hybrid_rrf_k: int = 60,
+        nprobe: int = 8,
+        ivf_min_vectors: int = 4096,
+        exact_search_threshold: int = 2048,
+        max_segments: int = 8,
+        compaction_threshold: float = 0.2,
+        background_compaction: bool = True,
+        bm25_k1: float = 1.2,
+        bm25_b: float = 0.75,
+    ):
+        # Derive collection from name if not provided
+        if collection is None:
+            if name is not None:
+                collection = name.lower().replace(" ", "_")
+            else:
+                raise ValueError("Either 'collection' or 'name' must be provided.")
+
+        # Dynamic ID generation based on unique identifiers
+        if id is None:
+            from agno.utils.string import generate_id
+
+            id = generate_id(f"{path}#{collection}")
+
+        super().__init__(id=id, name=name, description=description)
+
+        self.collection_name: str = collection
+        self.path: str = path
+        self.directory: Path = Path(path) / collection
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_debug("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.distance: Distance = distance
+        self.search_type: SearchType = search_type
+        self.reranker: Optional[Reranker] = reranker
+        self.hybrid_rrf_k: int = hybrid_rrf_k
+
+        # Index configuration
+        self.nprobe: int = nprobe
+        self.ivf_min_vectors: int = ivf_min_vectors
+        self.exact_search_threshold: int = exact_search_threshold
+        self.max_segments: int = max_segments
+        self.compaction_threshold: float = compaction_threshold
+        self.background_compaction: bool = background_compaction
+        self.bm25_k1: float = bm25_k1
+        self.bm25_b: float = bm25_b
+
+        # Collection state, guarded by _lock
+        self._lock = RLock()
+        self._loaded: bool = False
+        self._dimensions: Optional[int] = None
+        self._segments: List[Segment] = []
+        self._next_segment: int = 0
+        self._ids: Dict[str, Tuple[Segment, int]] = {}
+        self._ivf: Optional[IvfIndex] = None
+        self._ivf_trained_on: int = 0
+
+        # Serializes compactions
+        self._compaction_lock = Lock()
+        self._compaction_thread: Optional[Thread] = None
+        self._closed: bool = False
+
+    @property
+    def _manifest_file(self) -> Path:
+        return self.directory / "manifest.json"
+
+    @property
+    def _ivf_file(self) -> Path:
+        return self.directory / "ivf.npy"
+
+    def _load(self) -> None:
+        """Load the collection from disk on first use."""
+        with self._lock:
+            if self._loaded:
+                return
+            if self._manifest_file.exists():
+                manifest = json.loads(self._manifest_file.read_text(encoding="utf-8"))
+                if manifest["distance"] != self.distance.value:
+                    log_warning(
+                        f"Collection '{self.collection_name}' was created with distance {manifest['distance']}, "
+                        f"using it instead of {self.distance.value}"
+                    )
+                    self.distance = Distance(manifest["distance"])
+                self._dimensions = manifest["dimensions"]
+                self._next_segment = manifest["next_segment"]
+                if self._dimensions is not None:
+                    self._segments = [
+                        Segment.load(self.directory, segment["name"], self._dimensions, segment["deleted"])
+                        for segment in manifest["segments"]
+                    ]
+                if self._ivf_file.exists():
+                    self._ivf = IvfIndex.load(self._ivf_file)
+                    self._ivf_trained_on = manifest.get("ivf_trained_on", 0)
+                    for segment in self._segments:
+                        segment.assignments = self._ivf.assign(segment.vectors)
+                self._rebuild_ids()
+                log_debug(f"Loaded {len(self._segments)} segments of collection '{self.collection_name}'")
+            self._loaded = True
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "distance": self.distance.value,
+            "dimensions": self._dimensions,
+            "next_segment": self._next_segment,
+            "ivf_trained_on": self._ivf_trained_on,
+            "segments": [{"name": segment.name, "deleted": segment.deleted} for segment in self._segments],
+        }
+        atomic_write(self._manifest_file, json.dumps(manifest).encode("utf-8"))
+
+    def _rebuild_ids(self) -> None:
+        self._ids = {}
+        for segment in self._segments:
+            for row in np.flatnonzero(segment.live):
+                self._ids[segment.records[row]["id"]] = (segment, int(row))
+
+    def _new_segment_name(self) -> str:
+        name = f"segment-{self._next_segment:08d}"
+        self._next_segment += 1
+        return name
+
+    def create(self) -> None:
+        """Create the collection directory."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load()
+            if not self._manifest_file.exists():
+                log_debug(f"Creating collection: {self.collection_name}")
+                self._write_manifest()
+
+    async def async_create(self) -> None:
+        await asyncio.to_thread(self.create)
+
+    def exists(self) -> bool:
+        return self._manifest_file.exists()
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def drop(self) -> None:
+        """Delete the collection and its files, waiting for a running background compaction first."""
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+        with self._lock:
+            if self.directory.exists():
+                log_debug(f"Deleting collection: {self.collection_name}")
+                shutil.rmtree(self.directory)
+            self._segments = []
+            self._ids = {}
+            self._ivf = None
+            self._ivf_trained_on = 0
+            self._dimensions = None
+            self._next_segment = 0
+            self._loaded = False
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def delete(self) -> bool:
+        """Delete all documents in the collection."""
+        try:
+            self.drop()
+            self.create()
+            return True
+        except Exception as e:
+            logger.error(f"Error clearing collection: {e}")
+            return False
+
+    def get_count(self) -> int:
+        """Get the number of documents in the collection."""
+        self._load()
+        with self._lock:
+            return len(self._ids)
+
+    def get_supported_search_types(self) -> List[str]:
+        return [SearchType.vector, SearchType.keyword, SearchType.hybrid]
+
+    # Writes
+
+    def _prepare_vectors(self, embeddings: List[Any]) -> Any:
+        vectors: Any = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError("All embeddings must have the same number of dimensions")
+        if self._dimensions is not None and vectors.shape[1] != self._dimensions:
+            raise ValueError(f"Expected embeddings of {self._dimensions} dimensions, got {vectors.shape[1]}")
+        if self.distance == Distance.cosine:
+            # Normalize once on insert so cosine similarity is a dot product
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+        return vectors
+
+    def _prepare_query(self, embedding: Any) -> Tuple[Any, float]:
+        query = np.asarray(embedding, dtype=np.float32)
+        if self.distance == Distance.cosine:
+            norm = np.linalg.norm(query)
+            if norm > 0:
+                query = query / norm
+        return query, float(query @ query)
+
+    def _embed_documents(self, documents: List[Document]) -> None:
+        """Embed the documents that don't have an embedding yet."""
+        for document in documents:
+            if document.embedding is None or len(document.embedding) == 0:
+                document.embed(embedder=self.embedder)
+
+    async def _async_embed_documents(self, documents: List[Document]) -> None:
+        """Embed the documents that don't have an embedding yet, in batches if the embedder supports it."""
+        missing = [doc for doc in documents if doc.embedding is None or len(doc.embedding) == 0]
+        if not missing:
+            return
+        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
+            try:
+                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(
+                    [doc.content for doc in missing]
+                )
+                for j, doc in enumerate(missing):
+                    if j < len(embeddings):
+                        doc.embedding = embeddings[j]
+                        doc.usage = usages[j] if j < len(usages) else None
+                return
+            except Exception as e:
+                # Don't fall back on rate limits, it would make things worse
+                if self.embedder._is_rate_limit_error(e):
+                    logger.error(f"Rate limit detected during batch embedding. {e}")
+                    raise e
+                logger.warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
+        await asyncio.gather(*[doc.async_embed(embedder=self.embedder) for doc in missing], return_exceptions=True)
+
+    def _write_documents(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write the embedded documents as a new segment. Documents with an existing id replace the stored ones."""
+        records: List[Dict[str, Any]] = []
+        embeddings: List[Any] = []
+        for document in documents:
+            if document.embedding is None or len(document.embedding) == 0:
+                log_error(f"Skipping document without embedding: {document.name}")
+                continue
+            cleaned_content = document.content.replace("\x00", "\ufffd")
+            # Include content_hash in ID to ensure uniqueness across different content hashes
+            base_id = document.id or md5(cleaned_content.encode()).hexdigest()
+            meta_data = dict(document.meta_data or {})
+            if filters:
+                meta_data.update(filters)
+            records.append(
+                {
+                    "id": md5(f"{base_id}_{content_hash}".encode()).hexdigest(),
+                    "name": document.name,
+                    "content": cleaned_content,
+                    "meta_data": meta_data,
+                    "content_id": document.content_id,
+                    "content_hash": content_hash,
+                    "usage": document.usage,
+                }
+            )
+            embeddings.append(document.embedding)
+        if not records:
+            return
+
+        with self._lock:
+            self.create()
+            vectors = self._prepare_vectors(embeddings)
+            if self._dimensions is None:
+                self._dimensions = vectors.shape[1]
+            segment = Segment.write(self.directory, self._new_segment_name(), records, vectors)
+            if self._ivf is not None:
+                segment.assignments = self._ivf.assign(segment.vectors)
+            # Later writes of the same id replace earlier ones, including duplicates within this batch
+            for row, record in enumerate(records):
+                previous = self._ids.get(record["id"])
+                if previous is not None:
+                    previous[0].delete(previous[1])
+                self._ids[record["id"]] = (segment, row)
+            self._segments.append(segment)
+            self._write_manifest()
+            log_debug(f"Wrote {len(records)} documents to {segment.name}")
+            self._maybe_compact()
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents into the collection, embedding those without an embedding."""
+        log_info(f"Inserting {len(documents)} documents")
+        self._embed_documents(documents)
+        self._write_documents(content_hash, documents, filters)
+
+    async def async_insert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        log_info(f"Async Inserting {len(documents)} documents")
+        await self._async_embed_documents(documents)
+        await asyncio.to_thread(self._write_documents, content_hash, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Replace the documents stored for content_hash."""
+        log_info(f"Upserting {len(documents)} documents")
+        self._embed_documents(documents)
+        with self._lock:
+            self._delete_where({"content_hash": content_hash})
+            self._write_documents(content_hash, documents, filters)
+
+    async def async_upsert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        log_info(f"Async Upserting {len(documents)} documents")
+        await self._async_embed_documents(documents)
+
+        def replace() -> None:
+            with self._lock:
+                self._delete_where({"content_hash": content_hash})
+                self._write_documents(content_hash, documents, filters)
+
+        await asyncio.to_thread(replace)
+
+    def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        """Merge metadata into the documents with the given content_id."""
+        self._load()
+        with self._lock:
+            updated = 0
+            for segment in self._segments:
+                rows = np.flatnonzero(segment.live & segment.filter_mask({"content_id": content_id}))
+                if len(rows) > 0:
+                    segment.update_metadata(rows, metadata)
+                    updated += len(rows)
+            if updated == 0:
+                log_debug(f"No documents found with content_id: {content_id}")
+            else:
+                log_debug(f"Updated metadata for {updated} documents with content_id: {content_id}")
+
+    # Deletes
+
+    def _delete_where(self, filters: Filters) -> bool:
+        self._load()
+        with self._lock:
+            deleted = 0
+            for segment in self._segments:
+                rows = np.flatnonzero(segment.live & segment.filter_mask(filters))
+                if len(rows) == 0:
+                    continue
+                segment.delete(rows)
+                for row in rows:
+                    self._ids.pop(segment.records[row]["id"], None)
+                deleted += len(rows)
+            if deleted:
+                self._write_manifest()
+                log_debug(f"Deleted {deleted} documents matching {filters}")
+                self._maybe_compact()
+            return deleted > 0
+
+    def delete_by_id(self, id: str) -> bool:
+        self._load()
+        with self._lock:
+            location = self._ids.pop(id, None)
+            if location is None:
+                return False
+            location[0].delete(location[1])
+            self._write_manifest()
+            self._maybe_compact()
+            return True
+
+    def delete_by_name(self, name: str) -> bool:
+        return self._delete_where({"name": name})
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        return self._delete_where(metadata)
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        return self._delete_where({"content_id": content_id})
+
+    # Lookups
+
+    def _any_match(self, filters: Filters) -> bool:
+        self._load()
+        with self._lock:
+            return any((segment.live & segment.filter_mask(filters)).any() for segment in self._segments)
+
+    def id_exists(self, id: str) -> bool:
+        self._load()
+        return id in self._ids
+
+    def name_exists(self, name: str) -> bool:
+        return self._any_match({"name": name})
+
+    async def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        return self._any_match({"content_hash": content_hash})
+
+    # Search
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Filters] = None) -> List[Document]:
+        """Search the collection for a query.
+
+        Args:
+            query (str): Query to search for.
+            limit (int): Number of results to return.
+            filters (Optional[Union[Dict[str, Any], List[FilterExpr]]]): Metadata filters, either a dict of values to
+                match or a list of filter expressions (EQ, IN, GT, LT, AND, OR, NOT).
+        Returns:
+            List[Document]: List of search results.
+        """
+        if self.search_type == SearchType.vector:
+            hits = self._vector_hits(self._embed_query(query), limit, filters)
+        elif self.search_type == SearchType.keyword:
+            hits = self._keyword_hits(query, limit, filters)
+        elif self.search_type == SearchType.hybrid:
+            hits = self._hybrid_hits(query, limit, filters)
+        else:
+            logger.error(f"Invalid search type '{self.search_type}'.")
+            return []
+        search_results = self._build_search_results(hits)
+
+        if self.reranker and search_results:
+            try:
+                search_results = self.reranker.rerank(query=query, documents=search_results)
+            except Exception as e:
+                log_warning(f"Reranker failed, returning unranked results: {e}")
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    async def async_search(self, query: str, limit: int = 5, filters: Optional[Filters] = None) -> List[Document]:
+        return await asyncio.to_thread(self.search, query, limit, filters)
+
+    def search_by_embedding(
+        self, embedding: Any, limit: int = 5, filters: Optional[Filters] = None, exact: bool = False
+    ) -> List[Document]:
+        """Search by a query embedding. With exact=True, scan every vector instead of the closest IVF lists."""
+        return self._build_search_results(self._vector_hits(embedding, limit, filters, exact=exact))
+
+    def _embed_query(self, query: str) -> Any:
+        embedding = self.embedder.get_embedding(query)
+        if embedding is None or len(embedding) == 0:
+            raise ValueError(f"Failed to embed query: {query}")
+        return embedding
+
+    def _snapshot(self, filters: Optional[Filters]) -> Tuple[List[Segment], List[Any], Optional[IvfIndex]]:
+        """Segments to search, with the mask of their live rows matching the filters."""
+        self._load()
+        with self._lock:
+            segments = list(self._segments)
+            ivf = self._ivf
+        masks = [
+            segment.live & segment.filter_mask(filters) if filters else segment.live.copy() for segment in segments
+        ]
+        return segments, masks, ivf
+
+    def _vector_hits(self, embedding: Any, limit: int, filters: Optional[Filters], exact: bool = False) -> List[Hit]:
+        query, query_norm = self._prepare_query(embedding)
+        segments, masks, ivf = self._snapshot(filters)
+        if self._dimensions is not None and len(query) != self._dimensions:
+            raise ValueError(f"Expected a query embedding of {self._dimensions} dimensions, got {len(query)}")
+
+        lists = None
+        if ivf is not None and not exact:
+            # A selective filter leaves few enough candidates to score all of them
+            if not filters or sum(int(mask.sum()) for mask in masks) > self.exact_search_threshold:
+                lists = ivf.probe(query, self.nprobe, self.distance)
+
+        hits: List[Hit] = []
+        for segment, mask in zip(segments, masks):
+            if lists is not None and segment.assignments is not None:
+                mask &= np.isin(segment.assignments, lists)
+            rows = np.flatnonzero(mask)
+            if len(rows) == 0:
+                continue
+            scores = segment.vector_scores(query, query_norm, rows, self.distance)
+            hits.extend((float(scores[i]), segment, int(rows[i])) for i in top_k(scores, limit))
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+        return hits[:limit]
+
+    def _keyword_hits(self, query: str, limit: int, filters: Optional[Filters]) -> List[Hit]:
+        segments, masks, _ = self._snapshot(filters)
+        hits: List[Hit] = []
+        for segment, scores in zip(segments, bm25_scores(segments, masks, query, self.bm25_k1, self.bm25_b)):
+            if scores is None:
+                continue
+            hits.extend((float(scores[i]), segment, int(i)) for i in top_k(scores, limit) if scores[i] > 0)
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+        return hits[:limit]
+
+    def _hybrid_hits(self, query: str, limit: int, filters: Optional[Filters]) -> List[Hit]:
+        """Fuse vector and keyword rankings with Reciprocal Rank Fusion: score(d) = sum(1 / (k + rank_i(d)))."""
+        candidates = max(limit * 4, 20)
+        fused: Dict[Tuple[str, int], Hit] = {}
+        for ranking in (
+            self._vector_hits(self._embed_query(query), candidates, filters),
+            self._keyword_hits(query, candidates, filters),
+        ):
+            for rank, (_, segment, row) in enumerate(ranking, start=1):
+                key = (segment.name, row)
+                score = fused[key][0] if key in fused else 0.0
+                fused[key] = (score + 1.0 / (self.hybrid_rrf_k + rank), segment, row)
+        return sorted(fused.values(), key=lambda hit: hit[0], reverse=True)[:limit]
+
+    def _build_search_results(self, hits: List[Hit]) -> List[Document]:
+        search_results: List[Document] = []
+        for _, segment, row in hits:
+            record = segment.records[row]
+            search_results.append(
+                Document(
+                    id=record["id"],
+                    name=record["name"],
+                    meta_data=dict(record["meta_data"]),
+                    content=record["content"],
+                    embedder=self.embedder,
+                    embedding=segment.vectors[row].tolist(),
+                    usage=record["usage"],
+                    content_id=record["content_id"],
+                )
+            )
+        return search_results
+
+    # Compaction
+
+    def _needs_compaction(self) -> bool:
+        total = sum(len(segment) for segment in self._segments)
+        live = len(self._ids)
+        if len(self._segments) > self.max_segments:
+            return True
+        if total > 0 and (total - live) / total > self.compaction_threshold:
+            return True
+        # Train the IVF index once there are enough vectors, and retrain it when the collection has doubled
+        return live >= self.ivf_min_vectors and live > 2 * self._ivf_trained_on
+
+    def _maybe_compact(self) -> None:
+        with self._lock:
+            if self._closed or not self.background_compaction or not self._needs_compaction():
+                return
+            if self._compaction_thread is not None and self._compaction_thread.is_alive():
+                return
+            # Not a daemon, so the interpreter waits for a running compaction instead of killing it mid-write
+            self._compaction_thread = Thread(target=self._compact_in_background, name="agno-vectordb-compaction")
+            self._compaction_thread.start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            log_error(f"Error compacting collection '{self.collection_name}': {e}")
+
+    def compact(self) -> bool:
+        """Merge all segments into one without the deleted rows, (re)training the IVF index if needed.
+
+        Searches and writes continue while the merged segment is built. If documents of the merged segments are
+        deleted or updated meanwhile, the result is discarded and False returned.
+        """
+        self._load()
+        with self._compaction_lock:
+            with self._lock:
+                segments = list(self._segments)
+                versions = [segment.version for segment in segments]
+                masks = [segment.live.copy() for segment in segments]
+                ivf = self._ivf
+                trained_on = self._ivf_trained_on
+                name = self._new_segment_name() if segments else None
+            if name is None or self._dimensions is None:
+                return False
+
+            records = [segment.records[row] for segment, mask in zip(segments, masks) for row in np.flatnonzero(mask)]
+            merged: Optional[Segment] = None
+            if records:
+                vectors = np.concatenate([np.asarray(segment.vectors[mask]) for segment, mask in zip(segments, masks)])
+                if len(records) >= self.ivf_min_vectors and (ivf is None or len(records) > 2 * trained_on):
+                    log_debug(f"Training IVF index on {len(records)} vectors")
+                    ivf = IvfIndex.train(vectors, num_lists=int(sqrt(len(records))))
+                    trained_on = len(records)
+                merged = Segment.write(self.directory, name, records, vectors)
+                if ivf is not None:
+                    merged.assignments = ivf.assign(merged.vectors)
+
+            with self._lock:
+                unchanged = self._segments[: len(segments)] == segments and all(
+                    segment.version == version for segment, version in zip(segments, versions)
+                )
+                if not unchanged:
+                    log_debug("Collection changed during compaction, discarding the merged segment")
+                    for path in merged.files if merged is not None else []:
+                        path.unlink(missing_ok=True)
+                    return False
+
+                new_segments = self._segments[len(segments) :]
+                if ivf is not self._ivf and ivf is not None:
+                    ivf.save(self._ivf_file)
+                    for segment in new_segments:
+                        segment.assignments = ivf.assign(segment.vectors)
+                self._ivf = ivf
+                self._ivf_trained_on = trained_on
+                self._segments = ([merged] if merged is not None else []) + new_segments
+                self._rebuild_ids()
+                self._write_manifest()
+
+            for segment in segments:
+                for path in segment.files:
+                    path.unlink(missing_ok=True)
+            log_debug(f"Compacted {len(segments)} segments into {name}")
+            return True
+
+    def close(self) -> None:
+        """Stop compacting in the background, waiting for a running compaction.
+
+        Call it before removing or reusing the directory. Writes after close() are compacted by optimize() only.
+        """
+        with self._lock:
+            self._closed = True
+            thread = self._compaction_thread
+        if thread is not None:
+            thread.join()
+
+    async def async_close(self) -> None:
+        await asyncio.to_thread(self.close)
+
+    def __enter__(self) -> "LocalVectorDb":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def optimize(self) -> None:
+        """Compact the collection now, waiting for a running background compaction first."""
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+        self.compact()
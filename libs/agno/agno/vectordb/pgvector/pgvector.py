@@ -11,9 +11,9 @@ try:
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
-    from sqlalchemy.schema import Column, Index, MetaData, Table
+    from sqlalchemy.schema import Column, Computed, Index, MetaData, Table
     from sqlalchemy.sql.elements import ColumnElement
-    from sqlalchemy.sql.expression import bindparam, desc, func, select, text
+    from sqlalchemy.sql.expression import bindparam, func, select, text
     from sqlalchemy.types import DateTime, Integer, String
 
 except ImportError:
@@ -63,6 +63,8 @@ class PgVector(VectorDb):
         auto_upgrade_schema: bool = False,
         reranker: Optional[Reranker] = None,
         create_schema: bool = True,
+        hybrid_candidates: int = 100,
+        hybrid_rrf_k: int = 60,
     ):
         """
         Initialize the PgVector instance.
@@ -85,6 +87,9 @@ class PgVector(VectorDb):
             auto_upgrade_schema (bool): Automatically upgrade schema if True.
             create_schema (bool): Whether to automatically create the database schema if it doesn't exist.
                 Set to False if schema is managed externally (e.g., via migrations). Defaults to True.
+            hybrid_candidates (int): Number of candidates taken from each of the vector and full-text indexes
+                in hybrid search before fusing them.
+            hybrid_rrf_k (int): RRF (Reciprocal Rank Fusion) constant used to fuse the hybrid search candidates.
         """
         if not table_name:
             raise ValueError("Table name must be provided.")
@@ -150,6 +155,12 @@ class PgVector(VectorDb):
         # Reranker instance
         self.reranker: Optional[Reranker] = reranker
 
+        # Hybrid search fuses the top candidates of the vector and full-text indexes
+        self.hybrid_candidates: int = hybrid_candidates
+        self.hybrid_rrf_k: int = hybrid_rrf_k
+        # Whether the table has the generated content_tsv column, checked on first text search
+        self._has_tsvector_column: Optional[bool] = None
+
         # Schema creation flag
         self.create_schema: bool = create_schema
 
@@ -182,6 +193,8 @@ class PgVector(VectorDb):
             Column("updated_at", DateTime(timezone=True), onupdate=func.now()),
             Column("content_hash", String),
             Column("content_id", String),
+            # Full-text search vector, kept up to date by Postgres and served by the GIN index
+            Column("content_tsv", postgresql.TSVECTOR, Computed(self._tsvector_expression(), persisted=True)),
             extend_existing=True,
         )
 
@@ -192,6 +205,11 @@ class PgVector(VectorDb):
         Index(f"idx_{self.table_name}_content_id", table.c.content_id)
         return table
 
+    def _tsvector_expression(self) -> str:
+        """SQL expression of the generated content_tsv column."""
+        language = self.content_language.replace("'", "''")
+        return f"to_tsvector('{language}'::regconfig, coalesce(content, ''))"
+
     def get_table(self) -> Table:
         """
         Get the SQLAlchemy Table object based on the current schema version.
@@ -231,6 +249,43 @@ class PgVector(VectorDb):
                     sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
             log_debug(f"Creating table: {self.table_name}")
             self.table.create(self.db_engine)
+            self._has_tsvector_column = True
+        elif not self._tsvector_column_exists() and self.auto_upgrade_schema:
+            self._add_tsvector_column()
+
+    def _tsvector_column_exists(self) -> bool:
+        """Check if the table has the content_tsv column, which tables created by older versions lack."""
+        if self._has_tsvector_column is None:
+            try:
+                columns = inspect(self.db_engine).get_columns(self.table_name, schema=self.schema)
+            except Exception as e:
+                log_error(f"Error checking columns of table '{self.table.fullname}': {e}")
+                return False
+            self._has_tsvector_column = any(column["name"] == "content_tsv" for column in columns)
+            if not self._has_tsvector_column:
+                log_warning(
+                    f"Table '{self.table.fullname}' has no content_tsv column, full-text search will not use an index. "
+                    "Set auto_upgrade_schema=True and call create() to add it."
+                )
+        return self._has_tsvector_column
+
+    def _add_tsvector_column(self) -> None:
+        """Add the generated content_tsv column to an existing table. Rewrites the table, so it can take a while."""
+        log_info(f"Adding content_tsv column to table '{self.table.fullname}'")
+        with self.Session() as sess, sess.begin():
+            sess.execute(
+                text(
+                    f"ALTER TABLE {self.table.fullname} ADD COLUMN IF NOT EXISTS content_tsv tsvector "
+                    f"GENERATED ALWAYS AS ({self._tsvector_expression()}) STORED;"
+                )
+            )
+        self._has_tsvector_column = True
+
+    def _text_search_vector(self) -> ColumnElement:
+        """The stored content_tsv column, or the tsvector computed per row for tables without it."""
+        if self._tsvector_column_exists():
+            return self.table.c.content_tsv
+        return func.to_tsvector(self.content_language, self.table.c.content)
 
     async def async_create(self) -> None:
         """Create the table asynchronously by running in a thread."""
@@ -934,13 +989,16 @@ class PgVector(VectorDb):
             stmt = select(*columns)
 
             # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+            ts_vector = self._text_search_vector()
             # Create the ts_query using websearch_to_tsquery with parameter binding
             processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
             ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
             # Compute the text rank
             text_rank = func.ts_rank_cd(ts_vector, ts_query)
 
+            # Only rank matching rows, which the GIN index finds
+            stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
             # Apply filters if provided
             if filters is not None:
                 # Handle dict filters
@@ -995,6 +1053,19 @@ class PgVector(VectorDb):
             log_error(f"Error during keyword search: {e}")
             return []
 
+    def _apply_filters(self, stmt, filters: Optional[Union[Dict[str, Any], List[FilterExpr]]]):
+        """Apply dict filters or FilterExpr DSL filters to a select statement."""
+        if filters is None:
+            return stmt
+        # Handle dict filters
+        if isinstance(filters, dict):
+            return stmt.where(self.table.c.meta_data.contains(filters))
+        # Handle FilterExpr DSL: convert each expression to SQLAlchemy and AND them together
+        sqlalchemy_conditions = [
+            self._dsl_to_sqlalchemy(f.to_dict() if hasattr(f, "to_dict") else f, self.table) for f in filters
+        ]
+        return stmt.where(and_(*sqlalchemy_conditions))
+
     def hybrid_search(
         self,
         query: str,
@@ -1004,6 +1075,10 @@ class PgVector(VectorDb):
         """
         Perform a hybrid search combining vector similarity and full-text search.
 
+        The top hybrid_candidates rows by vector distance (served by the vector index) and by text rank (served by the
+        GIN index on content_tsv) are fused with weighted Reciprocal Rank Fusion:
+        score = vector_score_weight / (k + vector_rank) + (1 - vector_score_weight) / (k + text_rank).
+
         Args:
             query (str): The search query.
             limit (int): Maximum number of results to return.
@@ -1019,78 +1094,79 @@ class PgVector(VectorDb):
                 log_error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
+            # Validate the vector_weight parameter
+            if not 0 <= self.vector_score_weight <= 1:
+                raise ValueError("vector_score_weight must be between 0 and 1")
+            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+            num_candidates = max(self.hybrid_candidates, limit)
 
-            # Compute the vector similarity score
+            # Vector candidates, ordered by distance so the vector index serves them
             if self.distance == Distance.l2:
-                # For L2 distance, smaller distances are better
                 vector_distance = self.table.c.embedding.l2_distance(query_embedding)
-                # Invert and normalize the distance to get a similarity score between 0 and 1
-                vector_score = 1 / (1 + vector_distance)
             elif self.distance == Distance.cosine:
-                # For cosine distance, smaller distances are better
                 vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
-                vector_score = 1 / (1 + vector_distance)
             elif self.distance == Distance.max_inner_product:
-                # For inner product, higher values are better
-                # Assume embeddings are normalized, so inner product ranges from -1 to 1
-                raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
-                # Normalize to range [0, 1]
-                vector_score = (raw_vector_score + 1) / 2
+                vector_distance = self.table.c.embedding.max_inner_product(query_embedding)
             else:
                 log_error(f"Unknown distance metric: {self.distance}")
                 return []
-
-            # Apply weights to control the influence of each score
-            # Validate the vector_weight parameter
-            if not 0 <= self.vector_score_weight <= 1:
-                raise ValueError("vector_score_weight must be between 0 and 1")
-            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
-
-            # Combine the scores into a hybrid score
-            hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
-
-            # Build the base statement, including the hybrid score
-            stmt = select(*columns, hybrid_score.label("hybrid_score"))
-
-            # Add the full-text search condition
-            # stmt = stmt.where(ts_vector.op("@@")(ts_query))
-
-            # Apply filters if provided
-            if filters is not None:
-                # Handle dict filters
-                if isinstance(filters, dict):
-                    stmt = stmt.where(self.table.c.meta_data.contains(filters))
-                # Handle FilterExpr DSL
-                else:
-                    # Convert each DSL expression to SQLAlchemy and AND them together
-                    sqlalchemy_conditions = [
-                        self._dsl_to_sqlalchemy(f.to_dict() if hasattr(f, "to_dict") else f, self.table)
-                        for f in filters
-                    ]
-                    stmt = stmt.where(and_(*sqlalchemy_conditions))
-
-            # Order the results by the hybrid score in descending order
-            stmt = stmt.order_by(desc("hybrid_score"))
-
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            vector_candidates = (
+                self._apply_filters(select(self.table.c.id, vector_distance.label("distance")), filters)
+                .order_by(vector_distance)
+                .limit(num_candidates)
+                .subquery("vector_candidates")
+            )
+            vector_ranks = select(
+                vector_candidates.c.id,
+                func.row_number().over(order_by=vector_candidates.c.distance).label("rank"),
+            ).subquery("vector_ranks")
+
+            # Full-text candidates, matched through the GIN index
+            ts_vector = self._text_search_vector()
+            # Create the ts_query using websearch_to_tsquery with parameter binding
+            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
+            text_rank = func.ts_rank_cd(ts_vector, ts_query)
+            text_candidates = (
+                self._apply_filters(
+                    select(self.table.c.id, text_rank.label("text_rank")).where(ts_vector.op("@@")(ts_query)), filters
+                )
+                .order_by(text_rank.desc())
+                .limit(num_candidates)
+                .subquery("text_candidates")
+            )
+            text_ranks = select(
+                text_candidates.c.id,
+                func.row_number().over(order_by=text_candidates.c.text_rank.desc()).label("rank"),
+            ).subquery("text_ranks")
+
+            # Fuse both candidate sets by rank
+            fused = (
+                select(
+                    func.coalesce(vector_ranks.c.id, text_ranks.c.id).label("id"),
+                    (
+                        func.coalesce(self.vector_score_weight / (self.hybrid_rrf_k + vector_ranks.c.rank), 0)
+                        + func.coalesce(text_rank_weight / (self.hybrid_rrf_k + text_ranks.c.rank), 0)
+                    ).label("hybrid_score"),
+                )
+                .select_from(vector_ranks.outerjoin(text_ranks, vector_ranks.c.id == text_ranks.c.id, full=True))
+                .subquery("fused")
+            )
+
+            # Fetch the winning rows, without their embeddings
+            stmt = (
+                select(
+                    self.table.c.id,
+                    self.table.c.name,
+                    self.table.c.meta_data,
+                    self.table.c.content,
+                    self.table.c.usage,
+                    fused.c.hybrid_score,
+                )
+                .join(fused, self.table.c.id == fused.c.id)
+                .order_by(fused.c.hybrid_score.desc())
+                .limit(limit)
+            )
 
             # Log the query for debugging
             log_debug(f"Hybrid search query: {stmt}")
@@ -1102,7 +1178,9 @@ class PgVector(VectorDb):
                         if isinstance(self.vector_index, Ivfflat):
                             sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
                         elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                            # HNSW returns at most ef_search rows, so it must cover all the candidates
+                            ef_search = max(self.vector_index.ef_search, num_candidates)
+                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
                 log_error(f"Error performing hybrid search: {e}")
@@ -1118,7 +1196,6 @@ class PgVector(VectorDb):
                         meta_data=result.meta_data,
                         content=result.content,
                         embedder=self.embedder,
-                        embedding=result.embedding,
                         usage=result.usage,
                     )
                 )
@@ -1370,9 +1447,13 @@ class PgVector(VectorDb):
             with self.Session() as sess, sess.begin():
                 log_debug(f"Creating GIN index '{gin_index_name}' on table '{self.table.fullname}'.")
                 # Create index
+                if self._tsvector_column_exists():
+                    indexed_expression = "content_tsv"
+                else:
+                    language = self.content_language.replace("'", "''")
+                    indexed_expression = f"to_tsvector('{language}', content)"
                 create_gin_index_sql = text(
-                    f'CREATE INDEX "{gin_index_name}" ON {self.table.fullname} '
-                    f"USING GIN (to_tsvector({self.content_language}, content));"
+                    f'CREATE INDEX "{gin_index_name}" ON {self.table.fullname} USING GIN ({indexed_expression});'
                 )
                 sess.execute(create_gin_index_sql)
         except Exception as e:
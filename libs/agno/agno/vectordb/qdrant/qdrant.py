@@ -436,14 +436,16 @@ class Qdrant(VectorDb):
             base_id = document.id or md5(cleaned_content.encode()).hexdigest()
             doc_id = md5(f"{base_id}_{content_hash}".encode()).hexdigest()
 
+            # Qdrant points take lists, so convert float32 arrays (Embedder.use_numpy) here
+            embedding = document.embedding.tolist() if hasattr(document.embedding, "tolist") else document.embedding
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                vector = document.embedding  # Already embedded above
+                vector = embedding  # Already embedded above
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    vector[self.dense_vector_name] = document.embedding  # Already embedded above
+                    vector[self.dense_vector_name] = embedding  # Already embedded above
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
                     vector[self.sparse_vector_name] = next(
@@ -21,10 +21,11 @@ from typing import (
 )
 from uuid import uuid4
 
-from fastapi import WebSocket
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
+    from fastapi import WebSocket
+
     from agno.os.managers import WebSocketHandler
 
 from agno.agent.agent import Agent
@@ -74,12 +75,6 @@ from agno.utils.log import (
     set_log_level_to_info,
     use_workflow_logger,
 )
-from agno.utils.print_response.workflow import (
-    aprint_response,
-    aprint_response_stream,
-    print_response,
-    print_response_stream,
-)
 from agno.utils.string import generate_id_from_name
 from agno.workflow.agent import WorkflowAgent
 from agno.workflow.condition import Condition
@@ -4007,7 +4002,7 @@ class Workflow:
         stream: Literal[False] = False,
         stream_events: Optional[bool] = None,
         background: Optional[bool] = False,
-        websocket: Optional[WebSocket] = None,
+        websocket: Optional["WebSocket"] = None,
         background_tasks: Optional[Any] = None,
         dependencies: Optional[Dict[str, Any]] = None,
     ) -> WorkflowRunOutput: ...
@@ -4028,7 +4023,7 @@ class Workflow:
         stream: Literal[True] = True,
         stream_events: Optional[bool] = None,
         background: Optional[bool] = False,
-        websocket: Optional[WebSocket] = None,
+        websocket: Optional["WebSocket"] = None,
         background_tasks: Optional[Any] = None,
         dependencies: Optional[Dict[str, Any]] = None,
     ) -> AsyncIterator[WorkflowRunOutputEvent]: ...
@@ -4048,7 +4043,7 @@ class Workflow:
         stream: Optional[bool] = None,
         stream_events: Optional[bool] = None,
         background: Optional[bool] = False,
-        websocket: Optional[WebSocket] = None,
+        websocket: Optional["WebSocket"] = None,
         background_tasks: Optional[Any] = None,
         dependencies: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
@@ -4278,6 +4273,8 @@ class Workflow:
         if "stream_events" in kwargs:
             kwargs.pop("stream_events")
 
+        from agno.utils.print_response.workflow import print_response, print_response_stream
+
         if stream:
             print_response_stream(
                 workflow=self,
@@ -4354,6 +4351,8 @@ class Workflow:
         if "stream_events" in kwargs:
             kwargs.pop("stream_events")
 
+        from agno.utils.print_response.workflow import aprint_response, aprint_response_stream
+
         if stream:
             await aprint_response_stream(
                 workflow=self,
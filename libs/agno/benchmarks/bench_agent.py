@@ -0,0 +1,141 @@
+"""Overhead of the Agent: construction, copies, context assembly, tool parsing and runs against a mock model."""
+
+from itertools import count
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.models.mock import MockModel, MockToolCall
+from agno.run.agent import RunInput, RunOutput
+from agno.run.base import RunContext
+
+from .fixtures import TOOLS, make_session, sample_text
+from .runner import benchmark
+
+
+@benchmark
+def instantiate():
+    return lambda: Agent(model=MockModel(), telemetry=False)
+
+
+@benchmark
+def instantiate_with_tools():
+    return lambda: Agent(model=MockModel(), tools=TOOLS, instructions=["Be concise."] * 5, telemetry=False)
+
+
+@benchmark
+def deep_copy():
+    agent = Agent(model=MockModel(), tools=TOOLS, db=InMemoryDb(), instructions=["Be concise."] * 5, telemetry=False)
+    return agent.deep_copy
+
+
+def _prepare_run(agent: Agent, input: str):
+    """The state an Agent builds before assembling the messages of a run"""
+    agent.initialize_agent()
+    session = agent._read_or_create_session(session_id="benchmark-session", user_id="benchmark-user")
+    run_context = RunContext(run_id="benchmark-run", session_id=session.session_id, session_state={})
+    run_response = RunOutput(
+        run_id=run_context.run_id,
+        session_id=session.session_id,
+        agent_id=agent.id,
+        input=RunInput(input_content=input),
+    )
+    return session, run_context, run_response
+
+
+@benchmark
+def parse_tools():
+    agent = Agent(model=MockModel(), tools=TOOLS, telemetry=False)
+    session, run_context, run_response = _prepare_run(agent, "What is the weather in Paris?")
+    tools = agent.get_tools(run_response=run_response, run_context=run_context, session=session)
+    assert agent.model is not None
+    model = agent.model
+    return lambda: agent._parse_tools(tools=tools, model=model, run_context=run_context)
+
+
+@benchmark(num_iterations=20)
+def get_run_messages():
+    # A system message with instructions and tools, and the history of a session with 20 runs
+    db = InMemoryDb()
+    db.upsert_session(make_session(num_runs=20))
+    agent = Agent(
+        model=MockModel(),
+        db=db,
+        tools=TOOLS,
+        instructions=["Be concise.", "Answer in English."],
+        add_history_to_context=True,
+        num_history_runs=10,
+        add_datetime_to_context=True,
+        telemetry=False,
+    )
+    input = "What is the weather in Paris?"
+    session, run_context, run_response = _prepare_run(agent, input)
+    assert agent.model is not None
+    processed_tools = agent.get_tools(run_response=run_response, run_context=run_context, session=session)
+    tools = agent._determine_tools_for_model(
+        model=agent.model,
+        processed_tools=processed_tools,
+        run_response=run_response,
+        run_context=run_context,
+        session=session,
+    )
+
+    def get_run_messages():
+        agent._get_run_messages(
+            run_response=run_response, run_context=run_context, input=input, session=session, tools=tools
+        )
+
+    return get_run_messages
+
+
+@benchmark
+def run():
+    agent = Agent(model=MockModel(), telemetry=False)
+    return lambda: agent.run("Hello")
+
+
+@benchmark
+async def arun():
+    agent = Agent(model=MockModel(), telemetry=False)
+
+    async def arun():
+        await agent.arun("Hello")
+
+    return arun
+
+
+@benchmark
+def run_stream():
+    # 100 chunks, so the per-chunk overhead dominates
+    agent = Agent(model=MockModel(responses=[sample_text(100)]), telemetry=False)
+
+    def run_stream():
+        for _ in agent.run("Hello", stream=True, stream_events=True):
+            pass
+
+    return run_stream
+
+
+@benchmark
+async def arun_stream():
+    agent = Agent(model=MockModel(responses=[sample_text(100)]), telemetry=False)
+
+    async def arun_stream():
+        async for _ in agent.arun("Hello", stream=True, stream_events=True):
+            pass
+
+    return arun_stream
+
+
+@benchmark
+def run_with_tool_call():
+    model = MockModel(responses=[MockToolCall(name="get_weather", arguments={"city": "Paris"}), "It is sunny."])
+    agent = Agent(model=model, tools=TOOLS, telemetry=False)
+    return lambda: agent.run("What is the weather in Paris?")
+
+
+@benchmark
+def run_with_db():
+    # Creates and saves a session per run, so the runs do not slow down as a session grows
+    agent = Agent(model=MockModel(), db=InMemoryDb(), telemetry=False)
+    session_ids = (f"benchmark-session-{i}" for i in count())
+    return lambda: agent.run("Hello", session_id=next(session_ids))
@@ -0,0 +1,63 @@
+"""Cost of serializing the events streamed by a run, and the runs and sessions stored after it."""
+
+from agno.agent import Agent
+from agno.models.mock import MockModel, MockToolCall
+from agno.run.agent import RunOutput
+from agno.session import AgentSession
+
+from .fixtures import TOOLS, make_session, sample_text
+from .runner import benchmark
+
+
+def _events():
+    """The events of a streamed run calling a tool, with 100 content chunks"""
+    model = MockModel(responses=[MockToolCall(name="get_weather", arguments={"city": "Paris"}), sample_text(100)])
+    agent = Agent(model=model, tools=TOOLS, telemetry=False)
+    return list(agent.run("What is the weather in Paris?", stream=True, stream_events=True))
+
+
+@benchmark
+def events_to_dict():
+    events = _events()
+
+    def events_to_dict():
+        for event in events:
+            event.to_dict()
+
+    return events_to_dict
+
+
+@benchmark
+def events_to_json():
+    events = _events()
+
+    def events_to_json():
+        for event in events:
+            event.to_json(indent=None)
+
+    return events_to_json
+
+
+@benchmark
+def run_output_to_dict():
+    agent = Agent(model=MockModel(responses=[sample_text(500)]), tools=TOOLS, telemetry=False)
+    run_output = agent.run(sample_text(100))
+    return run_output.to_dict
+
+
+@benchmark
+def run_output_from_dict():
+    agent = Agent(model=MockModel(responses=[sample_text(500)]), tools=TOOLS, telemetry=False)
+    data = agent.run(sample_text(100)).to_dict()
+    return lambda: RunOutput.from_dict(data)
+
+
+@benchmark(num_iterations=20)
+def session_to_dict():
+    return make_session(num_runs=20).to_dict
+
+
+@benchmark(num_iterations=20)
+def session_from_dict():
+    data = make_session(num_runs=20).to_dict()
+    return lambda: AgentSession.from_dict(data)
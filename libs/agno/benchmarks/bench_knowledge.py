@@ -0,0 +1,100 @@
+"""Cost of each stage of Knowledge ingestion and of searches, on a local vector db with a hashing embedder."""
+
+from agno.db.in_memory import InMemoryDb
+from agno.knowledge.chunking.fixed import FixedSizeChunking
+from agno.knowledge.chunking.recursive import RecursiveChunking
+from agno.knowledge.document.base import Document
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.text_reader import TextReader
+from agno.vectordb.local import LocalVectorDb
+from agno.vectordb.search import SearchType
+
+from .fixtures import HashEmbedder, sample_text, temporary_directory
+from .runner import benchmark
+
+# A text of ~10k words, split in 100 chunks of ~500 characters
+TEXT = sample_text(10_000)
+CHUNK_SIZE = 600
+NUM_SEARCHED_DOCUMENTS = 2000
+
+
+def _documents():
+    return FixedSizeChunking(chunk_size=CHUNK_SIZE).chunk(Document(name="benchmark", content=TEXT))
+
+
+def _local_vector_db(directory, **kwargs):
+    # Used as a context manager inside temporary_directory, so its background compaction is stopped before the
+    # directory is removed
+    return LocalVectorDb(collection="benchmark", path=str(directory), embedder=HashEmbedder(), **kwargs)
+
+
+@benchmark(num_iterations=20)
+def read():
+    with temporary_directory() as directory:
+        path = directory / "benchmark.txt"
+        path.write_text(TEXT)
+        reader = TextReader(chunk=False)
+        yield lambda: reader.read(path)
+
+
+@benchmark(num_iterations=20)
+def chunk_fixed():
+    document = Document(name="benchmark", content=TEXT)
+    return lambda: FixedSizeChunking(chunk_size=CHUNK_SIZE).chunk(document)
+
+
+@benchmark(num_iterations=20)
+def chunk_recursive():
+    document = Document(name="benchmark", content=TEXT)
+    return lambda: RecursiveChunking(chunk_size=CHUNK_SIZE).chunk(document)
+
+
+@benchmark(num_iterations=20)
+def embed():
+    embedder = HashEmbedder()
+    documents = _documents()
+
+    def embed():
+        for document in documents:
+            document.embedding = None
+            document.embed(embedder=embedder)
+
+    return embed
+
+
+@benchmark(num_iterations=20)
+def vector_db_upsert():
+    documents = _documents()
+    with temporary_directory() as directory, _local_vector_db(directory) as vector_db:
+        vector_db.create()
+        # Embedded once, so only the writes are measured
+        vector_db.upsert("benchmark", documents)
+        yield lambda: vector_db.upsert("benchmark", documents)
+
+
+@benchmark(num_iterations=10)
+def insert():
+    with temporary_directory() as directory, _local_vector_db(directory) as vector_db:
+        knowledge = Knowledge(vector_db=vector_db, contents_db=InMemoryDb())
+        yield lambda: knowledge.insert(name="benchmark", text_content=TEXT, reader=TextReader(chunk_size=CHUNK_SIZE))
+
+
+@benchmark(num_iterations=10)
+async def ainsert():
+    with temporary_directory() as directory, _local_vector_db(directory) as vector_db:
+        knowledge = Knowledge(vector_db=vector_db, contents_db=InMemoryDb())
+
+        async def ainsert():
+            await knowledge.ainsert(name="benchmark", text_content=TEXT, reader=TextReader(chunk_size=CHUNK_SIZE))
+
+        yield ainsert
+
+
+@benchmark(params={"vector": SearchType.vector, "keyword": SearchType.keyword, "hybrid": SearchType.hybrid})
+def search(search_type):
+    documents = [Document(name=f"document-{i}", content=sample_text(80, seed=i)) for i in range(NUM_SEARCHED_DOCUMENTS)]
+    with temporary_directory() as directory, _local_vector_db(directory, search_type=search_type) as vector_db:
+        vector_db.create()
+        vector_db.insert("benchmark", documents)
+        knowledge = Knowledge(vector_db=vector_db)
+        yield lambda: knowledge.search("vector search over the chunks of a document", max_results=10)
@@ -0,0 +1,59 @@
+"""Cost of saving and loading a session with 20 runs, per database."""
+
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.json import JsonDb
+from agno.db.sqlite import AsyncSqliteDb, SqliteDb
+
+from .fixtures import make_session, temporary_directory
+from .runner import benchmark
+
+SYNC_DBS = {
+    "in_memory": lambda directory: InMemoryDb(),
+    "json": lambda directory: JsonDb(db_path=str(directory)),
+    "sqlite": lambda directory: SqliteDb(db_file=str(directory / "agno.db")),
+}
+
+
+@benchmark(params=SYNC_DBS, num_iterations=20)
+def save(make_db):
+    session = make_session(num_runs=20)
+    with temporary_directory() as directory:
+        db = make_db(directory)
+        yield lambda: db.upsert_session(session)
+
+
+@benchmark(params=SYNC_DBS, num_iterations=20)
+def load(make_db):
+    session = make_session(num_runs=20)
+    with temporary_directory() as directory:
+        db = make_db(directory)
+        db.upsert_session(session)
+        yield lambda: db.get_session(session.session_id, SessionType.AGENT)
+
+
+@benchmark(name="session.save[async_sqlite]", num_iterations=20)
+async def asave():
+    session = make_session(num_runs=20)
+    with temporary_directory() as directory:
+        db = AsyncSqliteDb(db_file=str(directory / "agno.db"))
+
+        async def asave():
+            await db.upsert_session(session)
+
+        yield asave
+        await db.db_engine.dispose()
+
+
+@benchmark(name="session.load[async_sqlite]", num_iterations=20)
+async def aload():
+    session = make_session(num_runs=20)
+    with temporary_directory() as directory:
+        db = AsyncSqliteDb(db_file=str(directory / "agno.db"))
+        await db.upsert_session(session)
+
+        async def aload():
+            await db.get_session(session.session_id, SessionType.AGENT)
+
+        yield aload
+        await db.db_engine.dispose()
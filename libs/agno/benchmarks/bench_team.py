@@ -0,0 +1,50 @@
+"""Overhead of the Team: construction, copies and runs delegating to a member, against mock models."""
+
+from typing import List, Union
+
+from agno.agent import Agent
+from agno.models.mock import MockModel, MockToolCall
+from agno.team import Team
+
+from .fixtures import TOOLS
+from .runner import benchmark
+
+
+def _team() -> Team:
+    members: List[Union[Agent, Team]] = [
+        Agent(id=name, name=name, role=f"The {name}", model=MockModel(), tools=TOOLS, telemetry=False)
+        for name in ["researcher", "writer", "reviewer"]
+    ]
+    leader_model = MockModel(
+        responses=[
+            MockToolCall(name="delegate_task_to_member", arguments={"member_id": "researcher", "task": "Research"}),
+            "Done.",
+        ]
+    )
+    return Team(model=leader_model, members=members, telemetry=False)
+
+
+@benchmark
+def instantiate():
+    return _team
+
+
+@benchmark
+def deep_copy():
+    return _team().deep_copy
+
+
+@benchmark
+def run():
+    team = _team()
+    return lambda: team.run("Write a report")
+
+
+@benchmark
+async def arun():
+    team = _team()
+
+    async def arun():
+        await team.arun("Write a report")
+
+    return arun
@@ -0,0 +1,42 @@
+"""Overhead of the Workflow: runs of sequential and parallel steps, against mock models."""
+
+from agno.agent import Agent
+from agno.models.mock import MockModel
+from agno.workflow import Parallel, Step, Workflow
+
+from .runner import benchmark
+
+
+def _workflow() -> Workflow:
+    def agent(name: str) -> Agent:
+        return Agent(name=name, model=MockModel(responses=[f"Output of the {name}"]), telemetry=False)
+
+    return Workflow(
+        name="Benchmark Workflow",
+        steps=[
+            Step(name="research", agent=agent("researcher")),
+            Parallel(
+                Step(name="draft", agent=agent("writer")),  # type: ignore[arg-type]
+                Step(name="fact check", agent=agent("fact checker")),  # type: ignore[arg-type]
+                name="write",
+            ),
+            Step(name="review", agent=agent("reviewer")),
+        ],
+        telemetry=False,
+    )
+
+
+@benchmark
+def run():
+    workflow = _workflow()
+    return lambda: workflow.run("Write a report")
+
+
+@benchmark
+async def arun():
+    workflow = _workflow()
+
+    async def arun():
+        await workflow.arun("Write a report")
+
+    return arun
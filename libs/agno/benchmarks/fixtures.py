@@ -0,0 +1,107 @@
+"""Offline stand-ins shared by the benchmarks: embedder, tools, texts, sessions and databases."""
+
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from random import Random
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from zlib import crc32
+
+from agno.agent import Agent
+from agno.knowledge.embedder.base import Embedder
+from agno.models.mock import MockModel
+from agno.session import AgentSession
+
+WORDS = (
+    "agent team workflow model tool memory knowledge session run event message context vector search chunk "
+    "document embedding reader database storage cache latency stream token prompt response reasoning summary "
+    "history state metric trace span filter index query score retrieve insert update delete"
+).split()
+
+
+class HashEmbedder(Embedder):
+    """Embeds a text by hashing its words into a vector, so the benchmarks measure agno and not an embedding model"""
+
+    dimensions: Optional[int] = 256
+
+    def get_embedding(self, text: str) -> List[float]:
+        vector = [0.0] * (self.dimensions or 256)
+        for word in text.lower().split():
+            vector[crc32(word.encode()) % len(vector)] += 1.0
+        return vector
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding_and_usage(text)
+
+
+def sample_text(num_words: int, seed: int = 0) -> str:
+    """Deterministic text of num_words words, in paragraphs of sentences"""
+    rng = Random(seed)
+    sentences = []
+    for i in range(0, num_words, 12):
+        sentence = " ".join(rng.choice(WORDS) for _ in range(min(12, num_words - i)))
+        sentences.append(sentence.capitalize() + ".")
+    paragraphs = [" ".join(sentences[i : i + 5]) for i in range(0, len(sentences), 5)]
+    return "\n\n".join(paragraphs)
+
+
+def get_weather(city: str) -> str:
+    """Get the current weather of a city.
+
+    Args:
+        city: Name of the city.
+    """
+    return f"Sunny in {city}"
+
+
+def get_forecast(city: str, days: int = 3) -> str:
+    """Get the weather forecast of a city.
+
+    Args:
+        city: Name of the city.
+        days: Number of days to forecast.
+    """
+    return f"Sunny in {city} for {days} days"
+
+
+def convert_temperature(celsius: float) -> float:
+    """Convert a temperature from Celsius to Fahrenheit.
+
+    Args:
+        celsius: Temperature in Celsius.
+    """
+    return celsius * 9 / 5 + 32
+
+
+TOOLS: List[Callable[..., Any]] = [get_weather, get_forecast, convert_temperature]
+
+
+def make_session(num_runs: int = 20, session_id: str = "benchmark-session") -> AgentSession:
+    """A session holding num_runs runs of a mock agent, each with a few hundred words of messages"""
+    from agno.db.in_memory import InMemoryDb
+
+    db = InMemoryDb()
+    agent = Agent(
+        model=MockModel(responses=[sample_text(200, seed=i) for i in range(num_runs)]),
+        db=db,
+        session_id=session_id,
+        user_id="benchmark-user",
+        telemetry=False,
+    )
+    for i in range(num_runs):
+        agent.run(sample_text(50, seed=num_runs + i))
+    session = agent.get_session(session_id)
+    assert isinstance(session, AgentSession)
+    return session
+
+
+@contextmanager
+def temporary_directory() -> Iterator[Path]:
+    with tempfile.TemporaryDirectory(prefix="agno-benchmarks-") as directory:
+        yield Path(directory)
@@ -0,0 +1,351 @@
+"""Run the benchmarks, store baselines and report regressions against them.
+
+Usage, from libs/agno:
+    python -m benchmarks                      # Run all benchmarks and compare them to the baseline of this machine
+    python -m benchmarks -k session           # Only run benchmarks whose name contains "session"
+    python -m benchmarks --save               # Store the results as the baseline of this machine
+    python -m benchmarks --baseline main.json # Compare to a given baseline file
+    python -m benchmarks --quick              # Run every benchmark a few times, to check they work
+    python -m benchmarks --skip-import-errors # Skip benchmarks of features missing from this branch
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import logging
+import pkgutil
+import platform
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agno.eval.performance import PerformanceEval
+
+BENCHMARKS_DIR = Path(__file__).parent
+BASELINES_DIR = BENCHMARKS_DIR / "baselines"
+
+# A benchmark regresses when its median run time grows by more than its threshold, relative to the baseline
+DEFAULT_THRESHOLD = 0.25
+# Same for its median peak memory usage
+DEFAULT_MEMORY_THRESHOLD = 0.10
+# Memory changes under this many MiB are ignored, tracemalloc peaks of tiny functions are noisy
+MIN_MEMORY_CHANGE = 0.01
+
+
+@dataclass
+class Benchmark:
+    """A function to measure, and how to measure it"""
+
+    name: str
+    # Sets the benchmark up and returns the function to measure, sync or async.
+    # Can also be a generator yielding the function to measure, and cleaning up after the yield.
+    setup: Callable[..., Any]
+    setup_args: Tuple[Any, ...] = ()
+    num_iterations: int = 50
+    warmup_runs: int = 5
+    threshold: float = DEFAULT_THRESHOLD
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD
+    measure_memory: bool = True
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    num_iterations: int
+    # Run times in seconds
+    median_run_time: float
+    p95_run_time: float
+    min_run_time: float
+    # Peak memory usage in MiB
+    median_memory_usage: Optional[float] = None
+    max_memory_usage: Optional[float] = None
+    # Filled when compared to a baseline
+    baseline_median_run_time: Optional[float] = None
+    baseline_median_memory_usage: Optional[float] = None
+    run_time_change: Optional[float] = None
+    memory_change: Optional[float] = None
+    regressions: List[str] = field(default_factory=list)
+
+
+_benchmarks: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    setup: Optional[Callable[..., Any]] = None,
+    *,
+    name: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    num_iterations: int = 50,
+    warmup_runs: int = 5,
+    threshold: float = DEFAULT_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+    measure_memory: bool = True,
+):
+    """
+    Register a benchmark. The decorated function sets it up and returns the function to measure.
+
+    Benchmarks are named "<module>.<function>", without the "bench_" prefix of the module. With params, one benchmark
+    is registered per param, named "<module>.<function>[<param name>]", and the setup receives the param value.
+
+    Example:
+        >>> @benchmark(params={"sqlite": make_sqlite_db, "in_memory": InMemoryDb})
+        ... def load_session(make_db):
+        ...     db = make_db()
+        ...     db.upsert_session(session)
+        ...     return lambda: db.get_session(session.session_id, SessionType.AGENT)
+    """
+
+    def register(setup: Callable[..., Any]) -> Callable[..., Any]:
+        module_name = setup.__module__.rsplit(".", 1)[-1]
+        group = module_name[len("bench_") :] if module_name.startswith("bench_") else module_name
+        base_name = name or f"{group}.{setup.__name__}"
+        options = dict(
+            num_iterations=num_iterations,
+            warmup_runs=warmup_runs,
+            threshold=threshold,
+            memory_threshold=memory_threshold,
+            measure_memory=measure_memory,
+        )
+        if params is None:
+            _register(Benchmark(name=base_name, setup=setup, **options))  # type: ignore[arg-type]
+        else:
+            for param_name, param in params.items():
+                _register(
+                    Benchmark(name=f"{base_name}[{param_name}]", setup=setup, setup_args=(param,), **options)  # type: ignore[arg-type]
+                )
+        return setup
+
+    if setup is not None:
+        return register(setup)
+    return register
+
+
+def _register(benchmark: Benchmark) -> None:
+    if benchmark.name in _benchmarks:
+        raise ValueError(f"Benchmark {benchmark.name} is registered twice")
+    _benchmarks[benchmark.name] = benchmark
+
+
+def collect_benchmarks(filters: Optional[List[str]] = None, skip_import_errors: bool = False) -> List[Benchmark]:
+    """Import the bench_* modules and return their benchmarks, keeping those whose name contains a filter"""
+    for module in pkgutil.iter_modules([str(BENCHMARKS_DIR)]):
+        if module.name.startswith("bench_"):
+            try:
+                importlib.import_module(f"{__package__}.{module.name}")
+            except ImportError as e:
+                if not skip_import_errors:
+                    raise
+                print(f"Skipped the benchmarks of {module.name}, which cannot be imported: {e}", file=sys.stderr)
+    return [benchmark for name, benchmark in _benchmarks.items() if not filters or any(f in name for f in filters)]
+
+
+def run_benchmark(benchmark: Benchmark, num_iterations: Optional[int] = None, warmup_runs: Optional[int] = None):
+    """Set the benchmark up, measure it with a PerformanceEval and clean it up."""
+    if inspect.iscoroutinefunction(benchmark.setup) or inspect.isasyncgenfunction(benchmark.setup):
+        return asyncio.run(_arun_benchmark(benchmark, num_iterations, warmup_runs))
+
+    setup = benchmark.setup(*benchmark.setup_args)
+    func = next(setup) if inspect.isgenerator(setup) else setup
+    try:
+        performance_eval = _performance_eval(benchmark, func, num_iterations, warmup_runs)
+        if inspect.iscoroutinefunction(func):
+            result = asyncio.run(performance_eval.arun())
+        else:
+            result = performance_eval.run()
+    finally:
+        if inspect.isgenerator(setup):
+            # Runs the cleanup after the yield
+            next(setup, None)
+    return _benchmark_result(benchmark, result, performance_eval.num_iterations)
+
+
+async def _arun_benchmark(benchmark: Benchmark, num_iterations: Optional[int], warmup_runs: Optional[int]):
+    # Async setups create resources bound to the event loop, so they are measured in the same loop
+    setup = benchmark.setup(*benchmark.setup_args)
+    func = await setup.__anext__() if inspect.isasyncgen(setup) else await setup
+    try:
+        performance_eval = _performance_eval(benchmark, func, num_iterations, warmup_runs)
+        result = await performance_eval.arun()
+    finally:
+        if inspect.isasyncgen(setup):
+            # Runs the cleanup after the yield
+            async for _ in setup:
+                pass
+    return _benchmark_result(benchmark, result, performance_eval.num_iterations)
+
+
+def _performance_eval(
+    benchmark: Benchmark, func: Callable, num_iterations: Optional[int], warmup_runs: Optional[int]
+) -> PerformanceEval:
+    return PerformanceEval(
+        func=func,
+        name=benchmark.name,
+        num_iterations=num_iterations or benchmark.num_iterations,
+        warmup_runs=warmup_runs if warmup_runs is not None else benchmark.warmup_runs,
+        measure_memory=benchmark.measure_memory,
+        telemetry=False,
+    )
+
+
+def _benchmark_result(benchmark: Benchmark, result: Any, num_iterations: int) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=benchmark.name,
+        num_iterations=num_iterations,
+        median_run_time=result.median_run_time,
+        p95_run_time=result.p95_run_time,
+        min_run_time=result.min_run_time,
+        median_memory_usage=result.median_memory_usage if benchmark.measure_memory else None,
+        max_memory_usage=result.max_memory_usage if benchmark.measure_memory else None,
+    )
+
+
+def compare_to_baseline(result: BenchmarkResult, baseline: Dict[str, Any], benchmark: Benchmark) -> None:
+    """Fill the changes relative to the baseline result, and the regressions past the benchmark thresholds"""
+    result.baseline_median_run_time = baseline.get("median_run_time")
+    result.baseline_median_memory_usage = baseline.get("median_memory_usage")
+
+    if result.baseline_median_run_time:
+        result.run_time_change = result.median_run_time / result.baseline_median_run_time - 1
+        if result.run_time_change > benchmark.threshold:
+            result.regressions.append(f"run time +{result.run_time_change:.0%}")
+
+    if result.median_memory_usage is not None and result.baseline_median_memory_usage is not None:
+        memory_delta = result.median_memory_usage - result.baseline_median_memory_usage
+        if result.baseline_median_memory_usage > 0:
+            result.memory_change = memory_delta / result.baseline_median_memory_usage
+        if memory_delta > MIN_MEMORY_CHANGE and (
+            result.memory_change is None or result.memory_change > benchmark.memory_threshold
+        ):
+            result.regressions.append(f"memory +{memory_delta:.3f} MiB")
+
+
+def default_baseline_path() -> Path:
+    """Baselines are only comparable on the same kind of machine and Python version"""
+    python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    return BASELINES_DIR / f"{platform.system()}-{platform.machine()}-py{python_version}.json".lower()
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get("results", {})
+
+
+def save_baseline(path: Path, results: List[BenchmarkResult]) -> None:
+    """Store the results in the baseline file, keeping the baselines of benchmarks that were not run"""
+    from agno.utils.dttm import now_epoch_s
+
+    baseline = load_baseline(path)
+    for result in results:
+        baseline[result.name] = {
+            "median_run_time": result.median_run_time,
+            "p95_run_time": result.p95_run_time,
+            "median_memory_usage": result.median_memory_usage,
+            "num_iterations": result.num_iterations,
+        }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "machine": f"{platform.system()} {platform.machine()} {platform.processor()}".strip(),
+                "python": platform.python_version(),
+                "created_at": now_epoch_s(),
+                "results": dict(sorted(baseline.items())),
+            },
+            indent=2,
+        )
+    )
+
+
+def print_results(results: List[BenchmarkResult]) -> None:
+    from rich.console import Console
+    from rich.markup import escape
+    from rich.table import Table
+
+    # Changes are relative to the baseline, memory is the median peak usage of a run
+    table = Table(title="Benchmarks", show_header=True, header_style="bold magenta")
+    table.add_column("Benchmark", style="cyan", no_wrap=True)
+    table.add_column("Median", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Memory", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Status")
+
+    for result in results:
+        table.add_row(
+            escape(result.name),
+            _format_time(result.median_run_time),
+            _format_time(result.p95_run_time),
+            _format_change(result.run_time_change),
+            f"{result.median_memory_usage * 1024:.1f} KiB" if result.median_memory_usage is not None else "-",
+            _format_change(result.memory_change),
+            "[red]" + ", ".join(result.regressions) + "[/red]" if result.regressions else "[green]ok[/green]",
+        )
+    Console().print(table)
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+def _format_change(change: Optional[float]) -> str:
+    return f"{change:+.1%}" if change is not None else "-"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the overhead of agno")
+    parser.add_argument("-k", dest="filters", action="append", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--baseline", type=Path, help="Baseline file, defaults to the baseline of this machine")
+    parser.add_argument("--save", action="store_true", help="Store the results as the baseline")
+    parser.add_argument("--quick", action="store_true", help="Run each benchmark twice, without warm-up")
+    parser.add_argument("--threshold", type=float, help="Override the run time threshold of every benchmark")
+    parser.add_argument("--iterations", type=int, help="Override the number of iterations of every benchmark")
+    parser.add_argument("--json", type=Path, help="Also write the results to this JSON file")
+    parser.add_argument(
+        "--skip-import-errors", action="store_true", help="Skip the benchmark modules that cannot be imported"
+    )
+    args = parser.parse_args(argv)
+
+    from agno.utils.log import agent_logger, team_logger, workflow_logger
+
+    # Runs log at INFO level, which would bury the results. Agents reset the log level on every run, so filter instead.
+    for agno_logger in [agent_logger, team_logger, workflow_logger]:
+        agno_logger.addFilter(lambda record: record.levelno >= logging.WARNING)
+
+    baseline_path = args.baseline or default_baseline_path()
+    baseline = load_baseline(baseline_path)
+    num_iterations = 2 if args.quick else args.iterations
+    warmup_runs = 0 if args.quick else None
+
+    results: List[BenchmarkResult] = []
+    for benchmark in collect_benchmarks(args.filters, skip_import_errors=args.skip_import_errors):
+        result = run_benchmark(benchmark, num_iterations=num_iterations, warmup_runs=warmup_runs)
+        if result.name in baseline and not args.quick:
+            if args.threshold is not None:
+                benchmark.threshold = args.threshold
+            compare_to_baseline(result, baseline[result.name], benchmark)
+        results.append(result)
+
+    print_results(results)
+
+    if args.json:
+        args.json.write_text(json.dumps([asdict(result) for result in results], indent=2))
+    if args.save and not args.quick:
+        save_baseline(baseline_path, results)
+        print(f"Saved the baseline to {baseline_path}")
+
+    regressions = [result for result in results if result.regressions]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed past their threshold compared to {baseline_path}")
+        return 1
+    return 0
@@ -0,0 +1,66 @@
+import threading
+
+import pytest
+
+from agno.db.async_adapter import AsyncDbAdapter
+from agno.db.base import AsyncBaseDb, SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.schemas import UserMemory
+from agno.session.agent import AgentSession
+
+
+@pytest.fixture
+def sync_db():
+    return InMemoryDb()
+
+
+def test_adapter_mirrors_wrapped_db(sync_db):
+    db = AsyncDbAdapter(sync_db)
+
+    assert isinstance(db, AsyncBaseDb)
+    assert db.id == sync_db.id
+    assert db.session_table_name == sync_db.session_table_name
+    assert db.memory_table_name == sync_db.memory_table_name
+
+
+def test_adapter_rejects_empty_pool(sync_db):
+    with pytest.raises(ValueError):
+        AsyncDbAdapter(sync_db, max_workers=0)
+
+
+async def test_session_round_trip(sync_db):
+    db = AsyncDbAdapter(sync_db)
+    await db.upsert_session(AgentSession(session_id="session-1", agent_id="agent-1", user_id="user-1"))
+
+    session = await db.get_session(session_id="session-1", session_type=SessionType.AGENT)
+    assert session is not None
+    assert session.session_id == "session-1"
+
+    await db.upsert_user_memory(UserMemory(memory="likes tea", memory_id="memory-1", user_id="user-1"))
+    memories = await db.get_user_memories(user_id="user-1")
+    assert [m.memory_id for m in memories] == ["memory-1"]
+
+    await db.close()
+
+
+async def test_calls_run_off_the_event_loop_with_session_affinity(sync_db, monkeypatch):
+    db = AsyncDbAdapter(sync_db, max_workers=4)
+    threads = []
+    get_session = sync_db.get_session
+
+    def record_thread(**kwargs):
+        threads.append((kwargs["session_id"], threading.current_thread().name))
+        return get_session(**kwargs)
+
+    monkeypatch.setattr(sync_db, "get_session", record_thread)
+
+    for _ in range(3):
+        for session_id in ("session-a", "session-b"):
+            await db.get_session(session_id=session_id, session_type=SessionType.AGENT)
+
+    loop_thread = threading.current_thread().name
+    assert all(name != loop_thread for _, name in threads)
+    assert len({name for session_id, name in threads if session_id == "session-a"}) == 1
+    assert len({name for session_id, name in threads if session_id == "session-b"}) == 1
+
+    await db.close()
@@ -0,0 +1,161 @@
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.schemas import UserMemory
+from agno.db.sqlite import SqliteDb
+from agno.db.utils import apply_cursor_to_records, decode_cursor, encode_cursor, get_next_cursor, get_sort_value
+from agno.session.agent import AgentSession
+
+
+@pytest.fixture(params=["sqlite", "in_memory"])
+def db(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteDb(db_file=str(tmp_path / "pagination.db"))
+    return InMemoryDb()
+
+
+def _fill_sessions(db, count: int = 7):
+    # Several sessions share a timestamp so the id tiebreaker is exercised
+    for i in range(count):
+        db.upsert_session(
+            AgentSession(session_id=f"session-{i}", agent_id="agent-1", user_id="user-1", created_at=1000 + i // 3)
+        )
+
+
+def _collect_pages(fetch, id_key: str, sort_by, limit: int):
+    seen, cursor = [], None
+    while True:
+        rows, _ = fetch(cursor)
+        seen.extend(row[id_key] for row in rows)
+        cursor = get_next_cursor(rows, id_key, sort_by, limit)
+        if cursor is None:
+            return seen
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(1234, "session-1")
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (1234, "session-1")
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(1, "a")[:-3], "WzFd"])
+def test_decode_cursor_rejects_invalid_input(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_get_next_cursor_stops_on_short_page():
+    records = [{"id": "a", "created_at": 1}, {"id": "b", "created_at": 2}]
+    assert get_next_cursor(records, "id", "created_at", limit=3) is None
+    assert get_next_cursor([], "id", "created_at", limit=2) is None
+    assert decode_cursor(get_next_cursor(records, "id", "created_at", limit=2)) == (2, "b")
+
+
+def test_apply_cursor_to_records_breaks_ties_by_id():
+    records = [{"id": i, "created_at": 1} for i in ["c", "a", "b"]] + [{"id": "d", "created_at": 0}]
+    ordered = apply_cursor_to_records(records, "id", "created_at", "desc")
+    assert [r["id"] for r in ordered] == ["c", "b", "a", "d"]
+
+    after = apply_cursor_to_records(records, "id", "created_at", "desc", encode_cursor(1, "b"))
+    assert [r["id"] for r in after] == ["a", "d"]
+
+    ascending = apply_cursor_to_records(records, "id", "created_at", "asc", encode_cursor(1, "a"))
+    assert [r["id"] for r in ascending] == ["b", "c"]
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+def test_session_cursor_pages_cover_all_rows_once(db, sort_order):
+    _fill_sessions(db)
+
+    def fetch(cursor):
+        return db.get_sessions(
+            session_type=SessionType.AGENT,
+            sort_by="created_at",
+            sort_order=sort_order,
+            limit=2,
+            cursor=cursor,
+            deserialize=False,
+        )
+
+    seen = _collect_pages(fetch, "session_id", "created_at", 2)
+    assert sorted(seen) == sorted(f"session-{i}" for i in range(7))
+    assert len(seen) == len(set(seen))
+
+
+def test_cursor_takes_precedence_over_page(db):
+    _fill_sessions(db)
+    first, _ = db.get_sessions(
+        session_type=SessionType.AGENT, sort_by="created_at", sort_order="desc", limit=3, deserialize=False
+    )
+    cursor = get_next_cursor(first, "session_id", "created_at", 3)
+
+    second, _ = db.get_sessions(
+        session_type=SessionType.AGENT,
+        sort_by="created_at",
+        sort_order="desc",
+        limit=3,
+        page=5,
+        cursor=cursor,
+        deserialize=False,
+    )
+    assert [s["session_id"] for s in second] == ["session-3", "session-2", "session-1"]
+
+
+def test_count_total_false_returns_page_size(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "pagination.db"))
+    _fill_sessions(db)
+    sessions, total_count = db.get_sessions(
+        session_type=SessionType.AGENT, limit=3, page=1, count_total=False, deserialize=False
+    )
+    assert len(sessions) == 3
+    assert total_count == 3
+
+    _, total_count = db.get_sessions(session_type=SessionType.AGENT, limit=3, page=1, deserialize=False)
+    assert total_count == 7
+
+
+def test_memory_cursor_pagination(db):
+    for i in range(5):
+        db.upsert_user_memory(UserMemory(memory=f"memory {i}", memory_id=f"memory-{i}", user_id="user-1", updated_at=1))
+
+    def fetch(cursor):
+        return db.get_user_memories(
+            user_id="user-1", sort_by="updated_at", sort_order="desc", limit=2, cursor=cursor, deserialize=False
+        )
+
+    seen = _collect_pages(fetch, "memory_id", "updated_at", 2)
+    assert seen == [f"memory-{i}" for i in reversed(range(5))]
+
+
+def test_updated_at_pages_are_served_by_the_sort_index(tmp_path):
+    from sqlalchemy import select, text
+
+    from agno.db.sqlite.utils import apply_cursor, apply_sorting
+
+    db = SqliteDb(db_file=str(tmp_path / "pagination.db"))
+    table = db._get_table("sessions", create_table_if_not_found=True)
+    stmt = apply_sorting(select(table), table, "updated_at", "desc")
+    stmt = apply_cursor(stmt, table, "session_id", "updated_at", "desc", encode_cursor(1000, "session-3")).limit(2)
+
+    sql = str(stmt.compile(db.db_engine, compile_kwargs={"literal_binds": True}))
+    with db.db_engine.connect() as conn:
+        plan = " ".join(str(row) for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+    assert "idx_agno_sessions_updated_at_created_at_session_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_mongo_pipeline_sorts_on_the_cursor_sort_value():
+    pytest.importorskip("pymongo")
+    from agno.db.mongo.utils import get_cursor_pipeline
+
+    pipeline = get_cursor_pipeline({"user_id": "user-1"}, "memory_id", "updated_at", "desc", encode_cursor(5, "m"), 2)
+
+    # Legacy documents without updated_at are sorted and paginated on created_at, like get_next_cursor does
+    assert pipeline[1] == {"$addFields": {"_sort_value": {"$ifNull": ["$updated_at", "$created_at"]}}}
+    assert pipeline[2] == {
+        "$match": {"$or": [{"_sort_value": {"$lt": 5}}, {"_sort_value": 5, "memory_id": {"$lt": "m"}}]}
+    }
+    assert pipeline[3] == {"$sort": {"_sort_value": -1, "memory_id": -1}}
+    assert get_sort_value({"updated_at": None, "created_at": 5}, "updated_at") == 5
@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from agno.db.migrations.manager import MigrationManager
+from agno.db.migrations.versions import v2_5_0
+from agno.db.sqlite import AsyncSqliteDb, SqliteDb
+
+SESSION_INDEXES = {f"idx_agno_sessions_{name}" for name in v2_5_0.ADDED_INDEXES["sessions"]}
+
+
+def _index_names(db: SqliteDb, table_name: str) -> set:
+    # Reflection skips expression indexes, so list them from the catalog
+    with db.db_engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table_name"),
+            {"table_name": table_name},
+        )
+        return {row[0] for row in rows}
+
+
+@pytest.fixture
+def legacy_sqlite_db(tmp_path):
+    """A SqliteDb whose sessions table was created before the workload indexes existed"""
+    db = SqliteDb(db_file=str(tmp_path / "agno.db"), session_table="agno_sessions")
+    db._get_table("sessions", create_table_if_not_found=True)
+    with db.db_engine.begin() as conn:
+        for index_name in SESSION_INDEXES:
+            conn.execute(text(f'DROP INDEX "{index_name}"'))
+    return db
+
+
+def test_new_tables_have_workload_indexes(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "agno.db"))
+    db._get_table("sessions", create_table_if_not_found=True)
+    db._get_table("traces", create_table_if_not_found=True)
+
+    assert SESSION_INDEXES <= _index_names(db, db.session_table_name)
+    assert "idx_agno_traces_session_id_start_time" in _index_names(db, db.trace_table_name)
+
+
+def test_up_creates_missing_indexes_and_down_drops_them(legacy_sqlite_db):
+    assert not SESSION_INDEXES & _index_names(legacy_sqlite_db, "agno_sessions")
+
+    assert v2_5_0.up(legacy_sqlite_db, "sessions", "agno_sessions")
+    assert SESSION_INDEXES <= _index_names(legacy_sqlite_db, "agno_sessions")
+    # Running it again is a no-op
+    assert v2_5_0.up(legacy_sqlite_db, "sessions", "agno_sessions")
+
+    assert v2_5_0.down(legacy_sqlite_db, "sessions", "agno_sessions")
+    indexes = _index_names(legacy_sqlite_db, "agno_sessions")
+    assert not SESSION_INDEXES & indexes
+    # Keyset pagination indexes predate this version and are kept
+    assert "idx_agno_sessions_created_at_session_id" in indexes
+
+
+def test_up_skips_missing_table(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "agno.db"))
+
+    assert not v2_5_0.up(db, "sessions", "agno_sessions")
+
+
+async def test_migration_manager_applies_v2_5_0(legacy_sqlite_db):
+    legacy_sqlite_db.upsert_schema_version("agno_sessions", "2.3.0")
+
+    await MigrationManager(legacy_sqlite_db).up(table_type="session")
+
+    assert SESSION_INDEXES <= _index_names(legacy_sqlite_db, "agno_sessions")
+    assert legacy_sqlite_db.get_latest_schema_version("agno_sessions") == "2.5.0"
+
+
+async def test_async_up(tmp_path):
+    db_file = str(tmp_path / "agno.db")
+    legacy = SqliteDb(db_file=db_file)
+    legacy._get_table("memories", create_table_if_not_found=True)
+    with legacy.db_engine.begin() as conn:
+        conn.execute(text('DROP INDEX "idx_agno_memories_agent_id_updated_at"'))
+
+    db = AsyncSqliteDb(db_file=db_file)
+    assert await v2_5_0.async_up(db, "memories", "agno_memories")
+
+    assert "idx_agno_memories_agent_id_updated_at" in _index_names(legacy, "agno_memories")
+
+
+def test_postgres_statements_build_concurrently_and_replace_invalid_indexes():
+    db = SimpleNamespace(db_schema="ai")
+    existing = {
+        "idx_agno_sessions_created_at_session_id": True,
+        "idx_agno_sessions_updated_at_created_at_session_id": True,
+        "idx_agno_sessions_agent_id_created_at": False,
+    }
+
+    statements = v2_5_0._create_statements("PostgresDb", db, "sessions", "agno_sessions", existing)
+
+    assert statements[0] == (
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_agno_sessions_user_id_session_type_created_at" '
+        'ON "ai"."agno_sessions" ("user_id", "session_type", "created_at")'
+    )
+    assert statements[1] == 'DROP INDEX CONCURRENTLY IF EXISTS "ai"."idx_agno_sessions_agent_id_created_at"'
+    assert statements[2].startswith('CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_agno_sessions_agent_id_created_at"')
+    assert len(statements) == 5
+
+
+def test_mysql_statements_build_without_locking():
+    db = SimpleNamespace(db_schema="ai")
+
+    statements = v2_5_0._create_statements("MySQLDb", db, "traces", "agno_traces", {})
+
+    assert "ALTER TABLE `ai`.`agno_traces` ADD INDEX `idx_agno_traces_session_id_start_time` " in statements[1]
+    assert all(statement.endswith("ALGORITHM=INPLACE, LOCK=NONE") for statement in statements)
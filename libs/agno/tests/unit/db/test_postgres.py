@@ -191,7 +191,7 @@ def test_create_memory_table(postgres_db, mock_session):
     for index in table.indexes:
         for column in index.columns:
             indexed_columns.append(column.name)
-    assert set(indexed_columns) == {"user_id", "created_at", "updated_at"}
+    assert set(indexed_columns) == {"user_id", "agent_id", "team_id", "created_at", "updated_at", "memory_id"}
 
 
 def test_create_eval_table(postgres_db, mock_session):
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.sqlite import SqliteDb
+from agno.db.utils import SESSION_SUMMARY_COLUMNS, project_session
+from agno.os.schema import SessionSchema
+from agno.run.agent import RunInput, RunOutput
+from agno.run.team import TeamRunInput, TeamRunOutput
+from agno.session.agent import AgentSession
+from agno.session.team import TeamSession
+
+
+def _session(session_id: str, session_name=None, num_runs: int = 2) -> AgentSession:
+    runs = [
+        RunOutput(run_id=f"{session_id}-{i}", agent_id="agent-1", input=RunInput(input_content=f"question {i}"))
+        for i in range(num_runs)
+    ]
+    session_data = {"session_name": session_name} if session_name else {}
+    return AgentSession(
+        session_id=session_id,
+        agent_id="agent-1",
+        user_id="user-1",
+        session_data=session_data,
+        runs=runs,
+        created_at=int(time.time()),
+    )
+
+
+@pytest.fixture(params=["sqlite", "in_memory"])
+def db(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteDb(db_file=str(tmp_path / "sessions.db"))
+    return InMemoryDb()
+
+
+def test_summary_projection_drops_runs_of_named_sessions(db):
+    db.upsert_session(_session("named", session_name="My session", num_runs=3))
+    db.upsert_session(_session("unnamed", num_runs=2))
+
+    sessions, total_count = db.get_sessions(
+        session_type=SessionType.AGENT, deserialize=False, columns=SESSION_SUMMARY_COLUMNS, sort_by="created_at"
+    )
+    by_id = {session["session_id"]: session for session in sessions}
+
+    assert total_count == 2
+    assert "runs" not in by_id["named"] or by_id["named"]["runs"] is None
+    assert by_id["named"]["run_count"] == 3
+    assert by_id["unnamed"]["run_count"] == 2
+    assert by_id["unnamed"]["runs"] == [{"input": {"input_content": "question 0"}}]
+    assert "agent_data" not in by_id["named"]
+
+    full_sessions, _ = db.get_sessions(session_type=SessionType.AGENT, deserialize=False)
+    expected_names = {session["session_id"]: SessionSchema.from_dict(session).session_name for session in full_sessions}
+    schemas = {session["session_id"]: SessionSchema.from_dict(session) for session in sessions}
+    assert schemas["named"].session_name == "My session"
+    assert schemas["unnamed"].session_name == expected_names["unnamed"]
+    assert "question 0" in schemas["unnamed"].session_name
+    assert schemas["named"].run_count == 3
+
+
+def test_summary_projection_names_team_sessions_after_the_first_team_run(db):
+    # Member runs are stored in the session before the team run they belong to
+    db.upsert_session(
+        TeamSession(
+            session_id="team-session",
+            team_id="team-1",
+            session_data={},
+            runs=[
+                RunOutput(run_id="member-run", agent_id="agent-1", input=RunInput(input_content="member task")),
+                TeamRunOutput(run_id="team-run", team_id="team-1", input=TeamRunInput(input_content="team question")),
+            ],
+            created_at=int(time.time()),
+        )
+    )
+
+    sessions, _ = db.get_sessions(session_type=SessionType.TEAM, deserialize=False, columns=SESSION_SUMMARY_COLUMNS)
+
+    assert sessions[0]["runs"] == [{"input": {"input_content": "team question"}}]
+    assert SessionSchema.from_dict(sessions[0]).session_name == "team question"
+
+
+def test_projection_ignored_when_deserializing(db):
+    db.upsert_session(_session("s1", session_name="Named"))
+
+    sessions = db.get_sessions(session_type=SessionType.AGENT, columns=SESSION_SUMMARY_COLUMNS)
+
+    assert len(sessions) == 1
+    assert len(sessions[0].runs) == 2
+
+
+def test_project_session_counts_runs_when_not_stored():
+    session = {"session_id": "s1", "session_data": {"session_name": "x"}, "runs": [{}, {}], "agent_data": {}}
+
+    projected = project_session(session, ["session_id", "run_count", "unnamed_runs"])
+
+    assert projected == {"session_id": "s1", "run_count": 2}
+    assert project_session(session, None) is session
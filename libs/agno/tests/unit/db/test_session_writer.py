@@ -0,0 +1,216 @@
+import asyncio
+import threading
+from copy import copy
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.async_adapter import AsyncDbAdapter
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.session_writer import SessionWriter
+from agno.db.sqlite import AsyncSqliteDb
+from agno.models.mock import MockModel
+from agno.run.agent import RunOutput
+from agno.session.agent import AgentSession
+
+
+@pytest.fixture
+def db():
+    return InMemoryDb()
+
+
+def _record_writes(db, monkeypatch, release=None, started=None):
+    """Record the number of runs of every session written to the db, optionally blocking writes until released"""
+    writes = []
+    upsert_session = db.upsert_session
+
+    def record(session, **kwargs):
+        if started is not None:
+            started.set()
+        if release is not None:
+            release.wait(timeout=5)
+        writes.append((session.session_id, len(session.runs or [])))
+        return upsert_session(session, **kwargs)
+
+    monkeypatch.setattr(db, "upsert_session", record)
+    return writes
+
+
+def test_saves_are_coalesced(db, monkeypatch):
+    writes = _record_writes(db, monkeypatch)
+    writer = SessionWriter(coalesce_ms=200)
+    session = AgentSession(session_id="session", agent_id="agent", runs=[])
+
+    futures = []
+    for i in range(5):
+        session.upsert_run(RunOutput(run_id=f"run-{i}", agent_id="agent"))
+        futures.append(writer.save(db, session))
+    writer.flush()
+
+    assert writes == [("session", 5)]
+    assert all(future is futures[0] for future in futures)
+    stored = db.get_session(session_id="session", session_type=SessionType.AGENT)
+    assert stored is not None and len(stored.runs or []) == 5
+    writer.close()
+
+
+def test_writes_of_a_session_are_ordered(db, monkeypatch):
+    release, started = threading.Event(), threading.Event()
+    writes = _record_writes(db, monkeypatch, release=release, started=started)
+    writer = SessionWriter(coalesce_ms=100, max_workers=2)
+    session = AgentSession(session_id="session", agent_id="agent", runs=[])
+
+    # The first write blocks, so the next saves are coalesced into one write queued behind it
+    session.upsert_run(RunOutput(run_id="run-0", agent_id="agent"))
+    first = writer.save(db, session)
+    assert started.wait(timeout=5)
+    for i in range(1, 4):
+        session.upsert_run(RunOutput(run_id=f"run-{i}", agent_id="agent"))
+        assert writer.save(db, session) is not first
+    release.set()
+    writer.flush()
+
+    assert writes == [("session", 1), ("session", 4)]
+    writer.close()
+
+
+def test_the_latest_run_is_copied_when_saved(db, monkeypatch):
+    release, started = threading.Event(), threading.Event()
+    _record_writes(db, monkeypatch, release=release, started=started)
+    writer = SessionWriter(coalesce_ms=0)
+    session = AgentSession(session_id="session", agent_id="agent", runs=[])
+    run = RunOutput(run_id="run-0", agent_id="agent", content="draft")
+    session.upsert_run(run)
+
+    writer.save(db, session)
+    assert started.wait(timeout=5)
+    # The caller goes on changing its run while the session is written
+    run.content = "final"
+    release.set()
+    writer.flush()
+
+    stored = db.get_session(session_id="session", session_type=SessionType.AGENT)
+    assert stored is not None and stored.runs is not None
+    assert stored.runs[0].content == "draft"
+    writer.close()
+
+
+def test_copies_of_a_database_share_the_writes_of_a_session(db):
+    writer = SessionWriter(coalesce_ms=200)
+    session = AgentSession(session_id="session", agent_id="agent", runs=[])
+
+    first = writer.save(db, session)
+    # A copy of the database has the same id, and writes to the same sessions
+    assert writer.save(copy(db), session) is first
+    writer.flush()
+    writer.close()
+
+
+def test_sync_mode_waits_for_the_write(db, monkeypatch):
+    writes = _record_writes(db, monkeypatch)
+    writer = SessionWriter(durability="sync", coalesce_ms=1000)
+
+    writer.save(db, AgentSession(session_id="session", agent_id="agent"))
+
+    assert writes == [("session", 0)]
+    writer.close()
+
+
+def test_failed_writes_resolve_their_future(db, monkeypatch):
+    def fail(session, **kwargs):
+        raise RuntimeError("database is down")
+
+    monkeypatch.setattr(db, "upsert_session", fail)
+    writer = SessionWriter(coalesce_ms=0)
+
+    future = writer.save(db, AgentSession(session_id="session", agent_id="agent"))
+    writer.flush()
+
+    assert isinstance(future.exception(), RuntimeError)
+    writer.close()
+
+
+def test_agent_writes_sessions_behind_runs(db, monkeypatch):
+    release = threading.Event()
+    writes = _record_writes(db, monkeypatch, release=release)
+    writer = SessionWriter(durability="async", coalesce_ms=0)
+    agent = Agent(
+        model=MockModel(responses=["First answer", "Second answer"]),
+        db=db,
+        session_writer=writer,
+        add_history_to_context=True,
+        telemetry=False,
+    )
+
+    # The run returns while its session is still being written
+    agent.run("First question", session_id="session")
+    assert writes == []
+    release.set()
+
+    # The next run waits for the pending write of its session before reading it
+    second_run = agent.run("Second question", session_id="session")
+    writer.flush()
+
+    assert [m.content for m in second_run.messages or [] if m.from_history] == ["First question", "First answer"]
+    assert writes == [("session", 1), ("session", 2)]
+    writer.close()
+
+
+async def test_writes_to_async_databases(db, monkeypatch):
+    writes = _record_writes(db, monkeypatch)
+    async_db = AsyncDbAdapter(db)
+    writer = SessionWriter(coalesce_ms=50)
+    writer.attach(asyncio.get_running_loop())
+    session = AgentSession(session_id="session", agent_id="agent", runs=[])
+
+    for i in range(3):
+        session.upsert_run(RunOutput(run_id=f"run-{i}", agent_id="agent"))
+        await writer.asave(async_db, session)
+    await writer.aflush()
+
+    assert writes == [("session", 3)]
+    await writer.aclose()
+    await async_db.close()
+
+
+def test_back_to_back_runs_keep_every_run(db):
+    writer = SessionWriter(coalesce_ms=200)
+    agent = Agent(
+        model=MockModel(responses=["First answer", "Second answer"]), db=db, session_writer=writer, telemetry=False
+    )
+
+    agent.run("First question", session_id="session")
+    agent.run("Second question", session_id="session")
+    writer.flush()
+
+    stored = db.get_session(session_id="session", session_type=SessionType.AGENT)
+    assert stored is not None and len(stored.runs or []) == 2
+    writer.close()
+
+
+def test_async_writes_land_before_the_loop_ends(tmp_path):
+    async_db = AsyncSqliteDb(db_file=str(tmp_path / "agno.db"))
+    writer = SessionWriter()
+    agent = Agent(model=MockModel(responses=["Answer"]), db=async_db, session_writer=writer, telemetry=False)
+
+    asyncio.run(agent.arun("Question", session_id="session"))
+    writer.flush()
+
+    stored = asyncio.run(async_db.get_session(session_id="session", session_type=SessionType.AGENT))
+    assert stored is not None and len(stored.runs or []) == 1
+
+
+def test_cancelled_async_writes_fail_their_future(db):
+    async_db = AsyncDbAdapter(db)
+    writer = SessionWriter(coalesce_ms=1000)
+
+    async def save():
+        # Attached to the loop, the write is left in the background, and cancelled when the loop ends
+        writer.attach(asyncio.get_running_loop())
+        return await writer.asave(async_db, AgentSession(session_id="session", agent_id="agent"))
+
+    future = asyncio.run(save())
+    writer.flush()
+
+    assert isinstance(future.exception(timeout=1), RuntimeError)
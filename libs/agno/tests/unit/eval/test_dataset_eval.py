@@ -0,0 +1,246 @@
+"""Unit tests for DatasetEval"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.eval.accuracy import AccuracyAgentResponse, AccuracyEval
+from agno.eval.agent_as_judge import AgentAsJudgeEval, BinaryJudgeResponse
+from agno.eval.dataset import DatasetEval, EvalCase, _BinaryJudgeBatchResponse, _IndexedBinaryJudgeResponse
+from agno.models.openai import OpenAIChat
+from agno.run.agent import RunOutput
+
+
+def _agent(answer=lambda input: f"Answer to {input}") -> Agent:
+    agent = Agent(id="agent-under-test", model=OpenAIChat(id="gpt-4o-mini"))
+    agent.run = MagicMock(side_effect=lambda input, **kwargs: RunOutput(content=answer(input)))  # type: ignore[method-assign]
+    return agent
+
+
+def _binary_judge(supports_structured_outputs: bool = True) -> AgentAsJudgeEval:
+    """A judge passing outputs mentioning 'even', answering batch prompts with one evaluation per case"""
+    evaluator = Agent(model=OpenAIChat(id="gpt-4o-mini"))
+    evaluator.model.supports_native_structured_outputs = supports_structured_outputs  # type: ignore[union-attr]
+
+    def judge(prompt, output_schema=None, **kwargs):
+        if output_schema is _BinaryJudgeBatchResponse:
+            cases = prompt.split('<case index="')[1:]
+            evaluations = [
+                _IndexedBinaryJudgeResponse(case_index=int(case.split('"')[0]), passed="even" in case, reason="ok")
+                for case in cases
+            ]
+            return RunOutput(content=_BinaryJudgeBatchResponse(evaluations=evaluations))
+        return RunOutput(content=BinaryJudgeResponse(passed="even" in prompt, reason="ok"))
+
+    evaluator.run = MagicMock(side_effect=judge)  # type: ignore[method-assign]
+    return AgentAsJudgeEval(criteria="Mentions even numbers", evaluator_agent=evaluator, telemetry=False)
+
+
+def _cases(n: int):
+    return [EvalCase(input=f"{'even' if i % 2 == 0 else 'odd'} case {i}") for i in range(n)]
+
+
+def test_runs_cases_and_iterations_with_bounded_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def answer(input):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        threading.Event().wait(0.02)
+        with lock:
+            in_flight -= 1
+        return input
+
+    judge = _binary_judge()
+    dataset_eval = DatasetEval(
+        cases=_cases(10), evaluation=judge, agent=_agent(answer), num_iterations=2, max_concurrency=4
+    )
+    result = dataset_eval.run()
+
+    assert result is not None
+    assert len(result.results) == 20
+    assert {(r.case_id, r.iteration) for r in result.results} == {
+        (case.id, i) for case in dataset_eval.get_cases() for i in (1, 2)
+    }
+    assert result.pass_rate == 50.0
+    assert result.judge_calls == 20
+    assert result.throughput > 0
+    assert max_in_flight == 4
+
+
+def test_batch_judging():
+    judge = _binary_judge()
+    result = DatasetEval(
+        cases=_cases(10), evaluation=judge, agent=_agent(lambda input: input), judge_batch_size=4
+    ).run()
+
+    assert result is not None
+    assert result.judge_calls == 3
+    assert result.pass_rate == 50.0
+    assert all(r.reason == "ok" for r in result.results)
+
+
+def test_batch_judging_needs_structured_outputs():
+    judge = _binary_judge(supports_structured_outputs=False)
+    result = DatasetEval(cases=_cases(4), evaluation=judge, agent=_agent(lambda input: input), judge_batch_size=4).run()
+
+    assert result is not None
+    assert result.judge_calls == 4
+    assert result.pass_rate == 50.0
+
+
+def test_failed_runs_are_recorded_and_not_judged():
+    def answer(input):
+        if "case 1" in input:
+            raise RuntimeError("model unavailable")
+        return input
+
+    judge = _binary_judge()
+    result = DatasetEval(cases=_cases(3), evaluation=judge, agent=_agent(answer)).run()
+
+    assert result is not None
+    assert result.failed == 1
+    assert result.judge_calls == 2
+    failed = next(r for r in result.results if r.error is not None)
+    assert failed.error == "RuntimeError: model unavailable"
+
+
+def test_resume_from_checkpoints():
+    db = InMemoryDb()
+    calls = []
+
+    def interrupted(input):
+        if len(calls) == 5:
+            raise KeyboardInterrupt
+        calls.append(input)
+        return input
+
+    dataset_eval = DatasetEval(
+        cases=_cases(8),
+        evaluation=_binary_judge(),
+        agent=_agent(interrupted),
+        max_concurrency=1,
+        checkpoint_interval=2,
+        db=db,
+        run_id="nightly",
+    )
+    with pytest.raises(KeyboardInterrupt):
+        dataset_eval.run()
+    # The first two windows were checkpointed
+    assert db.get_eval_run("nightly-checkpoint-1") is not None
+    assert db.get_eval_run("nightly") is None
+
+    agent = _agent()
+    result = DatasetEval(
+        cases=_cases(8), evaluation=_binary_judge(), agent=agent, checkpoint_interval=2, db=db, run_id="nightly"
+    ).run()
+
+    assert result is not None
+    assert result.resumed == 4
+    assert len(result.results) == 8
+    assert agent.run.call_count == 4
+    # Checkpoints are replaced by the final eval run
+    assert db.get_eval_run("nightly-checkpoint-0") is None
+    stored = db.get_eval_run("nightly")
+    assert stored is not None and len(stored.eval_data["results"]) == 8
+
+    # A finished run is not run again
+    agent = _agent()
+    result = DatasetEval(cases=_cases(8), evaluation=_binary_judge(), agent=agent, db=db, run_id="nightly").run()
+    assert result is not None and len(result.results) == 8
+    agent.run.assert_not_called()
+
+
+def test_checkpoints_skip_failed_writes_and_failed_evaluations(monkeypatch):
+    db = InMemoryDb()
+    create_eval_run = db.create_eval_run
+    writes = []
+
+    def flaky_create_eval_run(eval_run):
+        writes.append(eval_run.run_id)
+        # The checkpoint of the first window is not stored
+        if len(writes) == 1:
+            raise RuntimeError("database is down")
+        return create_eval_run(eval_run)
+
+    monkeypatch.setattr(db, "create_eval_run", flaky_create_eval_run)
+
+    def answer(input):
+        if "case 3" in input:
+            raise RuntimeError("model unavailable")
+        if "case 5" in input:
+            raise KeyboardInterrupt
+        return input
+
+    dataset_eval = DatasetEval(
+        cases=_cases(8),
+        evaluation=_binary_judge(),
+        agent=_agent(answer),
+        max_concurrency=1,
+        checkpoint_interval=2,
+        db=db,
+        run_id="nightly",
+    )
+    with pytest.raises(KeyboardInterrupt):
+        dataset_eval.run()
+
+    # The failed write is retried under the same number, with the results of both windows, except the failed case
+    assert writes == ["nightly-checkpoint-0", "nightly-checkpoint-0"]
+    checkpoint = db.get_eval_run("nightly-checkpoint-0")
+    assert checkpoint is not None and len(checkpoint.eval_data["results"]) == 3
+
+    agent = _agent()
+    result = DatasetEval(
+        cases=_cases(8), evaluation=_binary_judge(), agent=agent, checkpoint_interval=2, db=db, run_id="nightly"
+    ).run()
+
+    assert result is not None
+    assert result.resumed == 3
+    assert result.failed == 0
+    assert len(result.results) == 8
+    assert agent.run.call_count == 5
+
+
+async def test_arun_with_accuracy_eval():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def arun(input, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return RunOutput(content="4")
+
+    async def judge(prompt, **kwargs):
+        return RunOutput(content=AccuracyAgentResponse(accuracy_score=10, accuracy_reason="Correct"))
+
+    agent = Agent(model=OpenAIChat(id="gpt-4o-mini"))
+    agent.arun = arun  # type: ignore[method-assign]
+    evaluator = Agent(model=OpenAIChat(id="gpt-4o-mini"))
+    evaluator.arun = judge  # type: ignore[method-assign]
+    accuracy = AccuracyEval(input="", expected_output="", agent=agent, evaluator_agent=evaluator, telemetry=False)
+
+    cases = [{"input": f"What is 2+2? ({i})", "expected_output": "4"} for i in range(12)]
+    result = await DatasetEval(cases=cases, evaluation=accuracy, max_concurrency=3, db=InMemoryDb()).arun()
+
+    assert result is not None
+    assert len(result.results) == 12
+    assert result.avg_score == 10
+    assert max_in_flight == 3
+
+
+def test_accuracy_eval_requires_expected_output():
+    accuracy = AccuracyEval(input="", expected_output="", agent=_agent(), telemetry=False)
+
+    with pytest.raises(ValueError, match="expected_output"):
+        DatasetEval(cases=[EvalCase(input="What is 2+2?")], evaluation=accuracy).run()
@@ -0,0 +1,144 @@
+"""Unit tests for the PerformanceEval load test mode"""
+
+import threading
+import time
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.eval.performance import LoadTestResult, PerformanceEval
+from agno.models.mock import MockModel
+
+
+def _agent(**model_kwargs) -> Agent:
+    return Agent(model=MockModel(responses=["one two three four"], **model_kwargs), telemetry=False)
+
+
+def test_load_test_with_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+    agent = _agent(latency=0.01)
+
+    def run():
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        try:
+            return agent.run("hi")
+        finally:
+            with lock:
+                in_flight -= 1
+
+    result = PerformanceEval(func=run, num_requests=20, concurrency=4, warmup_runs=0, telemetry=False).run_load_test()
+
+    assert result.num_requests == 20
+    assert len(result.latencies) == 20
+    assert max_in_flight == 4
+    assert result.output_tokens == 80
+    assert result.tokens_per_second > 0
+    assert result.error_rate == 0
+    assert 0.01 <= result.p50_latency <= result.p95_latency <= result.p99_latency <= result.max_latency
+    # Not streamed
+    assert result.p50_time_to_first_token is None
+    # Only sampled by arun_load_test()
+    assert result.avg_loop_lag is None
+
+
+def test_load_test_streams_measure_time_to_first_token():
+    agent = _agent(latency=0.01, chunk_latency=0.01)
+    result = PerformanceEval(
+        func=lambda: agent.run("hi", stream=True, yield_run_output=True),
+        num_requests=6,
+        concurrency=3,
+        warmup_runs=0,
+        telemetry=False,
+    ).run_load_test()
+
+    assert len(result.times_to_first_token) == 6
+    assert result.p50_time_to_first_token is not None and result.p50_time_to_first_token < result.p50_latency
+    assert result.output_tokens == 24
+
+
+def test_load_test_counts_errors():
+    calls = 0
+    lock = threading.Lock()
+
+    def flaky():
+        nonlocal calls
+        with lock:
+            calls += 1
+            call = calls
+        if call % 4 == 0:
+            raise RuntimeError("rate limited")
+        return "ok"
+
+    result = PerformanceEval(func=flaky, num_requests=20, concurrency=2, warmup_runs=0, telemetry=False).run_load_test()
+
+    assert len(result.errors) == 5
+    assert result.errors[0] == "RuntimeError: rate limited"
+    assert result.error_rate == 0.25
+    assert len(result.latencies) == 15
+
+
+def test_load_test_with_arrival_rate():
+    start = time.perf_counter()
+    result = PerformanceEval(
+        func=lambda: None, num_requests=10, arrival_rate=100, concurrency=2, warmup_runs=0, telemetry=False
+    ).run_load_test()
+
+    # Requests start every 10ms
+    assert time.perf_counter() - start >= 0.09
+    assert result.arrival_rate == 100
+    assert result.num_requests == 10
+
+
+async def test_async_load_test_measures_event_loop_lag():
+    agent = _agent(latency=0.01, chunk_latency=0.005)
+
+    async def blocking():
+        # Blocks the event loop
+        time.sleep(0.03)
+
+    streamed = await PerformanceEval(
+        func=lambda: agent.arun("hi", stream=True, stream_events=True),
+        num_requests=20,
+        concurrency=10,
+        warmup_runs=0,
+        telemetry=False,
+    ).arun_load_test()
+    blocked = await PerformanceEval(
+        func=blocking, num_requests=5, concurrency=5, warmup_runs=0, telemetry=False
+    ).arun_load_test()
+
+    assert len(streamed.times_to_first_token) == 20
+    assert streamed.output_tokens == 80
+    assert streamed.max_loop_lag is not None and blocked.max_loop_lag is not None
+    assert blocked.max_loop_lag >= 0.02
+    assert blocked.max_loop_lag > streamed.avg_loop_lag  # type: ignore[operator]
+
+
+async def test_async_load_test_logs_eval_run():
+    db = InMemoryDb()
+    agent = _agent()
+    performance_eval = PerformanceEval(
+        func=lambda: agent.arun("hi"), num_requests=5, warmup_runs=0, db=db, name="load", telemetry=False
+    )
+    await performance_eval.arun_load_test()
+
+    eval_run = db.get_eval_run(performance_eval.eval_id)
+    assert eval_run is not None
+    assert eval_run.eval_input["num_requests"] == 5
+    assert eval_run.eval_data["load_test"]["num_requests"] == 5
+    assert "latencies" not in eval_run.eval_data["load_test"]
+
+
+def test_load_test_result_percentiles():
+    result = LoadTestResult(latencies=[float(i) for i in range(1, 101)], num_requests=100, duration=10)
+
+    assert result.p50_latency == pytest.approx(50.5)
+    assert result.p95_latency == pytest.approx(95.05)
+    assert result.p99_latency == pytest.approx(99.01)
+    assert result.throughput == 10
@@ -0,0 +1,104 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.embedder.base import Embedder
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class BadRequestError(Exception):
+    pass
+
+
+class AuthenticationError(Exception):
+    status_code = 401
+
+
+@dataclass
+class FakeEmbedder(Embedder):
+    enable_batch: bool = True
+    rate_limit_base_delay: float = 0.0
+    fail_on: Optional[str] = None
+    error: Optional[Exception] = None
+    rate_limited_calls: int = 0
+    calls: List[List[str]] = field(default_factory=list)
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.calls.append(texts)
+        if self.rate_limited_calls > 0:
+            self.rate_limited_calls -= 1
+            raise RateLimitError("429 Too Many Requests")
+        if self.error is not None:
+            raise self.error
+        if self.fail_on is not None and self.fail_on in texts:
+            raise BadRequestError("invalid input")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return [[float(len(text))] for text in texts], [{"total_tokens": len(texts)}] * len(texts)
+
+
+async def test_batches_run_concurrently_up_to_the_limit_and_keep_order():
+    embedder = FakeEmbedder(batch_size=2, max_concurrent_batches=3)
+    texts = ["a" * i for i in range(1, 21)]
+
+    embeddings, usages = await embedder._async_embed_batches(texts)
+
+    assert embeddings == [[float(i)] for i in range(1, 21)]
+    assert usages == [{"total_tokens": 2}] * 20
+    assert len(embedder.calls) == 10
+    assert embedder.max_in_flight == 3
+
+
+def test_batches_are_cut_by_token_budget():
+    embedder = FakeEmbedder(batch_size=100, max_batch_tokens=100)
+    texts = ["x" * 150] * 4 + ["y"] * 3
+
+    # 150 chars is estimated at 51 tokens, so two long texts do not fit in one batch
+    assert embedder._get_batches(texts) == [(0, 1), (1, 2), (2, 3), (3, 7)]
+
+
+async def test_rate_limited_batch_is_retried_with_backoff():
+    embedder = FakeEmbedder(batch_size=10, rate_limited_calls=2)
+
+    embeddings, _ = await embedder._async_embed_batches(["a", "bb"])
+
+    assert embeddings == [[1.0], [2.0]]
+    assert len(embedder.calls) == 3
+
+
+async def test_rate_limit_is_raised_once_retries_run_out():
+    embedder = FakeEmbedder(batch_size=10, rate_limited_calls=10, rate_limit_retries=2)
+
+    with pytest.raises(RateLimitError):
+        await embedder._async_embed_batches(["a", "bb"])
+    assert len(embedder.calls) == 3
+
+
+async def test_failing_text_is_isolated_without_per_text_fallback():
+    embedder = FakeEmbedder(batch_size=8, fail_on="bad")
+    texts = ["a", "b", "c", "bad", "e", "f", "g", "h"]
+
+    embeddings, usages = await embedder._async_embed_batches(texts)
+
+    assert embeddings[3] == [] and usages[3] is None
+    assert [e for i, e in enumerate(embeddings) if i != 3] == [[1.0]] * 7
+    # The batch is bisected down to the bad text: 1 + 2 + 2 + 2 calls instead of 1 + 8
+    assert len(embedder.calls) == 7
+
+
+async def test_errors_not_caused_by_the_texts_fail_fast():
+    embedder = FakeEmbedder(batch_size=8, error=AuthenticationError("Incorrect API key provided"))
+
+    with pytest.raises(AuthenticationError):
+        await embedder._async_embed_batches(["a", "b", "c", "d", "e", "f", "g", "h"])
+    # Not bisected: splitting the batch would fail every half the same way
+    assert len(embedder.calls) == 1
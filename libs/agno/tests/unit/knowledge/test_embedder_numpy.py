@@ -0,0 +1,89 @@
+import base64
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from agno.knowledge.embedder.base import Embedder, to_float32_matrix
+
+
+@dataclass
+class FakeEmbedder(Embedder):
+    enable_batch: bool = True
+    dimensions: Optional[int] = 2
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text)), 1.0]
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def _async_embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        if "bad" in texts:
+            raise ValueError("invalid input")
+        return [self.get_embedding(text) for text in texts], [None] * len(texts)
+
+
+def test_to_float32_matrix_marks_failed_rows_as_nan():
+    matrix = to_float32_matrix([[1.0, 2.0], [], [3.0, 4.0]])
+
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (3, 2)
+    assert np.isnan(matrix[1]).all()
+    assert matrix[2].tolist() == [3.0, 4.0]
+
+
+def test_format_batch_embeddings_returns_lists_by_default():
+    embedder = FakeEmbedder()
+
+    assert embedder._format_batch_embeddings(np.ones((2, 2), dtype=np.float32)) == [[1.0, 1.0], [1.0, 1.0]]
+    assert embedder._format_batch_embeddings([np.zeros(2), []]) == [[0.0, 0.0], []]
+
+
+def test_format_batch_embeddings_returns_rows_of_one_matrix_with_use_numpy():
+    embedder = FakeEmbedder(use_numpy=True)
+
+    rows = embedder._format_batch_embeddings([[1.0, 2.0], [], [3.0, 4.0]])
+
+    assert rows[1] == []
+    assert rows[0].dtype == np.float32 and rows[2].tolist() == [3.0, 4.0]
+    assert rows[0].base is rows[2].base
+
+
+async def test_async_batches_with_use_numpy_keep_failed_texts_empty():
+    embedder = FakeEmbedder(use_numpy=True, batch_size=2)
+
+    embeddings, _ = await embedder._async_embed_batches(["a", "bad", "ccc"])
+
+    assert embeddings[1] == []
+    assert embeddings[0].tolist() == [1.0, 1.0]
+    assert embeddings[2].tolist() == [3.0, 1.0]
+
+
+async def test_get_embeddings_array():
+    embedder = FakeEmbedder()
+
+    assert embedder.get_embeddings_array(["a", "bb"]).tolist() == [[1.0, 1.0], [2.0, 1.0]]
+    matrix = await embedder.async_get_embeddings_array(["a", "bad"])
+    assert matrix.dtype == np.float32
+    assert matrix[0].tolist() == [1.0, 1.0]
+    assert np.isnan(matrix[1]).all()
+
+
+async def test_openai_use_numpy_decodes_base64_embeddings():
+    from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+    vectors = np.array([[0.5, 1.5], [2.5, 3.5]], dtype=np.float32)
+    response = MagicMock()
+    response.data = [MagicMock(embedding=base64.b64encode(vector.tobytes()).decode()) for vector in vectors]
+    response.usage = None
+    client = MagicMock()
+    client.embeddings.create = AsyncMock(return_value=response)
+    embedder = OpenAIEmbedder(dimensions=2, use_numpy=True, async_client=client)
+
+    embeddings, _ = await embedder.async_get_embeddings_batch_and_usage(["a", "b"])
+
+    assert client.embeddings.create.call_args.kwargs["encoding_format"] == "base64"
+    assert embeddings[0].dtype == np.float32
+    assert [embedding.tolist() for embedding in embeddings] == vectors.tolist()
@@ -0,0 +1,104 @@
+import asyncio
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from agno.knowledge.embedder.pool import LocalEmbeddingPool
+
+
+def _encode(texts):
+    if "die" in texts:
+        os._exit(1)
+    if "fail" in texts:
+        raise ValueError("cannot encode")
+    return [[float(len(text)), float(ord(text[0])), 1.0] for text in texts]
+
+
+def _load_encoder():
+    return _encode
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with LocalEmbeddingPool(_load_encoder, dimensions=3, num_workers=2, max_batch_size=64, max_wait_ms=50) as pool:
+        yield pool
+
+
+def test_embed_returns_float32_rows_in_order(pool):
+    embeddings = pool.embed(["a", "bb", "ccc"])
+
+    assert embeddings.dtype == np.float32
+    assert embeddings.tolist() == [[1.0, 97.0, 1.0], [2.0, 98.0, 1.0], [3.0, 99.0, 1.0]]
+    assert pool.embed([]).shape == (0, 3)
+
+
+def test_requests_larger_than_a_batch_are_split(pool):
+    texts = ["x" * (i % 7 + 1) for i in range(150)]
+    embeddings = pool.embed(texts)
+
+    assert embeddings.shape == (150, 3)
+    assert embeddings[:, 0].tolist() == [float(len(text)) for text in texts]
+
+
+def test_concurrent_requests_share_micro_batches(pool):
+    batches_before = pool.num_batches
+    results = {}
+
+    def run(i):
+        results[i] = pool.embed([f"text-{i}"] * 4)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(results[i][0, 0] == len(f"text-{i}") for i in range(16))
+    assert pool.num_batches - batches_before < 16
+
+
+async def test_aembed_does_not_block_the_event_loop(pool):
+    results = await asyncio.gather(pool.aembed(["a"]), pool.aembed(["bb", "ccc"]))
+
+    assert results[0].tolist() == [[1.0, 97.0, 1.0]]
+    assert results[1].shape == (2, 3)
+
+
+def test_worker_errors_are_raised_to_callers(pool):
+    with pytest.raises(ValueError, match="cannot encode"):
+        pool.embed(["fail"])
+    # The pool keeps working afterwards
+    assert pool.embed(["a"]).shape == (1, 3)
+
+
+async def test_cancelled_callers_do_not_block_their_batch(pool):
+    # The requests share a micro-batch, and the first one is cancelled while the batch is encoded
+    cancelled = asyncio.ensure_future(pool.aembed(["a"]))
+    others = [asyncio.ensure_future(pool.aembed(["bb"])), asyncio.ensure_future(pool.aembed(["ccc"]))]
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*others), timeout=10)
+
+    assert cancelled.cancelled()
+    assert [result.tolist() for result in results] == [[[2.0, 98.0, 1.0]], [[3.0, 99.0, 1.0]]]
+    assert pool.embed(["a"]).shape == (1, 3)
+
+
+def test_requests_that_would_overflow_a_batch_start_the_next_one():
+    with LocalEmbeddingPool(_load_encoder, dimensions=3, num_workers=1, max_batch_size=4, max_wait_ms=200) as pool:
+        futures = [pool.submit(["abc"] * 3) for _ in range(3)]
+
+        assert all(future.result(timeout=30).shape == (3, 3) for future in futures)
+        assert pool.num_batches == 3
+
+
+def test_workers_are_restarted_after_a_worker_dies():
+    with LocalEmbeddingPool(_load_encoder, dimensions=3, num_workers=1, max_wait_ms=0) as pool:
+        with pytest.raises(BrokenProcessPool):
+            pool.embed(["die"])
+
+        assert pool.embed(["a"]).tolist() == [[1.0, 97.0, 1.0]]
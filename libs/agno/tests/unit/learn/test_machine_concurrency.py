@@ -0,0 +1,206 @@
+import asyncio
+import time
+from typing import Any, List, Optional
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.learn.machine import LearningMachine
+from agno.models.mock import MockModel
+
+
+class SlowStore:
+    """Minimal LearningStore that sleeps to simulate a model call or DB read."""
+
+    def __init__(self, name: str, delay: float = 0.1, fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.processed = False
+
+    @property
+    def learning_type(self) -> str:
+        return self.name
+
+    @property
+    def schema(self) -> Any:
+        return dict
+
+    def recall(self, **kwargs) -> Optional[Any]:
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return self.name
+
+    async def arecall(self, **kwargs) -> Optional[Any]:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return self.name
+
+    def process(self, messages: List[Any], **kwargs) -> None:
+        time.sleep(self.delay)
+        self.processed = True
+
+    async def aprocess(self, messages: List[Any], **kwargs) -> None:
+        await asyncio.sleep(self.delay)
+        self.processed = True
+
+    def build_context(self, data: Any) -> str:
+        return f"<{data}>"
+
+    def get_tools(self, **kwargs) -> List[Any]:
+        return []
+
+    async def aget_tools(self, **kwargs) -> List[Any]:
+        return []
+
+
+def _machine(*stores: SlowStore, **kwargs) -> LearningMachine:
+    return LearningMachine(custom_stores={store.name: store for store in stores}, **kwargs)
+
+
+def test_recall_runs_stores_concurrently():
+    machine = _machine(SlowStore("a"), SlowStore("b"), SlowStore("c"))
+
+    start = time.perf_counter()
+    results = machine.recall(user_id="u1")
+    elapsed = time.perf_counter() - start
+
+    assert list(results) == ["a", "b", "c"]
+    assert elapsed < 0.25
+    assert set(machine.store_latencies["recall"]) == {"a", "b", "c"}
+    assert all(latency >= 0.09 for latency in machine.store_latencies["recall"].values())
+
+
+def test_recall_sequential_when_disabled():
+    machine = _machine(SlowStore("a"), SlowStore("b"), concurrent=False)
+
+    start = time.perf_counter()
+    results = machine.recall(user_id="u1")
+
+    assert list(results) == ["a", "b"]
+    assert time.perf_counter() - start >= 0.2
+
+
+def test_recall_skips_failed_and_timed_out_stores():
+    machine = _machine(
+        SlowStore("fast", delay=0.0),
+        SlowStore("broken", delay=0.0, fail=True),
+        SlowStore("slow", delay=0.5),
+        store_timeout=0.1,
+    )
+
+    start = time.perf_counter()
+    context = machine.build_context(user_id="u1")
+
+    assert context == "<fast>"
+    assert time.perf_counter() - start < 0.4
+
+
+def test_process_runs_every_store():
+    stores = [SlowStore("a"), SlowStore("b")]
+    machine = _machine(*stores)
+
+    machine.process(messages=[])
+
+    assert all(store.processed for store in stores)
+    assert set(machine.store_latencies["process"]) == {"a", "b"}
+
+
+@pytest.mark.asyncio
+async def test_arecall_runs_stores_concurrently():
+    machine = _machine(SlowStore("a"), SlowStore("b"), SlowStore("c"))
+
+    start = time.perf_counter()
+    results = await machine.arecall(user_id="u1")
+    elapsed = time.perf_counter() - start
+
+    assert list(results) == ["a", "b", "c"]
+    assert elapsed < 0.25
+
+
+@pytest.mark.asyncio
+async def test_arecall_applies_store_timeout():
+    machine = _machine(SlowStore("fast", delay=0.0), SlowStore("slow", delay=0.5), store_timeout=0.1)
+
+    context = await machine.abuild_context(user_id="u1")
+
+    assert context == "<fast>"
+    assert machine.store_latencies["recall"]["slow"] < 0.4
+
+
+@pytest.mark.asyncio
+async def test_aprocess_runs_every_store():
+    stores = [SlowStore("a"), SlowStore("b")]
+    machine = _machine(*stores)
+
+    await machine.aprocess(messages=[])
+
+    assert all(store.processed for store in stores)
+
+
+def test_sequential_recall_applies_store_timeout():
+    machine = _machine(SlowStore("slow", delay=0.5), SlowStore("fast", delay=0.0), concurrent=False, store_timeout=0.1)
+
+    start = time.perf_counter()
+    context = machine.build_context(user_id="u1")
+
+    assert context == "<fast>"
+    assert time.perf_counter() - start < 0.4
+
+
+def test_stores_share_the_thread_pool_of_the_machine():
+    machine = _machine(SlowStore("a"), SlowStore("b"))
+
+    machine.recall(user_id="u1")
+    executor = machine._executor
+    machine.recall(user_id="u1")
+
+    assert executor is not None and machine._executor is executor
+    machine.close()
+    assert machine._executor is None
+
+
+def test_queued_stores_are_timed_from_their_start():
+    # One worker runs the stores one after the other, each within the timeout, but not all of them together
+    machine = _machine(SlowStore("a"), SlowStore("b"), SlowStore("c"), max_workers=1, store_timeout=0.2)
+
+    results = machine.recall(user_id="u1")
+
+    assert list(results) == ["a", "b", "c"]
+
+
+def test_recall_fills_the_latencies_of_the_call():
+    machine = _machine(SlowStore("a"), SlowStore("b", delay=0.0))
+    store_latencies: dict = {}
+
+    machine.build_context(user_id="u1", store_latencies=store_latencies)
+
+    assert set(store_latencies) == {"a", "b"}
+    assert store_latencies["a"] >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_arecall_fills_the_latencies_of_the_call():
+    machine = _machine(SlowStore("a"), SlowStore("b", delay=0.0))
+    store_latencies: dict = {}
+
+    await machine.abuild_context(user_id="u1", store_latencies=store_latencies)
+
+    assert set(store_latencies) == {"a", "b"}
+
+
+def test_agent_records_learning_store_latencies_in_run_metrics():
+    agent = Agent(
+        model=MockModel(responses=["Hi"]),
+        db=InMemoryDb(),
+        learning=_machine(SlowStore("a", delay=0.0), SlowStore("b", delay=0.0)),
+        telemetry=False,
+    )
+
+    run_output = agent.run("Hello", user_id="u1")
+
+    assert run_output.metrics is not None and run_output.metrics.additional_metrics is not None
+    assert set(run_output.metrics.additional_metrics["learning_stores"]) == {"a", "b"}
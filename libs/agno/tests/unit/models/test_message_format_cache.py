@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+import pytest
+
+from agno.media import Image
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+
+
+def _history():
+    return [
+        Message(role="system", content="You are helpful"),
+        Message(role="user", content="Describe this", images=[Image(content=b"\x89PNG fake image")]),
+        Message(
+            role="assistant",
+            tool_calls=[{"id": "call-1", "type": "function", "function": {"name": "lookup", "arguments": "{}"}}],
+        ),
+        Message(role="tool", tool_call_id="call-1", content="a long tool result", compressed_content="short"),
+    ]
+
+
+def test_get_formatted_reuses_payload_until_message_changes():
+    message = Message(role="user", content="hello")
+    calls = []
+
+    def formatter(m: Message, suffix: str):
+        calls.append(m.content)
+        return {"text": f"{m.content}{suffix}"}
+
+    first = message.get_formatted("provider", formatter, "!")
+    assert message.get_formatted("provider", formatter, "!") is first
+    assert calls == ["hello"]
+
+    # Attribute assignment invalidates the cache
+    message.content = "bye"
+    assert message.get_formatted("provider", formatter, "!") == {"text": "bye!"}
+
+    # In-place changes to list fields invalidate the cache too
+    message.tool_calls = []
+    message.get_formatted("provider", formatter, "!")
+    message.tool_calls.append({"id": "call-1"})
+    message.get_formatted("provider", formatter, "!")
+    assert calls == ["hello", "bye", "bye", "bye"]
+
+
+def test_openai_formats_each_message_once_across_tool_loop():
+    model = OpenAIChat(id="gpt-4o")
+    messages = _history()
+    expected = [model._format_message(m) for m in messages]
+
+    with patch.object(OpenAIChat, "_format_message", autospec=True, side_effect=OpenAIChat._format_message) as spy:
+        assert model._format_messages(messages) == expected
+        messages.append(Message(role="assistant", content="done"))
+        model._format_messages(messages)
+
+    assert spy.call_count == len(messages)
+
+
+def test_cache_is_keyed_by_compression_mode():
+    model = OpenAIChat(id="gpt-4o")
+    tool_message = _history()[-1]
+
+    assert model._format_messages([tool_message], compress_tool_results=False)[0]["content"] == "a long tool result"
+    assert model._format_messages([tool_message], compress_tool_results=True)[0]["content"] == "short"
+
+    tool_message.compressed_content = "shorter"
+    assert model._format_messages([tool_message], compress_tool_results=True)[0]["content"] == "shorter"
+
+
+def test_claude_formatting_is_stable_across_iterations():
+    pytest.importorskip("anthropic")
+    from agno.utils.models.claude import format_messages as format_claude_messages
+
+    messages = _history()
+    first, system = format_claude_messages(messages)
+    second, _ = format_claude_messages(messages)
+
+    assert system == "You are helpful"
+    assert second == first
+    # Images are only appended to the user content once
+    assert len(second[0]["content"]) == 2
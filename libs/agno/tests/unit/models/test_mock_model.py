@@ -0,0 +1,103 @@
+"""Unit tests for MockModel"""
+
+from agno.agent import Agent
+from agno.exceptions import ModelRateLimitError
+from agno.models.mock import MockModel, MockToolCall
+from agno.models.utils import get_model
+from agno.run.agent import RunContentEvent, ToolCallCompletedEvent
+from agno.run.base import RunStatus
+
+
+def test_responses_are_cycled():
+    agent = Agent(model=MockModel(responses=["first", "second"]), telemetry=False)
+
+    assert [agent.run("hi").content for _ in range(3)] == ["first", "second", "first"]
+
+
+def test_usage_is_deterministic():
+    agent = Agent(model=MockModel(responses=["one two three"]), telemetry=False)
+    run_output = agent.run("how are you")
+
+    assert run_output.metrics is not None
+    assert run_output.metrics.input_tokens == 3
+    assert run_output.metrics.output_tokens == 3
+
+
+def test_stream_in_chunks():
+    agent = Agent(model=MockModel(responses=["one two three four five"], chunk_size=2), telemetry=False)
+
+    chunks = [event.content for event in agent.run("hi", stream=True)]
+
+    assert chunks == ["one two ", "three four ", "five"]
+
+
+async def test_async_stream():
+    agent = Agent(model=MockModel(responses=["one two"]), telemetry=False)
+
+    chunks = [event.content async for event in agent.arun("hi", stream=True)]
+
+    assert chunks == ["one ", "two"]
+
+
+def test_model_string():
+    model = get_model("mock:scripted")
+
+    assert isinstance(model, MockModel)
+    assert model.id == "scripted"
+
+
+def get_weather(city: str) -> str:
+    """Get the weather of a city"""
+    return f"Sunny in {city}"
+
+
+def test_tool_calls():
+    model = MockModel(responses=[MockToolCall(name="get_weather", arguments={"city": "Paris"}), "It is sunny."])
+    agent = Agent(model=model, tools=[get_weather], telemetry=False)
+
+    run_output = agent.run("What is the weather in Paris?")
+
+    assert run_output.content == "It is sunny."
+    assert run_output.tools is not None
+    assert [(tool.tool_name, tool.tool_args, tool.result) for tool in run_output.tools] == [
+        ("get_weather", {"city": "Paris"}, "Sunny in Paris")
+    ]
+    assert run_output.tools[0].tool_call_id == "call_0_0"
+
+
+def test_streamed_parallel_tool_calls():
+    model = MockModel(
+        responses=[
+            [
+                MockToolCall(name="get_weather", arguments={"city": "Paris"}),
+                MockToolCall(name="get_weather", arguments={"city": "Rome"}),
+            ],
+            "Sunny in both.",
+        ]
+    )
+    agent = Agent(model=model, tools=[get_weather], telemetry=False)
+
+    events = list(agent.run("Weather in Paris and Rome?", stream=True, stream_events=True))
+
+    tool_results = [event.tool.result for event in events if isinstance(event, ToolCallCompletedEvent)]
+    assert tool_results == ["Sunny in Paris", "Sunny in Rome"]
+    assert "".join(event.content for event in events if isinstance(event, RunContentEvent)) == "Sunny in both."
+
+
+def test_scripted_errors():
+    model = MockModel(responses=[ModelRateLimitError("Too many requests"), "ok"])
+    agent = Agent(model=model, telemetry=False)
+
+    assert agent.run("hi").status == RunStatus.error
+    assert agent.run("hi").content == "ok"
+
+
+def test_latency_distribution_is_seeded():
+    def samples(model: MockModel):
+        return [model._sample_latency(model.latency) for _ in range(5)]
+
+    latency = lambda rng: rng.uniform(0.1, 0.2)  # noqa: E731
+
+    assert samples(MockModel(latency=latency, seed=1)) == samples(MockModel(latency=latency, seed=1))
+    assert samples(MockModel(latency=latency, seed=1)) != samples(MockModel(latency=latency, seed=2))
+    assert all(0.1 <= sample <= 0.2 for sample in samples(MockModel(latency=latency)))
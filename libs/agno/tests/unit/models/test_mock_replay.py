@@ -0,0 +1,132 @@
+"""Unit tests for recording and replaying model provider HTTP exchanges"""
+
+import json
+
+import httpx
+import pytest
+
+from agno.agent import Agent
+from agno.models.mock import RecordReplayTransport, use_cassette
+from agno.models.openai import OpenAIChat
+
+
+class FakeProvider:
+    """Answers chat completion requests like the OpenAI API, counting them"""
+
+    def __init__(self):
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        body = json.loads(request.content)
+        if body.get("stream"):
+            chunks = [
+                {
+                    "id": "chatcmpl-1",
+                    "object": "chat.completion.chunk",
+                    "created": 1,
+                    "model": body["model"],
+                    "choices": [{"index": 0, "delta": {"role": "assistant", "content": word}, "finish_reason": None}],
+                }
+                for word in ["Paris ", "is ", "sunny"]
+            ]
+            content = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=content.encode())
+        return httpx.Response(
+            200,
+            headers={"set-cookie": "session=secret"},
+            json={
+                "id": "chatcmpl-1",
+                "object": "chat.completion",
+                "created": 1,
+                "model": body["model"],
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": "Paris"}, "finish_reason": "stop"}
+                ],
+                "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+            },
+        )
+
+
+@pytest.fixture
+def provider():
+    return FakeProvider()
+
+
+@pytest.fixture(autouse=True)
+def openai_api_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+
+def _agent(transport=None) -> Agent:
+    http_client = httpx.Client(transport=transport) if transport is not None else None
+    return Agent(model=OpenAIChat(id="gpt-4o-mini", http_client=http_client), telemetry=False)
+
+
+def _record(tmp_path, provider) -> None:
+    transport = RecordReplayTransport(
+        tmp_path / "cassette.json",
+        transport=httpx.MockTransport(provider),
+        async_transport=httpx.MockTransport(provider),
+    )
+    assert transport.mode == "record"
+    agent = _agent(transport)
+    agent.run("What is the capital of France?")
+    list(agent.run("What is the weather in Paris?", stream=True))
+
+
+def test_record_then_replay(tmp_path, provider):
+    _record(tmp_path, provider)
+    assert provider.requests == 2
+
+    transport = RecordReplayTransport(tmp_path / "cassette.json")
+    assert transport.mode == "replay"
+    agent = _agent(transport)
+
+    assert agent.run("What is the capital of France?").content == "Paris"
+    streamed = "".join(event.content for event in agent.run("What is the weather in Paris?", stream=True))
+    assert streamed == "Paris is sunny"
+    # Replayed requests cycle through the recorded responses
+    assert agent.run("What is the capital of France?").content == "Paris"
+    assert provider.requests == 2
+
+
+def test_cassette_does_not_record_credentials(tmp_path, provider):
+    _record(tmp_path, provider)
+    cassette = (tmp_path / "cassette.json").read_text()
+
+    assert "test-key" not in cassette
+    assert "secret" not in cassette
+    exchange = json.loads(cassette)["exchanges"][0]
+    assert exchange["request"]["body"]["messages"][-1]["content"] == "What is the capital of France?"
+
+
+def test_replay_fails_on_unrecorded_request(tmp_path, provider):
+    _record(tmp_path, provider)
+    transport = RecordReplayTransport(tmp_path / "cassette.json", mode="replay")
+
+    with pytest.raises(ValueError, match="No exchange recorded"):
+        transport.handle_request(httpx.Request("POST", "https://api.openai.com/v1/chat/completions", json={"a": 1}))
+
+
+async def test_use_cassette_replays_async_runs(tmp_path, provider):
+    _record(tmp_path, provider)
+
+    with use_cassette(tmp_path / "cassette.json", mode="replay"):
+        agent = _agent()
+        run_output = await agent.arun("What is the capital of France?")
+        streamed = [event.content async for event in agent.arun("What is the weather in Paris?", stream=True)]
+
+    assert run_output.content == "Paris"
+    assert "".join(streamed) == "Paris is sunny"
+    assert provider.requests == 2
+
+
+def test_sanitizes_query_credentials(tmp_path):
+    transport = RecordReplayTransport(
+        tmp_path / "cassette.json", transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    )
+    httpx.Client(transport=transport).get("https://provider.test/v1/models?key=secret&page=2")
+
+    recorded_url = transport.exchanges[0]["request"]["url"]
+    assert recorded_url == "https://provider.test/v1/models?page=2"
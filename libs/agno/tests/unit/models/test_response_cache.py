@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import time
+from copy import deepcopy
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from agno.models.cache import InMemoryResponseCache, SqliteResponseCache, TieredResponseCache
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse
+from agno.tools.function import Function
+
+
+def _model(**kwargs) -> OpenAIChat:
+    return OpenAIChat(id="gpt-4o", cache_response=True, response_cache=InMemoryResponseCache(), **kwargs)
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryResponseCache(max_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == 2 and cache.stats.misses == 1
+
+
+def test_in_memory_cache_ttl():
+    cache = InMemoryResponseCache()
+    cache.set("a", {"v": 1}, ttl=0)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_evicts_by_size(tmp_path):
+    cache = SqliteResponseCache(tmp_path / "responses.db", max_size_bytes=250)
+    for key in ("a", "b", "c"):
+        cache.set(key, {"content": key * 100})
+        time.sleep(0.01)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == {"content": "c" * 100}
+    assert cache.stats.evictions == 1
+
+    # Entries survive reopening the file
+    cache.close()
+    assert SqliteResponseCache(tmp_path / "responses.db").get("c") == {"content": "c" * 100}
+
+
+def test_sqlite_cache_checks_its_size_periodically(tmp_path):
+    cache = SqliteResponseCache(tmp_path / "responses.db", max_size_bytes=16 * 1024)
+    with patch.object(cache, "_evict", wraps=cache._evict) as evict:
+        for i in range(10):
+            cache.set(str(i), {"content": "x" * 100})
+
+    # Each entry is a small part of the budget, so the size is only summed once enough of them were written
+    assert evict.call_count == 1
+
+
+def test_sqlite_cache_ttl(tmp_path):
+    cache = SqliteResponseCache(tmp_path / "responses.db")
+    cache.set("a", {"v": 1}, ttl=0)
+    cache.set("b", {"v": 2}, ttl=60)
+    assert cache.get("a") is None
+    assert cache.get("b") == {"v": 2}
+
+
+def test_redis_cache():
+    fakeredis = pytest.importorskip("fakeredis")
+    from agno.models.cache import RedisResponseCache
+
+    cache = RedisResponseCache(redis_client=fakeredis.FakeRedis())
+    cache.set("a", {"v": 1}, ttl=60)
+    assert cache.get("a") == {"v": 1}
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_tiered_cache_backfills_faster_tiers(tmp_path):
+    memory = InMemoryResponseCache()
+    disk = SqliteResponseCache(tmp_path / "responses.db")
+    disk.set("a", {"v": 1})
+    cache = TieredResponseCache([memory, disk])
+
+    assert cache.get("a") == {"v": 1}
+    assert memory.get("a") == {"v": 1}
+
+    cache.set("b", {"v": 2})
+    assert disk.get("b") == {"v": 2}
+
+
+def test_cache_key_accounts_for_tool_definitions_and_response_format():
+    class Answer(BaseModel):
+        text: str
+
+    model = _model()
+    messages = [Message(role="user", content="hi")]
+    search = Function(name="search", description="Search the web", parameters={"type": "object", "properties": {}})
+    other = Function(name="search", description="Search the docs", parameters={"type": "object", "properties": {}})
+
+    base_key = model._get_model_cache_key(messages, stream=False, tools=[search])
+    assert model._get_model_cache_key(messages, stream=False, tools=[search]) == base_key
+    assert model._get_model_cache_key(messages, stream=False, tools=[other]) != base_key
+    assert model._get_model_cache_key(messages, stream=False, tools=[search], response_format=Answer) != base_key
+
+
+def test_response_is_served_from_cache():
+    model = _model()
+    with patch.object(model, "invoke", return_value=ModelResponse(role="assistant", content="hello")) as invoke:
+        first = model.response([Message(role="user", content="hi")])
+        second = model.response([Message(role="user", content="hi")])
+
+    assert invoke.call_count == 1
+    assert first.content == second.content == "hello"
+    assert model.response_cache.stats.hits == 1
+
+
+def test_concurrent_identical_requests_call_the_provider_once():
+    model = _model()
+
+    def slow_invoke(*args, **kwargs):
+        time.sleep(0.2)
+        return ModelResponse(role="assistant", content="hello")
+
+    results = []
+    with patch.object(model, "invoke", side_effect=slow_invoke) as invoke:
+        threads = [
+            threading.Thread(target=lambda: results.append(model.response([Message(role="user", content="hi")])))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert invoke.call_count == 1
+    assert [r.content for r in results] == ["hello"] * 4
+    assert model.response_cache.stats.coalesced == 3
+
+
+async def test_concurrent_identical_async_requests_call_the_provider_once():
+    model = _model()
+
+    async def slow_ainvoke(*args, **kwargs):
+        await asyncio.sleep(0.1)
+        return ModelResponse(role="assistant", content="hello")
+
+    with patch.object(model, "ainvoke", new=AsyncMock(side_effect=slow_ainvoke)) as ainvoke:
+        results = await asyncio.gather(*[model.aresponse([Message(role="user", content="hi")]) for _ in range(4)])
+
+    assert ainvoke.call_count == 1
+    assert [r.content for r in results] == ["hello"] * 4
+
+
+def test_failed_request_releases_the_key():
+    model = _model()
+    with patch.object(model, "invoke", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError):
+            model.response([Message(role="user", content="hi")])
+
+    with patch.object(model, "invoke", return_value=ModelResponse(role="assistant", content="hello")):
+        assert model.response([Message(role="user", content="hi")]).content == "hello"
+
+
+def test_model_copies_share_the_response_cache():
+    model = _model()
+    assert deepcopy(model).response_cache is model.response_cache
+
+
+def test_request_stops_waiting_for_a_stuck_identical_request():
+    model = _model()
+    model.response_cache.inflight_timeout = 0.1
+    cache_key = model._get_model_cache_key([Message(role="user", content="hi")], stream=False)
+    # An identical request holds the key and never finishes
+    model.response_cache.acquire(cache_key)
+
+    with patch.object(model, "invoke", return_value=ModelResponse(role="assistant", content="hello")) as invoke:
+        response = model.response([Message(role="user", content="hi")])
+
+    assert response.content == "hello"
+    assert invoke.call_count == 1
+    model.response_cache.release(cache_key)
+    assert model.response_cache._inflight == {}
+
+
+async def test_async_request_stops_waiting_for_a_stuck_identical_request():
+    model = _model()
+    model.response_cache.inflight_timeout = 0.1
+    cache_key = model._get_model_cache_key([Message(role="user", content="hi")], stream=False)
+    await model.response_cache.aacquire(cache_key)
+
+    with patch.object(model, "ainvoke", new=AsyncMock(return_value=ModelResponse(role="assistant", content="hello"))):
+        response = await model.aresponse([Message(role="user", content="hi")])
+
+    assert response.content == "hello"
+    model.response_cache.arelease(cache_key)
+    assert model.response_cache._async_inflight == {}
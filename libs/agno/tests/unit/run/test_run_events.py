@@ -395,3 +395,47 @@ def test_requirements_in_run_paused_event():
     assert reconstructed.requirements[0].tool_execution.tool_name == "get_the_weather"
     assert reconstructed.requirements[0].tool_execution.requires_confirmation is True
     assert reconstructed.requirements[0].needs_confirmation is True
+
+
+def test_event_to_dict_matches_asdict_semantics():
+    from dataclasses import asdict
+
+    from agno.run.agent import RunContentEvent
+    from agno.run.base import EVENT_EXCLUDED_FIELDS
+
+    nested = {"numbers": [1, 2], "when": datetime(2025, 1, 1)}
+    event = RunContentEvent(
+        run_id="run-1",
+        agent_id="agent-1",
+        content={"answer": "Paris", "nested": nested},
+        reasoning_content="thinking",
+    )
+
+    expected = {k: v for k, v in asdict(event).items() if v is not None and k not in EVENT_EXCLUDED_FIELDS}
+    result = event.to_dict()
+    assert result == expected
+    assert list(result) == list(expected)
+
+    # Mutable values are copied, not shared with the event
+    assert result["content"]["nested"] is not nested
+    assert result["content"]["nested"]["numbers"] is not nested["numbers"]
+
+
+def test_compact_to_json_matches_stdlib_encoding():
+    from agno.utils.serialize import json_serializer
+
+    event = SampleRunEvent(date=datetime(2025, 1, 1, 12, 0, 0), location=RunEnum.CHI, name="Zoë ✓", age=30)
+
+    compact = event.to_json(separators=(",", ":"), indent=None)
+    expected = json.dumps(event.to_dict(), separators=(",", ":"), default=json_serializer, ensure_ascii=False)
+
+    assert json.loads(compact) == json.loads(expected)
+    assert " " not in compact.replace("Zoë ✓", "")
+    assert "Zoë ✓" in compact
+
+
+def test_compact_json_falls_back_for_values_orjson_rejects():
+    from agno.utils.serialize import dumps_compact_json
+
+    payload = {"big": 2**70, 1: "int key", "nan": "ok"}
+    assert json.loads(dumps_compact_json(payload)) == {"big": 2**70, "1": "int key", "nan": "ok"}
@@ -0,0 +1,74 @@
+"""Unit tests for the benchmarks runner"""
+
+import asyncio
+
+from benchmarks.runner import (
+    Benchmark,
+    BenchmarkResult,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+
+
+def _result(median_run_time: float, median_memory_usage: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name="agent.run",
+        num_iterations=10,
+        median_run_time=median_run_time,
+        p95_run_time=median_run_time,
+        min_run_time=median_run_time,
+        median_memory_usage=median_memory_usage,
+    )
+
+
+def test_compare_to_baseline():
+    benchmark = Benchmark(name="agent.run", setup=lambda: None, threshold=0.25, memory_threshold=0.1)
+    baseline = {"median_run_time": 1.0, "median_memory_usage": 1.0}
+
+    within_thresholds = _result(median_run_time=1.2, median_memory_usage=1.05)
+    compare_to_baseline(within_thresholds, baseline, benchmark)
+    assert within_thresholds.regressions == []
+    assert round(within_thresholds.run_time_change or 0, 2) == 0.2
+
+    regressed = _result(median_run_time=1.5, median_memory_usage=1.5)
+    compare_to_baseline(regressed, baseline, benchmark)
+    assert regressed.regressions == ["run time +50%", "memory +0.500 MiB"]
+
+
+def test_run_benchmark_cleans_up_setups():
+    cleaned_up = []
+
+    def sync_setup(value):
+        yield lambda: value * 2
+        cleaned_up.append("sync")
+
+    async def async_setup():
+        async def measured():
+            await asyncio.sleep(0)
+
+        yield measured
+        cleaned_up.append("async")
+
+    for benchmark in [
+        Benchmark(name="sync", setup=sync_setup, setup_args=(21,)),
+        Benchmark(name="async", setup=async_setup, measure_memory=False),
+    ]:
+        result = run_benchmark(benchmark, num_iterations=2, warmup_runs=0)
+        assert result.num_iterations == 2
+        assert result.median_run_time >= 0
+
+    assert cleaned_up == ["sync", "async"]
+
+
+def test_save_baseline_keeps_other_benchmarks(tmp_path):
+    path = tmp_path / "baseline.json"
+    save_baseline(path, [_result(median_run_time=1.0, median_memory_usage=1.0)])
+    other = _result(median_run_time=2.0, median_memory_usage=2.0)
+    other.name = "team.run"
+    save_baseline(path, [other])
+
+    baseline = load_baseline(path)
+    assert set(baseline) == {"agent.run", "team.run"}
+    assert baseline["agent.run"]["median_run_time"] == 1.0
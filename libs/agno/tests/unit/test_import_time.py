@@ -0,0 +1,100 @@
+"""Import time regression tests, for serverless and CLI cold starts"""
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# Optional subsystems, imported on first use only
+DEFERRED_MODULES = [
+    "agno.compression.manager",
+    "agno.culture.manager",
+    "agno.guardrails.openai",
+    "agno.knowledge.knowledge",
+    "agno.learn.machine",
+    "agno.memory.manager",
+    "agno.skills.agent_skills",
+    "agno.tracing",
+    "agno.utils.print_response.agent",
+    "agno.utils.print_response.team",
+    "agno.utils.print_response.workflow",
+    "fastapi",
+    "redis",
+    "rich.markdown",
+]
+
+
+def _import_times(statement: str) -> Dict[str, float]:
+    """Run the statement in a new interpreter with -X importtime, returning the cumulative seconds of each import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        # import time: <self us> | <cumulative us> | <indented module>
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        import_times[module.strip()] = int(cumulative) / 1e6
+        # Top-level imports are indented by a single space
+        if not module.startswith("  "):
+            import_times["total"] = import_times.get("total", 0) + int(cumulative) / 1e6
+    return import_times
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from agno.agent import Agent",
+        "from agno.team import Team",
+        "from agno.workflow import Workflow",
+    ],
+)
+def test_optional_subsystems_are_not_imported(statement):
+    import_times = _import_times(statement)
+
+    assert [module for module in DEFERRED_MODULES if module in import_times] == []
+
+
+def test_package_imports_are_lazy():
+    import_times = _import_times("import agno.agent, agno.team, agno.knowledge")
+
+    assert "agno.agent.agent" not in import_times
+    assert "agno.team.team" not in import_times
+    assert "agno.knowledge.knowledge" not in import_times
+
+
+# Generous caps, to catch large regressions on slow CI machines. The best of 3 runs is compared.
+@pytest.mark.parametrize(
+    "statement, max_seconds",
+    [
+        ("from agno.agent import Agent", 1.5),
+        ("from agno.os import AgentOS", 3.0),
+    ],
+)
+def test_import_time(statement, max_seconds):
+    if "agno.os" in statement:
+        pytest.importorskip("fastapi")
+
+    import_time = min(_import_times(statement)["total"] for _ in range(3))
+
+    assert import_time < max_seconds, f"`{statement}` took {import_time:.2f}s, over {max_seconds}s"
+
+
+@pytest.mark.parametrize("module, entity", [("agno.agent.agent", "Agent"), ("agno.team.team", "Team")])
+def test_deferred_annotation_names(module, entity):
+    # A new interpreter, so the deferred names are not imported yet
+    script = f"""
+import sys
+import typing
+import {module} as module
+
+assert "agno.memory" not in sys.modules
+hints = typing.get_type_hints(module.{entity})
+
+from agno.memory import MemoryManager
+assert hints["memory_manager"] == typing.Optional[MemoryManager]
+assert module.MemoryManager is MemoryManager
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
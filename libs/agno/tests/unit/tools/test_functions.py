@@ -3,6 +3,7 @@ from typing import Any, Callable, Dict
 import pytest
 from pydantic import ValidationError
 
+from agno.models.cache import InMemoryResponseCache
 from agno.tools.decorator import tool
 from agno.tools.function import Function, FunctionCall
 
@@ -255,47 +256,33 @@ def test_function_cache_key_dict_order_independence():
     assert cache_key1 == cache_key2 == cache_key3
 
 
-def test_function_cache_file_path():
-    """Test generation of cache file paths."""
-    func = Function(name="test_func", cache_results=True, cache_dir="/tmp")
+def test_function_default_result_cache(tmp_path):
+    """Test that functions share the default result cache of their cache_dir."""
+    func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
+    other = Function(name="other_func", cache_results=True, cache_dir=str(tmp_path))
 
-    cache_key = "test_key"
-    cache_file = func._get_cache_file_path(cache_key)
-    assert cache_file.startswith("/tmp/")
-    assert "test_func" in cache_file
-    assert "test_key" in cache_file
+    assert func._get_result_cache() is other._get_result_cache()
+    assert (tmp_path / "functions" / "results.db").exists()
 
 
 def test_function_cache_operations(tmp_path):
     """Test caching operations (save and retrieve)."""
-    import json
-    import os
-
-    func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
+    func = Function(name="test_func", cache_results=True, result_cache=InMemoryResponseCache())
 
     # Test saving to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
-
-    # Verify cache file exists and contains correct data
-    assert os.path.exists(cache_file)
-    with open(cache_file, "r") as f:
-        cached_data = json.load(f)
-    assert cached_data["result"] == {"result": "test_data"}
+    func._save_to_cache("test_key", test_result)
 
     # Test retrieving from cache
-    retrieved_result = func._get_cached_result(cache_file)
-    assert retrieved_result == test_result
+    assert func._get_cached_result("test_key") == test_result
+    assert func.result_cache.stats.hits == 1
 
     # Test retrieving non-existent cache
-    non_existent_file = os.path.join(str(tmp_path), "non_existent.json")
-    assert func._get_cached_result(non_existent_file) is None
+    assert func._get_cached_result("non_existent") is None
 
 
 def test_function_cache_ttl(tmp_path):
     """Test cache TTL functionality."""
-    import os
     import time
 
     func = Function(
@@ -307,17 +294,72 @@ def test_function_cache_ttl(tmp_path):
 
     # Save test data to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
+    func._save_to_cache("test_key", test_result)
 
     # Verify cache is valid immediately
-    assert func._get_cached_result(cache_file) == test_result
+    assert func._get_cached_result("test_key") == test_result
 
     # Wait for cache to expire
     time.sleep(1.1)
 
     # Verify cache is no longer valid
-    assert func._get_cached_result(cache_file) is None
+    assert func._get_cached_result("test_key") is None
+
+
+def test_concurrent_identical_calls_run_the_function_once():
+    """Test that identical concurrent calls wait for the in-flight call instead of running again."""
+    import threading
+    import time
+
+    calls = []
+
+    def get_quote(symbol: str) -> str:
+        calls.append(symbol)
+        time.sleep(0.2)
+        return f"{symbol}: 100"
+
+    func = Function.from_callable(get_quote)
+    func.cache_results = True
+    func.result_cache = InMemoryResponseCache()
+
+    results = []
+
+    def run():
+        results.append(FunctionCall(function=func, arguments={"symbol": "AAPL"}).execute().result)
+
+    threads = [threading.Thread(target=run) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["AAPL"]
+    assert results == ["AAPL: 100"] * 5
+    assert func.result_cache.stats.coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_async_calls_run_the_function_once():
+    """Test single-flight for async function calls."""
+    import asyncio
+
+    calls = []
+
+    async def get_quote(symbol: str) -> str:
+        calls.append(symbol)
+        await asyncio.sleep(0.1)
+        return f"{symbol}: 100"
+
+    func = Function.from_callable(get_quote)
+    func.cache_results = True
+    func.result_cache = InMemoryResponseCache()
+
+    results = await asyncio.gather(
+        *[FunctionCall(function=func, arguments={"symbol": "AAPL"}).aexecute() for _ in range(5)]
+    )
+
+    assert calls == ["AAPL"]
+    assert [r.result for r in results] == ["AAPL: 100"] * 5
 
 
 def test_function_call_initialization():
@@ -726,3 +768,77 @@ def test_tool_decorator_with_complex_types():
     assert complex_types_func.parameters["properties"]["param2"]["type"] == "object"
     assert complex_types_func.parameters["properties"]["param3"]["type"] == "boolean"
     assert "param3" not in complex_types_func.parameters["required"]
+
+
+def _greet(name: str, excited: bool = False) -> str:
+    """Greet someone.
+
+    Args:
+        name: Who to greet.
+        excited: Whether to add an exclamation mark.
+    """
+    return f"Hello {name}{'!' if excited else ''}"
+
+
+def test_get_processed_copy_reuses_schema(monkeypatch):
+    """The processed schema is built once and shared by later copies."""
+    func = Function(name="greet", entrypoint=_greet)
+    calls = []
+    original = Function.process_entrypoint
+
+    def counting_process_entrypoint(self, strict=False):
+        calls.append(strict)
+        return original(self, strict=strict)
+
+    monkeypatch.setattr(Function, "process_entrypoint", counting_process_entrypoint)
+
+    first = func.get_processed_copy()
+    second = func.get_processed_copy()
+
+    assert calls == [False]
+    assert first is not second
+    assert first.parameters is second.parameters
+    assert first.parameters["required"] == ["name"]
+    # The source Function is left unprocessed
+    assert func.parameters == {"type": "object", "properties": {}, "required": []}
+
+    strict_copy = func.get_processed_copy(strict=True)
+    assert calls == [False, True]
+    assert strict_copy.parameters["required"] == ["name", "excited"]
+
+
+def test_get_processed_copy_rebuilds_when_source_changes():
+    """Changing an input of processing invalidates the cached schema."""
+    func = Function(name="greet", entrypoint=_greet)
+    assert func.get_processed_copy().description.startswith("Greet someone")
+
+    func.description = "Say hello"
+    assert func.get_processed_copy().description == "Say hello"
+
+    func.parameters = {"type": "object", "properties": {"name": {"type": "string"}}, "required": []}
+    assert list(func.get_processed_copy().parameters["properties"]) == ["name"]
+
+
+def test_processed_copies_do_not_share_run_bindings():
+    """Per-run bindings and user input values stay on the copy."""
+    func = Function(name="greet", entrypoint=_greet, requires_user_input=True, user_input_fields=["name"])
+
+    first = func.get_processed_copy()
+    first._agent = object()
+    first.user_input_schema[0].value = "Ada"
+
+    second = func.get_processed_copy()
+    assert second._agent is None
+    assert second.user_input_schema[0].value is None
+
+
+def test_from_callable_cached():
+    """Functions built from the same callable are reused, per strict flag."""
+    first = Function.from_callable_cached(_greet)
+    second = Function.from_callable_cached(_greet)
+    strict = Function.from_callable_cached(_greet, strict=True)
+
+    assert first is not second
+    assert first.parameters is second.parameters
+    assert first.parameters == Function.from_callable(_greet).parameters
+    assert strict.parameters == Function.from_callable(_greet, strict=True).parameters
@@ -0,0 +1,159 @@
+import asyncio
+import threading
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.db.schemas.memory import UserMemory
+from agno.memory import MemoryManager
+from agno.models.mock import MockModel
+from agno.team import Team
+from agno.utils.context_assembly import ContextAssembly
+
+
+def test_stages_run_concurrently():
+    # Each stage waits for the other, so this only completes if they run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def stage(name):
+        barrier.wait()
+        return name
+
+    context_assembly = ContextAssembly()
+    context_assembly.add("first", lambda: stage("first"))
+    context_assembly.add("second", lambda: stage("second"))
+
+    assert context_assembly.result("first") == "first"
+    assert context_assembly.result("second") == "second"
+    assert set(context_assembly.timings) == {"first", "second"}
+
+
+def test_stages_of_concurrent_runs_are_not_queued():
+    # Every stage waits for all the others, e.g. a knowledge retriever running an agent that assembles its own context
+    num_runs = 16
+    barrier = threading.Barrier(num_runs, timeout=5)
+
+    def stage(i):
+        barrier.wait()
+        return i
+
+    context_assemblies = []
+    for i in range(num_runs):
+        context_assembly = ContextAssembly()
+        context_assembly.add("knowledge", lambda i=i: stage(i))
+        context_assemblies.append(context_assembly)
+
+    assert [context_assembly.result("knowledge") for context_assembly in context_assemblies] == list(range(num_runs))
+
+
+def test_stages_start_after_their_dependencies():
+    order = []
+
+    def get_query():
+        order.append("query")
+        return "tea"
+
+    def search(query):
+        order.append("search")
+        return f"results for {query}"
+
+    context_assembly = ContextAssembly()
+    context_assembly.add("query", get_query)
+    context_assembly.add("search", search, depends_on=["query"])
+
+    assert context_assembly.result("search") == "results for tea"
+    assert order == ["query", "search"]
+
+
+def test_failed_stages_raise_their_exception():
+    def fail():
+        raise RuntimeError("database is down")
+
+    context_assembly = ContextAssembly()
+    context_assembly.add("memories", fail)
+    context_assembly.add("summary", lambda memories: memories, depends_on=["memories"])
+
+    with pytest.raises(RuntimeError, match="database is down"):
+        context_assembly.result("memories")
+    with pytest.raises(RuntimeError, match="database is down"):
+        context_assembly.result("summary")
+    assert "memories" in context_assembly.timings
+
+
+def test_unknown_dependencies_are_rejected():
+    context_assembly = ContextAssembly()
+
+    with pytest.raises(ValueError):
+        context_assembly.add("search", lambda query: query, depends_on=["query"])
+
+
+async def test_async_stages():
+    async def search(query):
+        await asyncio.sleep(0.01)
+        return f"results for {query}"
+
+    context_assembly = ContextAssembly()
+    context_assembly.add("query", lambda: "tea")
+    context_assembly.aadd("search", search, depends_on=["query"])
+
+    assert await context_assembly.aresult("search") == "results for tea"
+    assert set(context_assembly.timings) == {"query", "search"}
+
+
+def _slow_context(monkeypatch):
+    """A memory manager and knowledge retriever that each wait for the other, so runs only succeed if they overlap"""
+    barrier = threading.Barrier(2, timeout=5)
+    memory_manager = MemoryManager(db=InMemoryDb())
+
+    def get_user_memories(user_id=None):
+        barrier.wait()
+        return [UserMemory(memory="Likes green tea", user_id=user_id)]
+
+    def knowledge_retriever(query, num_documents=None, **kwargs):
+        barrier.wait()
+        return [{"content": "Green tea is brewed at 80C"}]
+
+    monkeypatch.setattr(memory_manager, "get_user_memories", get_user_memories)
+    return memory_manager, knowledge_retriever
+
+
+def test_agent_assembles_context_concurrently(monkeypatch):
+    memory_manager, knowledge_retriever = _slow_context(monkeypatch)
+    agent = Agent(
+        model=MockModel(responses=["Brew it at 80C"]),
+        memory_manager=memory_manager,
+        add_memories_to_context=True,
+        knowledge_retriever=knowledge_retriever,
+        add_knowledge_to_context=True,
+        telemetry=False,
+    )
+
+    run_output = agent.run("How should I brew my tea?", user_id="user")
+
+    assert run_output.messages is not None
+    system_message, user_message = run_output.messages[0], run_output.messages[1]
+    assert "Likes green tea" in str(system_message.content)
+    assert "Green tea is brewed at 80C" in str(user_message.content)
+    assert run_output.metrics is not None and run_output.metrics.additional_metrics is not None
+    assert set(run_output.metrics.additional_metrics["context_assembly"]) == {"memories", "knowledge"}
+
+
+async def test_team_assembles_context_concurrently(monkeypatch):
+    memory_manager, knowledge_retriever = _slow_context(monkeypatch)
+    team = Team(
+        members=[Agent(model=MockModel(), telemetry=False)],
+        model=MockModel(responses=["Brew it at 80C"]),
+        memory_manager=memory_manager,
+        add_memories_to_context=True,
+        knowledge_retriever=knowledge_retriever,
+        add_knowledge_to_context=True,
+        telemetry=False,
+    )
+
+    run_output = await team.arun("How should I brew my tea?", user_id="user")
+
+    assert run_output.messages is not None
+    assert "Likes green tea" in str(run_output.messages[0].content)
+    assert run_output.metrics is not None and run_output.metrics.additional_metrics is not None
+    assert set(run_output.metrics.additional_metrics["context_assembly"]) == {"memories", "knowledge"}
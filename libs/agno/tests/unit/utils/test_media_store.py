@@ -0,0 +1,188 @@
+import base64
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.db.sqlite import SqliteDb
+from agno.media import Audio, File, Image
+from agno.media_store import InMemoryMediaStore, LocalMediaStore
+from agno.models.message import Message
+from agno.models.mock import MockModel
+from agno.run.agent import RunInput, RunOutput
+from agno.session.agent import AgentSession
+from agno.utils.agent import load_media_into_messages, load_media_into_session, offload_media_from_run_output
+
+
+@pytest.fixture(params=["in_memory", "local"])
+def media_store(request, tmp_path):
+    if request.param == "local":
+        return LocalMediaStore(tmp_path / "media")
+    return InMemoryMediaStore()
+
+
+def test_put_is_content_addressed_and_deduplicated(media_store):
+    first = media_store.put(b"image bytes")
+    second = media_store.put(memoryview(b"image bytes"))
+
+    assert first == second == media_store.content_id(b"image bytes")
+    assert media_store.get(first) == b"image bytes"
+    assert media_store.get(media_store.content_id(b"missing")) is None
+
+
+def test_garbage_collection_keeps_recent_payloads(media_store):
+    media_ref = media_store.put(b"payload")
+
+    assert media_store.collect_garbage(InMemoryDb()) == 0
+    assert media_store.exists(media_ref)
+    assert media_store.collect_garbage(InMemoryDb(), min_age=0) == 1
+    assert not media_store.exists(media_ref)
+
+
+def test_local_store_rejects_path_like_references(tmp_path):
+    store = LocalMediaStore(tmp_path / "media")
+    with pytest.raises(ValueError):
+        store.get("../secrets")
+
+
+def test_base64_is_encoded_once_per_content():
+    image = Image(content=b"\x89PNG fake image")
+
+    assert image.to_base64() is image.to_base64()
+
+    image.content = b"other bytes"
+    assert image.to_base64() == base64.b64encode(b"other bytes").decode("utf-8")
+
+
+def test_from_base64_reuses_the_source_string():
+    encoded = base64.b64encode(b"audio bytes").decode("utf-8")
+    audio = Audio.from_base64(encoded)
+
+    assert audio.content == b"audio bytes"
+    assert audio.to_dict()["content"] is encoded
+
+
+def test_content_view_is_zero_copy():
+    image = Image(content=b"0123456789")
+    view = image.get_content_view()
+
+    assert view is not None
+    assert view.obj is image.content
+    assert bytes(view[2:4]) == b"23"
+
+
+def test_media_ref_replaces_inline_content():
+    image = Image(content=b"image bytes", media_ref="abc123")
+    file = File(content=b"%PDF", mime_type="application/pdf", media_ref="def456")
+
+    assert "content" not in image.to_dict()
+    assert image.to_dict()["media_ref"] == "abc123"
+    assert "content" not in file.to_dict()
+
+    restored = Image(**image.to_dict())
+    assert restored.content is None
+    assert restored.media_ref == "abc123"
+
+
+def test_session_round_trip_persists_references(media_store):
+    content = b"x" * 1024
+    run = RunOutput(
+        run_id="run-1",
+        agent_id="agent-1",
+        input=RunInput(input_content="describe this", images=[Image(content=content)]),
+        messages=[Message(role="user", content="describe this", images=[Image(content=content)])],
+        images=[Image(content=b"generated")],
+    )
+    stored_run = offload_media_from_run_output(run, media_store)
+
+    # The run itself still serializes its media
+    assert run.to_dict()["images"][0]["content"] == base64.b64encode(b"generated").decode("utf-8")
+    assert run.images is not None and run.images[0].media_ref is None
+
+    stored = AgentSession(session_id="session-1", runs=[stored_run]).to_dict()
+    assert base64.b64encode(content).decode("utf-8") not in str(stored)
+
+    session = AgentSession.from_dict(stored)
+    assert session is not None
+    load_media_into_session(session, media_store)
+
+    restored_run = session.runs[0]
+    assert restored_run.input.images[0].content == content
+    assert restored_run.messages[0].images[0].content == content
+    assert restored_run.images[0].content == b"generated"
+
+
+def test_agent_reads_media_of_the_history_window_only(monkeypatch):
+    media_store = InMemoryMediaStore()
+    agent = Agent(
+        model=MockModel(responses=["A cat", "A dog"]),
+        db=InMemoryDb(),
+        media_store=media_store,
+        add_history_to_context=True,
+        num_history_runs=1,
+        telemetry=False,
+    )
+    first_run = agent.run("Describe this", images=[Image(content=b"cat picture")], session_id="session")
+    agent.run("And this?", images=[Image(content=b"dog picture")], session_id="session")
+
+    # The returned run keeps serializing its media
+    assert first_run.input is not None and first_run.input.images is not None
+    assert first_run.input.images[0].to_dict()["content"] == base64.b64encode(b"cat picture").decode("utf-8")
+
+    reads = []
+    get = media_store.get
+
+    def record_get(media_ref):
+        reads.append(media_ref)
+        return get(media_ref)
+
+    monkeypatch.setattr(media_store, "get", record_get)
+    third_run = agent.run("Which one was last?", session_id="session")
+
+    history = [m for m in third_run.messages or [] if m.from_history]
+    assert [image.content for m in history for image in m.images or []] == [b"dog picture"]
+    assert set(reads) == {media_store.content_id(b"dog picture")}
+
+
+def test_payloads_shared_by_sessions_outlive_a_restart(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "agno.db"))
+
+    def agent(media_store):
+        return Agent(model=MockModel(responses=["A cat"]), db=db, media_store=media_store, telemetry=False)
+
+    agent(LocalMediaStore(tmp_path / "media")).run("Describe this", images=[Image(content=b"cat")], session_id="first")
+    agent(LocalMediaStore(tmp_path / "media")).run("And this?", images=[Image(content=b"cat")], session_id="second")
+
+    # A new process deletes one of the sessions sharing the payload
+    media_store = LocalMediaStore(tmp_path / "media")
+    media_ref = media_store.content_id(b"cat")
+    agent(media_store).delete_session("first")
+    assert media_store.collect_garbage(db, min_age=0) == 0
+    assert media_store.get(media_ref) == b"cat"
+
+    agent(media_store).delete_session("second")
+    assert media_store.collect_garbage(db, min_age=0) == 1
+    assert not media_store.exists(media_ref)
+
+
+async def test_async_garbage_collection():
+    media_store = InMemoryMediaStore()
+    db = InMemoryDb()
+    agent = Agent(model=MockModel(responses=["A cat"]), db=db, media_store=media_store, telemetry=False)
+    await agent.arun("Describe this", images=[Image(content=b"cat picture")], session_id="session")
+
+    assert await media_store.acollect_garbage(db, min_age=0) == 0
+    agent.delete_session("session")
+    assert await media_store.acollect_garbage(db, min_age=0) == 1
+
+
+def test_history_media_are_loaded_into_copies():
+    media_store = InMemoryMediaStore()
+    stored = Message(role="user", content="describe this", images=[Image(media_ref=media_store.put(b"cat picture"))])
+    history_copy = stored.model_copy(update={"from_history": True})
+
+    load_media_into_messages([history_copy], media_store)
+
+    assert history_copy.images is not None and history_copy.images[0].content == b"cat picture"
+    # The stored run keeps serializing the reference only
+    assert stored.images is not None and stored.images[0].content is None
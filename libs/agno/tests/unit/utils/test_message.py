@@ -0,0 +1,76 @@
+from typing import List
+
+from agno.agent import Agent
+from agno.db.in_memory import InMemoryDb
+from agno.models.message import Message
+from agno.models.mock import MockModel
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+from agno.session import AgentSession
+from agno.utils.message import get_history_messages
+
+
+def _runs(num_runs: int) -> List[RunOutput]:
+    return [
+        RunOutput(
+            run_id=f"run-{i}",
+            agent_id="agent",
+            status=RunStatus.completed,
+            messages=[
+                Message(role="system", content=f"system {i}"),
+                Message(role="user", content=f"user {i}"),
+                Message(role="assistant", content=f"assistant {i}"),
+            ],
+        )
+        for i in range(num_runs)
+    ]
+
+
+def test_get_history_messages_only_visits_the_window():
+    runs = _runs(1000)
+    visited = []
+
+    def include_run(run):
+        visited.append(run.run_id)
+        return True
+
+    messages = get_history_messages(runs, include_run, last_n_runs=2, skip_roles=["system"])
+
+    assert [m.content for m in messages] == ["user 998", "assistant 998", "user 999", "assistant 999"]
+    assert visited == ["run-999", "run-998", "run-997"]
+
+
+def test_get_history_messages_with_limit():
+    runs = _runs(1000)
+    runs[-1].status = RunStatus.error
+
+    session = AgentSession(session_id="session", runs=runs)
+    messages = session.get_messages(limit=4)
+
+    # The system message of the first run, then the latest messages of the completed runs
+    assert [m.content for m in messages] == ["system 0", "assistant 997", "user 998", "assistant 998"]
+    assert [m.content for m in session.get_messages(limit=3, skip_roles=["system"])] == [
+        "assistant 997",
+        "user 998",
+        "assistant 998",
+    ]
+
+
+def test_history_messages_are_copies():
+    agent = Agent(
+        model=MockModel(responses=["First answer", "Second answer"]),
+        db=InMemoryDb(),
+        add_history_to_context=True,
+        telemetry=False,
+    )
+    agent.run("First question", session_id="session")
+    second_run = agent.run("Second question", session_id="session")
+
+    session = agent.get_session("session")
+    assert session is not None and session.runs is not None
+    first_run_messages = session.runs[0].messages or []
+    history = [m for m in second_run.messages or [] if m.from_history]
+
+    assert [m.content for m in history] == ["First question", "First answer"]
+    assert not any(m.from_history for m in first_run_messages)
+    assert not any(m is original for m in history for original in first_run_messages)
@@ -0,0 +1,107 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from agno.client import AgentOSClient
+from agno.os.utils import format_sse_event, get_stream_encoder
+from agno.run.agent import RunCompletedEvent, RunContentEvent, RunStartedEvent
+from agno.run.team import RunContentEvent as TeamRunContentEvent
+from agno.utils.sse import DeltaStreamDecoder, DeltaStreamEncoder
+
+
+def _content(text: str, run_id: str = "run-1", **kwargs) -> RunContentEvent:
+    return RunContentEvent(
+        run_id=run_id,
+        session_id="session-1",
+        agent_id="agent-1",
+        agent_name="Agent",
+        workflow_id="workflow-1",
+        step_name="write",
+        content=text,
+        **{"created_at": 1000, **kwargs},
+    )
+
+
+def _payloads(events):
+    encoder = DeltaStreamEncoder()
+    return [json.loads(format_sse_event(event, encoder).split("data: ", 1)[1]) for event in events]
+
+
+def test_content_events_after_the_first_are_deltas():
+    events = [RunStartedEvent(run_id="run-1", agent_id="agent-1", created_at=1000)]
+    events += [_content(f"token {i}") for i in range(3)]
+    payloads = _payloads(events)
+
+    assert payloads[0]["event"] == "RunStarted"
+    assert payloads[1]["content"] == "token 0"
+    assert payloads[2] == {"event": "RunContent", "seq": 3, "delta": "token 1"}
+    assert payloads[3] == {"event": "RunContent", "seq": 4, "delta": "token 2"}
+
+
+def test_decoder_restores_full_events():
+    events = [
+        RunStartedEvent(run_id="run-1", agent_id="agent-1", created_at=1000),
+        _content("Hello"),
+        _content(" world"),
+        _content("!", created_at=1001),
+        # Identity change: sent in full and becomes the new template
+        _content(" Bye", reasoning_content="thinking"),
+        _content(" now", reasoning_content="thinking"),
+        RunCompletedEvent(run_id="run-1", agent_id="agent-1", created_at=1002),
+    ]
+    decoder = DeltaStreamDecoder()
+    decoded = [decoder.decode(payload) for payload in _payloads(events)]
+
+    assert decoded == [event.to_dict() for event in events]
+
+
+def test_interleaved_runs_carry_their_run_id():
+    events = [
+        TeamRunContentEvent(run_id="team-run", team_id="team-1", content="a", created_at=1000),
+        _content("b", run_id="member-run"),
+        TeamRunContentEvent(run_id="team-run", team_id="team-1", content="c", created_at=1000),
+        _content("d", run_id="member-run"),
+        _content("e", run_id="member-run"),
+    ]
+    payloads = _payloads(events)
+
+    assert payloads[2] == {"event": "TeamRunContent", "seq": 3, "delta": "c"}
+    assert payloads[4] == {"event": "RunContent", "seq": 5, "delta": "e"}
+
+    decoder = DeltaStreamDecoder()
+    assert [decoder.decode(p) for p in payloads] == [event.to_dict() for event in events]
+
+
+def test_delta_before_template_is_rejected():
+    with pytest.raises(ValueError):
+        DeltaStreamDecoder().decode({"event": "RunContent", "seq": 1, "delta": "orphan"})
+
+
+def test_get_stream_encoder_validates_format():
+    assert get_stream_encoder("full") is None
+    assert isinstance(get_stream_encoder("delta"), DeltaStreamEncoder)
+    with pytest.raises(HTTPException) as exc_info:
+        get_stream_encoder("gzip")
+    assert exc_info.value.status_code == 400
+
+
+async def test_client_decodes_delta_streams():
+    events = [RunStartedEvent(run_id="run-1", agent_id="agent-1", created_at=1000)]
+    events += [_content(f"token {i} ") for i in range(5)]
+    encoder = DeltaStreamEncoder()
+    lines = [line for event in events for line in format_sse_event(event, encoder).splitlines()]
+
+    async def raw_stream():
+        for line in lines:
+            yield line
+
+    client = AgentOSClient(base_url="http://localhost:7777")
+    with patch.object(client, "_astream_post_form_data") as mock_stream:
+        mock_stream.return_value = raw_stream()
+        received = [event async for event in client.run_agent_stream("agent-1", "hi", stream_format="delta")]
+
+    assert mock_stream.call_args.args[1]["stream_format"] == "delta"
+    assert [e.to_dict() for e in received] == [e.to_dict() for e in events]
+    assert all(isinstance(e, RunContentEvent) and e.agent_name == "Agent" for e in received[1:])
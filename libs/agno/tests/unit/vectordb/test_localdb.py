@@ -0,0 +1,251 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from zlib import crc32
+
+import numpy as np
+import pytest
+
+from agno.filters import AND, EQ, GT, IN, NOT, OR
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.vectordb.distance import Distance
+from agno.vectordb.local import LocalVectorDb
+from agno.vectordb.search import SearchType
+
+
+@dataclass
+class BagOfWordsEmbedder(Embedder):
+    """Deterministic embedder hashing the words of a text into a vector, so similar texts get similar vectors"""
+
+    dimensions: Optional[int] = 64
+
+    def get_embedding(self, text: str) -> List[float]:
+        vector = [0.0] * (self.dimensions or 64)
+        for word in text.lower().split():
+            vector[crc32(word.encode()) % len(vector)] += 1.0
+        return vector
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding_and_usage(text)
+
+
+@pytest.fixture
+def local_db(tmp_path):
+    db = LocalVectorDb(collection="recipes", path=str(tmp_path), embedder=BagOfWordsEmbedder())
+    db.create()
+    yield db
+    db.drop()
+
+
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    return [
+        Document(
+            content="Tom Kha Gai is a Thai coconut soup with chicken",
+            meta_data={"cuisine": "Thai", "type": "soup", "spice": 2},
+            name="tom_kha",
+            content_id="thai",
+        ),
+        Document(
+            content="Pad Thai is a stir-fried rice noodle dish",
+            meta_data={"cuisine": "Thai", "type": "noodles", "spice": 1},
+            name="pad_thai",
+            content_id="thai",
+        ),
+        Document(
+            content="Green curry is a spicy Thai curry with coconut milk",
+            meta_data={"cuisine": "Thai", "type": "curry", "spice": 4},
+            name="green_curry",
+            content_id="thai",
+        ),
+        Document(
+            content="Carbonara is an Italian pasta with eggs and cheese",
+            meta_data={"cuisine": "Italian", "type": "pasta", "spice": 0, "tags": ["eggs", "cheese"]},
+            name="carbonara",
+            content_id="italian",
+        ),
+    ]
+
+
+def test_insert_and_search(local_db, sample_documents):
+    local_db.insert(content_hash="hash1", documents=sample_documents)
+
+    assert local_db.get_count() == 4
+    assert local_db.content_hash_exists("hash1")
+    assert local_db.name_exists("pad_thai")
+    assert not local_db.name_exists("ramen")
+
+    results = local_db.search("Thai coconut soup with chicken", limit=2)
+    assert [doc.name for doc in results] == ["tom_kha", "green_curry"]
+    assert results[0].meta_data["cuisine"] == "Thai"
+    assert local_db.id_exists(results[0].id)
+
+
+def test_search_filters(local_db, sample_documents):
+    local_db.insert(content_hash="hash1", documents=sample_documents)
+
+    def names(filters) -> List[str]:
+        return sorted(doc.name for doc in local_db.search("coconut", limit=10, filters=filters))
+
+    assert names({"cuisine": "Italian"}) == ["carbonara"]
+    assert names({"tags": "cheese"}) == ["carbonara"]
+    assert names([GT("spice", 1)]) == ["green_curry", "tom_kha"]
+    assert names([IN("type", ["soup", "pasta"])]) == ["carbonara", "tom_kha"]
+    assert names([AND(EQ("cuisine", "Thai"), NOT(EQ("type", "curry")))]) == ["pad_thai", "tom_kha"]
+    assert names([OR(EQ("type", "noodles"), EQ("name", "carbonara"))]) == ["carbonara", "pad_thai"]
+
+
+def test_keyword_and_hybrid_search(local_db, sample_documents):
+    local_db.insert(content_hash="hash1", documents=sample_documents)
+
+    local_db.search_type = SearchType.keyword
+    results = local_db.search("spicy curry", limit=5)
+    assert [doc.name for doc in results] == ["green_curry"]
+
+    local_db.search_type = SearchType.hybrid
+    results = local_db.search("coconut curry", limit=2)
+    assert results[0].name == "green_curry"
+
+
+def test_upsert_replaces_documents_of_content_hash(local_db, sample_documents):
+    local_db.insert(content_hash="hash1", documents=sample_documents[:2])
+    local_db.upsert(content_hash="hash1", documents=[sample_documents[2]])
+
+    assert local_db.get_count() == 1
+    assert not local_db.name_exists("tom_kha")
+    assert local_db.name_exists("green_curry")
+
+
+def test_deletes(local_db, sample_documents):
+    local_db.insert(content_hash="hash1", documents=sample_documents)
+
+    assert local_db.delete_by_name("tom_kha")
+    assert not local_db.delete_by_name("tom_kha")
+    assert local_db.delete_by_metadata({"type": "noodles"})
+    assert local_db.delete_by_content_id("italian")
+    assert [doc.name for doc in local_db.search("anything", limit=10)] == ["green_curry"]
+
+    remaining_id = local_db.search("anything", limit=1)[0].id
+    assert local_db.delete_by_id(remaining_id)
+    assert local_db.get_count() == 0
+
+
+def test_update_metadata(local_db, sample_documents):
+    local_db.insert(content_hash="hash1", documents=sample_documents)
+
+    local_db.update_metadata("italian", {"reviewed": True})
+
+    results = local_db.search("pasta", limit=10, filters={"reviewed": True})
+    assert [doc.name for doc in results] == ["carbonara"]
+
+
+def test_reopen_from_disk(tmp_path, sample_documents):
+    db = LocalVectorDb(collection="recipes", path=str(tmp_path), embedder=BagOfWordsEmbedder())
+    db.insert(content_hash="hash1", documents=sample_documents)
+    db.delete_by_name("pad_thai")
+    db.update_metadata("italian", {"reviewed": True})
+
+    reopened = LocalVectorDb(collection="recipes", path=str(tmp_path), embedder=BagOfWordsEmbedder())
+
+    assert reopened.exists()
+    assert reopened.get_count() == 3
+    assert not reopened.name_exists("pad_thai")
+    assert [doc.name for doc in reopened.search("pasta", limit=5, filters={"reviewed": True})] == ["carbonara"]
+
+
+def test_compaction_merges_segments_and_drops_deleted_rows(tmp_path, sample_documents):
+    db = LocalVectorDb(
+        collection="recipes", path=str(tmp_path), embedder=BagOfWordsEmbedder(), background_compaction=False
+    )
+    for i, document in enumerate(sample_documents):
+        db.insert(content_hash=f"hash{i}", documents=[document])
+    db.delete_by_name("pad_thai")
+    assert len(db._segments) == 4
+
+    db.optimize()
+
+    assert len(db._segments) == 1
+    assert len(db._segments[0]) == 3
+    assert len(list(tmp_path.joinpath("recipes").glob("*.f32"))) == 1
+    assert db.search("Thai coconut soup with chicken", limit=1)[0].name == "tom_kha"
+    reopened = LocalVectorDb(collection="recipes", path=str(tmp_path), embedder=BagOfWordsEmbedder())
+    assert reopened.get_count() == 3
+
+
+def test_close_stops_background_compaction(tmp_path, sample_documents):
+    with LocalVectorDb(collection="recipes", path=str(tmp_path), embedder=BagOfWordsEmbedder(), max_segments=1) as db:
+        for i, document in enumerate(sample_documents):
+            db.insert(content_hash=f"hash{i}", documents=[document])
+
+    # The running compaction was joined, and no new one starts
+    assert db._compaction_thread is None or not db._compaction_thread.is_alive()
+    db.insert(content_hash="hash4", documents=[Document(content="Ramen is a Japanese noodle soup", name="ramen")])
+    db.insert(content_hash="hash5", documents=[Document(content="Pho is a Vietnamese noodle soup", name="pho")])
+    assert db._compaction_thread is None or not db._compaction_thread.is_alive()
+    assert len(db._segments) > 1
+
+
+def test_compaction_discards_result_when_segments_change(local_db, sample_documents):
+    local_db.background_compaction = False
+    local_db.insert(content_hash="hash1", documents=sample_documents)
+    segment = local_db._segments[0]
+    original_write = segment.__class__.write
+
+    def write_then_delete(*args, **kwargs):
+        merged = original_write(*args, **kwargs)
+        local_db.delete_by_name("carbonara")
+        return merged
+
+    segment.__class__.write = staticmethod(write_then_delete)  # type: ignore[method-assign]
+    try:
+        assert not local_db.compact()
+    finally:
+        segment.__class__.write = original_write  # type: ignore[method-assign]
+
+    assert local_db._segments == [segment]
+    assert local_db.get_count() == 3
+    assert len(list(local_db.directory.glob("*.f32"))) == 1
+
+
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_ivf_search_matches_exact_search(tmp_path, distance):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((600, 16)).astype(np.float32)
+    db = LocalVectorDb(
+        collection="vectors",
+        path=str(tmp_path),
+        embedder=BagOfWordsEmbedder(dimensions=16),
+        distance=distance,
+        ivf_min_vectors=500,
+        nprobe=24,
+        background_compaction=False,
+    )
+    documents = [Document(content=f"doc {i}", embedding=vector.tolist()) for i, vector in enumerate(vectors)]
+    db.insert(content_hash="random", documents=documents)
+    db.optimize()
+    assert db._ivf is not None and len(db._ivf) == 24
+
+    # Probing every list is an exhaustive search
+    query = rng.standard_normal(16)
+    ivf_results = db.search_by_embedding(query, limit=10)
+    exact_results = db.search_by_embedding(query, limit=10, exact=True)
+    assert [doc.id for doc in ivf_results] == [doc.id for doc in exact_results]
+
+    if distance == Distance.l2:
+        expected = np.argsort(((vectors - query) ** 2).sum(axis=1))[:10]
+        assert [doc.content for doc in exact_results] == [f"doc {i}" for i in expected]
+
+
+async def test_async_insert_and_search(local_db, sample_documents):
+    local_db.embedder.enable_batch = True
+    await local_db.async_insert(content_hash="hash1", documents=sample_documents)
+
+    results = await local_db.async_search("Italian pasta", limit=1)
+    assert results[0].name == "carbonara"
+    assert await local_db.async_exists()
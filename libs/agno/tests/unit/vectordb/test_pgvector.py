@@ -2,8 +2,10 @@ import uuid
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import URL, Engine
 from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable, MetaData
 
 from agno.knowledge.document import Document
 from agno.vectordb.pgvector import PgVector
@@ -791,3 +793,96 @@ def test_insert_merges_filters_into_metadata(mock_pgvector, mock_embedder):
         assert batch_records[0]["meta_data"]["doc_key"] == "doc_value"
         assert batch_records[0]["meta_data"]["knowledge_base_id"] == "kb-123"
         assert batch_records[0]["meta_data"]["source"] == "test"
+
+
+@pytest.fixture
+def pgvector_with_table(mock_engine, mock_embedder):
+    """PgVector with its real table definition and a session that records executed statements."""
+    with patch("agno.vectordb.pgvector.pgvector.scoped_session"):
+        db = PgVector(
+            table_name=TEST_TABLE,
+            schema=TEST_SCHEMA,
+            db_engine=mock_engine,
+            embedder=mock_embedder,
+            search_type=SearchType.hybrid,
+        )
+    db.metadata = MetaData(schema=TEST_SCHEMA)
+    db.table = db.get_table_v1()
+    db._has_tsvector_column = True
+
+    session = MagicMock()
+    session.execute.return_value.fetchall.return_value = []
+    db.Session = MagicMock()
+    db.Session.return_value.__enter__.return_value = session
+    return db, session
+
+
+def _compiled(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_table_has_generated_tsvector_column(pgvector_with_table):
+    db, _ = pgvector_with_table
+
+    create_sql = str(CreateTable(db.table).compile(dialect=postgresql.dialect()))
+
+    assert (
+        "content_tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('english'::regconfig, coalesce(content, ''))) STORED"
+        in create_sql
+    )
+
+
+def test_hybrid_search_fuses_index_served_candidates(pgvector_with_table):
+    db, session = pgvector_with_table
+    db.hybrid_candidates = 50
+
+    db.hybrid_search("thai soup", limit=5, filters={"cuisine": "Thai"})
+
+    set_ef_search, search = [call.args[0] for call in session.execute.call_args_list]
+    assert str(set_ef_search) == "SET LOCAL hnsw.ef_search = 50"
+    sql = _compiled(search)
+    select_clause = sql.split("FROM", 1)[0]
+    assert "embedding" not in select_clause
+    assert "to_tsvector" not in sql
+    assert "content_tsv @@ websearch_to_tsquery" in sql
+    assert "FULL OUTER JOIN" in sql
+    # Each candidate set is ordered by what its index serves and limited before fusing
+    assert sql.count("ORDER BY") == 5
+    assert sql.count("meta_data @>") == 2
+
+
+def test_keyword_search_matches_through_tsvector_column(pgvector_with_table):
+    db, session = pgvector_with_table
+
+    db.keyword_search("thai soup", limit=5)
+
+    sql = _compiled(session.execute.call_args.args[0])
+    assert "content_tsv @@ websearch_to_tsquery" in sql
+
+
+def test_text_search_falls_back_without_tsvector_column(pgvector_with_table):
+    db, session = pgvector_with_table
+    db._has_tsvector_column = False
+
+    db.keyword_search("thai soup", limit=5)
+
+    sql = _compiled(session.execute.call_args.args[0])
+    assert "content_tsv" not in sql
+    assert "to_tsvector" in sql
+
+
+def test_create_adds_tsvector_column_with_auto_upgrade(pgvector_with_table):
+    db, session = pgvector_with_table
+    db._has_tsvector_column = None
+    db.auto_upgrade_schema = True
+
+    with (
+        patch.object(db, "table_exists", return_value=True),
+        patch("agno.vectordb.pgvector.pgvector.inspect") as mock_inspect,
+    ):
+        mock_inspect.return_value.get_columns.return_value = [{"name": "id"}, {"name": "content"}]
+        db.create()
+
+    alter = str(session.execute.call_args.args[0])
+    assert alter.startswith(f"ALTER TABLE {TEST_SCHEMA}.{TEST_TABLE} ADD COLUMN IF NOT EXISTS content_tsv tsvector")
+    assert db._has_tsvector_column is True